@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+
+import path_util        # noqa: F401
+import argparse
+import asyncio
+import logging
+import os
+import sys
+
+from hummingbot import (
+    check_dev_mode,
+    init_logging,
+)
+from hummingbot.client.hummingbot_application import HummingbotApplication
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.client.config.config_helpers import (
+    create_yml_files,
+    write_config_to_yml,
+    read_system_configs_from_yml,
+    update_strategy_config_map_from_file,
+    all_configs_complete,
+)
+from hummingbot.client.headless import ControlServer
+from hummingbot.client.settings import (
+    CONF_FILE_PATH,
+    STRATEGIES,
+)
+from hummingbot.client.config.security import Security
+
+
+class CmdlineParser(argparse.ArgumentParser):
+    def __init__(self):
+        super().__init__(description="Runs a strategy without the terminal UI. The running bot is controlled through "
+                                     "a local unix socket, which accepts the commands `status`, `history` and "
+                                     "`stop`, one per line.")
+        self.add_argument("--strategy", "-s",
+                          type=str,
+                          choices=STRATEGIES,
+                          required=False,
+                          help="Choose the strategy you would like to run.")
+        self.add_argument("--config-file-name", "-f",
+                          type=str,
+                          required=False,
+                          help="Specify a file in `conf/` to load as the strategy config file.")
+        self.add_argument("--wallet", "-w",
+                          type=str,
+                          required=False,
+                          help="Specify the wallet public key you would like to use.")
+        self.add_argument("--config-password", "--wallet-password", "-p",
+                          type=str,
+                          required=False,
+                          help="Specify the password to unlock your encrypted files and wallets.")
+        self.add_argument("--control-socket",
+                          type=str,
+                          required=False,
+                          help="Path of the control socket. Defaults to `conf/<config file name>.sock`.")
+
+
+async def headless_start(args) -> int:
+    if args.strategy is None or args.config_file_name is None:
+        logging.getLogger().error("A strategy and a config file name are required in headless mode.")
+        return 1
+    if args.config_password is None:
+        logging.getLogger().error("A config password is required in headless mode.")
+        return 1
+    if not Security.login(args.config_password):
+        logging.getLogger().error("Invalid password.")
+        return 1
+
+    await Security.wait_til_decryption_done()
+    await create_yml_files()
+    init_logging("hummingbot_logs.yml", structured_logs=True)
+    read_system_configs_from_yml()
+
+    hb = HummingbotApplication.main_application(headless=True)
+    hb.strategy_name = args.strategy
+    hb.strategy_file_name = args.config_file_name
+    update_strategy_config_map_from_file(os.path.join(CONF_FILE_PATH, args.config_file_name))
+
+    # Same default as quickstart, for configs that predate the kill switch
+    if not global_config_map.get("kill_switch_enabled"):
+        global_config_map.get("kill_switch_enabled").value = False
+
+    if args.wallet:
+        global_config_map.get("ethereum_wallet").value = args.wallet
+
+    if not all_configs_complete(hb.strategy_name):
+        await hb.status_check_all()
+        return 1
+
+    dev_mode = check_dev_mode()
+    log_level = global_config_map.get("log_level").value
+    init_logging("hummingbot_logs.yml",
+                 override_log_level=log_level,
+                 dev_mode=dev_mode,
+                 structured_logs=True)
+
+    socket_path: str = args.control_socket or os.path.join(CONF_FILE_PATH,
+                                                           args.config_file_name.replace(".yml", "") + ".sock")
+    control_server: ControlServer = ControlServer(hb, socket_path)
+    await control_server.start()
+    try:
+        await write_config_to_yml(hb.strategy_name, hb.strategy_file_name)
+        hb.start(log_level)
+        await hb.run()
+    finally:
+        await control_server.stop()
+    return 0
+
+
+def main():
+    args = CmdlineParser().parse_args()
+
+    # Same environment variables as quickstart, e.g. for Docker deployments.
+    if args.strategy is None and len(os.environ.get("STRATEGY", "")) > 0:
+        args.strategy = os.environ["STRATEGY"]
+    if args.config_file_name is None and len(os.environ.get("CONFIG_FILE_NAME", "")) > 0:
+        args.config_file_name = os.environ["CONFIG_FILE_NAME"]
+    if args.wallet is None and len(os.environ.get("WALLET", "")) > 0:
+        args.wallet = os.environ["WALLET"]
+    if args.config_password is None and len(os.environ.get("CONFIG_PASSWORD", "")) > 0:
+        args.config_password = os.environ["CONFIG_PASSWORD"]
+    if args.control_socket is None and len(os.environ.get("CONTROL_SOCKET", "")) > 0:
+        args.control_socket = os.environ["CONTROL_SOCKET"]
+
+    sys.exit(asyncio.get_event_loop().run_until_complete(headless_start(args)))
+
+
+if __name__ == "__main__":
+    main()
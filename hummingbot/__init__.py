@@ -3,6 +3,7 @@ from typing import (
     List,
     Optional
 )
+import atexit
 import logging
 import subprocess
 from concurrent.futures import ThreadPoolExecutor
@@ -18,6 +19,7 @@ from hummingbot.logger.struct_logger import (
 )
 
 STRUCT_LOGGER_SET = False
+QUEUE_LOGGING_SHUTDOWN_REGISTERED = False
 DEV_STRATEGY_PREFIX = "dev"
 _prefix_path = None
 
@@ -134,7 +136,8 @@ def add_remote_logger_handler(loggers):
 def init_logging(conf_filename: str,
                  override_log_level: Optional[str] = None,
                  dev_mode: bool = False,
-                 strategy_file_path: str = "hummingbot"):
+                 strategy_file_path: str = "hummingbot",
+                 structured_logs: bool = False):
     import io
     import logging.config
     from os.path import join
@@ -143,11 +146,21 @@ def init_logging(conf_filename: str,
     from ruamel.yaml import YAML
 
     from hummingbot.client.config.global_config_map import global_config_map
+    from hummingbot.logger.queue_handler import (
+        DEFAULT_MAX_QUEUE_SIZE,
+        start_queue_logging,
+        stop_queue_logging,
+    )
     from hummingbot.logger.struct_logger import (
         StructLogRecord,
         StructLogger
     )
-    global STRUCT_LOGGER_SET
+    global STRUCT_LOGGER_SET, QUEUE_LOGGING_SHUTDOWN_REGISTERED
+    if not QUEUE_LOGGING_SHUTDOWN_REGISTERED:
+        # Registered after the logging module's own exit handler, so it runs first and the queued records are
+        # written out before the handlers get closed.
+        atexit.register(stop_queue_logging)
+        QUEUE_LOGGING_SHUTDOWN_REGISTERED = True
     if not STRUCT_LOGGER_SET:
         logging.setLogRecordFactory(StructLogRecord)
         logging.setLoggerClass(StructLogger)
@@ -170,10 +183,24 @@ def init_logging(conf_filename: str,
                 if global_config_map["logger_override_whitelist"].value and \
                         logger in global_config_map["logger_override_whitelist"].value:
                     config_dict["loggers"][logger]["level"] = override_log_level
+        if structured_logs:
+            # One JSON object per line on every handler, for headless bots whose output is collected by a log
+            # shipper rather than read in a terminal.
+            for handler_config in config_dict.get("handlers", {}).values():
+                if handler_config.get("class") == "hummingbot.logger.cli_handler.CLIHandler":
+                    handler_config["class"] = "logging.StreamHandler"
+                if "formatter" in handler_config:
+                    handler_config["formatter"] = "structured"
+        queue_logging_config: Dict = config_dict.pop("queue_logging", None) or {}
+        # Write out whatever the previous configuration still has queued, before dictConfig closes its handlers.
+        stop_queue_logging()
         logging.config.dictConfig(config_dict)
         # add remote logging to logger if in dev mode
         if dev_mode:
             add_remote_logger_handler(config_dict.get("loggers", []))
+        if queue_logging_config.get("enabled", False):
+            start_queue_logging(config_dict.get("loggers", []),
+                                queue_logging_config.get("max_queue_size", DEFAULT_MAX_QUEUE_SIZE))
 
 
 def get_strategy_list() -> List[str]:
@@ -20,7 +20,8 @@ from hummingbot.client.config.security import Security
 from hummingbot.client.config.config_var import ConfigVar
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.strategy.pure_market_making import (
-    PureMarketMakingStrategy
+    PureMarketMakingStrategy,
+    MultiPairPureMarketMakingStrategy,
 )
 from hummingbot.user.user_balances import UserBalances
 from typing import TYPE_CHECKING
@@ -141,8 +142,11 @@ class ConfigCommand:
             self._notify(f"{key}: {str(config_var.value)}")
             for config in missings:
                 self._notify(f"{config.key}: {str(config.value)}")
-            if isinstance(self.strategy, PureMarketMakingStrategy):
-                updated = ConfigCommand.update_running_pure_mm(self.strategy, key, config_var.value)
+            if isinstance(self.strategy, (PureMarketMakingStrategy, MultiPairPureMarketMakingStrategy)):
+                pure_mm_strategies = ([self.strategy] if isinstance(self.strategy, PureMarketMakingStrategy)
+                                      else self.strategy.pair_strategies)
+                updated = all([ConfigCommand.update_running_pure_mm(pure_mm_strategy, key, config_var.value)
+                               for pure_mm_strategy in pure_mm_strategies])
                 if updated:
                     self._notify(f"\nThe current {self.strategy_name} strategy has been updated "
                                  f"to reflect the new configuration.")
@@ -16,7 +16,6 @@ from hummingbot.client.settings import CONF_FILE_PATH, required_exchanges
 from hummingbot.client.config.global_config_map import global_config_map
 from hummingbot.client.config.security import Security
 from hummingbot.client.config.config_validators import validate_strategy
-from hummingbot.client.ui.completer import load_completer
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -86,6 +85,7 @@ class CreateCommand:
         self.strategy_file_name = file_name
         self.strategy_name = strategy
         # Reload completer here otherwise the new file will not appear
+        from hummingbot.client.ui.completer import load_completer
         self.app.input_field.completer = load_completer(self)
         self._notify(f"A new config file {self.strategy_file_name} created.")
         self.placeholder_mode = False
@@ -31,4 +31,8 @@ class ExitCommand:
         for notifier in self.notifiers:
             notifier.stop()
 
+        if self.metrics_server is not None:
+            await self.metrics_server.stop()
+            self.metrics_server = None
+
         self.app.exit()
@@ -22,6 +22,8 @@ from hummingbot.client.settings import (
     SCRIPTS_PATH
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import MetricsRegistry
+from hummingbot.core.utils.metrics_server import MetricsServer
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.data_feed.coin_cap_data_feed import CoinCapDataFeed
 from hummingbot.core.utils.kill_switch import KillSwitch
@@ -66,7 +68,8 @@ class StartCommand:
 
         init_logging("hummingbot_logs.yml",
                      override_log_level=log_level.upper() if log_level else None,
-                     strategy_file_path=self.strategy_file_name)
+                     strategy_file_path=self.strategy_file_name,
+                     structured_logs=self.headless)
 
         # If macOS, disable App Nap.
         if platform.system() == "Darwin":
@@ -77,12 +80,27 @@ class StartCommand:
         self.data_feed: DataFeedBase = CoinCapDataFeed.get_instance()
 
         self._initialize_notifiers()
+        await self._start_metrics_server()
 
         self._notify(f"\nStatus check complete. Starting '{self.strategy_name}' strategy...")
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\nPaper Trading ON: All orders are simulated, and no real orders are placed.")
         await self.start_market_making(self.strategy_name)
 
+    async def _start_metrics_server(self,  # type: HummingbotApplication
+                                    ):
+        metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance()
+        metrics_port: Optional[int] = global_config_map.get("metrics_port").value
+        if metrics is None or metrics_port is None or self.metrics_server is not None:
+            return
+        metrics_server: MetricsServer = MetricsServer(metrics, int(metrics_port))
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            self._notify(f"Could not serve metrics on port {metrics_port}: {e}")
+            return
+        self.metrics_server = metrics_server
+
     async def start_market_making(self,  # type: HummingbotApplication
                                   strategy_name: str):
         start_strategy: Callable = get_strategy_starter_file(strategy_name)
@@ -113,6 +131,8 @@ class StartCommand:
                     script_file = SCRIPTS_PATH + script_file
                 if self.strategy_name != "pure_market_making":
                     self._notify("Error: script feature is only available for pure_market_making strategy (for now).")
+                elif len(self.market_trading_pair_tuples) > 1:
+                    self._notify("Error: script feature is only available for a single trading pair (for now).")
                 else:
                     self._script_iterator = ScriptIterator(script_file, list(self.markets.values()),
                                                            self.strategy, 0.1)
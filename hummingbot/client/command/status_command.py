@@ -4,7 +4,7 @@ from collections import (
     deque,
     OrderedDict
 )
-from typing import List, Dict
+from typing import List, Dict, Optional
 from hummingbot import check_dev_mode
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.market.market_base import MarketBase
@@ -19,6 +19,7 @@ from hummingbot.client.config.security import Security
 from hummingbot.user.user_balances import UserBalances
 from hummingbot.client.settings import required_exchanges, DEXES
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import MetricsRegistry
 
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -71,11 +72,20 @@ class StatusCommand:
         if global_config_map.get("paper_trade_enabled").value:
             self._notify("\n  Paper Trading ON: All orders are simulated, and no real orders are placed.")
         self._notify(self.strategy.format_status() + "\n")
+        self.performance_status()
         self.application_warning()
         if self._script_iterator is not None:
             self._script_iterator.request_status()
         return True
 
+    def performance_status(self):
+        metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance()
+        if metrics is None:
+            return
+        performance_status: str = metrics.format_status()
+        if len(performance_status) > 0:
+            self._notify(performance_status + "\n")
+
     def application_warning(self):
         # Application warnings.
         self._expire_old_application_warnings()
@@ -12,7 +12,10 @@ class StopCommand:
         safe_ensure_future(self.stop_loop(skip_order_cancellation), loop=self.ev_loop)
 
     async def stop_loop(self,  # type: HummingbotApplication
-                        skip_order_cancellation: bool = False):
+                        skip_order_cancellation: bool = False) -> bool:
+        """
+        :return: False if some outstanding orders could not be cancelled, True otherwise
+        """
         self.logger().info("stop command initiated.")
         self._notify("\nWinding down...")
 
@@ -24,6 +27,8 @@ class StopCommand:
         if self._script_iterator is not None:
             self._script_iterator.stop(self.clock)
 
+        success: bool = True
+
         if self._trading_required and not skip_order_cancellation:
             # Remove the strategy from clock before cancelling orders, to
             # prevent race condition where the strategy tries to create more
@@ -50,3 +55,4 @@ class StopCommand:
         self.market_pair = None
         self.clock = None
         self.markets_recorder = None
+        return success
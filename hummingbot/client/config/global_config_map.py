@@ -381,6 +381,42 @@ global_config_map = {
                   type_str="bool",
                   default=False,
                   validator=validate_bool),
+    "message_decoder_workers":
+        ConfigVar(key="message_decoder_workers",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=0),
+    "message_decoder_use_processes":
+        ConfigVar(key="message_decoder_use_processes",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
+    "warm_cache_enabled":
+        ConfigVar(key="warm_cache_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=False),
+    "warm_cache_max_age":
+        ConfigVar(key="warm_cache_max_age",
+                  prompt=None,
+                  type_str="float",
+                  required_if=lambda: False,
+                  default=3600.0),
+    "metrics_enabled":
+        ConfigVar(key="metrics_enabled",
+                  prompt=None,
+                  type_str="bool",
+                  required_if=lambda: False,
+                  default=True),
+    "metrics_port":
+        ConfigVar(key="metrics_port",
+                  prompt=None,
+                  type_str="int",
+                  required_if=lambda: False,
+                  default=None),
     "script_enabled":
         ConfigVar(key="script_enabled",
                   prompt="Would you like to enable script feature? (Yes/No) >>> ",
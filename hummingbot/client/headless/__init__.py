@@ -0,0 +1,7 @@
+from .control_server import ControlServer
+from .headless_app import HeadlessApp
+
+__all__ = [
+    "ControlServer",
+    "HeadlessApp",
+]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+import asyncio
+import json
+import logging
+import os
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication
+
+
+class ControlServer:
+    """
+    Local control interface of a headless bot, on a unix domain socket.
+
+    A client sends one command per line - `status`, `history` or `stop` - and gets back one JSON object per line:
+    {"command": "status", "success": true, "output": ["...", ...]}, where output is the text the command would have
+    printed to the terminal UI. `stop` winds down the strategy, cancelling outstanding orders, and then shuts the bot
+    down. If some orders could not be cancelled, `stop` fails and the bot keeps running, so it can be sent again.
+    """
+    COMMANDS = ("status", "history", "stop")
+
+    _cs_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._cs_logger is None:
+            cls._cs_logger = logging.getLogger(__name__)
+        return cls._cs_logger
+
+    def __init__(self, hb: "HummingbotApplication", socket_path: str):
+        self._hb: "HummingbotApplication" = hb
+        self._socket_path: str = socket_path
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def socket_path(self) -> str:
+        return self._socket_path
+
+    async def start(self):
+        if os.path.exists(self._socket_path):
+            # Left behind by a bot that did not shut down cleanly.
+            os.unlink(self._socket_path)
+        self._server = await asyncio.start_unix_server(self._handle_client, path=self._socket_path)
+        os.chmod(self._socket_path, 0o600)
+        self.logger().info(f"Control socket listening at {self._socket_path}.")
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if len(line) == 0:
+                    break
+                command: str = line.decode("utf8").strip().lower()
+                if len(command) == 0:
+                    continue
+                response: Dict[str, Any] = await self.execute(command)
+                writer.write(json.dumps(response).encode("utf8") + b"\n")
+                await writer.drain()
+                if command == "stop" and response["success"]:
+                    self._hb.app.exit()
+                    break
+        except asyncio.CancelledError:
+            raise
+        except ConnectionError:
+            pass
+        except Exception:
+            self.logger().error("Unexpected error handling control socket client.", exc_info=True)
+        finally:
+            writer.close()
+
+    async def execute(self, command: str) -> Dict[str, Any]:
+        if command not in self.COMMANDS:
+            return {"command": command,
+                    "success": False,
+                    "output": [f"Unknown command. Available commands are: {', '.join(self.COMMANDS)}."]}
+
+        self.logger().info(f"Running '{command}' from the control socket.")
+        success: bool = True
+        with self._hb.app.capture_output() as output:
+            try:
+                if command == "status":
+                    success = await self._hb.status_check_all()
+                elif command == "history":
+                    self._hb.history()
+                elif command == "stop":
+                    success = await self._hb.stop_loop()
+                    if not success:
+                        self._hb.app.log("Failed to cancel all outstanding orders, the bot was not shut down. "
+                                         "Send 'stop' again to retry, or cancel the remaining orders manually.")
+            except Exception as e:
+                self.logger().error(f"Error running '{command}' from the control socket.", exc_info=True)
+                output.append(f"Error: {e}")
+                success = False
+        lines: List[str] = [line for text in output for line in text.strip("\n").split("\n")]
+        return {"command": command, "success": success, "output": lines}
@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+import asyncio
+from contextlib import contextmanager
+import logging
+from typing import (
+    Iterator,
+    List,
+    Optional,
+)
+
+from hummingbot.logger import HummingbotLogger
+
+
+class HeadlessApp:
+    """
+    Takes the place of HummingbotCLI when the bot runs as a daemon, without a terminal UI. Everything the application
+    would print to the output pane is logged instead, and is also returned to the control socket client whose
+    command produced it. There is no input field, so prompting for input cancels the command, as if the user had
+    pressed ctrl-c.
+    """
+    _ha_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ha_logger is None:
+            cls._ha_logger = logging.getLogger(__name__)
+        return cls._ha_logger
+
+    def __init__(self):
+        self.to_stop_config: bool = False
+        self.hide_input: bool = False
+        self.prompt_text: str = ""
+        self._exit_event: asyncio.Event = asyncio.Event()
+        self._output_captures: List[List[str]] = []
+
+    async def run(self):
+        await self._exit_event.wait()
+
+    def exit(self):
+        self._exit_event.set()
+
+    def log(self, text: str):
+        self.logger().info(text, extra={"do_not_send": True})
+        for output in self._output_captures:
+            output.append(text)
+
+    @contextmanager
+    def capture_output(self) -> Iterator[List[str]]:
+        """
+        Collects the text logged while the context is open, e.g. the output of a command run on behalf of a control
+        socket client.
+        """
+        output: List[str] = []
+        self._output_captures.append(output)
+        try:
+            yield output
+        finally:
+            self._output_captures.remove(output)
+
+    async def prompt(self, prompt: str, is_password: bool = False) -> str:
+        self.logger().error(f"Cannot prompt for input in headless mode, the command was cancelled - '{prompt}'.")
+        self.to_stop_config = True
+        return ""
+
+    def change_prompt(self, prompt: str, is_password: bool = False):
+        self.prompt_text = prompt
+
+    def set_text(self, new_text: str):
+        pass
+
+    def clear_input(self):
+        pass
+
+    def toggle_hide_input(self):
+        self.hide_input = not self.hide_input
+
+    def invalidate(self):
+        pass
@@ -4,7 +4,7 @@ import asyncio
 from collections import deque
 import logging
 import time
-from typing import List, Dict, Optional, Tuple, Set, Deque
+from typing import List, Dict, Optional, Tuple, Set, Deque, Type, TYPE_CHECKING
 
 from hummingbot.client.command import __all__ as commands
 from hummingbot.core.clock import Clock
@@ -12,28 +12,11 @@ from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSou
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTrackerDataSourceType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.logger.application_warning import ApplicationWarning
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.bittrex.bittrex_market import BittrexMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.liquid.liquid_market import LiquidMarket
-from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
 from hummingbot.market.market_base import MarketBase
+from hummingbot.market.market_registry import get_market_class
 from hummingbot.market.paper_trade import create_paper_trade_market
-from hummingbot.market.radar_relay.radar_relay_market import RadarRelayMarket
-from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
-from hummingbot.market.dolomite.dolomite_market import DolomiteMarket
-from hummingbot.market.bitcoin_com.bitcoin_com_market import BitcoinComMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
 from hummingbot.model.sql_connection_manager import SQLConnectionManager
-
-from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
-from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
-from hummingbot.client.ui.keybindings import load_key_bindings
 from hummingbot.client.ui.parser import load_parser, ThrowingArgumentParser
-from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
-from hummingbot.client.ui.completer import load_completer
 from hummingbot.client.errors import InvalidCommandError, ArgumentParserError
 from hummingbot.client.config.global_config_map import global_config_map, using_wallet
 from hummingbot.client.config.config_helpers import get_erc20_token_addresses, get_strategy_config_map
@@ -41,6 +24,7 @@ from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.cross_exchange_market_making import CrossExchangeMarketPair
 
 from hummingbot.core.utils.kill_switch import KillSwitch
+from hummingbot.core.utils.metrics_server import MetricsServer
 from hummingbot.data_feed.data_feed_base import DataFeedBase
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
@@ -48,23 +32,11 @@ from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.market.markets_recorder import MarketsRecorder
 from hummingbot.client.config.security import Security
 
+if TYPE_CHECKING:
+    from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 
-s_logger = None
 
-MARKET_CLASSES = {
-    "bamboo_relay": BambooRelayMarket,
-    "binance": BinanceMarket,
-    "coinbase_pro": CoinbaseProMarket,
-    "huobi": HuobiMarket,
-    "liquid": LiquidMarket,
-    "radar_relay": RadarRelayMarket,
-    "dolomite": DolomiteMarket,
-    "bittrex": BittrexMarket,
-    "kucoin": KucoinMarket,
-    "bitcoin_com": BitcoinComMarket,
-    "eterbase": EterbaseMarket,
-    "kraken": KrakenMarket
-}
+s_logger = None
 
 
 class HummingbotApplication(*commands):
@@ -82,20 +54,32 @@ class HummingbotApplication(*commands):
         return s_logger
 
     @classmethod
-    def main_application(cls) -> "HummingbotApplication":
+    def main_application(cls, headless: bool = False) -> "HummingbotApplication":
+        """
+        :param headless: only used when the application is created, i.e. on the first call
+        """
         if cls._main_app is None:
-            cls._main_app = HummingbotApplication()
+            cls._main_app = HummingbotApplication(headless=headless)
         return cls._main_app
 
-    def __init__(self):
+    def __init__(self, headless: bool = False):
         self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self.parser: ThrowingArgumentParser = load_parser(self)
-        self.app = HummingbotCLI(
-            input_handler=self._handle_command, bindings=load_key_bindings(self), completer=load_completer(self)
-        )
+        self.headless: bool = headless
+        # The terminal UI modules pull in prompt_toolkit, so they are only imported when there is a terminal UI.
+        if headless:
+            from hummingbot.client.headless.headless_app import HeadlessApp
+            self.app = HeadlessApp()
+        else:
+            from hummingbot.client.ui.keybindings import load_key_bindings
+            from hummingbot.client.ui.hummingbot_cli import HummingbotCLI
+            from hummingbot.client.ui.completer import load_completer
+            self.app = HummingbotCLI(
+                input_handler=self._handle_command, bindings=load_key_bindings(self), completer=load_completer(self)
+            )
 
         self.markets: Dict[str, MarketBase] = {}
-        self.wallet: Optional[Web3Wallet] = None
+        self.wallet: Optional["Web3Wallet"] = None
         # strategy file name and name get assigned value after import or create command
         self.strategy_file_name: str = None
         self.strategy_name: str = None
@@ -114,6 +98,7 @@ class HummingbotApplication(*commands):
         self.data_feed: Optional[DataFeedBase] = None
         self.notifiers: List[NotifierBase] = []
         self.kill_switch: Optional[KillSwitch] = None
+        self.metrics_server: Optional[MetricsServer] = None
         self._app_warnings: Deque[ApplicationWarning] = deque()
         self._trading_required: bool = True
 
@@ -200,18 +185,20 @@ class HummingbotApplication(*commands):
 
     @staticmethod
     def _initialize_market_assets(market_name: str, trading_pairs: List[str]) -> List[Tuple[str, str]]:
-        market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+        market_class: Type[MarketBase] = get_market_class(market_name) or MarketBase
         market_trading_pairs: List[Tuple[str, str]] = [market_class.split_trading_pair(trading_pair) for trading_pair in trading_pairs]
         return market_trading_pairs
 
     @staticmethod
     def _convert_to_exchange_trading_pair(market_name: str, hb_trading_pair: List[str]) -> List[str]:
-        market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+        market_class: Type[MarketBase] = get_market_class(market_name) or MarketBase
         return [market_class.convert_to_exchange_trading_pair(trading_pair) for trading_pair in hb_trading_pair]
 
     def _initialize_wallet(self, token_trading_pairs: List[str]):
         if not using_wallet():
             return
+        from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+        from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 
         ethereum_wallet = global_config_map.get("ethereum_wallet").value
         private_key = Security._private_keys[ethereum_wallet]
@@ -234,12 +221,14 @@ class HummingbotApplication(*commands):
         for market_name, trading_pairs in market_names:
             if market_name not in market_trading_pairs_map:
                 market_trading_pairs_map[market_name] = []
-            market_class: MarketBase = MARKET_CLASSES.get(market_name, MarketBase)
+            market_class: Type[MarketBase] = get_market_class(market_name) or MarketBase
             for trading_pair in trading_pairs:
                 exchange_trading_pair: str = market_class.convert_to_exchange_trading_pair(trading_pair)
                 market_trading_pairs_map[market_name].append(exchange_trading_pair)
 
         for market_name, trading_pairs in market_trading_pairs_map.items():
+            # Connectors are only imported once they are used.
+            market_class = get_market_class(market_name)
             if global_config_map.get("paper_trade_enabled").value:
                 try:
                     market = create_paper_trade_market(market_name, trading_pairs)
@@ -252,7 +241,7 @@ class HummingbotApplication(*commands):
             elif market_name == "binance":
                 binance_api_key = global_config_map.get("binance_api_key").value
                 binance_api_secret = global_config_map.get("binance_api_secret").value
-                market = BinanceMarket(
+                market = market_class(
                     binance_api_key,
                     binance_api_secret,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -262,7 +251,7 @@ class HummingbotApplication(*commands):
 
             elif market_name == "radar_relay":
                 assert self.wallet is not None
-                market = RadarRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -273,7 +262,7 @@ class HummingbotApplication(*commands):
                 assert self.wallet is not None
                 use_coordinator = global_config_map.get("bamboo_relay_use_coordinator").value
                 pre_emptive_soft_cancels = global_config_map.get("bamboo_relay_pre_emptive_soft_cancels").value
-                market = BambooRelayMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     trading_pairs=trading_pairs,
@@ -287,24 +276,24 @@ class HummingbotApplication(*commands):
                 coinbase_pro_secret_key = global_config_map.get("coinbase_pro_secret_key").value
                 coinbase_pro_passphrase = global_config_map.get("coinbase_pro_passphrase").value
 
-                market = CoinbaseProMarket(coinbase_pro_api_key,
-                                           coinbase_pro_secret_key,
-                                           coinbase_pro_passphrase,
-                                           trading_pairs=trading_pairs,
-                                           trading_required=self._trading_required)
+                market = market_class(coinbase_pro_api_key,
+                                      coinbase_pro_secret_key,
+                                      coinbase_pro_passphrase,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "huobi":
                 huobi_api_key = global_config_map.get("huobi_api_key").value
                 huobi_secret_key = global_config_map.get("huobi_secret_key").value
-                market = HuobiMarket(huobi_api_key,
-                                     huobi_secret_key,
-                                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                     trading_pairs=trading_pairs,
-                                     trading_required=self._trading_required)
+                market = market_class(huobi_api_key,
+                                      huobi_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "liquid":
                 liquid_api_key = global_config_map.get("liquid_api_key").value
                 liquid_secret_key = global_config_map.get("liquid_secret_key").value
 
-                market = LiquidMarket(liquid_api_key,
+                market = market_class(liquid_api_key,
                                       liquid_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       user_stream_tracker_data_source_type=UserStreamTrackerDataSourceType.EXCHANGE_API,
@@ -313,7 +302,7 @@ class HummingbotApplication(*commands):
             elif market_name == "dolomite":
                 assert self.wallet is not None
                 is_test_net: bool = global_config_map.get("ethereum_chain_name").value == "DOLOMITE_TEST"
-                market = DolomiteMarket(
+                market = market_class(
                     wallet=self.wallet,
                     ethereum_rpc_url=ethereum_rpc_url,
                     order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -324,16 +313,16 @@ class HummingbotApplication(*commands):
             elif market_name == "bittrex":
                 bittrex_api_key = global_config_map.get("bittrex_api_key").value
                 bittrex_secret_key = global_config_map.get("bittrex_secret_key").value
-                market = BittrexMarket(bittrex_api_key,
-                                       bittrex_secret_key,
-                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                       trading_pairs=trading_pairs,
-                                       trading_required=self._trading_required)
+                market = market_class(bittrex_api_key,
+                                      bittrex_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "kucoin":
                 kucoin_api_key = global_config_map.get("kucoin_api_key").value
                 kucoin_secret_key = global_config_map.get("kucoin_secret_key").value
                 kucoin_passphrase = global_config_map.get("kucoin_passphrase").value
-                market = KucoinMarket(kucoin_api_key,
+                market = market_class(kucoin_api_key,
                                       kucoin_passphrase,
                                       kucoin_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
@@ -342,24 +331,24 @@ class HummingbotApplication(*commands):
             elif market_name == "bitcoin_com":
                 bitcoin_com_api_key = global_config_map.get("bitcoin_com_api_key").value
                 bitcoin_com_secret_key = global_config_map.get("bitcoin_com_secret_key").value
-                market = BitcoinComMarket(bitcoin_com_api_key,
-                                          bitcoin_com_secret_key,
-                                          order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
-                                          trading_pairs=trading_pairs,
-                                          trading_required=self._trading_required)
+                market = market_class(bitcoin_com_api_key,
+                                      bitcoin_com_secret_key,
+                                      order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required)
             elif market_name == "eterbase":
                 eterbase_api_key = global_config_map.get("eterbase_api_key").value
                 eterbase_secret_key = global_config_map.get("eterbase_secret_key").value
                 eterbase_account = global_config_map.get("eterbase_account").value
-                market = EterbaseMarket(eterbase_api_key,
-                                        eterbase_secret_key,
-                                        trading_pairs=trading_pairs,
-                                        trading_required=self._trading_required,
-                                        eterbase_account=eterbase_account)
+                market = market_class(eterbase_api_key,
+                                      eterbase_secret_key,
+                                      trading_pairs=trading_pairs,
+                                      trading_required=self._trading_required,
+                                      eterbase_account=eterbase_account)
             elif market_name == "kraken":
                 kraken_api_key = global_config_map.get("kraken_api_key").value
                 kraken_secret_key = global_config_map.get("kraken_secret_key").value
-                market = KrakenMarket(kraken_api_key,
+                market = market_class(kraken_api_key,
                                       kraken_secret_key,
                                       order_book_tracker_data_source_type=OrderBookTrackerDataSourceType.EXCHANGE_API,
                                       trading_pairs=trading_pairs,
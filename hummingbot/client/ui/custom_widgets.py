@@ -1,4 +1,5 @@
 from __future__ import unicode_literals
+import asyncio
 import six
 from collections import deque
 from typing import (
@@ -46,6 +47,9 @@ class CustomBuffer(Buffer):
 
 
 class CustomTextArea:
+    # Appended lines are drawn at most this many times per second, however often log() is called.
+    REDRAW_FRAME_RATE = 20
+
     def __init__(self, text='', multiline=True, password=False,
                  lexer=None, auto_suggest=None, completer=None,
                  complete_while_typing=True, accept_handler=None, history=None,
@@ -131,7 +135,10 @@ class CustomTextArea:
             right_margins=right_margins,
             get_line_prefix=get_line_prefix)
 
-        self.log_lines: Deque[str] = deque()
+        # Ring buffer of the displayed lines. Appending drops the oldest lines in O(1).
+        self.log_lines: Deque[str] = deque(maxlen=max_line_count)
+        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self._redraw_scheduled: bool = False
         self.log(initial_text)
 
     @property
@@ -188,7 +195,24 @@ class CustomTextArea:
             new_lines.append(line)
 
         self.log_lines.extend(new_lines)
-        while len(self.log_lines) > self.max_line_count:
-            self.log_lines.popleft()
+        self._schedule_redraw()
+
+    def _schedule_redraw(self):
+        """
+        Coalesces the document updates of all log() calls within one frame into a single redraw. log() may be called
+        from other threads (e.g. via the stdout proxy), so the redraw is always handed over to the event loop.
+        """
+        if self._redraw_scheduled:
+            return
+        if not self._ev_loop.is_running():
+            self._redraw()
+            return
+        self._redraw_scheduled = True
+        self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, 1.0 / self.REDRAW_FRAME_RATE, self._redraw)
+
+    def _redraw(self):
+        self._redraw_scheduled = False
+        # The control only renders the lines in the visible part of the window, so the cost of a redraw is building
+        # the document text once per frame.
         new_text: str = "\n".join(self.log_lines)
         self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
@@ -61,10 +61,8 @@ class StdoutProxy(object):
         def write_and_flush():
             self.log_field.log(text)
 
-        def schedule_write_and_flush():
-            self._ev_loop.run_in_executor(None, write_and_flush)
-
-        self._ev_loop.call_soon_threadsafe(schedule_write_and_flush)
+        # Appending to the log field is cheap, since it only redraws once per frame.
+        self._ev_loop.call_soon_threadsafe(write_and_flush)
 
     def _write(self, data):
         if '\n' in data:
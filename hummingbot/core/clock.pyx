@@ -3,11 +3,20 @@
 import asyncio
 import logging
 import time
-from typing import List
+from typing import (
+    Dict,
+    List,
+    Optional,
+)
 
 from hummingbot.core.time_iterator import TimeIterator
 from hummingbot.core.time_iterator cimport TimeIterator
 from hummingbot.core.clock_mode import ClockMode
+from hummingbot.core.utils.metrics import (
+    GaugeSample,
+    Histogram,
+    MetricsRegistry,
+)
 from hummingbot.logger import HummingbotLogger
 
 s_logger = None
@@ -36,6 +45,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._tick_duration_histograms = {}
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -82,6 +92,28 @@ cdef class Clock:
             self._current_context.remove(iterator)
         self._child_iterators.remove(iterator)
 
+    def _get_tick_duration_histogram(self, metrics: MetricsRegistry, iterator: TimeIterator) -> Histogram:
+        cdef:
+            object histogram = self._tick_duration_histograms.get(iterator)
+        if histogram is None:
+            iterator_name: str = getattr(iterator, "display_name", None) or iterator.__class__.__name__
+            histogram = metrics.histogram("clock_tick_duration_seconds", iterator=iterator_name)
+            self._tick_duration_histograms[iterator] = histogram
+        return histogram
+
+    def _collect_metrics(self) -> List[GaugeSample]:
+        samples: List[GaugeSample] = []
+        if self._current_context is None:
+            return samples
+        for iterator in self._current_context:
+            iterator_name: str = getattr(iterator, "display_name", None) or iterator.__class__.__name__
+            dispatch_counts: Dict[int, int] = iterator.dispatch_counts
+            for event_tag, count in dispatch_counts.items():
+                samples.append(("pubsub_dispatched_events_total",
+                                {"iterator": iterator_name, "event_tag": str(event_tag)},
+                                count))
+        return samples
+
     async def run(self):
         await self.run_til(float("nan"))
 
@@ -90,6 +122,7 @@ cdef class Clock:
             TimeIterator child_iterator
             double now = time.time()
             double next_tick_time
+            double tick_start = 0
 
         if self._current_context is None:
             raise EnvironmentError("run() and run_til() can only be used within the context of a `with...` statement.")
@@ -101,6 +134,13 @@ cdef class Clock:
                 child_iterator.c_start(self, self._current_tick)
             self._started = True
 
+        # Timing the ticks costs two clock reads and a histogram update per iterator per tick.
+        metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance()
+        lag_histogram: Optional[Histogram] = None
+        if metrics is not None:
+            lag_histogram = metrics.histogram("event_loop_lag_seconds", clock=self._clock_mode.name.lower())
+            metrics.add_collector(self._collect_metrics)
+
         try:
             while True:
                 now = time.time()
@@ -112,9 +152,15 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
+                # How late the event loop woke the clock up - i.e. how long other tasks held the loop past the tick.
+                if lag_histogram is not None:
+                    lag_histogram.observe(max(time.time() - next_tick_time, 0.0))
+
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
+                    if metrics is not None:
+                        tick_start = time.perf_counter()
                     try:
                         child_iterator.c_tick(self._current_tick)
                     except StopIteration:
@@ -122,7 +168,13 @@ cdef class Clock:
                         return
                     except Exception:
                         self.logger().error("Unexpected error running clock tick.", exc_info=True)
+                    if metrics is not None:
+                        self._get_tick_duration_histogram(metrics, child_iterator).observe(
+                            time.perf_counter() - tick_start
+                        )
         finally:
+            if metrics is not None:
+                metrics.remove_collector(self._collect_metrics)
             for ci in self._current_context:
                 child_iterator = ci
                 child_iterator._clock = None
@@ -0,0 +1,12 @@
+cdef class DeadlineQueue:
+    cdef:
+        list _heap
+        dict _entries
+        long long _sequence
+
+    cdef c_push(self, object key, double deadline)
+    cdef c_remove(self, object key)
+    cdef bint c_contains(self, object key)
+    cdef double c_get_deadline(self, object key)
+    cdef list c_pop_expired(self, double timestamp)
+    cdef c_compact(self)
@@ -0,0 +1,95 @@
+import heapq
+from typing import Iterator
+
+NaN = float("nan")
+
+
+cdef class DeadlineQueue:
+    """
+    Keys with deadlines, ordered by deadline in a min-heap, for the trackers that expire entries on every tick.
+
+    Popping the expired keys costs O(expired * log n), rather than a scan over everything that's tracked. Removing or
+    rescheduling a key only updates the key's entry - the stale heap item is skipped when it comes up, and the heap is
+    rebuilt once stale items make up most of it.
+    """
+    # Rebuilding the heap is only worth it once it has this many more items than live entries.
+    COMPACTION_THRESHOLD = 64
+
+    def __init__(self):
+        self._heap = []
+        self._entries = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator:
+        return iter(self._entries)
+
+    def push(self, key, deadline: float):
+        self.c_push(key, deadline)
+
+    def remove(self, key):
+        self.c_remove(key)
+
+    def get_deadline(self, key) -> float:
+        return self.c_get_deadline(key)
+
+    def pop_expired(self, timestamp: float) -> list:
+        return self.c_pop_expired(timestamp)
+
+    def clear(self):
+        self._heap.clear()
+        self._entries.clear()
+
+    cdef c_push(self, object key, double deadline):
+        """
+        Adds the key, or moves it to the new deadline if it's already in the queue.
+        """
+        self._sequence += 1
+        self._entries[key] = (deadline, self._sequence)
+        heapq.heappush(self._heap, (deadline, self._sequence, key))
+        if len(self._heap) > 2 * len(self._entries) + self.COMPACTION_THRESHOLD:
+            self.c_compact()
+
+    cdef c_remove(self, object key):
+        self._entries.pop(key, None)
+
+    cdef bint c_contains(self, object key):
+        return key in self._entries
+
+    cdef double c_get_deadline(self, object key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return NaN
+        return entry[0]
+
+    cdef list c_pop_expired(self, double timestamp):
+        """
+        Removes and returns the keys whose deadlines are before timestamp, earliest deadline first.
+        """
+        cdef:
+            list expired_keys = []
+            list heap = self._heap
+            dict entries = self._entries
+            tuple item
+            long long sequence
+
+        while len(heap) > 0 and (<tuple> heap[0])[0] < timestamp:
+            item = heapq.heappop(heap)
+            key = item[2]
+            sequence = item[1]
+            entry = entries.get(key)
+            # Skip items of keys that have since been removed or rescheduled.
+            if entry is None or (<tuple> entry)[1] != sequence:
+                continue
+            del entries[key]
+            expired_keys.append(key)
+        return expired_keys
+
+    cdef c_compact(self):
+        self._heap = [(deadline, sequence, key) for key, (deadline, sequence) in self._entries.items()]
+        heapq.heapify(self._heap)
@@ -0,0 +1,25 @@
+# distutils: language=c++
+cimport numpy as np
+
+cdef class L3ActiveOrderTracker:
+    cdef dict _active_bids
+    cdef dict _active_asks
+    cdef dict _bid_volumes
+    cdef dict _ask_volumes
+    cdef dict _order_index
+    cdef dict _changed_bids
+    cdef dict _changed_asks
+    cdef str _size_key
+
+    cdef c_add_order(self, bint is_bid, object price, object order_id, object size, dict order_dict)
+    cdef bint c_update_order_size(self, object order_id, object size)
+    cdef bint c_remove_order(self, object order_id)
+    cdef c_set_level(self, bint is_bid, object price, object order_id, object size, dict order_dict)
+    cdef c_clear(self)
+    cdef double c_volume_for_price(self, bint is_bid, object price)
+    cdef tuple c_get_changed_levels(self)
+    cdef c_apply_diff_message(self, object message)
+    cdef c_apply_snapshot_message(self, object message)
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
+    cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
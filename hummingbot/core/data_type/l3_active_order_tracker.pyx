@@ -0,0 +1,300 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+import numpy as np
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
+s_decimal_0 = Decimal(0)
+
+L3OrderBookTrackingDictionary = Dict[Decimal, Dict[Any, Dict[str, Any]]]
+
+
+cdef object to_decimal(object size):
+    return size if isinstance(size, Decimal) else Decimal(str(size))
+
+
+cdef class L3ActiveOrderTracker:
+    """
+    Base class for active order trackers of exchanges that publish individual orders (L3) rather than price levels.
+
+    Besides the per price dictionaries of active orders, it keeps a running volume total for every price level and an
+    index from order id to (is_bid, price, size), so that applying an order update costs O(1) regardless of how many
+    orders rest at the same price. Sizes and totals are kept in Decimal, so a level's total doesn't drift however many
+    orders come and go on it. Levels touched since the last read are collected and returned as a batch, so any
+    number of messages can be applied before handing the changed levels to the order book.
+
+    Subclasses implement c_apply_diff_message() and c_apply_snapshot_message() in terms of c_add_order(),
+    c_update_order_size(), c_remove_order() and c_set_level().
+    """
+
+    def __init__(self,
+                 active_asks: L3OrderBookTrackingDictionary = None,
+                 active_bids: L3OrderBookTrackingDictionary = None,
+                 size_key: str = "remaining_size"):
+        super().__init__()
+        self._active_asks = {}
+        self._active_bids = {}
+        self._bid_volumes = {}
+        self._ask_volumes = {}
+        self._order_index = {}
+        self._changed_bids = {}
+        self._changed_asks = {}
+        self._size_key = size_key
+        for is_bid, active_orders in [(True, active_bids or {}), (False, active_asks or {})]:
+            for price, orders in active_orders.items():
+                for order_id, order_dict in orders.items():
+                    self.c_add_order(is_bid, price, order_id, order_dict[size_key], order_dict)
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+
+    @property
+    def active_asks(self) -> L3OrderBookTrackingDictionary:
+        """
+        Get all asks on the order book in dictionary format
+        :returns: Dict[price, Dict[order_id, order_book_message]]
+        """
+        return self._active_asks
+
+    @property
+    def active_bids(self) -> L3OrderBookTrackingDictionary:
+        """
+        Get all bids on the order book in dictionary format
+        :returns: Dict[price, Dict[order_id, order_book_message]]
+        """
+        return self._active_bids
+
+    @property
+    def order_index(self) -> Dict[Any, Tuple[bool, Decimal, Decimal]]:
+        """
+        :returns: Dict[order_id, (is_bid, price, size)]
+        """
+        return self._order_index
+
+    def volume_for_ask_price(self, price) -> float:
+        """
+        For a certain price, get the volume sum of all ask order book rows with that price
+        :returns: volume sum
+        """
+        return self.c_volume_for_price(False, price)
+
+    def volume_for_bid_price(self, price) -> float:
+        """
+        For a certain price, get the volume sum of all bid order book rows with that price
+        :returns: volume sum
+        """
+        return self.c_volume_for_price(True, price)
+
+    cdef double c_volume_for_price(self, bint is_bid, object price):
+        return float((self._bid_volumes if is_bid else self._ask_volumes).get(price, s_decimal_0))
+
+    cdef c_add_order(self, bint is_bid, object price, object order_id, object size, dict order_dict):
+        """
+        Starts tracking an order, replacing any previous order with the same id.
+        """
+        cdef:
+            dict active_orders = self._active_bids if is_bid else self._active_asks
+            dict volumes = self._bid_volumes if is_bid else self._ask_volumes
+            dict level
+            object amount = to_decimal(size)
+
+        if order_id in self._order_index:
+            self.c_remove_order(order_id)
+        level = active_orders.get(price)
+        if level is None:
+            level = active_orders[price] = {}
+        level[order_id] = order_dict
+        volumes[price] = volumes.get(price, s_decimal_0) + amount
+        self._order_index[order_id] = (is_bid, price, amount)
+        (self._changed_bids if is_bid else self._changed_asks)[price] = None
+
+    cdef bint c_update_order_size(self, object order_id, object size):
+        """
+        Sets the remaining size of a tracked order.
+        :returns: False if the order is not tracked
+        """
+        cdef:
+            tuple entry = self._order_index.get(order_id)
+            bint is_bid
+            object price
+            object old_amount
+            object amount = to_decimal(size)
+            dict volumes
+
+        if entry is None:
+            return False
+        is_bid, price, old_amount = entry
+        volumes = self._bid_volumes if is_bid else self._ask_volumes
+        volumes[price] += amount - old_amount
+        self._order_index[order_id] = (is_bid, price, amount)
+        (self._active_bids if is_bid else self._active_asks)[price][order_id][self._size_key] = size
+        (self._changed_bids if is_bid else self._changed_asks)[price] = None
+        return True
+
+    cdef bint c_remove_order(self, object order_id):
+        """
+        Stops tracking an order. The price level is dropped along with its last order.
+        :returns: False if the order is not tracked
+        """
+        cdef:
+            tuple entry = self._order_index.pop(order_id, None)
+            bint is_bid
+            object price
+            object amount
+            dict active_orders
+            dict volumes
+            dict level
+
+        if entry is None:
+            return False
+        is_bid, price, amount = entry
+        active_orders = self._active_bids if is_bid else self._active_asks
+        volumes = self._bid_volumes if is_bid else self._ask_volumes
+        level = active_orders[price]
+        del level[order_id]
+        if len(level) == 0:
+            del active_orders[price]
+            del volumes[price]
+        else:
+            volumes[price] -= amount
+        (self._changed_bids if is_bid else self._changed_asks)[price] = None
+        return True
+
+    cdef c_set_level(self, bint is_bid, object price, object order_id, object size, dict order_dict):
+        """
+        Replaces all orders on a price level with a single order, for exchanges that mix aggregated level updates
+        into their order feed. A zero size removes the level.
+        """
+        cdef:
+            dict level = (self._active_bids if is_bid else self._active_asks).get(price)
+
+        if level is not None:
+            for existing_order_id in list(level.keys()):
+                self.c_remove_order(existing_order_id)
+        if to_decimal(size) > 0:
+            self.c_add_order(is_bid, price, order_id, size, order_dict)
+        (self._changed_bids if is_bid else self._changed_asks)[price] = None
+
+    cdef c_clear(self):
+        self._active_bids.clear()
+        self._active_asks.clear()
+        self._bid_volumes.clear()
+        self._ask_volumes.clear()
+        self._order_index.clear()
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+
+    cdef tuple c_get_changed_levels(self):
+        """
+        Returns the price levels changed since the last call, and resets the change set.
+        :returns: Tuple(List[(price, volume)] (bids), List[(price, volume)] (asks))
+        """
+        cdef:
+            list bids = [(price, float(self._bid_volumes.get(price, s_decimal_0))) for price in self._changed_bids]
+            list asks = [(price, float(self._ask_volumes.get(price, s_decimal_0))) for price in self._changed_asks]
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+        return bids, asks
+
+    cdef c_apply_diff_message(self, object message):
+        raise NotImplementedError
+
+    cdef c_apply_snapshot_message(self, object message):
+        raise NotImplementedError
+
+    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
+        """
+        Interpret an incoming diff message and apply changes to the order book accordingly
+        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        """
+        cdef:
+            double timestamp = message.timestamp
+            double update_id = message.update_id
+            list bids
+            list asks
+
+        self.c_apply_diff_message(message)
+        bids, asks = self.c_get_changed_levels()
+        return (
+            np.array([[timestamp, float(price), volume, update_id] for price, volume in bids],
+                     dtype="float64").reshape((len(bids), 4)) if len(bids) > 0 else s_empty_diff,
+            np.array([[timestamp, float(price), volume, update_id] for price, volume in asks],
+                     dtype="float64").reshape((len(asks), 4)) if len(asks) > 0 else s_empty_diff
+        )
+
+    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+        """
+        Interpret an incoming snapshot message and apply changes to the order book accordingly
+        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        """
+        cdef:
+            double timestamp = message.timestamp
+            double update_id = message.update_id
+
+        # Refresh all order tracking.
+        self.c_clear()
+        self.c_apply_snapshot_message(message)
+        self._changed_bids.clear()
+        self._changed_asks.clear()
+
+        # Return the sorted snapshot tables.
+        cdef:
+            np.ndarray[np.float64_t, ndim=2] bids = np.array(
+                [[timestamp, float(price), float(self._bid_volumes[price]), update_id]
+                 for price in sorted(self._bid_volumes.keys(), reverse=True)], dtype="float64", ndmin=2)
+            np.ndarray[np.float64_t, ndim=2] asks = np.array(
+                [[timestamp, float(price), float(self._ask_volumes[price]), update_id]
+                 for price in sorted(self._ask_volumes.keys(), reverse=True)], dtype="float64", ndmin=2)
+
+        # If there're no rows, the shape would become (1, 0) and not (0, 4).
+        # Reshape to fix that.
+        if bids.shape[1] != 4:
+            bids = bids.reshape((0, 4))
+        if asks.shape[1] != 4:
+            asks = asks.reshape((0, 4))
+
+        return bids, asks
+
+    cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
+        raise NotImplementedError
+
+    def convert_diff_message_to_order_book_row(self, message):
+        """
+        Apply an incoming diff message and return the changed price levels as OrderBookRow
+        :returns: Tuple(List[bids_row], List[asks_row])
+        """
+        return self.convert_diff_messages_to_order_book_row([message])
+
+    def convert_diff_messages_to_order_book_row(self, messages: List[Any]):
+        """
+        Apply a batch of diff messages and return every price level they changed, once, at its final volume. The
+        rows carry the update id of the last message.
+        :returns: Tuple(List[bids_row], List[asks_row])
+        """
+        cdef:
+            list bids
+            list asks
+        for message in messages:
+            self.c_apply_diff_message(message)
+        update_id = messages[-1].update_id
+        bids, asks = self.c_get_changed_levels()
+        return ([OrderBookRow(float(price), volume, update_id) for price, volume in bids],
+                [OrderBookRow(float(price), volume, update_id) for price, volume in asks])
+
+    def convert_snapshot_message_to_order_book_row(self, message):
+        """
+        Convert an incoming snapshot message to Tuple of np.arrays, and then convert to OrderBookRow
+        :returns: Tuple(List[bids_row], List[asks_row])
+        """
+        np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
+        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
+        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
+        return bids_row, asks_row
@@ -17,10 +17,15 @@ cdef class OrderBook(PubSub):
     cdef double _best_bid
     cdef double _best_ask
     cdef bint _dex
+    cdef list _pending_trades
+    cdef str _pending_trades_trading_pair
+    cdef bint _trade_batch_flush_scheduled
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_add_to_trade_batch(self, object trade_event)
+    cdef c_flush_trade_batch(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
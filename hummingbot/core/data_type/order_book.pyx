@@ -9,7 +9,9 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
-    OrderBookTradeEvent
+    OrderBookTradeBatchEvent,
+    OrderBookTradeEvent,
+    TradeType
 )
 from typing import (
     List,
@@ -25,15 +27,26 @@ from .order_book_message import OrderBookMessage
 from .order_book_row import OrderBookRow
 from .order_book_query_result import OrderBookQueryResult
 from sqlalchemy.engine import RowProxy
+import asyncio
 import bisect
 import logging
 cimport numpy as np
 ob_logger = None
 NaN = float("nan")
+TRADE_BATCH_DTYPE = np.dtype([("timestamp", np.float64),
+                              ("price", np.float64),
+                              ("amount", np.float64),
+                              ("is_buy", np.bool_)])
 
 
 cdef class OrderBook(PubSub):
+    """
+    Trades are delivered to ORDER_BOOK_TRADE_EVENT_TAG listeners one OrderBookTradeEvent at a time. Listeners that
+    only need to see trades once per event loop iteration can instead listen to ORDER_BOOK_TRADE_BATCH_EVENT_TAG, and
+    receive all the trades since the last iteration as a single OrderBookTradeBatchEvent.
+    """
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TRADE_BATCH_EVENT_TAG = OrderBookEvent.TradeBatchEvent.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -48,6 +61,9 @@ cdef class OrderBook(PubSub):
         self._last_diff_uid = 0
         self._best_bid = self._best_ask = float("NaN")
         self._dex = dex
+        self._pending_trades = []
+        self._pending_trades_trading_pair = None
+        self._trade_batch_flush_scheduled = False
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -131,6 +147,38 @@ cdef class OrderBook(PubSub):
 
     cdef c_apply_trade(self, object trade_event):
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
+        if self.ORDER_BOOK_TRADE_BATCH_EVENT_TAG in self._listener_snapshots:
+            self.c_add_to_trade_batch(trade_event)
+
+    cdef c_add_to_trade_batch(self, object trade_event):
+        self._pending_trades.append((trade_event.timestamp,
+                                     float(trade_event.price),
+                                     float(trade_event.amount),
+                                     trade_event.type is TradeType.BUY))
+        self._pending_trades_trading_pair = trade_event.trading_pair
+        if self._trade_batch_flush_scheduled:
+            return
+        ev_loop = asyncio.get_event_loop()
+        if ev_loop.is_running():
+            self._trade_batch_flush_scheduled = True
+            ev_loop.call_soon(self.flush_trade_batch)
+        else:
+            # Without a running event loop, e.g. in backtests, there is no iteration to batch trades over.
+            self.c_flush_trade_batch()
+
+    cdef c_flush_trade_batch(self):
+        cdef:
+            list pending_trades = self._pending_trades
+        self._trade_batch_flush_scheduled = False
+        if len(pending_trades) == 0:
+            return
+        self._pending_trades = []
+        self.c_trigger_event(self.ORDER_BOOK_TRADE_BATCH_EVENT_TAG,
+                             OrderBookTradeBatchEvent(self._pending_trades_trading_pair,
+                                                      np.array(pending_trades, dtype=TRADE_BATCH_DTYPE)))
+
+    def flush_trade_batch(self):
+        self.c_flush_trade_batch()
 
     @property
     def snapshot_uid(self) -> int:
@@ -0,0 +1,35 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.rolling_statistics cimport (
+    RollingStats,
+    WindowedExtrema,
+)
+
+cdef class OrderBookFeatures:
+    cdef:
+        double _window
+        double _sample_interval
+        int _depth_levels
+        double _last_update_timestamp
+        double _next_sample_timestamp
+        double _best_bid
+        double _best_ask
+        double _mid_price
+        double _microprice
+        double _spread
+        double _depth_imbalance
+        double _last_sampled_mid_price
+        WindowedExtrema _mid_price_extrema
+        RollingStats _mid_price_stats
+        RollingStats _log_return_stats
+        RollingStats _spread_stats
+        RollingStats _buy_volume
+        RollingStats _sell_volume
+        RollingStats _trade_notional
+
+    cdef c_update_from_order_book(self, OrderBook order_book, double timestamp)
+    cdef c_add_trade(self, double timestamp, double price, double amount, bint is_buy)
+    cdef c_evict(self, double timestamp)
+    cdef double c_get_realized_volatility(self)
+    cdef double c_get_trade_flow_imbalance(self)
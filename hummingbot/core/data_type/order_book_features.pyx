@@ -0,0 +1,262 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+
+from cython.operator cimport(
+    preincrement as inc,
+    dereference as deref,
+)
+from libc.math cimport (
+    log,
+    sqrt,
+)
+from libcpp.set cimport set
+from typing import Dict
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.rolling_statistics import (
+    RollingStats,
+    WindowedExtrema,
+)
+
+NaN = float("nan")
+
+
+cdef class OrderBookFeatures:
+    """
+    Market signals of one trading pair, derived from its order book and trade stream:
+
+    - top of book values: mid price, microprice, spread and depth imbalance
+    - mid price max / min / mean and realized volatility over the rolling window
+    - trade flow over the rolling window: buy and sell volume, VWAP and buy / sell imbalance
+
+    The top of book values are recomputed on every update. The mid price and spread are sampled into the rolling
+    windows once per sample interval, and trades are added as they happen. Every update costs O(depth levels), and
+    every sample and trade O(1) amortized, however large the window is.
+    """
+
+    def __init__(self, window: float = 60.0, sample_interval: float = 1.0, depth_levels: int = 5):
+        """
+        :param window: Length of the rolling windows in seconds
+        :param sample_interval: Time between two mid price and spread samples in seconds
+        :param depth_levels: Number of price levels per side that the depth imbalance is computed from
+        """
+        self._window = window
+        self._sample_interval = sample_interval
+        self._depth_levels = depth_levels
+        self._last_update_timestamp = NaN
+        self._next_sample_timestamp = 0
+        self._best_bid = NaN
+        self._best_ask = NaN
+        self._mid_price = NaN
+        self._microprice = NaN
+        self._spread = NaN
+        self._depth_imbalance = NaN
+        self._last_sampled_mid_price = NaN
+        self._mid_price_extrema = WindowedExtrema(max_age=window)
+        self._mid_price_stats = RollingStats(max_age=window)
+        self._log_return_stats = RollingStats(max_age=window)
+        self._spread_stats = RollingStats(max_age=window)
+        self._buy_volume = RollingStats(max_age=window)
+        self._sell_volume = RollingStats(max_age=window)
+        self._trade_notional = RollingStats(max_age=window)
+
+    @property
+    def window(self) -> float:
+        return self._window
+
+    @property
+    def last_update_timestamp(self) -> float:
+        return self._last_update_timestamp
+
+    @property
+    def best_bid(self) -> float:
+        return self._best_bid
+
+    @property
+    def best_ask(self) -> float:
+        return self._best_ask
+
+    @property
+    def mid_price(self) -> float:
+        return self._mid_price
+
+    @property
+    def microprice(self) -> float:
+        """
+        Mid price weighted by the volume on the opposite side of the top of the book - it leans towards the side
+        that's more likely to be taken out next.
+        """
+        return self._microprice
+
+    @property
+    def spread(self) -> float:
+        return self._spread
+
+    @property
+    def depth_imbalance(self) -> float:
+        """
+        (bid volume - ask volume) / (bid volume + ask volume) over the top depth levels, from -1 to 1.
+        """
+        return self._depth_imbalance
+
+    @property
+    def mid_price_max(self) -> float:
+        cdef object value = self._mid_price_extrema.c_get_max()
+        return NaN if value is None else value
+
+    @property
+    def mid_price_min(self) -> float:
+        cdef object value = self._mid_price_extrema.c_get_min()
+        return NaN if value is None else value
+
+    @property
+    def mid_price_mean(self) -> float:
+        return self._mid_price_stats.c_get_mean()
+
+    @property
+    def mid_price_std(self) -> float:
+        return self._mid_price_stats.c_get_std()
+
+    @property
+    def spread_mean(self) -> float:
+        return self._spread_stats.c_get_mean()
+
+    @property
+    def realized_volatility(self) -> float:
+        """
+        Square root of the sum of the squared log returns of the mid price samples in the window.
+        """
+        return self.c_get_realized_volatility()
+
+    @property
+    def buy_volume(self) -> float:
+        return self._buy_volume.c_get_sum()
+
+    @property
+    def sell_volume(self) -> float:
+        return self._sell_volume.c_get_sum()
+
+    @property
+    def trade_count(self) -> int:
+        return self._buy_volume.count + self._sell_volume.count
+
+    @property
+    def trade_vwap(self) -> float:
+        cdef double volume = self._buy_volume.c_get_sum() + self._sell_volume.c_get_sum()
+        return self._trade_notional.c_get_sum() / volume if volume > 0 else NaN
+
+    @property
+    def trade_flow_imbalance(self) -> float:
+        """
+        (buy volume - sell volume) / (buy volume + sell volume) over the window, from -1 to 1.
+        """
+        return self.c_get_trade_flow_imbalance()
+
+    def update_from_order_book(self, order_book: OrderBook, timestamp: float):
+        self.c_update_from_order_book(order_book, timestamp)
+
+    def add_trade(self, timestamp: float, price: float, amount: float, is_buy: bool):
+        self.c_add_trade(timestamp, price, amount, is_buy)
+
+    def evict(self, timestamp: float):
+        self.c_evict(timestamp)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "mid_price": self.mid_price,
+            "microprice": self.microprice,
+            "spread": self.spread,
+            "depth_imbalance": self.depth_imbalance,
+            "mid_price_max": self.mid_price_max,
+            "mid_price_min": self.mid_price_min,
+            "mid_price_mean": self.mid_price_mean,
+            "spread_mean": self.spread_mean,
+            "realized_volatility": self.realized_volatility,
+            "buy_volume": self.buy_volume,
+            "sell_volume": self.sell_volume,
+            "trade_vwap": self.trade_vwap,
+            "trade_flow_imbalance": self.trade_flow_imbalance,
+        }
+
+    cdef c_update_from_order_book(self, OrderBook order_book, double timestamp):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = order_book._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = order_book._ask_book.begin()
+            double best_bid_volume
+            double best_ask_volume
+            double bid_depth = 0
+            double ask_depth = 0
+            int level = 0
+
+        self._last_update_timestamp = timestamp
+        if bid_it == order_book._bid_book.rend() or ask_it == order_book._ask_book.end():
+            self._best_bid = self._best_ask = self._mid_price = self._microprice = self._spread = NaN
+            self._depth_imbalance = NaN
+            self.c_evict(timestamp)
+            return
+
+        self._best_bid = deref(bid_it).getPrice()
+        self._best_ask = deref(ask_it).getPrice()
+        best_bid_volume = deref(bid_it).getAmount()
+        best_ask_volume = deref(ask_it).getAmount()
+        self._mid_price = (self._best_bid + self._best_ask) / 2
+        self._spread = self._best_ask - self._best_bid
+        if best_bid_volume + best_ask_volume > 0:
+            self._microprice = ((self._best_bid * best_ask_volume + self._best_ask * best_bid_volume) /
+                                (best_bid_volume + best_ask_volume))
+        else:
+            self._microprice = self._mid_price
+
+        while level < self._depth_levels and bid_it != order_book._bid_book.rend():
+            bid_depth += deref(bid_it).getAmount()
+            inc(bid_it)
+            level += 1
+        level = 0
+        while level < self._depth_levels and ask_it != order_book._ask_book.end():
+            ask_depth += deref(ask_it).getAmount()
+            inc(ask_it)
+            level += 1
+        self._depth_imbalance = (bid_depth - ask_depth) / (bid_depth + ask_depth) if bid_depth + ask_depth > 0 else 0
+
+        if timestamp >= self._next_sample_timestamp:
+            self._next_sample_timestamp = (timestamp // self._sample_interval + 1) * self._sample_interval
+            self._mid_price_extrema.c_add(timestamp, self._mid_price)
+            self._mid_price_stats.c_add(timestamp, self._mid_price)
+            self._spread_stats.c_add(timestamp, self._spread)
+            if self._last_sampled_mid_price > 0 and self._mid_price > 0:
+                self._log_return_stats.c_add(timestamp, log(self._mid_price / self._last_sampled_mid_price))
+            self._last_sampled_mid_price = self._mid_price
+        self.c_evict(timestamp)
+
+    cdef c_add_trade(self, double timestamp, double price, double amount, bint is_buy):
+        if is_buy:
+            self._buy_volume.c_add(timestamp, amount)
+        else:
+            self._sell_volume.c_add(timestamp, amount)
+        self._trade_notional.c_add(timestamp, price * amount)
+
+    cdef c_evict(self, double timestamp):
+        self._mid_price_extrema.c_evict(timestamp)
+        self._mid_price_stats.c_evict(timestamp)
+        self._log_return_stats.c_evict(timestamp)
+        self._spread_stats.c_evict(timestamp)
+        self._buy_volume.c_evict(timestamp)
+        self._sell_volume.c_evict(timestamp)
+        self._trade_notional.c_evict(timestamp)
+
+    cdef double c_get_realized_volatility(self):
+        cdef:
+            long long count = self._log_return_stats._count
+            double mean = self._log_return_stats._mean
+        if count < 1:
+            return NaN
+        # Sum of squares from the running moments: M2 + n * mean^2.
+        return sqrt(max(self._log_return_stats._m2, 0.0) + count * mean * mean)
+
+    cdef double c_get_trade_flow_imbalance(self):
+        cdef:
+            double buy_volume = self._buy_volume.c_get_sum()
+            double sell_volume = self._sell_volume.c_get_sum()
+        if buy_volume + sell_volume <= 0:
+            return NaN
+        return (buy_volume - sell_volume) / (buy_volume + sell_volume)
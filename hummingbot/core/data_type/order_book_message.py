@@ -41,6 +41,15 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
         else:
             return -1
 
+    @property
+    def first_update_id(self) -> int:
+        """
+        First update ID covered by a diff message. For exchanges that don't report it, this is the same as update_id.
+        """
+        if self.type is OrderBookMessageType.DIFF:
+            return self.content.get("first_update_id", self.update_id)
+        return self.update_id
+
     @property
     def trade_id(self) -> int:
         if self.type is OrderBookMessageType.TRADE:
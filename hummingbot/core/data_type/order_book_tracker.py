@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 import asyncio
 from abc import abstractmethod, ABC
-from collections import deque
+from collections import (
+    deque,
+    defaultdict
+)
 from enum import Enum
 import logging
 import pandas as pd
@@ -15,11 +18,22 @@ from typing import (
     Tuple,
     List)
 
-from hummingbot.core.event.events import OrderBookTradeEvent, TradeType
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_features import OrderBookFeatures
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.metrics import (
+    GaugeSample,
+    MetricsRegistry,
+)
+from hummingbot.core.utils.warm_cache import WarmCache
 from .order_book_message import (
     OrderBookMessageType,
     OrderBookMessage,
@@ -37,6 +51,14 @@ class OrderBookTrackerDataSourceType(Enum):
 
 class OrderBookTracker(ABC):
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_BUFFER_SIZE: int = 1000
+    RESYNC_RETRY_INTERVAL: float = 5.0
+    WARM_CACHE_SAVE_INTERVAL: float = 60.0
+    ORDER_BOOK_FEATURES_WINDOW: float = 60.0
+    ORDER_BOOK_FEATURES_SAMPLE_INTERVAL: float = 1.0
+    # Trackers that apply snapshots and diffs through _apply_snapshot_message() and _apply_diff_message() can seed
+    # their order books from the warm cache. The others would never reconcile the seeded books.
+    SUPPORTS_WARM_CACHE: bool = False
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -65,20 +87,59 @@ class OrderBookTracker(ABC):
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
 
+        # Diff messages held back while a trading pair is waiting for a resync snapshot after a sequence gap.
+        self._resync_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._resync_start_timestamps: Dict[str, float] = {}
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._resync_counts: Dict[str, int] = defaultdict(int)
+        self._last_resync_durations: Dict[str, float] = {}
+        self._total_resync_durations: Dict[str, float] = defaultdict(float)
+
+        # Order books seeded from the warm cache, which are not trustworthy until a fresh snapshot has been applied.
+        self._provisional_trading_pairs: Set[str] = set()
+        self._warm_cache_save_task: Optional[asyncio.Task] = None
+
+        # Rolling order book and trade flow features, only for the trading pairs they've been requested for.
+        self._order_book_features: Dict[str, OrderBookFeatures] = {}
+        self._order_book_feature_trade_forwarders: Dict[str, EventForwarder] = {}
+        # The order book object each trade forwarder is listening to.
+        self._order_book_feature_sources: Dict[str, OrderBook] = {}
+        self._order_book_features_task: Optional[asyncio.Task] = None
+
+        metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance()
+        if metrics is not None:
+            metrics.add_collector(self._collect_metrics)
+
     @property
     @abstractmethod
     def data_source(self) -> OrderBookTrackerDataSource:
         raise NotImplementedError
 
+    @property
+    def exchange_name(self) -> str:
+        raise NotImplementedError
+
     @property
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def provisional_trading_pairs(self) -> Set[str]:
+        """
+        Trading pairs whose order books were seeded from the warm cache and haven't been reconciled with a fresh
+        snapshot yet.
+        """
+        return self._provisional_trading_pairs
+
     @property
     def ready(self) -> bool:
         trading_pairs: List[str] = self.data_source._trading_pairs or []
+        # Order books seeded from the warm cache may be stale, they don't count until a fresh snapshot is applied.
+        live_order_book_count: int = len([trading_pair for trading_pair in self._order_books.keys()
+                                          if trading_pair not in self._provisional_trading_pairs])
         # if no trading_pairs wait for at least 1 order book else wait for trading_pairs
-        return len(trading_pairs) <= len(self._order_books) and len(self._order_books) > 0
+        return len(trading_pairs) <= live_order_book_count and live_order_book_count > 0
 
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
@@ -87,8 +148,122 @@ class OrderBookTracker(ABC):
             for trading_pair, order_book in self._order_books.items()
         }
 
+    @property
+    def resync_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Per trading pair counters for diff stream sequence gaps and the snapshot resyncs that repaired them.
+        """
+        trading_pairs: Set[str] = set(self._sequence_gap_counts.keys()) | set(self._resync_counts.keys())
+        return {
+            trading_pair: {
+                "sequence_gaps": self._sequence_gap_counts[trading_pair],
+                "resyncs": self._resync_counts[trading_pair],
+                "resync_pending": trading_pair in self._resync_buffers,
+                "last_resync_duration": self._last_resync_durations.get(trading_pair, 0.0),
+                "total_resync_duration": self._total_resync_durations[trading_pair],
+            }
+            for trading_pair in trading_pairs
+        }
+
+    def get_order_book_features(self, trading_pair: str) -> Optional[OrderBookFeatures]:
+        """
+        Rolling mid price, microprice, spread, depth imbalance, volatility and trade flow features of a trading pair.
+        Features are computed from the first time they are requested for a trading pair - the rolling values cover
+        at most the time since then.
+
+        :return: the features, or None if the trading pair's order book isn't being tracked (yet)
+        """
+        features: Optional[OrderBookFeatures] = self._order_book_features.get(trading_pair)
+        if features is not None:
+            self._start_order_book_features_task()
+            return features
+        order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+        if order_book is None:
+            return None
+
+        features = OrderBookFeatures(window=self.ORDER_BOOK_FEATURES_WINDOW,
+                                     sample_interval=self.ORDER_BOOK_FEATURES_SAMPLE_INTERVAL)
+        features.update_from_order_book(order_book, time.time())
+
+        def add_trade(trade: OrderBookTradeEvent):
+            features.add_trade(time.time(), trade.price, trade.amount, trade.type is TradeType.BUY)
+
+        self._order_book_features[trading_pair] = features
+        self._order_book_feature_trade_forwarders[trading_pair] = EventForwarder(add_trade)
+        self._attach_order_book_features(trading_pair, order_book)
+        self._start_order_book_features_task()
+        return features
+
+    def _attach_order_book_features(self, trading_pair: str, order_book: OrderBook):
+        """
+        Moves the trade forwarder of a trading pair's features over to its current order book object, which is
+        replaced whenever the trading pair starts being tracked again.
+        """
+        previous_order_book: Optional[OrderBook] = self._order_book_feature_sources.get(trading_pair)
+        if previous_order_book is order_book:
+            return
+        trade_forwarder: EventForwarder = self._order_book_feature_trade_forwarders[trading_pair]
+        if previous_order_book is not None:
+            previous_order_book.remove_listener(OrderBookEvent.TradeEvent, trade_forwarder)
+        order_book.add_listener(OrderBookEvent.TradeEvent, trade_forwarder)
+        self._order_book_feature_sources[trading_pair] = order_book
+
+    def _start_order_book_features_task(self):
+        # The sampler only runs while the tracker does - start() picks up the features requested before then.
+        if self._refresh_tracking_task is None:
+            return
+        if self._order_book_features_task is None or self._order_book_features_task.done():
+            self._order_book_features_task = safe_ensure_future(self._order_book_features_loop())
+
+    async def _order_book_features_loop(self):
+        """
+        Samples the order books into their features. Trades are added to the features as they arrive.
+        """
+        while True:
+            try:
+                now: float = time.time()
+                for trading_pair, features in self._order_book_features.items():
+                    order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+                    if order_book is not None:
+                        # Some trackers replace the order book objects in their own tracking refreshes.
+                        self._attach_order_book_features(trading_pair, order_book)
+                        features.update_from_order_book(order_book, now)
+                await asyncio.sleep(self.ORDER_BOOK_FEATURES_SAMPLE_INTERVAL -
+                                    time.time() % self.ORDER_BOOK_FEATURES_SAMPLE_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Unexpected error updating order book features.", exc_info=True)
+                await asyncio.sleep(self.ORDER_BOOK_FEATURES_SAMPLE_INTERVAL)
+
+    @property
+    def queue_sizes(self) -> Dict[str, int]:
+        """
+        Number of messages waiting in each of the tracker's streams. Growing queues mean the tracker can't keep up with
+        the exchange.
+        """
+        return {
+            "diff": self._order_book_diff_stream.qsize(),
+            "snapshot": self._order_book_snapshot_stream.qsize(),
+            "trade": self._order_book_trade_stream.qsize(),
+            "tracking": sum(queue.qsize() for queue in self._tracking_message_queues.values()),
+            "resync_buffer": sum(len(buffer) for buffer in self._resync_buffers.values()),
+        }
+
+    def _collect_metrics(self) -> List[GaugeSample]:
+        try:
+            exchange_name: str = self.exchange_name
+        except NotImplementedError:
+            exchange_name = self.__class__.__name__
+        return [("order_book_tracker_queue_size", {"exchange": exchange_name, "stream": stream}, size)
+                for stream, size in self.queue_sizes.items()]
+
     def start(self):
         self.stop()
+        warm_cache: Optional[WarmCache] = WarmCache.shared_instance() if self.SUPPORTS_WARM_CACHE else None
+        if warm_cache is not None:
+            self._seed_from_warm_cache(warm_cache)
+            self._warm_cache_save_task = safe_ensure_future(self._warm_cache_save_loop(warm_cache))
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
@@ -110,11 +285,20 @@ class OrderBookTracker(ABC):
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
+        if len(self._order_book_features) > 0:
+            self._start_order_book_features_task()
 
     def stop(self):
+        if self._warm_cache_save_task is not None:
+            self._warm_cache_save_task.cancel()
+            self._warm_cache_save_task = None
+            self._save_to_warm_cache(WarmCache.shared_instance())
         if self._emit_trade_event_task is not None:
             self._emit_trade_event_task.cancel()
             self._emit_trade_event_task = None
+        if self._order_book_features_task is not None:
+            self._order_book_features_task.cancel()
+            self._order_book_features_task = None
         if self._refresh_tracking_task is not None:
             self._refresh_tracking_task.cancel()
             self._refresh_tracking_task = None
@@ -140,6 +324,13 @@ class OrderBookTracker(ABC):
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        if len(self._resync_tasks) > 0:
+            for _, task in self._resync_tasks.items():
+                task.cancel()
+            self._resync_tasks.clear()
+        self._resync_buffers.clear()
+        self._resync_start_timestamps.clear()
+        self._provisional_trading_pairs.clear()
 
     async def _refresh_tracking_tasks(self):
         """
@@ -147,15 +338,18 @@ class OrderBookTracker(ABC):
         """
         tracking_trading_pairs: Set[str] = set([key for key in self._tracking_tasks.keys()
                                                 if not self._tracking_tasks[key].done()])
+        if len(self._provisional_trading_pairs) > 0:
+            trading_pairs: List[str] = await self.data_source.get_trading_pairs()
+            if set(trading_pairs) <= tracking_trading_pairs:
+                # Every trading pair was seeded from the warm cache, and is being reconciled in the background.
+                return
         available_pairs: Dict[str, OrderBookTrackerEntry] = await self.data_source.get_tracking_pairs()
         available_trading_pairs: Set[str] = set(available_pairs.keys())
         new_trading_pairs: Set[str] = available_trading_pairs - tracking_trading_pairs
         deleted_trading_pairs: Set[str] = tracking_trading_pairs - available_trading_pairs
 
         for trading_pair in new_trading_pairs:
-            self._order_books[trading_pair] = available_pairs[trading_pair].order_book
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+            self._start_tracking(trading_pair, available_pairs[trading_pair].order_book)
             self.logger().info("Started order book tracking for %s." % trading_pair)
 
         for trading_pair in deleted_trading_pairs:
@@ -163,8 +357,64 @@ class OrderBookTracker(ABC):
             del self._tracking_tasks[trading_pair]
             del self._order_books[trading_pair]
             del self._tracking_message_queues[trading_pair]
+            if trading_pair in self._resync_tasks:
+                self._resync_tasks.pop(trading_pair).cancel()
+            self._resync_buffers.pop(trading_pair, None)
+            self._resync_start_timestamps.pop(trading_pair, None)
+            self._provisional_trading_pairs.discard(trading_pair)
             self.logger().info("Stopped order book tracking for %s." % trading_pair)
 
+    def _start_tracking(self, trading_pair: str, order_book: OrderBook):
+        self._order_books[trading_pair] = order_book
+        if trading_pair in self._order_book_features:
+            self._attach_order_book_features(trading_pair, order_book)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+
+    def _seed_from_warm_cache(self, warm_cache: WarmCache):
+        """
+        Starts tracking the order books saved by the last run right away. They are marked provisional, and each one
+        gets a background snapshot fetch to reconcile it with the exchange.
+        """
+        try:
+            cached_order_books: Dict[str, OrderBook] = warm_cache.load_order_books(
+                self.exchange_name, self.data_source.order_book_create_function
+            )
+        except Exception:
+            self.logger().error("Error loading order books from the warm cache.", exc_info=True)
+            return
+        trading_pairs: Optional[List[str]] = self.data_source._trading_pairs
+        for trading_pair, order_book in cached_order_books.items():
+            if trading_pairs and trading_pair not in trading_pairs:
+                continue
+            self._start_tracking(trading_pair, order_book)
+            self._provisional_trading_pairs.add(trading_pair)
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+            self.logger().info(f"Started order book tracking for {trading_pair} from the warm cache.")
+
+    def _save_to_warm_cache(self, warm_cache: Optional[WarmCache]):
+        if warm_cache is None:
+            return
+        order_books: Dict[str, OrderBook] = {trading_pair: order_book
+                                             for trading_pair, order_book in self._order_books.items()
+                                             if trading_pair not in self._provisional_trading_pairs}
+        if len(order_books) > 0:
+            warm_cache.save(f"{self.exchange_name}_order_books", warm_cache.order_books_to_json(order_books))
+
+    async def _warm_cache_save_loop(self, warm_cache: WarmCache):
+        while True:
+            try:
+                await asyncio.sleep(self.WARM_CACHE_SAVE_INTERVAL)
+                order_books: Dict[str, OrderBook] = {trading_pair: order_book
+                                                     for trading_pair, order_book in self._order_books.items()
+                                                     if trading_pair not in self._provisional_trading_pairs}
+                if len(order_books) > 0:
+                    await warm_cache.save_order_books(self.exchange_name, order_books)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().error("Error saving order books to the warm cache.", exc_info=True)
+
     async def _refresh_tracking_loop(self):
         """
         Refreshes the tracking of new markets, removes inactive markets, every once in a while.
@@ -239,6 +489,123 @@ class OrderBookTracker(ABC):
                 self.logger().error("Unknown error. Retrying after 5 seconds.", exc_info=True)
                 await asyncio.sleep(5.0)
 
+    def _is_diff_in_sequence(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks whether a diff message directly follows the last update applied to the order book.
+        Exchanges with sequenced diff streams should override this; the default accepts every diff.
+        """
+        return True
+
+    def _is_diff_stale(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks whether a diff message only covers updates that have already been applied to the order book. Stale diffs
+        are dropped before the sequence check. Exchanges with sequenced diff streams should override this; the default
+        treats no diff as stale.
+        """
+        return False
+
+    def _apply_diff_message(self,
+                            trading_pair: str,
+                            order_book: OrderBook,
+                            message: OrderBookMessage,
+                            past_diffs_window: Deque[OrderBookMessage]) -> bool:
+        """
+        Applies a diff message to the order book, unless the book is waiting for a resync or the diff does not follow
+        the last applied update. In both of those cases the diff is buffered instead. Stale diffs are dropped.
+        :return: True if the diff was applied to the order book
+        """
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.get(trading_pair)
+        if resync_buffer is not None:
+            resync_buffer.append(message)
+            return False
+        if self._is_diff_stale(order_book, message):
+            return False
+        if not self._is_diff_in_sequence(order_book, message):
+            self._start_order_book_resync(trading_pair, order_book, message)
+            return False
+
+        order_book.apply_diffs(message.bids, message.asks, message.update_id)
+        past_diffs_window.append(message)
+        while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
+            past_diffs_window.popleft()
+        return True
+
+    def _apply_snapshot_message(self,
+                                trading_pair: str,
+                                order_book: OrderBook,
+                                message: OrderBookMessage,
+                                past_diffs_window: Deque[OrderBookMessage]):
+        """
+        Applies a snapshot message to the order book. If the book is waiting for a resync, the buffered diffs newer
+        than the snapshot are replayed on top of it.
+        """
+        self._provisional_trading_pairs.discard(trading_pair)
+        resync_buffer: Optional[Deque[OrderBookMessage]] = self._resync_buffers.pop(trading_pair, None)
+        if resync_buffer is None:
+            past_diffs: List[OrderBookMessage] = list(past_diffs_window)
+            order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+            return
+
+        order_book.apply_snapshot(message.bids, message.asks, message.update_id)
+        past_diffs_window.clear()
+        while len(resync_buffer) > 0:
+            diff_message: OrderBookMessage = resync_buffer.popleft()
+            if diff_message.update_id <= message.update_id:
+                continue
+            self._apply_diff_message(trading_pair, order_book, diff_message, past_diffs_window)
+            if trading_pair in self._resync_buffers:
+                # The snapshot is older than the gap, a new resync has been started from this diff.
+                self._resync_buffers[trading_pair].extend(resync_buffer)
+                return
+
+        resync_duration: float = time.time() - self._resync_start_timestamps.pop(trading_pair, time.time())
+        self._resync_counts[trading_pair] += 1
+        self._last_resync_durations[trading_pair] = resync_duration
+        self._total_resync_durations[trading_pair] += resync_duration
+        self.logger().info(f"Resynced order book for {trading_pair} in {resync_duration:.3f} seconds.")
+
+    def _start_order_book_resync(self, trading_pair: str, order_book: OrderBook, message: OrderBookMessage):
+        """
+        Starts buffering diff messages for a trading pair and schedules a fresh snapshot fetch for it.
+        """
+        self._resync_buffers[trading_pair] = deque([message], maxlen=self.RESYNC_BUFFER_SIZE)
+        self._sequence_gap_counts[trading_pair] += 1
+        if trading_pair not in self._resync_start_timestamps:
+            self._resync_start_timestamps[trading_pair] = time.time()
+        self.logger().warning(f"Order book diff sequence gap detected for {trading_pair} "
+                              f"(last update ID: {max(order_book.snapshot_uid, order_book.last_diff_uid)}, "
+                              f"next diff update ID: {message.update_id}). Resyncing from a new snapshot.")
+        resync_task: Optional[asyncio.Task] = self._resync_tasks.get(trading_pair)
+        if resync_task is None or resync_task.done():
+            self._resync_tasks[trading_pair] = safe_ensure_future(self._resync_order_book(trading_pair))
+
+    async def _resync_order_book(self, trading_pair: str):
+        """
+        Fetches a fresh snapshot for a single trading pair and routes it to the pair's tracking task, which replays
+        the buffered diffs on top of it.
+        """
+        while trading_pair in self._resync_buffers or trading_pair in self._provisional_trading_pairs:
+            try:
+                snapshot_message: OrderBookMessage = await self.data_source.get_snapshot_message(trading_pair)
+                message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(trading_pair)
+                if message_queue is not None:
+                    await message_queue.put(snapshot_message)
+                return
+            except asyncio.CancelledError:
+                raise
+            except NotImplementedError:
+                self.logger().warning(f"Order book data source does not support single pair snapshots. "
+                                      f"Waiting for the next periodic snapshot to reconcile {trading_pair}.")
+                return
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error fetching resync snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Unexpected error resyncing order book. "
+                                    f"Retrying after {self.RESYNC_RETRY_INTERVAL:.0f} seconds."
+                )
+                await asyncio.sleep(self.RESYNC_RETRY_INTERVAL)
+
     async def _track_single_book(self, trading_pair: str):
         past_diffs_window: Deque[OrderBookMessage] = deque()
         self._past_diffs_windows[trading_pair] = past_diffs_window
@@ -252,11 +619,8 @@ class OrderBookTracker(ABC):
             try:
                 message: OrderBookMessage = await message_queue.get()
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    if self._apply_diff_message(trading_pair, order_book, message, past_diffs_window):
+                        diff_messages_accepted += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -266,8 +630,7 @@ class OrderBookTracker(ABC):
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._apply_snapshot_message(trading_pair, order_book, message, past_diffs_window)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
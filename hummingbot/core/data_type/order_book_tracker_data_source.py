@@ -13,6 +13,7 @@ from typing import (
 )
 
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 
 
@@ -41,6 +42,14 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         raise NotImplementedError
 
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Fetches a fresh order book snapshot for a single trading pair. The order book tracker uses this to resync a
+        book after a gap in the diff stream. Data sources that can't do this leave the resync to the periodic
+        snapshots.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         """
@@ -0,0 +1,21 @@
+#!/usr/bin/env python
+
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+    NamedTuple,
+)
+
+from hummingbot.core.event.events import OrderType
+
+
+class OrderRequest(NamedTuple):
+    """
+    A single order in a batch submitted through MarketBase.batch_submit_orders().
+    """
+    is_buy: bool
+    amount: Decimal
+    order_type: OrderType
+    price: Decimal
+    kwargs: Dict[str, Any] = {}
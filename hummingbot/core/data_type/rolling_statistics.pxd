@@ -0,0 +1,41 @@
+# distutils: language=c++
+
+cdef class RollingWindow:
+    cdef:
+        object _timestamps
+        long long _next_index
+        long long _first_index
+        int _max_length
+        double _max_age
+
+    cdef c_evict_first(self)
+    cdef c_evict(self, double timestamp)
+
+
+cdef class WindowedExtrema(RollingWindow):
+    cdef:
+        object _values
+        object _max_deque
+        object _min_deque
+        int _nan_count
+
+    cdef c_add(self, double timestamp, object value)
+    cdef object c_get_max(self)
+    cdef object c_get_min(self)
+    cdef object c_get_last(self)
+    cdef bint c_has_nan(self)
+
+
+cdef class RollingStats(RollingWindow):
+    cdef:
+        object _values
+        long long _count
+        double _mean
+        double _m2
+        double _sum
+
+    cdef c_add(self, double timestamp, double value)
+    cdef double c_get_mean(self)
+    cdef double c_get_variance(self)
+    cdef double c_get_std(self)
+    cdef double c_get_sum(self)
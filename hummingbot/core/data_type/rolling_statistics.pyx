@@ -0,0 +1,226 @@
+# distutils: language=c++
+
+from collections import deque
+from libc.math cimport sqrt
+
+NaN = float("nan")
+
+
+cdef class RollingWindow:
+    """
+    Sliding window of timestamped samples, bounded by sample count, by age, or both. Subclasses keep their running
+    values up to date as samples enter and leave the window, so every sample costs O(1) amortized however large the
+    window is.
+
+    Age based eviction happens when samples are added. Callers that read a window that may not have received samples
+    for a while should call evict() with the current time first.
+    """
+
+    def __init__(self, max_length: int = 0, max_age: float = 0.0):
+        """
+        :param max_length: Maximum number of samples in the window, 0 for no limit
+        :param max_age: Maximum age of the samples in the window in seconds, 0 for no limit
+        """
+        if max_length <= 0 and max_age <= 0:
+            raise ValueError("A rolling window needs a max length, a max age, or both.")
+        self._timestamps = deque()
+        self._next_index = 0
+        self._first_index = 0
+        self._max_length = max_length
+        self._max_age = max_age
+
+    def __len__(self) -> int:
+        return self._next_index - self._first_index
+
+    @property
+    def max_length(self) -> int:
+        return self._max_length
+
+    @property
+    def max_age(self) -> float:
+        return self._max_age
+
+    def evict(self, timestamp: float):
+        self.c_evict(timestamp)
+
+    cdef c_evict_first(self):
+        self._timestamps.popleft()
+        self._first_index += 1
+
+    cdef c_evict(self, double timestamp):
+        cdef:
+            double min_timestamp = timestamp - self._max_age
+        if self._max_length > 0:
+            while self._next_index - self._first_index > self._max_length:
+                self.c_evict_first()
+        if self._max_age > 0:
+            while self._next_index > self._first_index and self._timestamps[0] <= min_timestamp:
+                self.c_evict_first()
+
+
+cdef class WindowedExtrema(RollingWindow):
+    """
+    Max and min of the samples in a rolling window, from a pair of monotonic deques - each sample is pushed and popped
+    at most once per deque. Samples can be any comparable type, e.g. Decimal. NaN samples are counted, but left out
+    of the extrema.
+    """
+
+    def __init__(self, max_length: int = 0, max_age: float = 0.0):
+        super().__init__(max_length, max_age)
+        self._values = deque()
+        self._max_deque = deque()
+        self._min_deque = deque()
+        self._nan_count = 0
+
+    def add(self, timestamp: float, value):
+        self.c_add(timestamp, value)
+
+    @property
+    def max(self):
+        """
+        :return: the largest sample in the window, or None if there are no samples other than NaN
+        """
+        return self.c_get_max()
+
+    @property
+    def min(self):
+        return self.c_get_min()
+
+    @property
+    def last(self):
+        return self.c_get_last()
+
+    @property
+    def nan_count(self) -> int:
+        return self._nan_count
+
+    cdef c_add(self, double timestamp, object value):
+        cdef:
+            long long index = self._next_index
+            object max_deque = self._max_deque
+            object min_deque = self._min_deque
+
+        self._timestamps.append(timestamp)
+        self._values.append(value)
+        self._next_index += 1
+        if value != value:
+            self._nan_count += 1
+        else:
+            while len(max_deque) > 0 and max_deque[-1][1] <= value:
+                max_deque.pop()
+            max_deque.append((index, value))
+            while len(min_deque) > 0 and min_deque[-1][1] >= value:
+                min_deque.pop()
+            min_deque.append((index, value))
+        self.c_evict(timestamp)
+
+    cdef c_evict_first(self):
+        cdef:
+            object value = self._values.popleft()
+        RollingWindow.c_evict_first(self)
+        if value != value:
+            self._nan_count -= 1
+        if len(self._max_deque) > 0 and self._max_deque[0][0] < self._first_index:
+            self._max_deque.popleft()
+        if len(self._min_deque) > 0 and self._min_deque[0][0] < self._first_index:
+            self._min_deque.popleft()
+
+    cdef object c_get_max(self):
+        if len(self._max_deque) < 1:
+            return None
+        return self._max_deque[0][1]
+
+    cdef object c_get_min(self):
+        if len(self._min_deque) < 1:
+            return None
+        return self._min_deque[0][1]
+
+    cdef object c_get_last(self):
+        if len(self._values) < 1:
+            return None
+        return self._values[-1]
+
+    cdef bint c_has_nan(self):
+        return self._nan_count > 0
+
+
+cdef class RollingStats(RollingWindow):
+    """
+    Count, sum, mean and sample variance of the samples in a rolling window. Welford's updates are applied as samples
+    enter and are reverted as they leave the window. NaN samples are ignored.
+    """
+
+    def __init__(self, max_length: int = 0, max_age: float = 0.0):
+        super().__init__(max_length, max_age)
+        self._values = deque()
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum = 0.0
+
+    def add(self, timestamp: float, value: float):
+        self.c_add(timestamp, value)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        return self.c_get_mean()
+
+    @property
+    def variance(self) -> float:
+        return self.c_get_variance()
+
+    @property
+    def std(self) -> float:
+        return self.c_get_std()
+
+    @property
+    def sum(self) -> float:
+        return self.c_get_sum()
+
+    cdef c_add(self, double timestamp, double value):
+        cdef:
+            double delta
+        if value != value:
+            return
+        self._timestamps.append(timestamp)
+        self._values.append(value)
+        self._next_index += 1
+        self._count += 1
+        self._sum += value
+        delta = value - self._mean
+        self._mean += delta / self._count
+        self._m2 += delta * (value - self._mean)
+        self.c_evict(timestamp)
+
+    cdef c_evict_first(self):
+        cdef:
+            double value = self._values.popleft()
+            double delta
+        RollingWindow.c_evict_first(self)
+        self._count -= 1
+        if self._count == 0:
+            # Start over from exact zeros, so rounding errors don't accumulate over the life of the window.
+            self._mean = self._m2 = self._sum = 0.0
+            return
+        self._sum -= value
+        delta = value - self._mean
+        self._mean -= delta / self._count
+        self._m2 -= delta * (value - self._mean)
+
+    cdef double c_get_mean(self):
+        return self._mean if self._count > 0 else NaN
+
+    cdef double c_get_variance(self):
+        if self._count < 2:
+            return NaN
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    cdef double c_get_std(self):
+        return sqrt(self.c_get_variance())
+
+    cdef double c_get_sum(self):
+        return self._sum
@@ -51,6 +51,7 @@ class ERC20WatcherEvent(Enum):
 
 class OrderBookEvent(Enum):
     TradeEvent = 901
+    TradeBatchEvent = 902
 
 
 class ZeroExEvent(Enum):
@@ -228,6 +229,13 @@ class OrderBookTradeEvent(NamedTuple):
     amount: Decimal
 
 
+class OrderBookTradeBatchEvent(NamedTuple):
+    trading_pair: str
+    # numpy structured array of the trades since the last batch, with the fields of
+    # order_book.TRADE_BATCH_DTYPE: timestamp, price, amount, is_buy
+    trades: any
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
@@ -17,11 +17,18 @@ ctypedef pair[int64_t, EventListenersCollection] EventsPair
 cdef class PubSub:
     cdef:
         Events _events
+        unordered_map[int64_t, int64_t] _dispatch_counts
+        dict _listener_snapshots
+        bint _has_dead_listeners
+        object _dead_listener_callback
         object __weakref__
 
     cdef c_log_exception(self, int64_t event_tag, object arg)
+    cdef object c_find_listener_weakref(self, int64_t event_tag, EventListener listener)
     cdef c_add_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener)
     cdef c_remove_dead_listeners(self, int64_t event_tag)
+    cdef c_remove_all_dead_listeners(self)
+    cdef c_update_listener_snapshot(self, int64_t event_tag)
     cdef c_get_listeners(self, int64_t event_tag)
     cdef c_trigger_event(self, int64_t event_tag, object arg)
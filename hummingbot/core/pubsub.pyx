@@ -14,8 +14,10 @@ from cython.operator cimport (
 from libcpp.vector cimport vector
 from enum import Enum
 import logging
-import random
-from typing import List
+from typing import (
+    Dict,
+    List,
+)
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.event_listener import EventListener
@@ -26,25 +28,20 @@ class_logger = None
 
 cdef class PubSub:
     """
-    PubSub with weak references. This avoids the lapsed listener problem by periodically performing GC on dead
-    event listener.
+    PubSub with weak references. This avoids the lapsed listener problem by removing dead event listeners.
+    Adding or removing a listener takes O(n).
 
-    Dead listener is done by calling c_remove_dead_listeners(), which checks whether the listener weak references are
-    alive or not, and removes the dead ones. Each call to c_remove_dead_listeners() takes O(n).
+    Every listener weak reference is created with a callback, which flags the PubSub once any of its listeners has
+    been garbage collected. The next call that reads the listeners then removes the dead ones, in O(n). So dead
+    listeners cost nothing until a listener actually dies.
 
-    Here's how the dead listener GC is performed:
+    c_trigger_event() iterates over an immutable snapshot of the listeners of the event tag, which is only rebuilt when
+    listeners are added or removed. Listeners are allowed to call c_remove_listener() while an event is being
+    dispatched, and triggering an event tag without listeners is a single dict lookup.
 
-    1. c_add_listener():
-       Randomly with ADD_LISTENER_GC_PROBABILITY. This assumes c_add_listener() is called frequently and so it doesn't
-       make sense to do the GC every time.
-    2. c_remove_listener():
-       Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    The number of events dispatched to listeners is counted per event tag, for the performance metrics.
     """
 
-    ADD_LISTENER_GC_PROBABILITY = 0.005
-
     @classmethod
     def logger(cls) -> HummingbotLogger:
         global class_logger
@@ -52,8 +49,18 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
-    def __init__(self):
-        self._events = Events()
+    def __cinit__(self, *args, **kwargs):
+        cdef:
+            object self_weakref = PyWeakref_NewRef(self, None)
+
+        def dead_listener_callback(listener_weakref):
+            pubsub = self_weakref()
+            if pubsub is not None:
+                (<PubSub>pubsub)._has_dead_listeners = True
+
+        self._listener_snapshots = {}
+        self._has_dead_listeners = False
+        self._dead_listener_callback = dead_listener_callback
 
     def add_listener(self, event_tag: Enum, listener: EventListener):
         self.c_add_listener(event_tag.value, listener)
@@ -67,15 +74,33 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    @property
+    def dispatch_counts(self) -> Dict[int, int]:
+        return self._dispatch_counts
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
+    cdef object c_find_listener_weakref(self, int64_t event_tag, EventListener listener):
+        cdef:
+            tuple listener_weakrefs = self._listener_snapshots.get(event_tag)
+            object listener_weakref
+        if listener_weakrefs is None:
+            return None
+        for listener_weakref in listener_weakrefs:
+            if <object>PyWeakref_GetObject(listener_weakref) is listener:
+                return listener_weakref
+        return None
+
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
+        if self.c_find_listener_weakref(event_tag, listener) is not None:
+            return
+
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection new_listeners
             EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
+            object listener_weakref = PyWeakref_NewRef(listener, self._dead_listener_callback)
             PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
         if it != self._events.end():
             listeners_ptr = address(deref(it).second)
@@ -83,19 +108,19 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
-
-        if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
-            self.c_remove_dead_listeners(event_tag)
+        self.c_update_listener_snapshot(event_tag)
 
     cdef c_remove_listener(self, int64_t event_tag, EventListener listener):
+        # Each listener weak reference has its own callback, so it needs to be looked up to be removed.
         cdef:
+            object listener_weakref = self.c_find_listener_weakref(event_tag, listener)
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weakref = PyWeakref_NewRef(listener, None)
-            PyRef listener_wrapper = PyRef(<PyObject *>listener_weakref)
+            PyRef listener_wrapper
             EventListenersIterator lit
-        if it == self._events.end():
+        if it == self._events.end() or listener_weakref is None:
             return
+        listener_wrapper = PyRef(<PyObject *>listener_weakref)
         listeners_ptr = address(deref(it).second)
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
@@ -122,44 +147,62 @@ cdef class PubSub:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
             self._events.erase(it)
+        self.c_update_listener_snapshot(event_tag)
 
-    cdef c_get_listeners(self, int64_t event_tag):
-        self.c_remove_dead_listeners(event_tag)
+    cdef c_remove_all_dead_listeners(self):
+        cdef:
+            int64_t event_tag
+        self._has_dead_listeners = False
+        for event_tag in list(self._listener_snapshots.keys()):
+            self.c_remove_dead_listeners(event_tag)
 
+    cdef c_update_listener_snapshot(self, int64_t event_tag):
         cdef:
             EventsIterator it = self._events.find(event_tag)
             EventListenersCollection *listeners_ptr
-            object listener_weafref
-            EventListener typed_listener
-
+            list listener_weakrefs
         if it == self._events.end():
-            return []
-
-        retval = []
+            self._listener_snapshots.pop(event_tag, None)
+            return
         listeners_ptr = address(deref(it).second)
+        listener_weakrefs = []
         for pyref in deref(listeners_ptr):
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
-            retval.append(typed_listener)
-        return retval
+            listener_weakrefs.append(<object>pyref.get())
+        self._listener_snapshots[event_tag] = tuple(listener_weakrefs)
+
+    cdef c_get_listeners(self, int64_t event_tag):
+        if self._has_dead_listeners:
+            self.c_remove_all_dead_listeners()
+
+        cdef:
+            tuple listener_weakrefs = self._listener_snapshots.get(event_tag)
+            object listener_weakref
+
+        if listener_weakrefs is None:
+            return []
+        return [<object>PyWeakref_GetObject(listener_weakref) for listener_weakref in listener_weakrefs]
 
     cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+        if self._has_dead_listeners:
+            self.c_remove_all_dead_listeners()
 
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple listener_weakrefs = self._listener_snapshots.get(event_tag)
+            object listener_weakref
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
+        if listener_weakrefs is None:
             return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+        self._dispatch_counts[event_tag] += 1
+
+        # The snapshot is immutable - listeners are allowed to call c_remove_listener(), which replaces the snapshot
+        # instead of modifying the one being iterated on here.
+        for listener_weakref in listener_weakrefs:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                # The listener was garbage collected while the event was being dispatched.
+                continue
+            typed_listener = listener
             try:
                 typed_listener.c_set_event_info(event_tag, self)
                 typed_listener.c_call(arg)
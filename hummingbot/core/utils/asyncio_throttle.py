@@ -8,6 +8,11 @@ from typing import (
     Deque
 )
 
+from hummingbot.core.utils.metrics import (
+    Histogram,
+    MetricsRegistry,
+)
+
 RequestWeight = int
 Seconds = float
 Timestamp_s = float
@@ -18,16 +23,22 @@ class Throttler:
     def __init__(self,
                  rate_limit: Tuple[RequestWeight, Seconds],
                  period_safety_margin: Seconds = 0.1,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 name: Optional[str] = None):
         """
         :param rate_limit: Max weight allowed in the given period
         :param retry_interval: Time between each limit check
+        :param name: Name of the throttler in the performance metrics. Waits of unnamed throttlers aren't recorded.
         """
         self._rate_limit_weight: int = rate_limit[0]
         self._period: float = rate_limit[1]
         self._retry_interval: float = retry_interval
         self._period_safety_margin = period_safety_margin
         self._task_logs: Deque[TaskLog] = deque()
+        self._wait_histogram: Optional[Histogram] = None
+        metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance() if name is not None else None
+        if metrics is not None:
+            self._wait_histogram = metrics.histogram("throttle_wait_seconds", throttler=name)
 
     def weighted_task(self,
                       request_weight):
@@ -35,7 +46,8 @@ class Throttler:
             rate_limit=self._rate_limit_weight,
             period=self._period,
             request_weight=request_weight,
-            task_logs=self._task_logs)
+            task_logs=self._task_logs,
+            wait_histogram=self._wait_histogram)
 
 
 class ThrottlerContextManager:
@@ -53,7 +65,8 @@ class ThrottlerContextManager:
                  request_weight: RequestWeight = 1,
                  period_safety_margin: Seconds = 0.1,
                  period: Seconds = 1.0,
-                 retry_interval: Seconds = 0.1):
+                 retry_interval: Seconds = 0.1,
+                 wait_histogram: Optional[Histogram] = None):
         """
         :param task_logs: Shared task logs
         :param rate_limit: Max weight allowed in the given period
@@ -61,6 +74,7 @@ class ThrottlerContextManager:
         :param period_safety_margin: estimate for the network latency
         :param period: Time interval of the rate limit
         :param retry_interval: Time between each limit check
+        :param wait_histogram: Records the time spent waiting for the lock and the rate limit
         """
         self._period_safety_margin = period_safety_margin
         self._lock = asyncio.Lock()
@@ -69,6 +83,7 @@ class ThrottlerContextManager:
         self._period: float = period
         self._retry_interval: float = retry_interval
         self._task_logs: Deque[TaskLog] = task_logs
+        self._wait_histogram: Optional[Histogram] = wait_histogram
 
     def flush(self):
         """
@@ -94,8 +109,11 @@ class ThrottlerContextManager:
         self._task_logs.append((time.time(), self._request_weight))
 
     async def __aenter__(self):
+        wait_start: float = time.perf_counter()
         async with self._lock:
             await self.acquire()
+        if self._wait_histogram is not None:
+            self._wait_histogram.observe(time.perf_counter() - wait_start)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
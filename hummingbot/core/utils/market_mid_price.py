@@ -2,8 +2,7 @@ import requests
 from decimal import Decimal
 from typing import Optional
 import cachetools.func
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
+from hummingbot.market.market_registry import get_market_class
 
 
 BINANCE_PRICE_URL = "https://api.binance.com/api/v3/ticker/bookTicker"
@@ -36,8 +35,9 @@ def binance_mid_price(trading_pair: str) -> Optional[Decimal]:
     resp = requests.get(url=BINANCE_PRICE_URL)
     records = resp.json()
     result = None
+    binance_market_class = get_market_class("binance")
     for record in records:
-        pair = BinanceMarket.convert_from_exchange_trading_pair(record["symbol"])
+        pair = binance_market_class.convert_from_exchange_trading_pair(record["symbol"])
         if trading_pair == pair and record["bidPrice"] is not None and record["askPrice"] is not None:
             result = (Decimal(record["bidPrice"]) + Decimal(record["askPrice"])) / Decimal("2")
             break
@@ -85,7 +85,7 @@ def bittrex_mid_price(trading_pair: str) -> Optional[Decimal]:
 
 @cachetools.func.ttl_cache(ttl=10)
 def kraken_mid_price(trading_pair: str) -> Optional[Decimal]:
-    k_pair = KrakenMarket.convert_to_exchange_trading_pair(trading_pair)
+    k_pair = get_market_class("kraken").convert_to_exchange_trading_pair(trading_pair)
     resp = requests.get(url=KRAKEN_PRICE_URL + k_pair)
     resp_json = resp.json()
     if len(resp_json["error"]) == 0:
@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+
+import asyncio
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+import logging
+from typing import (
+    Any,
+    AsyncIterable,
+    Callable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.logger import HummingbotLogger
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+# Decodes a batch of raw websocket frames into a list of ready to use messages. Must be a module level function if the
+# pool uses worker processes, so it can be pickled.
+DecodeFunction = Callable[[List[Any]], List[Any]]
+
+
+def decode_batch(decode_function: DecodeFunction, raw_frames: List[Any]) -> Tuple[List[Any], List[str]]:
+    """
+    Decodes a batch of frames in a worker. If the batch fails to decode, its frames are decoded again one at a time,
+    so only the frames that can't be decoded are dropped.
+
+    :return: (decoded messages, errors of the dropped frames)
+    """
+    try:
+        return decode_function(raw_frames), []
+    except Exception:
+        pass
+    decoded: List[Any] = []
+    errors: List[str] = []
+    for raw_frame in raw_frames:
+        try:
+            decoded.extend(decode_function([raw_frame]))
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+    return decoded, errors
+
+
+class _DecodeStream:
+    """
+    Per stream state of the decoder pool. Frames arriving while a batch is being decoded are accumulated and submitted
+    as the next batch once the worker is done, so batches grow naturally under load.
+    """
+
+    def __init__(self,
+                 pool: "MessageDecoderPool",
+                 decode_function: DecodeFunction,
+                 output: asyncio.Queue):
+        self._pool: "MessageDecoderPool" = pool
+        self._decode_function: DecodeFunction = decode_function
+        self._output: asyncio.Queue = output
+        self._frames: List[Any] = []
+        self._in_flight: Optional[asyncio.Future] = None
+
+    def add_frame(self, raw_frame: Any):
+        self._frames.append(raw_frame)
+        if self._in_flight is None or len(self._frames) >= self._pool.max_batch_size:
+            self.flush()
+
+    def flush(self):
+        if len(self._frames) == 0:
+            return
+        raw_frames: List[Any] = self._frames
+        self._frames = []
+        future: asyncio.Future = self._pool.submit(self._decode_function, raw_frames)
+        self._in_flight = future
+        future.add_done_callback(self._on_batch_done)
+        # Futures go into the output queue in submission order, so batches are delivered in stream order.
+        self._output.put_nowait(future)
+
+    def _on_batch_done(self, future: asyncio.Future):
+        if future is self._in_flight:
+            self._in_flight = None
+            self.flush()
+
+    def close(self):
+        self.flush()
+        self._output.put_nowait(None)
+
+
+class MessageDecoderPool:
+    """
+    Optional pipeline stage that moves websocket frame decompression, JSON parsing and normalization into
+    OrderBookMessage objects off the event loop, onto a pool of worker threads or processes.
+    """
+    _mdp_shared_instance: Optional["MessageDecoderPool"] = None
+    _mdp_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mdp_logger is None:
+            cls._mdp_logger = logging.getLogger(__name__)
+        return cls._mdp_logger
+
+    @classmethod
+    def shared_instance(cls) -> Optional["MessageDecoderPool"]:
+        """
+        :return: the shared decoder pool, or None if message decoding workers are disabled in the global config
+        """
+        if cls._mdp_shared_instance is None:
+            max_workers: int = int(global_config_map.get("message_decoder_workers").value or 0)
+            if max_workers <= 0:
+                return None
+            use_processes: bool = bool(global_config_map.get("message_decoder_use_processes").value)
+            cls._mdp_shared_instance = MessageDecoderPool(max_workers=max_workers, use_processes=use_processes)
+        return cls._mdp_shared_instance
+
+    def __init__(self, max_workers: int = 2, use_processes: bool = False, max_batch_size: int = 500):
+        self._max_workers: int = max_workers
+        self._use_processes: bool = use_processes
+        self._max_batch_size: int = max_batch_size
+        self._executor: Optional[Executor] = None
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self._use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        return self._executor
+
+    def submit(self, decode_function: DecodeFunction, raw_frames: List[Any]) -> asyncio.Future:
+        return self._ev_loop.run_in_executor(self.executor, decode_batch, decode_function, raw_frames)
+
+    async def decode_stream(self,
+                            raw_frames: AsyncIterable[Any],
+                            decode_function: DecodeFunction) -> AsyncIterable[List[Any]]:
+        """
+        Reads raw frames from a websocket message iterator and yields decoded batches in stream order. Frames
+        that fail to decode are logged and dropped, the rest of their batch is still delivered. An error reading the
+        websocket is raised once the batches read before it have been delivered.
+        """
+        batch_futures: asyncio.Queue = asyncio.Queue()
+        stream: _DecodeStream = _DecodeStream(self, decode_function, batch_futures)
+        read_errors: List[Exception] = []
+
+        async def read_frames():
+            try:
+                async for raw_frame in raw_frames:
+                    stream.add_frame(raw_frame)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                read_errors.append(e)
+            finally:
+                stream.close()
+
+        read_task: asyncio.Task = safe_ensure_future(read_frames())
+        try:
+            while True:
+                future: Optional[asyncio.Future] = await batch_futures.get()
+                if future is None:
+                    if len(read_errors) > 0:
+                        raise read_errors[0]
+                    break
+                batch, errors = await future
+                for error in errors:
+                    self.logger().error(f"Dropped a websocket message that could not be decoded - {error}")
+                if len(batch) > 0:
+                    yield batch
+        finally:
+            read_task.cancel()
+
+    def stop(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -0,0 +1,309 @@
+#!/usr/bin/env python
+
+from bisect import bisect_left
+from functools import lru_cache
+import logging
+import math
+import time
+import types
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+import weakref
+
+import aiohttp
+
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.logger import HummingbotLogger
+
+# Sorted (label name, label value) pairs, so that the same labels always make the same key.
+LabelSet = Tuple[Tuple[str, str], ...]
+# A point-in-time value reported by a collector: (metric name, labels, value).
+GaugeSample = Tuple[str, Dict[str, str], float]
+
+# 50us to ~6.5s, doubling - tick durations, event loop lag and REST latencies all fall well within this range.
+DEFAULT_BUCKETS: Tuple[float, ...] = tuple(0.00005 * 2 ** i for i in range(18))
+
+METRIC_DESCRIPTIONS: Dict[str, str] = {
+    "clock_tick_duration_seconds": "Time spent in c_tick() of each clock iterator.",
+    "event_loop_lag_seconds": "Delay between the scheduled and the actual start of each clock tick.",
+    "rest_request_duration_seconds": "REST API request latency per connector.",
+    "rest_request_errors_total": "REST API requests that failed without a response, per connector.",
+    "throttle_wait_seconds": "Time spent waiting for a rate limit throttler.",
+    "order_book_tracker_queue_size": "Messages waiting in the order book tracker streams.",
+    "pubsub_dispatched_events_total": "Events dispatched to listeners, per clock iterator and event tag.",
+}
+
+
+def _label_set(labels: Dict[str, str]) -> LabelSet:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _format_labels(labels: Iterable[Tuple[str, str]]) -> str:
+    formatted: List[str] = [f'{key}="{value}"'
+                            for key, value in labels]
+    return "{" + ",".join(formatted) + "}" if len(formatted) > 0 else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class Histogram:
+    """
+    Fixed bucket histogram. Observing a value is a binary search and an increment, so it's cheap enough to run on
+    every tick and every request.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._buckets: Tuple[float, ...] = buckets
+        # The last count is the +Inf bucket.
+        self._counts: List[int] = [0] * (len(buckets) + 1)
+        self._count: int = 0
+        self._sum: float = 0.0
+        self._max: float = 0.0
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self._buckets
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self._count if self._count > 0 else 0.0
+
+    def observe(self, value: float):
+        self._counts[bisect_left(self._buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+        if value > self._max:
+            self._max = value
+
+    def quantile(self, q: float) -> float:
+        """
+        :return: the upper bound of the bucket that holds the q-th quantile, capped at the largest observed value
+        """
+        if self._count == 0:
+            return 0.0
+        rank: float = q * self._count
+        cumulative_count: int = 0
+        for i, bucket_count in enumerate(self._counts):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank and bucket_count > 0:
+                return min(self._buckets[i], self._max) if i < len(self._buckets) else self._max
+        return self._max
+
+    def cumulative_counts(self) -> List[Tuple[float, int]]:
+        retval: List[Tuple[float, int]] = []
+        cumulative_count: int = 0
+        for bucket, bucket_count in zip(self._buckets + (math.inf,), self._counts):
+            cumulative_count += bucket_count
+            retval.append((bucket, cumulative_count))
+        return retval
+
+
+class MetricsRegistry:
+    """
+    Process wide registry of the performance metrics of the bot - histograms and counters that are updated on the
+    hot paths, and collectors that report gauges (e.g. queue sizes) only when the metrics are read.
+
+    The metrics can be read as Prometheus text exposition format, or summarized for the `status` command.
+    """
+    _mr_shared_instance: Optional["MetricsRegistry"] = None
+    _mr_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._mr_logger is None:
+            cls._mr_logger = logging.getLogger(__name__)
+        return cls._mr_logger
+
+    @classmethod
+    def shared_instance(cls) -> Optional["MetricsRegistry"]:
+        """
+        :return: the shared metrics registry, or None if metrics are disabled in the global config
+        """
+        if cls._mr_shared_instance is None:
+            if not global_config_map.get("metrics_enabled").value:
+                return None
+            cls._mr_shared_instance = MetricsRegistry()
+        return cls._mr_shared_instance
+
+    def __init__(self):
+        self._histograms: Dict[str, Dict[LabelSet, Histogram]] = {}
+        self._counters: Dict[str, Dict[LabelSet, float]] = {}
+        self._collectors: List[Callable[[], Optional[Callable[[], List[GaugeSample]]]]] = []
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        """
+        Gets or creates a histogram. Callers on hot paths should keep the returned histogram, instead of looking it up
+        for every observation.
+        """
+        label_set: LabelSet = _label_set(labels)
+        histograms: Dict[LabelSet, Histogram] = self._histograms.setdefault(name, {})
+        histogram: Optional[Histogram] = histograms.get(label_set)
+        if histogram is None:
+            histogram = histograms[label_set] = Histogram()
+        return histogram
+
+    def increment(self, name: str, amount: float = 1, **labels: str):
+        counters: Dict[LabelSet, float] = self._counters.setdefault(name, {})
+        label_set: LabelSet = _label_set(labels)
+        counters[label_set] = counters.get(label_set, 0) + amount
+
+    def add_collector(self, collector: Callable[[], List[GaugeSample]]):
+        """
+        Adds a function that reports gauge samples whenever the metrics are read. Bound methods are held by weak
+        reference, so registering an object's method doesn't keep the object alive.
+        """
+        if isinstance(collector, types.MethodType):
+            self._collectors.append(weakref.WeakMethod(collector))
+        else:
+            self._collectors.append(lambda: collector)
+
+    def remove_collector(self, collector: Callable[[], List[GaugeSample]]):
+        self._collectors = [collector_ref for collector_ref in self._collectors
+                            if collector_ref() is not None and collector_ref() != collector]
+
+    def collect_gauges(self) -> List[GaugeSample]:
+        samples: List[GaugeSample] = []
+        live_collectors: List[Callable] = []
+        for collector_ref in self._collectors:
+            collector: Optional[Callable[[], List[GaugeSample]]] = collector_ref()
+            if collector is None:
+                continue
+            live_collectors.append(collector_ref)
+            try:
+                samples.extend(collector())
+            except Exception:
+                self.logger().error("Unexpected error collecting metrics.", exc_info=True)
+        self._collectors = live_collectors
+        return samples
+
+    def get_histograms(self, name: str) -> Dict[LabelSet, Histogram]:
+        return self._histograms.get(name, {})
+
+    def get_counters(self, name: str) -> Dict[LabelSet, float]:
+        return self._counters.get(name, {})
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = []
+
+        def add_header(metric_name: str, metric_type: str):
+            if metric_name in METRIC_DESCRIPTIONS:
+                lines.append(f"# HELP {metric_name} {METRIC_DESCRIPTIONS[metric_name]}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+
+        for name, histograms in sorted(self._histograms.items()):
+            add_header(name, "histogram")
+            for label_set, histogram in sorted(histograms.items()):
+                for bucket, cumulative_count in histogram.cumulative_counts():
+                    bucket_labels: str = _format_labels(label_set + (("le", _format_value(bucket)),))
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative_count}")
+                lines.append(f"{name}_sum{_format_labels(label_set)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(label_set)} {histogram.count}")
+
+        for name, counters in sorted(self._counters.items()):
+            add_header(name, "counter")
+            for label_set, value in sorted(counters.items()):
+                lines.append(f"{name}{_format_labels(label_set)} {_format_value(value)}")
+
+        gauges: Dict[str, List[Tuple[LabelSet, float]]] = {}
+        for name, labels, value in self.collect_gauges():
+            gauges.setdefault(name, []).append((_label_set(labels), value))
+        for name, samples in sorted(gauges.items()):
+            add_header(name, "counter" if name.endswith("_total") else "gauge")
+            for label_set, value in sorted(samples):
+                lines.append(f"{name}{_format_labels(label_set)} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def format_status(self) -> str:
+        """
+        Short summary of where the time goes, for the `status` command.
+        """
+        lines: List[str] = []
+
+        def histogram_line(label: str, histogram: Histogram) -> str:
+            return (f"    {label:<30} p50 {histogram.quantile(0.5) * 1e3:>8.2f} ms"
+                    f"  p99 {histogram.quantile(0.99) * 1e3:>8.2f} ms"
+                    f"  max {histogram.max * 1e3:>8.2f} ms  n {histogram.count}")
+
+        def add_section(title: str, name: str, label_name: str):
+            histograms: Dict[LabelSet, Histogram] = self.get_histograms(name)
+            if len(histograms) == 0:
+                return
+            lines.append(f"  {title}:")
+            for label_set, histogram in sorted(histograms.items()):
+                lines.append(histogram_line(dict(label_set).get(label_name, ""), histogram))
+
+        add_section("Tick durations", "clock_tick_duration_seconds", "iterator")
+        add_section("Event loop lag", "event_loop_lag_seconds", "clock")
+        add_section("REST request latency", "rest_request_duration_seconds", "connector")
+        add_section("Throttle waits", "throttle_wait_seconds", "throttler")
+
+        queue_sizes: List[GaugeSample] = [sample for sample in self.collect_gauges()
+                                          if sample[0] == "order_book_tracker_queue_size" and sample[2] > 0]
+        if len(queue_sizes) > 0:
+            lines.append("  Order book tracker queues:")
+            for _, labels, value in sorted(queue_sizes, key=lambda s: _label_set(s[1])):
+                lines.append(f"    {labels.get('exchange', '')} {labels.get('stream', '')}: {int(value)}")
+
+        if len(lines) == 0:
+            return ""
+        return "\n  Performance:\n" + "\n".join(lines)
+
+
+@lru_cache(maxsize=None)
+def rest_request_trace_config(connector_name: str) -> Optional[aiohttp.TraceConfig]:
+    """
+    Makes an aiohttp trace config that records the latency of the requests of a connector, for the connector's
+    client sessions. There's one trace config per connector, shared by all its sessions.
+
+    :return: the trace config, or None if metrics are disabled
+    """
+    metrics: Optional[MetricsRegistry] = MetricsRegistry.shared_instance()
+    if metrics is None:
+        return None
+    histogram: Histogram = metrics.histogram("rest_request_duration_seconds", connector=connector_name)
+
+    async def on_request_start(session, context, params):
+        context.start_time = time.perf_counter()
+
+    async def on_request_end(session, context, params):
+        histogram.observe(time.perf_counter() - context.start_time)
+
+    async def on_request_exception(session, context, params):
+        metrics.increment("rest_request_errors_total", connector=connector_name)
+
+    trace_config: aiohttp.TraceConfig = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def rest_request_trace_configs(connector_name: str) -> List[aiohttp.TraceConfig]:
+    """
+    :return: the trace_configs argument for the connector's aiohttp.ClientSession
+    """
+    trace_config: Optional[aiohttp.TraceConfig] = rest_request_trace_config(connector_name)
+    return [trace_config] if trace_config is not None else []
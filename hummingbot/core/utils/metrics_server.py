@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+from aiohttp import web
+import logging
+from typing import Optional
+
+from hummingbot.core.utils.metrics import MetricsRegistry
+from hummingbot.logger import HummingbotLogger
+
+PROMETHEUS_CONTENT_TYPE = "text/plain"
+
+
+class MetricsServer:
+    """
+    Serves the metrics registry at /metrics, in Prometheus text exposition format.
+    """
+    _ms_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._ms_logger is None:
+            cls._ms_logger = logging.getLogger(__name__)
+        return cls._ms_logger
+
+    def __init__(self, metrics: MetricsRegistry, port: int, host: str = "127.0.0.1"):
+        self._metrics: MetricsRegistry = metrics
+        self._host: str = host
+        self._port: int = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.Response(text=self._metrics.prometheus_text(),
+                            content_type=PROMETHEUS_CONTENT_TYPE,
+                            headers={"Cache-Control": "no-cache"})
+
+    async def start(self):
+        if self._runner is not None:
+            return
+        app: web.Application = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner: web.AppRunner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self._host, self._port).start()
+        except Exception:
+            await runner.cleanup()
+            raise
+        self._runner = runner
+        self.logger().info(f"Serving metrics at http://{self._host}:{self._port}/metrics.")
+
+    async def stop(self):
+        if self._runner is None:
+            return
+        await self._runner.cleanup()
+        self._runner = None
@@ -57,8 +57,20 @@ class TradingPairFetcher:
     def __init__(self):
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        self._seed_from_warm_cache()
         safe_ensure_future(self.fetch_all())
 
+    def _seed_from_warm_cache(self):
+        # Imported here since the warm cache depends on the global config map, which depends on this module.
+        from hummingbot.core.utils.warm_cache import WarmCache
+        warm_cache: Optional[WarmCache] = WarmCache.shared_instance()
+        if warm_cache is None:
+            return
+        cached_trading_pairs: Dict[str, List[str]] = warm_cache.load_trading_pairs()
+        if len(cached_trading_pairs) > 0:
+            self.trading_pairs = cached_trading_pairs
+            self.ready = True
+
     async def fetch_binance_trading_pairs(self) -> List[str]:
         try:
             from hummingbot.market.binance.binance_market import BinanceMarket
@@ -386,3 +398,11 @@ class TradingPairFetcher:
             "eterbase": results[11]
         }
         self.ready = True
+
+        from hummingbot.core.utils.warm_cache import WarmCache
+        warm_cache: Optional[WarmCache] = WarmCache.shared_instance()
+        if warm_cache is not None:
+            try:
+                warm_cache.save_trading_pairs(self.trading_pairs)
+            except Exception:
+                self.logger().error("Error saving trading pairs to the warm cache.", exc_info=True)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+
+import asyncio
+from decimal import Decimal
+import json
+import logging
+import os
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+import hummingbot
+from hummingbot.client.config.global_config_map import global_config_map
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.logger import HummingbotLogger
+from hummingbot.market.trading_rule import TradingRule
+
+TRADING_RULE_DECIMAL_FIELDS = [
+    "min_order_size",
+    "max_order_size",
+    "min_price_increment",
+    "min_base_amount_increment",
+    "min_quote_amount_increment",
+    "min_notional_size",
+    "min_order_value",
+    "max_price_significant_digits",
+]
+TRADING_RULE_BOOL_FIELDS = [
+    "supports_limit_orders",
+    "supports_market_orders",
+]
+
+
+class WarmCache:
+    """
+    On-disk cache of the last known order books, trading rules and trading pair lists, so that a restarted bot can
+    start from them immediately instead of re-downloading everything before it's ready. Cached values are
+    timestamped and ignored once they are older than the configured max age.
+    """
+    ORDER_BOOK_DEPTH = 200
+
+    _wc_shared_instance: Optional["WarmCache"] = None
+    _wc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._wc_logger is None:
+            cls._wc_logger = logging.getLogger(__name__)
+        return cls._wc_logger
+
+    @classmethod
+    def shared_instance(cls) -> Optional["WarmCache"]:
+        """
+        :return: the shared warm cache, or None if the warm cache is disabled in the global config
+        """
+        if cls._wc_shared_instance is None:
+            if not global_config_map.get("warm_cache_enabled").value:
+                return None
+            max_age: float = float(global_config_map.get("warm_cache_max_age").value or 0)
+            cls._wc_shared_instance = WarmCache(os.path.join(hummingbot.data_path(), "warm_cache"), max_age)
+        return cls._wc_shared_instance
+
+    def __init__(self, cache_dir: str, max_age: float = 3600.0):
+        self._cache_dir: str = cache_dir
+        self._max_age: float = max_age
+
+    @property
+    def cache_dir(self) -> str:
+        return self._cache_dir
+
+    def _cache_file_path(self, key: str) -> str:
+        return os.path.join(self._cache_dir, f"{key}.json")
+
+    def save(self, key: str, data: Any):
+        """
+        Writes a cache entry atomically, so a crash in the middle of a write never leaves a corrupt cache file.
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+        file_path: str = self._cache_file_path(key)
+        temp_file_path: str = f"{file_path}.tmp"
+        with open(temp_file_path, "w") as fd:
+            json.dump({"timestamp": time.time(), "data": data}, fd)
+        os.replace(temp_file_path, file_path)
+
+    def load(self, key: str) -> Optional[Any]:
+        file_path: str = self._cache_file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        try:
+            with open(file_path, "r") as fd:
+                entry: Dict[str, Any] = json.load(fd)
+        except Exception:
+            self.logger().warning(f"Error reading warm cache file {file_path}. Ignoring it.", exc_info=True)
+            return None
+        if time.time() - entry["timestamp"] > self._max_age:
+            self.logger().info(f"Warm cache entry {key} has expired. Ignoring it.")
+            return None
+        return entry["data"]
+
+    async def save_async(self, key: str, data: Any):
+        await asyncio.get_event_loop().run_in_executor(hummingbot.get_executor(), self.save, key, data)
+
+    def order_books_to_json(self, order_books: Dict[str, OrderBook]) -> Dict[str, Any]:
+        """
+        Copies the top levels of each order book into a JSON friendly dict. This must run on the event loop, since
+        the order books are mutated there.
+        """
+        retval: Dict[str, Any] = {}
+        for trading_pair, order_book in order_books.items():
+            bids: List[List[float]] = []
+            asks: List[List[float]] = []
+            for row in order_book.bid_entries():
+                if len(bids) >= self.ORDER_BOOK_DEPTH:
+                    break
+                bids.append([row.price, row.amount])
+            for row in order_book.ask_entries():
+                if len(asks) >= self.ORDER_BOOK_DEPTH:
+                    break
+                asks.append([row.price, row.amount])
+            retval[trading_pair] = {
+                "update_id": max(order_book.snapshot_uid, order_book.last_diff_uid),
+                "bids": bids,
+                "asks": asks
+            }
+        return retval
+
+    async def save_order_books(self, exchange_name: str, order_books: Dict[str, OrderBook]):
+        await self.save_async(f"{exchange_name}_order_books", self.order_books_to_json(order_books))
+
+    def load_order_books(self,
+                         exchange_name: str,
+                         order_book_create_function: Callable[[], OrderBook]) -> Dict[str, OrderBook]:
+        cached_order_books: Optional[Dict[str, Any]] = self.load(f"{exchange_name}_order_books")
+        retval: Dict[str, OrderBook] = {}
+        for trading_pair, cached_order_book in (cached_order_books or {}).items():
+            update_id: int = cached_order_book["update_id"]
+            order_book: OrderBook = order_book_create_function()
+            order_book.apply_snapshot([OrderBookRow(price, amount, update_id)
+                                       for price, amount in cached_order_book["bids"]],
+                                      [OrderBookRow(price, amount, update_id)
+                                       for price, amount in cached_order_book["asks"]],
+                                      update_id)
+            retval[trading_pair] = order_book
+        return retval
+
+    async def save_trading_rules(self, exchange_name: str, trading_rules: Dict[str, TradingRule]):
+        await self.save_async(f"{exchange_name}_trading_rules", {
+            trading_pair: {
+                **{field: str(getattr(trading_rule, field)) for field in TRADING_RULE_DECIMAL_FIELDS},
+                **{field: bool(getattr(trading_rule, field)) for field in TRADING_RULE_BOOL_FIELDS},
+            }
+            for trading_pair, trading_rule in trading_rules.items()
+        })
+
+    def load_trading_rules(self, exchange_name: str) -> Dict[str, TradingRule]:
+        cached_trading_rules: Optional[Dict[str, Any]] = self.load(f"{exchange_name}_trading_rules")
+        return {
+            trading_pair: TradingRule(
+                trading_pair,
+                **{field: Decimal(cached_rule[field]) for field in TRADING_RULE_DECIMAL_FIELDS},
+                **{field: cached_rule[field] for field in TRADING_RULE_BOOL_FIELDS}
+            )
+            for trading_pair, cached_rule in (cached_trading_rules or {}).items()
+        }
+
+    def save_trading_pairs(self, trading_pairs: Dict[str, List[str]]):
+        # Exchanges whose fetch failed hold exceptions instead of lists, those are not worth caching.
+        self.save("trading_pairs", {exchange: pairs for exchange, pairs in trading_pairs.items()
+                                    if isinstance(pairs, list)})
+
+    def load_trading_pairs(self) -> Dict[str, List[str]]:
+        return self.load("trading_pairs") or {}
@@ -10,9 +10,10 @@ from logging import (
 )
 
 
-from .logger import HummingbotLogger
-
-NETWORK = DEBUG + 6
+from .logger import (
+    HummingbotLogger,
+    NETWORK
+)
 
 
 def log_encoder(obj):
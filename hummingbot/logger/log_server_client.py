@@ -28,8 +28,13 @@ class LogServerClient(NetworkBase):
         super().__init__()
         self.queue = asyncio.Queue()
         self.consume_queue_task = None
+        self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
 
     def request(self, req):
+        # Log handlers may run on the log writer thread, so the request is handed over to the event loop's thread.
+        self._ev_loop.call_soon_threadsafe(self._enqueue_request, req)
+
+    def _enqueue_request(self, req):
         if not self.started:
             self.start()
         self.queue.put_nowait(req)
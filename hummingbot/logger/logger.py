@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 
 import io
-from logging import Logger as PythonLogger
+from logging import (
+    DEBUG,
+    Logger as PythonLogger
+)
 import os
 import time
 import sys
@@ -10,6 +13,12 @@ from typing import Optional
 
 from .application_warning import ApplicationWarning
 
+NETWORK = DEBUG + 6
+
+# Application warnings are not raised in test runs. Worked out on the first network() call with a warning, rather
+# than calling getcwd() on every one.
+_in_test_run: Optional[bool] = None
+
 
 #  --- Copied from logging module ---
 if hasattr(sys, '_getframe'):
@@ -30,12 +39,15 @@ class HummingbotLogger(PythonLogger):
         super().__init__(name)
 
     def network(self, log_msg: str, app_warning_msg: Optional[str] = None, *args, **kwargs):
-        from hummingbot.client.hummingbot_application import HummingbotApplication
-        from . import NETWORK
-        from os import getcwd
-
-        self.log(NETWORK, log_msg, *args, **kwargs)
-        if app_warning_msg is not None and "test" not in getcwd():
+        global _in_test_run
+        if self.isEnabledFor(NETWORK):
+            self._log(NETWORK, log_msg, args, **kwargs)
+        if app_warning_msg is None:
+            return
+        if _in_test_run is None:
+            _in_test_run = "test" in os.getcwd()
+        if not _in_test_run:
+            from hummingbot.client.hummingbot_application import HummingbotApplication
             app_warning: ApplicationWarning = ApplicationWarning(
                 time.time(),
                 self.name,
@@ -43,7 +55,7 @@ class HummingbotLogger(PythonLogger):
                 app_warning_msg
             )
             self.warning(app_warning.warning_msg)
-            hummingbot_app: HummingbotApplication = HummingbotApplication.main_application()
+            hummingbot_app: "HummingbotApplication" = HummingbotApplication.main_application()
             hummingbot_app.add_application_warning(app_warning)
 
     #  --- Copied from logging module ---
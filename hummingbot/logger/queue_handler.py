@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+
+import logging
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+)
+import queue
+from typing import (
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+DEFAULT_MAX_QUEUE_SIZE = 10000
+
+
+class LogWriterThread(QueueListener):
+    """
+    Background thread that runs the actual log handlers (file, console, reporting proxy) for every logger that has
+    been switched over to queue logging. Each queue entry carries the handlers it is meant for, so a single thread
+    serves all loggers while each of them keeps its own handler set.
+
+    The queue is bounded. When the writer falls behind - e.g. a slow disk or very verbose debug logging - new records
+    are dropped and counted rather than blocking the thread that logged them.
+    """
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+        super().__init__(queue.Queue(max_queue_size))
+        self._dropped_records: int = 0
+
+    @property
+    def dropped_records(self) -> int:
+        return self._dropped_records
+
+    def enqueue(self, handlers: Tuple[logging.Handler, ...], record: logging.LogRecord):
+        try:
+            if self._dropped_records > 0:
+                self.queue.put_nowait((handlers, self._make_dropped_records_record(record)))
+                self._dropped_records = 0
+            self.queue.put_nowait((handlers, record))
+        except queue.Full:
+            self._dropped_records += 1
+
+    def _make_dropped_records_record(self, record: logging.LogRecord) -> logging.LogRecord:
+        return logging.makeLogRecord({
+            "name": record.name,
+            "levelno": logging.WARNING,
+            "levelname": logging.getLevelName(logging.WARNING),
+            "msg": f"{self._dropped_records} log records were dropped because the log queue was full.",
+            "do_not_send": True
+        })
+
+    def enqueue_sentinel(self):
+        # Wait for room rather than failing on a full queue, so stop() always writes out what was queued.
+        self.queue.put(self._sentinel)
+
+    def handle(self, entry: Tuple[Tuple[logging.Handler, ...], logging.LogRecord]):
+        handlers, record = entry
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Stands in for the handlers of a logger, and passes its records on to the log writer thread untouched. Unlike the
+    standard QueueHandler, the message is not formatted here - formatting, JSON serialization and I/O all happen on
+    the writer thread.
+    """
+    def __init__(self, writer: LogWriterThread, handlers: Iterable[logging.Handler]):
+        super().__init__(writer.queue)
+        self._writer: LogWriterThread = writer
+        self._handlers: Tuple[logging.Handler, ...] = tuple(handlers)
+        self.setLevel(min(h.level for h in self._handlers))
+
+    @property
+    def handlers(self) -> Tuple[logging.Handler, ...]:
+        return self._handlers
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        self._writer.enqueue(self._handlers, record)
+
+
+_log_writer: Optional[LogWriterThread] = None
+
+
+def log_writer() -> Optional[LogWriterThread]:
+    return _log_writer
+
+
+def start_queue_logging(logger_names: Iterable[str], max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE):
+    """
+    Moves the handlers of the root logger and of the named loggers behind queue handlers, and starts the log writer
+    thread that runs them.
+    """
+    global _log_writer
+    stop_queue_logging()
+    _log_writer = LogWriterThread(max_queue_size)
+    loggers: List[logging.Logger] = [logging.getLogger()] + [logging.getLogger(name) for name in logger_names]
+    for logger in loggers:
+        handlers: List[logging.Handler] = [h for h in logger.handlers if not isinstance(h, BoundedQueueHandler)]
+        if len(handlers) == 0:
+            continue
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(BoundedQueueHandler(_log_writer, handlers))
+    _log_writer.start()
+
+
+def stop_queue_logging():
+    """
+    Writes out the records that are still queued and stops the log writer thread. The queue handlers stay attached,
+    and whatever they receive afterwards is dropped - so this should be followed by reconfiguring logging.
+    """
+    global _log_writer
+    if _log_writer is not None:
+        _log_writer.stop()
+        _log_writer = None
@@ -49,8 +49,6 @@ class ReportingProxyHandler(logging.Handler):
     def emit(self, record):
         if record.__dict__.get("do_not_send", False):
             return
-        if not self.log_server_client.started:
-            self.log_server_client.start()
         log_type = record.__dict__.get("message_type", "log")
         if not log_type == "event":
             self.process_log(record)
@@ -0,0 +1,32 @@
+#!/usr/bin/env python
+
+import json
+import logging
+from typing import (
+    Any,
+    Dict,
+)
+
+from hummingbot.logger import log_encoder
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formats each log record as a single line JSON object. Event logs keep their event dict as an object, rather than
+    as a JSON string inside the message.
+    """
+    def format(self, record: logging.LogRecord) -> str:
+        log_entry: Dict[str, Any] = {
+            "timestamp": record.created,
+            "process": record.process,
+            "name": record.name,
+            "level": record.levelname,
+        }
+        dict_msg: Any = record.__dict__.get("dict_msg")
+        if isinstance(dict_msg, dict):
+            log_entry["event"] = dict_msg
+        else:
+            log_entry["msg"] = record.getMessage()
+        if record.exc_info:
+            log_entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(log_entry, default=log_encoder)
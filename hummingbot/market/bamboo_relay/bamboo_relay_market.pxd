@@ -1,5 +1,6 @@
 from libc.stdint cimport int64_t
 from hummingbot.market.market_base cimport MarketBase
+from hummingbot.core.data_type.deadline_queue cimport DeadlineQueue
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -20,16 +21,18 @@ cdef class BambooRelayMarket(MarketBase):
         double _last_update_available_balance_timestamp
         double _poll_interval
         dict _in_flight_limit_orders
+        dict _in_flight_limit_orders_by_hash
         dict _in_flight_market_orders
         object _in_flight_pending_limit_orders
         object _in_flight_cancels
         object _in_flight_pending_cancels
-        list _filled_order_hashes
-        object _order_expiry_queue
+        object _filled_order_hashes
+        DeadlineQueue _order_expiry_queue
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
         object _coordinator
+        object _order_hasher
         bint _use_coordinator
         bint _pre_emptive_soft_cancels
         dict _withdraw_rules
@@ -66,8 +69,17 @@ cdef class BambooRelayMarket(MarketBase):
                                        object amount,
                                        str tx_hash,
                                        object protocol_fee_amount)
+    cdef str c_place_order(self,
+                           object trade_type,
+                           str trading_pair,
+                           object amount,
+                           object order_type,
+                           object price,
+                           dict kwargs,
+                           object signing_batch)
     cdef c_expire_order(self, str order_id, int seconds)
     cdef c_check_and_remove_expired_orders(self)
+    cdef c_add_filled_order_hash(self, str order_hash)
     cdef list c_get_orders_for_amount_price(self,
                                             str trading_pair,
                                             object trade_type,
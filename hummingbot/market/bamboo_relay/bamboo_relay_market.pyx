@@ -1,10 +1,7 @@
 import aiohttp
 import asyncio
 from async_timeout import timeout
-from collections import (
-    deque,
-    OrderedDict
-)
+from collections import OrderedDict
 import copy
 import logging
 import math
@@ -26,7 +23,9 @@ from libc.stdint cimport int64_t
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
 
+import hummingbot
 from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.deadline_queue import DeadlineQueue
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
@@ -63,11 +62,13 @@ from hummingbot.market.market_base import (
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
-    fix_signature,
-    generate_order_hash_hex,
     jsdict_order_to_struct,
-    Order as ZeroExOrder
+    sign_order_hash,
+    sign_order_hashes,
+    Order as ZeroExOrder,
+    ZeroExOrderHasher
 )
+from hummingbot.wallet.ethereum.zero_ex.order_signing_batch import OrderSigningBatch
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_coordinator_v3 import ZeroExCoordinator
 from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
@@ -100,6 +101,7 @@ from hummingbot.market.bamboo_relay.bamboo_relay_constants import (
     BAMBOO_RELAY_KOVAN_FEE_RECIPIENT_ADDRESS,
     BAMBOO_RELAY_TEST_FEE_RECIPIENT_ADDRESS
 )
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
@@ -139,6 +141,7 @@ cdef class BambooRelayMarket(MarketBase):
     UPDATE_RULES_INTERVAL = 60.0
     UPDATE_OPEN_LIMIT_ORDERS_INTERVAL = 10.0
     UPDATE_MARKET_ORDERS_INTERVAL = 10.0
+    FILLED_ORDER_HASHES_WINDOW_SIZE = 1000
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -176,12 +179,13 @@ cdef class BambooRelayMarket(MarketBase):
         self._last_update_available_balance_timestamp = 0
         self._poll_interval = poll_interval
         self._in_flight_limit_orders = {}   # limit orders are off chain
+        self._in_flight_limit_orders_by_hash = {}  # the same limit orders, keyed by order hash
         self._in_flight_market_orders = {}  # market orders are on chain
         self._in_flight_pending_limit_orders = OrderedDict()  # in the case that an order needs to be cancelled before its been accepted
         self._in_flight_cancels = OrderedDict()
         self._in_flight_pending_cancels = OrderedDict()
-        self._filled_order_hashes = []      # To prevent market filling trying to overfill an inflight market order that's pending
-        self._order_expiry_queue = deque()
+        self._filled_order_hashes = OrderedDict()  # To prevent market filling trying to overfill an inflight market order that's pending
+        self._order_expiry_queue = DeadlineQueue()
         self._tx_tracker = BambooRelayTransactionTracker(self)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
@@ -247,6 +251,7 @@ cdef class BambooRelayMarket(MarketBase):
                                               coordinator_registry_address,
                                               wallet,
                                               self._chain_id)
+        self._order_hasher = ZeroExOrderHasher(self._exchange_address.lower(), self._chain_id)
 
     @property
     def name(self) -> str:
@@ -301,13 +306,12 @@ cdef class BambooRelayMarket(MarketBase):
             BambooRelayInFlightOrder typed_in_flight_order
             str base_currency
             str quote_currency
-            set expiring_order_ids = set([order_id for _, order_id in self._order_expiry_queue])
 
         for in_flight_order in self._in_flight_limit_orders.values():
             typed_in_flight_order = in_flight_order
             # Skip orders that are or have been cancelled but are still being tracked
             if (typed_in_flight_order.order_type is not OrderType.LIMIT or
-                    typed_in_flight_order.client_order_id in expiring_order_ids or
+                    self._order_expiry_queue.c_contains(typed_in_flight_order.client_order_id) or
                     typed_in_flight_order.client_order_id in self._in_flight_cancels or
                     typed_in_flight_order.client_order_id in self._in_flight_pending_cancels or
                     typed_in_flight_order.has_been_cancelled):
@@ -331,10 +335,11 @@ cdef class BambooRelayMarket(MarketBase):
     def reset_state(self):
         self._in_flight_market_orders = {}
         self._in_flight_limit_orders = {}
+        self._in_flight_limit_orders_by_hash = {}
         self._in_flight_pending_limit_orders = OrderedDict()
         self._in_flight_cancels = OrderedDict()
         self._in_flight_pending_cancels = OrderedDict()
-        self._order_expiry_queue = deque()
+        self._order_expiry_queue = DeadlineQueue()
 
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         # ignore saved orders that may not reflect current version schema
@@ -358,6 +363,10 @@ cdef class BambooRelayMarket(MarketBase):
                             order.is_done or
                             order.expires < self._current_timestamp):
                         del self._in_flight_limit_orders[order.client_order_id]
+            self._in_flight_limit_orders_by_hash = {
+                order.exchange_order_id: order
+                for order in self._in_flight_limit_orders.values()
+            }
         except Exception:
             self.logger().error(f"Error restoring tracking states.", exc_info=True)
 
@@ -530,33 +539,22 @@ cdef class BambooRelayMarket(MarketBase):
     async def _get_order_updates(self, tracked_limit_orders: List[BambooRelayInFlightOrder]) -> List[Dict[str, Any]]:
         cdef:
             BambooRelayInFlightOrder tracked_limit_order
-            list account_orders_list = []
-            list order_updates = []
-            list hashes = []
-            dict hash_index = {}
-            dict account_orders_map = {}
+            list missing_hashes
+            dict order_updates_map = {}
 
         # Fetch cached account endpoint
-        account_orders_list = await self.get_account_orders()
-        for account_order in account_orders_list:
-            account_orders_map[account_order["orderHash"]] = account_order
-
-        for i, tracked_order in enumerate(tracked_limit_orders):
-            order_hash = tracked_order.exchange_order_id
-            if order_hash not in account_orders_map:
-                hashes.append(tracked_order.exchange_order_id)
-                hash_index[order_hash] = i
-                order_updates.append(None)
-            else:
-                order_updates.append(account_orders_map[order_hash])
+        for account_order in await self.get_account_orders():
+            order_updates_map[account_order["orderHash"]] = account_order
 
-        if len(hashes):
+        missing_hashes = [tracked_limit_order.exchange_order_id
+                          for tracked_limit_order in tracked_limit_orders
+                          if tracked_limit_order.exchange_order_id not in order_updates_map]
+        if len(missing_hashes):
             # Grab all of the orders details at once by hash
-            orders = await self.get_orders(hashes)
-            for hash in orders:
-                order_updates[hash_index[hash]] = orders[hash]
+            order_updates_map.update(await self.get_orders(missing_hashes))
 
-        return order_updates
+        return [order_updates_map.get(tracked_limit_order.exchange_order_id)
+                for tracked_limit_order in tracked_limit_orders]
 
     # Single order update, i.e. via RPC logs instead of market API
     def _update_single_limit_order(self, fill_event: ZeroExFillEvent):
@@ -569,90 +567,89 @@ cdef class BambooRelayMarket(MarketBase):
             int quote_asset_decimals
             BambooRelayInFlightOrder tracked_limit_order
 
-        tracked_limit_orders = list(self._in_flight_limit_orders.values())
-
-        for tracked_limit_order in tracked_limit_orders:
-            if tracked_limit_order.exchange_order_id == fill_event.order_hash:
-                previous_is_done = tracked_limit_order.is_done
-
-                if not previous_is_done:
-                    order_remaining_base_token_amount = tracked_limit_order.available_amount_base
+        tracked_limit_order = self._in_flight_limit_orders_by_hash.get(fill_event.order_hash)
+        if tracked_limit_order is None:
+            return
 
-                    trading_pair_rules = self.trading_rules.get(tracked_limit_order.trading_pair)
-                    base_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_base_amount_increment))))
-                    quote_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_quote_amount_increment))))
+        previous_is_done = tracked_limit_order.is_done
 
-                    order_filled_base_token_amount = s_decimal_0
-                    order_filled_quote_token_amount = s_decimal_0
+        if not previous_is_done:
+            order_remaining_base_token_amount = tracked_limit_order.available_amount_base
 
-                    # Each update has a list of fills, we only process these once
-                    if fill_event.tx_hash not in tracked_limit_order.recorded_fills:
-                        if tracked_limit_order.trade_type is TradeType.BUY:
-                            order_filled_base_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
-                            order_filled_quote_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
-                        else:
-                            order_filled_base_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
-                            order_filled_quote_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
+            trading_pair_rules = self.trading_rules.get(tracked_limit_order.trading_pair)
+            base_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_base_amount_increment))))
+            quote_asset_decimals = -int(math.ceil(math.log10(float(trading_pair_rules.min_quote_amount_increment))))
 
-                        if order_filled_base_token_amount > 0:
-                            tracked_limit_order.recorded_fills.append(fill_event.tx_hash)
+            order_filled_base_token_amount = s_decimal_0
+            order_filled_quote_token_amount = s_decimal_0
 
-                    tracked_limit_order.available_amount_base = order_remaining_base_token_amount - order_filled_base_token_amount
-
-                    if tracked_limit_order.available_amount_base < 0:
-                        tracked_limit_order.available_amount_base = 0
+            # Each update has a list of fills, we only process these once
+            if fill_event.tx_hash not in tracked_limit_order.recorded_fills:
+                if tracked_limit_order.trade_type is TradeType.BUY:
+                    order_filled_base_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
+                    order_filled_quote_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
+                else:
+                    order_filled_base_token_amount = fill_event.maker_asset_filled_amount / Decimal(f"1e{base_asset_decimals}")
+                    order_filled_quote_token_amount = fill_event.taker_asset_filled_amount / Decimal(f"1e{quote_asset_decimals}")
 
-                    if order_filled_base_token_amount > 0:
-                        tracked_limit_order.executed_amount_base = tracked_limit_order.executed_amount_base + order_filled_base_token_amount
-                        tracked_limit_order.executed_amount_quote = tracked_limit_order.executed_amount_quote + order_filled_quote_token_amount
-                        self.logger().info(f"Filled {order_filled_base_token_amount} out of {tracked_limit_order.amount} of the "
-                                           f"limit order {tracked_limit_order.client_order_id} according to the RPC transaction logs.")
-                        self.c_trigger_event(
-                            self.MARKET_ORDER_FILLED_EVENT_TAG,
-                            OrderFilledEvent(
-                                current_timestamp,
-                                tracked_limit_order.client_order_id,
-                                tracked_limit_order.trading_pair,
-                                tracked_limit_order.trade_type,
-                                OrderType.LIMIT,
-                                tracked_limit_order.price,
-                                order_filled_base_token_amount,
-                                TradeFee(0.0),  # no fee for limit order fills
-                                tracked_limit_order.exchange_order_id,  # Use order hash for limit order validation
-                            )
-                        )
-                    if tracked_limit_order.available_amount_base == 0:
-                        tracked_limit_order.last_state = "FILLED"
-                        self.c_expire_order(tracked_limit_order.client_order_id, 60)
-                        # Remove from log tracking
-                        safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(tracked_limit_order.exchange_order_id))
-                        if tracked_limit_order.trade_type is TradeType.BUY:
-                            self.logger().info(f"The limit buy order {tracked_limit_order.client_order_id} "
-                                               f"has completed according to the RPC transaction logs.")
-                            self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
-                                                 BuyOrderCompletedEvent(current_timestamp,
-                                                                        tracked_limit_order.client_order_id,
-                                                                        tracked_limit_order.base_asset,
-                                                                        tracked_limit_order.quote_asset,
-                                                                        tracked_limit_order.quote_asset,
-                                                                        tracked_limit_order.executed_amount_base,
-                                                                        tracked_limit_order.executed_amount_quote,
-                                                                        tracked_limit_order.protocol_fee_amount,
-                                                                        OrderType.LIMIT))
-                        else:
-                            self.logger().info(f"The limit sell order {tracked_limit_order.client_order_id} "
-                                               f"has completed according to the RPC transaction logs.")
-                            self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
-                                                 SellOrderCompletedEvent(current_timestamp,
-                                                                         tracked_limit_order.client_order_id,
-                                                                         tracked_limit_order.base_asset,
-                                                                         tracked_limit_order.quote_asset,
-                                                                         tracked_limit_order.quote_asset,
-                                                                         tracked_limit_order.executed_amount_base,
-                                                                         tracked_limit_order.executed_amount_quote,
-                                                                         tracked_limit_order.protocol_fee_amount,
-                                                                         OrderType.LIMIT))
-                return
+                if order_filled_base_token_amount > 0:
+                    tracked_limit_order.recorded_fills.append(fill_event.tx_hash)
+
+            tracked_limit_order.available_amount_base = order_remaining_base_token_amount - order_filled_base_token_amount
+
+            if tracked_limit_order.available_amount_base < 0:
+                tracked_limit_order.available_amount_base = 0
+
+            if order_filled_base_token_amount > 0:
+                tracked_limit_order.executed_amount_base = tracked_limit_order.executed_amount_base + order_filled_base_token_amount
+                tracked_limit_order.executed_amount_quote = tracked_limit_order.executed_amount_quote + order_filled_quote_token_amount
+                self.logger().info(f"Filled {order_filled_base_token_amount} out of {tracked_limit_order.amount} of the "
+                                   f"limit order {tracked_limit_order.client_order_id} according to the RPC transaction logs.")
+                self.c_trigger_event(
+                    self.MARKET_ORDER_FILLED_EVENT_TAG,
+                    OrderFilledEvent(
+                        current_timestamp,
+                        tracked_limit_order.client_order_id,
+                        tracked_limit_order.trading_pair,
+                        tracked_limit_order.trade_type,
+                        OrderType.LIMIT,
+                        tracked_limit_order.price,
+                        order_filled_base_token_amount,
+                        TradeFee(0.0),  # no fee for limit order fills
+                        tracked_limit_order.exchange_order_id,  # Use order hash for limit order validation
+                    )
+                )
+            if tracked_limit_order.available_amount_base == 0:
+                tracked_limit_order.last_state = "FILLED"
+                self.c_expire_order(tracked_limit_order.client_order_id, 60)
+                # Remove from log tracking
+                safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(tracked_limit_order.exchange_order_id))
+                if tracked_limit_order.trade_type is TradeType.BUY:
+                    self.logger().info(f"The limit buy order {tracked_limit_order.client_order_id} "
+                                       f"has completed according to the RPC transaction logs.")
+                    self.c_trigger_event(self.MARKET_BUY_ORDER_COMPLETED_EVENT_TAG,
+                                         BuyOrderCompletedEvent(current_timestamp,
+                                                                tracked_limit_order.client_order_id,
+                                                                tracked_limit_order.base_asset,
+                                                                tracked_limit_order.quote_asset,
+                                                                tracked_limit_order.quote_asset,
+                                                                tracked_limit_order.executed_amount_base,
+                                                                tracked_limit_order.executed_amount_quote,
+                                                                tracked_limit_order.protocol_fee_amount,
+                                                                OrderType.LIMIT))
+                else:
+                    self.logger().info(f"The limit sell order {tracked_limit_order.client_order_id} "
+                                       f"has completed according to the RPC transaction logs.")
+                    self.c_trigger_event(self.MARKET_SELL_ORDER_COMPLETED_EVENT_TAG,
+                                         SellOrderCompletedEvent(current_timestamp,
+                                                                 tracked_limit_order.client_order_id,
+                                                                 tracked_limit_order.base_asset,
+                                                                 tracked_limit_order.quote_asset,
+                                                                 tracked_limit_order.quote_asset,
+                                                                 tracked_limit_order.executed_amount_base,
+                                                                 tracked_limit_order.executed_amount_quote,
+                                                                 tracked_limit_order.protocol_fee_amount,
+                                                                 OrderType.LIMIT))
 
     async def _update_limit_order_status(self):
         cdef:
@@ -925,7 +922,7 @@ cdef class BambooRelayMarket(MarketBase):
                 if len(self._pending_approval_tx_hashes) > 0:
                     for tx_hash in list(self._pending_approval_tx_hashes):
                         try:
-                            receipt = self._w3.eth.getTransactionReceipt(tx_hash)
+                            receipt = self._w3.eth.getTransactionReceipt(self._wallet.get_current_tx_hash(tx_hash))
                             self._pending_approval_tx_hashes.remove(tx_hash)
                         except TransactionNotFound:
                             pass
@@ -944,7 +941,7 @@ cdef class BambooRelayMarket(MarketBase):
                            url: str,
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with aiohttp.ClientSession(trace_configs=rest_request_trace_configs("bamboo_relay")) as client:
             async with client.request(http_method,
                                       url=url,
                                       timeout=self.API_CALL_TIMEOUT,
@@ -968,22 +965,23 @@ cdef class BambooRelayMarket(MarketBase):
                                       f"HTTP status is {response.status} - {response_text}.")
 
     def get_order_hash_hex(self, unsigned_order: Dict[str, Any]) -> str:
-        order_struct = jsdict_order_to_struct(unsigned_order)
-        order_hash_hex = "0x" + generate_order_hash_hex(
-            order=order_struct,
-            exchange_address=self._exchange_address.lower(),
-            chain_id=unsigned_order["chainId"]
-        )
-        return order_hash_hex
+        return "0x" + self._order_hasher.hash_order_hex(jsdict_order_to_struct(unsigned_order))
 
     def get_zero_ex_signature(self, order_hash_hex: str) -> str:
-        signature = self._wallet.current_backend.sign_hash(hexstr=order_hash_hex)
-        fixed_signature = fix_signature(self._provider, 
-                                        self._wallet.address, 
-                                        order_hash_hex,
-                                        signature, 
-                                        self._chain_id)
-        return fixed_signature
+        return sign_order_hash(self._wallet.current_backend.account, order_hash_hex)
+
+    def hash_and_sign_orders(self, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """
+        Hashes and signs several unsigned orders at once, e.g. every level of an order ladder.
+        :return: (order hash, signature) for each order, in the same order
+        """
+        order_hashes = [self.get_order_hash_hex(unsigned_order) for unsigned_order in unsigned_orders]
+        return list(zip(order_hashes, sign_order_hashes(self._wallet.current_backend.account, order_hashes)))
+
+    async def hash_and_sign_orders_async(self, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        return await self._ev_loop.run_in_executor(hummingbot.get_executor(),
+                                                   self.hash_and_sign_orders,
+                                                   unsigned_orders)
 
     cdef list c_get_orders_for_amount_price(self,
                                             str trading_pair,
@@ -996,7 +994,7 @@ cdef class BambooRelayMarket(MarketBase):
             object current_item
             object current_price
             list found_orders = []
-            list found_hashes = []
+            set found_hashes = set()
 
         active_orders = self._order_book_tracker.get_active_order_tracker(trading_pair=trading_pair)
 
@@ -1016,7 +1014,7 @@ cdef class BambooRelayMarket(MarketBase):
                         order = active_asks[current_price][order_hash]
                         amount_filled += Decimal(order["remainingBaseTokenAmount"])
                         found_orders.append(order)
-                        found_hashes.append(order_hash)
+                        found_hashes.add(order_hash)
                         if amount_filled >= amount:
                             raise StopIteration
             if trade_type is TradeType.SELL:
@@ -1034,7 +1032,7 @@ cdef class BambooRelayMarket(MarketBase):
                         order = active_bids[current_price][order_hash]
                         amount_filled += Decimal(order["remainingBaseTokenAmount"])
                         found_orders.append(order)
-                        found_hashes.append(order_hash)
+                        found_hashes.add(order_hash)
                         if amount_filled >= amount:
                             raise StopIteration
         except StopIteration:
@@ -1108,7 +1106,7 @@ cdef class BambooRelayMarket(MarketBase):
                     total_quote_token_amount = amount * calculated_price
                     taker_asset_fill_amount = max_base_amount_with_decimals.to_integral_exact(rounding=ROUND_FLOOR)
             if amount >= remaining_base_token_amount:
-                self._filled_order_hashes.append(apiOrder["orderHash"])
+                self.c_add_filled_order_hash(apiOrder["orderHash"])
 
             if is_coordinated:
                 tx_hash, protocol_fee = await self._coordinator.fill_order(order, taker_asset_fill_amount, signature)
@@ -1138,7 +1136,7 @@ cdef class BambooRelayMarket(MarketBase):
                 remaining_base_token_amount = amount - total_base_token_amount
                 remaining_quote_token_amount = remaining_base_token_amount * order_price
             else:
-                self._filled_order_hashes.append(apiOrder["orderHash"])
+                self.c_add_filled_order_hash(apiOrder["orderHash"])
 
             if trade_type is TradeType.BUY:
                 taker_asset_fill_amounts.append((remaining_quote_token_amount * Decimal(f"1e{quote_asset_decimals}")).to_integral_exact(rounding=ROUND_FLOOR))
@@ -1174,7 +1172,12 @@ cdef class BambooRelayMarket(MarketBase):
                                  is_coordinated: bool,
                                  amount: Decimal,
                                  price: Decimal,
-                                 expires: int) -> Tuple[str, ZeroExOrder]:
+                                 expires: int,
+                                 order_id: Optional[str] = None,
+                                 signing_batch: Optional[OrderSigningBatch] = None) -> Tuple[str, ZeroExOrder]:
+        """
+        :param signing_batch: if given, the order is hashed and signed together with the other orders of the batch
+        """
         # It's faster to generate fresh orders client-side
         latest_salt = self._latest_salt
 
@@ -1236,9 +1239,11 @@ cdef class BambooRelayMarket(MarketBase):
             'takerFeeAssetData': maker_asset_data
         }
 
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        if signing_batch is not None:
+            order_hash_hex, signature = await signing_batch.hash_and_sign_order(order_id, unsigned_limit_order)
+        else:
+            order_hash_hex, signature = (await self.hash_and_sign_orders_async([unsigned_limit_order]))[0]
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         try:
             await self._api_request(http_method="post",
@@ -1388,7 +1393,8 @@ cdef class BambooRelayMarket(MarketBase):
                             trading_pair: str,
                             amount: Decimal,
                             price: Decimal,
-                            expires: int) -> str:
+                            expires: int,
+                            signing_batch: Optional[OrderSigningBatch] = None) -> str:
         cdef:
             object q_price
             object q_amt = self.c_quantize_order_amount(trading_pair, amount)
@@ -1418,7 +1424,9 @@ cdef class BambooRelayMarket(MarketBase):
                                                                                      is_coordinated=self._use_coordinator,
                                                                                      amount=q_amt,
                                                                                      price=q_price,
-                                                                                     expires=expires)
+                                                                                     expires=expires,
+                                                                                     order_id=order_id,
+                                                                                     signing_batch=signing_batch)
                     self.c_start_tracking_limit_order(order_id=order_id,
                                                       exchange_order_id=exchange_order_id,
                                                       trading_pair=trading_pair,
@@ -1488,16 +1496,21 @@ cdef class BambooRelayMarket(MarketBase):
                 self.MARKET_ORDER_FAILURE_EVENT_TAG,
                 MarketOrderFailureEvent(self._current_timestamp, order_id, order_type)
             )
-
-    cdef str c_buy(self,
-                   str trading_pair,
-                   object amount,
-                   object order_type=OrderType.MARKET,
-                   object price=s_decimal_NaN,
-                   dict kwargs={}):
+        finally:
+            if signing_batch is not None:
+                signing_batch.remove(order_id)
+
+    cdef str c_place_order(self,
+                           object trade_type,
+                           str trading_pair,
+                           object amount,
+                           object order_type,
+                           object price,
+                           dict kwargs,
+                           object signing_batch):
         cdef:
             int64_t tracking_nonce = <int64_t> get_tracking_nonce()
-            str order_id = str(f"buy-{trading_pair}-{tracking_nonce}")
+            str order_id = str(f"{'buy' if trade_type is TradeType.BUY else 'sell'}-{trading_pair}-{tracking_nonce}")
             double current_timestamp = self._current_timestamp
         expires = kwargs.get("expiration_ts", None)
         if expires is not None and not math.isnan(expires):
@@ -1510,44 +1523,60 @@ cdef class BambooRelayMarket(MarketBase):
                 raise
             # Record the in-flight limit order placement.
             self._in_flight_pending_limit_orders[order_id] = self._current_timestamp
+            if signing_batch is not None:
+                signing_batch.add(order_id)
+        else:
+            # Only limit orders are signed.
+            signing_batch = None
         safe_ensure_future(self.execute_trade(order_id=order_id,
                                               order_type=order_type,
-                                              trade_type=TradeType.BUY,
+                                              trade_type=trade_type,
                                               trading_pair=trading_pair,
                                               amount=amount,
                                               price=price,
-                                              expires=expires))
+                                              expires=expires,
+                                              signing_batch=signing_batch))
         return order_id
 
+    cdef str c_buy(self,
+                   str trading_pair,
+                   object amount,
+                   object order_type=OrderType.MARKET,
+                   object price=s_decimal_NaN,
+                   dict kwargs={}):
+        return self.c_place_order(TradeType.BUY, trading_pair, amount, order_type, price, kwargs, None)
+
     cdef str c_sell(self,
                     str trading_pair,
                     object amount,
                     object order_type=OrderType.MARKET,
                     object price=s_decimal_NaN,
                     dict kwargs={}):
+        return self.c_place_order(TradeType.SELL, trading_pair, amount, order_type, price, kwargs, None)
+
+    cdef list c_batch_submit_orders(self, str trading_pair, list order_requests):
+        """
+        Submits the orders the same way c_buy and c_sell do, except that the limit orders of the batch are hashed
+        and signed together, in a single call.
+        """
         cdef:
-            int64_t tracking_nonce = <int64_t> get_tracking_nonce()
-            str order_id = str(f"sell-{trading_pair}-{tracking_nonce}")
-            double current_timestamp = self._current_timestamp
-        expires = kwargs.get("expiration_ts", None)
-        if expires is not None and not math.isnan(expires):
-            expires = int(expires)
-        else:
-            expires = int(current_timestamp) + 120
-        if order_type is OrderType.LIMIT:
-            # Don't spam the server endpoint if a order placement failed recently
-            if current_timestamp - self._last_failed_limit_order_timestamp <= self.ORDER_CREATION_BACKOFF_TIME:
-                raise
-            # Record the in-flight limit order placement.
-            self._in_flight_pending_limit_orders[order_id] = self._current_timestamp
-        safe_ensure_future(self.execute_trade(order_id=order_id,
-                                              order_type=order_type,
-                                              trade_type=TradeType.SELL,
-                                              trading_pair=trading_pair,
-                                              amount=amount,
-                                              price=price,
-                                              expires=expires))
-        return order_id
+            list order_ids = []
+            object signing_batch = OrderSigningBatch(self.hash_and_sign_orders_async)
+        for order_request in order_requests:
+            try:
+                order_ids.append(self.c_place_order(TradeType.BUY if order_request.is_buy else TradeType.SELL,
+                                                    trading_pair,
+                                                    order_request.amount,
+                                                    order_request.order_type,
+                                                    order_request.price,
+                                                    order_request.kwargs,
+                                                    signing_batch))
+            except Exception:
+                self.logger().error(f"Error submitting {'buy' if order_request.is_buy else 'sell'} order for "
+                                    f"{order_request.amount} {trading_pair} at {order_request.price}.",
+                                    exc_info=True)
+                order_ids.append(None)
+        return order_ids
 
     async def cancel_order(self, client_order_id: str) -> CancellationResult:
         cdef:
@@ -1623,7 +1652,7 @@ cdef class BambooRelayMarket(MarketBase):
 
     def get_tx_hash_receipt(self, tx_hash: str) -> Dict[str, Any]:
         try:
-            tx_hash_receipt = self._w3.eth.getTransactionReceipt(tx_hash)
+            tx_hash_receipt = self._w3.eth.getTransactionReceipt(self._wallet.get_current_tx_hash(tx_hash))
             return tx_hash_receipt
         except TransactionNotFound:
             return None
@@ -1697,6 +1726,38 @@ cdef class BambooRelayMarket(MarketBase):
         self.c_check_and_remove_expired_orders()
         self._last_timestamp = timestamp
 
+    # The following exposed Python functions are meant for unit tests
+    # ---------------------------------------------------------------
+    def start_tracking_limit_order(self,
+                                   order_id: str,
+                                   exchange_order_id: str,
+                                   trading_pair: str,
+                                   trade_type: TradeType,
+                                   price: Decimal,
+                                   amount: Decimal,
+                                   expires: int,
+                                   zero_ex_order: Optional[ZeroExOrder] = None):
+        self.c_start_tracking_limit_order(order_id, exchange_order_id, trading_pair, OrderType.LIMIT,
+                                          self._use_coordinator, trade_type, price, amount, expires, zero_ex_order)
+
+    def stop_tracking_order(self, order_id: str):
+        self.c_stop_tracking_order(order_id)
+
+    def expire_order(self, order_id: str, seconds: int):
+        self.c_expire_order(order_id, seconds)
+
+    def get_in_flight_limit_order_by_hash(self, order_hash: str) -> Optional[BambooRelayInFlightOrder]:
+        return self._in_flight_limit_orders_by_hash.get(order_hash)
+
+    def add_filled_order_hash(self, order_hash: str):
+        self.c_add_filled_order_hash(order_hash)
+
+    @property
+    def filled_order_hashes(self) -> List[str]:
+        return list(self._filled_order_hashes.keys())
+
+    # ---------------------------------------------------------------
+
     cdef c_start_tracking_limit_order(self,
                                       str order_id,
                                       str exchange_order_id,
@@ -1721,6 +1782,7 @@ cdef class BambooRelayMarket(MarketBase):
             tx_hash=None,
             zero_ex_order=zero_ex_order
         )
+        self._in_flight_limit_orders_by_hash[exchange_order_id] = self._in_flight_limit_orders[order_id]
         # Watch for Fill events for this order hash
         safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.watch_order_hash(exchange_order_id, self._update_single_limit_order))
 
@@ -1749,22 +1811,38 @@ cdef class BambooRelayMarket(MarketBase):
         )
 
     cdef c_expire_order(self, str order_id, int seconds):
-        self._order_expiry_queue.append((self._current_timestamp + seconds, order_id))
+        cdef:
+            double expiry_timestamp = self._current_timestamp + seconds
+
+        # An order that's expired more than once stops being tracked at the earliest of its expiry times.
+        if (self._order_expiry_queue.c_contains(order_id) and
+                self._order_expiry_queue.c_get_deadline(order_id) <= expiry_timestamp):
+            return
+        self._order_expiry_queue.c_push(order_id, expiry_timestamp)
 
     cdef c_check_and_remove_expired_orders(self):
         cdef:
             double current_timestamp = self._current_timestamp
             str order_id
 
-        while len(self._order_expiry_queue) > 0 and self._order_expiry_queue[0][0] < current_timestamp:
-            _, order_id = self._order_expiry_queue.popleft()
+        for order_id in self._order_expiry_queue.c_pop_expired(current_timestamp):
             self.c_stop_tracking_order(order_id)
 
+    cdef c_add_filled_order_hash(self, str order_hash):
+        self._filled_order_hashes[order_hash] = True
+        self._filled_order_hashes.move_to_end(order_hash)
+        while len(self._filled_order_hashes) > self.FILLED_ORDER_HASHES_WINDOW_SIZE:
+            self._filled_order_hashes.popitem(last=False)
+
     cdef c_stop_tracking_order(self, str order_id):
+        cdef:
+            str exchange_order_id
         if order_id in self._in_flight_limit_orders:
+            exchange_order_id = self._in_flight_limit_orders[order_id].exchange_order_id
             # Unwatch this order hash from Fill events
-            safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(self._in_flight_limit_orders[order_id].exchange_order_id))
+            safe_ensure_future(self._wallet.current_backend.zeroex_fill_watcher.unwatch_order_hash(exchange_order_id))
             del self._in_flight_limit_orders[order_id]
+            self._in_flight_limit_orders_by_hash.pop(exchange_order_id, None)
         elif order_id in self._in_flight_market_orders:
             del self._in_flight_market_orders[order_id]
 
@@ -214,9 +214,9 @@ class BambooRelayOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    # Diff message just refreshes the entire snapshot
+                    # Only the price levels touched by the message are returned
                     bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_snapshot(bids, asks, message.update_id)
+                    order_book.apply_diffs(bids, asks, message.update_id)
                 elif message.type is OrderBookMessageType.SNAPSHOT:
                     s_bids, s_asks = active_order_tracker.convert_snapshot_message_to_order_book_row(message)
                     order_book.apply_snapshot(s_bids, s_asks, message.update_id)
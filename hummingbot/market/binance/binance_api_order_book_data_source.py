@@ -19,6 +19,8 @@ from websockets.exceptions import ConnectionClosed
 
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.message_decoder_pool import MessageDecoderPool
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -34,10 +36,22 @@ TICKER_PRICE_CHANGE_URL = "https://api.binance.com/api/v1/ticker/24hr"
 EXCHANGE_INFO_URL = "https://api.binance.com/api/v1/exchangeInfo"
 
 
+def decode_diff_messages(raw_messages: List[str]) -> List[OrderBookMessage]:
+    timestamp: float = time.time()
+    return [BinanceOrderBook.diff_message_from_exchange(ujson.loads(raw_msg), timestamp)
+            for raw_msg in raw_messages]
+
+
+def decode_trade_messages(raw_messages: List[str]) -> List[OrderBookMessage]:
+    return [BinanceOrderBook.trade_message_from_exchange(ujson.loads(raw_msg)) for raw_msg in raw_messages]
+
+
 class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
     PING_TIMEOUT = 10.0
+    # A 1000 level depth snapshot weighs 10 on Binance's request weight limits.
+    SNAPSHOT_REQUEST_WEIGHT = 10
 
     _baobds_logger: Optional[HummingbotLogger] = None
 
@@ -51,6 +65,7 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
         super().__init__()
         self._trading_pairs: Optional[List[str]] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
+        self._snapshot_throttler: Throttler = Throttler(rate_limit=(20, 1.0), name="binance_order_book_snapshots")
 
     @classmethod
     @async_ttl_cache(ttl=60 * 30, maxsize=1)
@@ -132,6 +147,17 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
             return data
 
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        async with self._snapshot_throttler.weighted_task(request_weight=self.SNAPSHOT_REQUEST_WEIGHT):
+            async with aiohttp.ClientSession() as client:
+                snapshot: Dict[str, Any] = await self.get_snapshot(client, trading_pair, 1000)
+        snapshot_timestamp: float = time.time()
+        return BinanceOrderBook.snapshot_message_from_exchange(
+            snapshot,
+            snapshot_timestamp,
+            metadata={"trading_pair": trading_pair}
+        )
+
     async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
         # Get the currently active markets
         async with aiohttp.ClientSession() as client:
@@ -191,10 +217,17 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
-                        output.put_nowait(trade_msg)
+                    decoder_pool: Optional[MessageDecoderPool] = MessageDecoderPool.shared_instance()
+                    if decoder_pool is not None:
+                        async for batch in decoder_pool.decode_stream(self._inner_messages(ws),
+                                                                      decode_trade_messages):
+                            for trade_msg in batch:
+                                output.put_nowait(trade_msg)
+                    else:
+                        async for raw_msg in self._inner_messages(ws):
+                            msg = ujson.loads(raw_msg)
+                            trade_msg: OrderBookMessage = BinanceOrderBook.trade_message_from_exchange(msg)
+                            output.put_nowait(trade_msg)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -211,11 +244,18 @@ class BinanceAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
                 async with websockets.connect(stream_url) as ws:
                     ws: websockets.WebSocketClientProtocol = ws
-                    async for raw_msg in self._inner_messages(ws):
-                        msg = ujson.loads(raw_msg)
-                        order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
-                            msg, time.time())
-                        output.put_nowait(order_book_message)
+                    decoder_pool: Optional[MessageDecoderPool] = MessageDecoderPool.shared_instance()
+                    if decoder_pool is not None:
+                        async for batch in decoder_pool.decode_stream(self._inner_messages(ws),
+                                                                      decode_diff_messages):
+                            for order_book_message in batch:
+                                output.put_nowait(order_book_message)
+                    else:
+                        async for raw_msg in self._inner_messages(ws):
+                            msg = ujson.loads(raw_msg)
+                            order_book_message: OrderBookMessage = BinanceOrderBook.diff_message_from_exchange(
+                                msg, time.time())
+                            output.put_nowait(order_book_message)
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -28,6 +28,7 @@ from typing import (
 
 import conf
 from hummingbot.core.utils.asyncio_throttle import Throttler
+from hummingbot.core.utils.warm_cache import WarmCache
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -66,6 +67,7 @@ from hummingbot.core.data_type.user_stream_tracker import UserStreamTrackerDataS
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.transaction_tracker import TransactionTracker
 from hummingbot.market.trading_rule cimport TradingRule
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -112,7 +114,7 @@ cdef class BinanceMarket(MarketBase):
     API_CALL_TIMEOUT = 10.0
     SHORT_POLL_INTERVAL = 5.0
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
-    LONG_POLL_INTERVAL = 120.0
+    USER_STREAM_STALE_INTERVAL = 60.0
     BINANCE_TRADE_TOPIC_NAME = "binance-trade.serialized"
     BINANCE_USER_STREAM_TOPIC_NAME = "binance-user-stream.serialized"
 
@@ -158,7 +160,7 @@ cdef class BinanceMarket(MarketBase):
         self._trading_rules_polling_task = None
         self._async_scheduler = AsyncCallScheduler(call_interval=0.5)
         self._last_poll_timestamp = 0
-        self._throttler = Throttler((10.0, 1.0))
+        self._throttler = Throttler((10.0, 1.0), name="binance")
 
     @staticmethod
     def split_trading_pair(trading_pair: str) -> Optional[Tuple[str, str]]:
@@ -224,6 +226,13 @@ cdef class BinanceMarket(MarketBase):
     def user_stream_tracker(self) -> BinanceUserStreamTracker:
         return self._user_stream_tracker
 
+    @property
+    def poll_notifier(self) -> asyncio.Event:
+        """
+        Set by c_tick to wake up the REST status polling loop.
+        """
+        return self._poll_notifier
+
     def restore_tracking_states(self, saved_states: Dict[str, any]):
         self._in_flight_orders.update({
             key: BinanceInFlightOrder.from_json(value)
@@ -268,7 +277,7 @@ cdef class BinanceMarket(MarketBase):
 
     async def query_url(self, url, request_weight: int = 1) -> any:
         async with self._throttler.weighted_task(request_weight=request_weight):
-            async with aiohttp.ClientSession() as client:
+            async with aiohttp.ClientSession(trace_configs=rest_request_trace_configs("binance")) as client:
                 async with client.get(url, timeout=self.API_CALL_TIMEOUT) as response:
                     if response.status != 200:
                         raise IOError(f"Error fetching data from {url}. HTTP status is {response.status}.")
@@ -349,12 +358,20 @@ cdef class BinanceMarket(MarketBase):
         cdef:
             int64_t last_tick = <int64_t>(self._last_timestamp / 60.0)
             int64_t current_tick = <int64_t>(self._current_timestamp / 60.0)
+        warm_cache = WarmCache.shared_instance()
+        if len(self._trading_rules) < 1 and warm_cache is not None:
+            # Start from the trading rules saved by the last run, the live rules replace them on the next minute.
+            self._trading_rules.update(warm_cache.load_trading_rules(self.name))
+            if len(self._trading_rules) > 0:
+                return
         if current_tick > last_tick or len(self._trading_rules) < 1:
             exchange_info = await self.query_api(self._binance_client.get_exchange_info)
             trading_rules_list = self._format_trading_rules(exchange_info)
             self._trading_rules.clear()
             for trading_rule in trading_rules_list:
                 self._trading_rules[trading_rule.trading_pair] = trading_rule
+            if warm_cache is not None:
+                await warm_cache.save_trading_rules(self.name, self._trading_rules)
 
     def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
@@ -807,14 +824,15 @@ cdef class BinanceMarket(MarketBase):
     cdef c_tick(self, double timestamp):
         cdef:
             double now = time.time()
-            double poll_interval = (self.SHORT_POLL_INTERVAL
-                                    if now - self.user_stream_tracker.last_recv_time > 60.0
-                                    else self.LONG_POLL_INTERVAL)
-            int64_t last_tick = <int64_t>(self._last_timestamp / poll_interval)
-            int64_t current_tick = <int64_t>(timestamp / poll_interval)
+            int64_t last_tick = <int64_t>(self._last_timestamp / self.SHORT_POLL_INTERVAL)
+            int64_t current_tick = <int64_t>(timestamp / self.SHORT_POLL_INTERVAL)
         MarketBase.c_tick(self, timestamp)
         self._tx_tracker.c_tick(timestamp)
-        if current_tick > last_tick:
+        # The user stream is authoritative for order, fill and balance updates. The REST status polling only runs to
+        # fetch the initial balances, and to reconcile state while the user stream is stale.
+        if current_tick > last_tick and (len(self._account_balances) == 0 or
+                                         now - self._user_stream_tracker.last_recv_time >
+                                         self.USER_STREAM_STALE_INTERVAL):
             if not self._poll_notifier.is_set():
                 self._poll_notifier.set()
         self._last_timestamp = timestamp
@@ -1055,3 +1073,30 @@ cdef class BinanceMarket(MarketBase):
             return s_decimal_0
 
         return quantized_amount
+
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices):
+        cdef:
+            TradingRule trading_rule = self._trading_rules[trading_pair]
+            object price_quantum = trading_rule.min_price_increment
+        return [price if price.is_nan() else round(price / price_quantum) * price_quantum for price in prices]
+
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts, list prices=None):
+        cdef:
+            TradingRule trading_rule = self._trading_rules[trading_pair]
+            object order_size_quantum = Decimal(trading_rule.min_base_amount_increment)
+            object min_notional_size = trading_rule.min_notional_size * Decimal("1.01")
+            object current_price = self.c_get_price(trading_pair, False)
+            list quantized_amounts = []
+            object quantized_amount
+        if prices is None:
+            prices = [s_decimal_0] * len(amounts)
+
+        # Same checks as c_quantize_order_amount(), with the trading rule and the current price looked up once.
+        for amount, price in zip(amounts, prices):
+            quantized_amount = (amount // order_size_quantum) * order_size_quantum
+            if quantized_amount < trading_rule.min_order_size:
+                quantized_amount = s_decimal_0
+            elif (current_price if price == s_decimal_0 else price) * quantized_amount < min_notional_size:
+                quantized_amount = s_decimal_0
+            quantized_amounts.append(quantized_amount)
+        return quantized_amounts
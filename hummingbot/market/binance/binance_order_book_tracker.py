@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_message import OrderBookMessage, Order
 
 
 class BinanceOrderBookTracker(OrderBookTracker):
+    SUPPORTS_WARM_CACHE: bool = True
     _bobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -59,6 +60,17 @@ class BinanceOrderBookTracker(OrderBookTracker):
     def exchange_name(self) -> str:
         return "binance"
 
+    def _is_diff_stale(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        # Duplicate and out of order diffs end at or before the last update applied to the book. Applying them again
+        # would move the book's last diff update ID backwards.
+        return message.update_id <= max(order_book.snapshot_uid, order_book.last_diff_uid)
+
+    def _is_diff_in_sequence(self, order_book: OrderBook, message: OrderBookMessage) -> bool:
+        # Binance diffs carry the first (U) and last (u) update IDs they cover. A diff is in sequence if it starts at
+        # or before the update right after the last one applied to the book.
+        last_update_id: int = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return message.first_update_id <= last_update_id + 1
+
     async def _order_book_diff_router(self):
         """
         Route the real-time order book diff messages to the correct order book.
@@ -131,11 +143,8 @@ class BinanceOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
-                    while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
-                        past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    if self._apply_diff_message(trading_pair, order_book, message, past_diffs_window):
+                        diff_messages_accepted += 1
 
                     # Output some statistics periodically.
                     now: float = time.time()
@@ -145,8 +154,7 @@ class BinanceOrderBookTracker(OrderBookTracker):
                         diff_messages_accepted = 0
                     last_message_timestamp = now
                 elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+                    self._apply_snapshot_message(trading_pair, order_book, message, past_diffs_window)
                     self.logger().debug("Processed order book snapshot for %s.", trading_pair)
             except asyncio.CancelledError:
                 raise
@@ -57,6 +57,7 @@ from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.market.bitcoin_com.bitcoin_com_in_flight_order import BitcoinComInFlightOrder
 from hummingbot.market.bitcoin_com.bitcoin_com_in_flight_order cimport BitcoinComInFlightOrder
 from hummingbot.market.bitcoin_com.bitcoin_com_utils import EventTypes, join_paths
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 
 s_logger = None
@@ -354,7 +355,7 @@ cdef class BitcoinComMarket(MarketBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = aiohttp.ClientSession(trace_configs=rest_request_trace_configs("bitcoin_com"))
         return self._shared_client
 
     async def _api_request(self,
@@ -1,10 +1,6 @@
 # distutils: language=c++
 cimport numpy as np
+from hummingbot.core.data_type.l3_active_order_tracker cimport L3ActiveOrderTracker
 
-cdef class BitfinexActiveOrderTracker:
-    cdef dict _active_bids
-    cdef dict _active_asks
-
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message)
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message)
-    cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message)
+cdef class BitfinexActiveOrderTracker(L3ActiveOrderTracker):
+    pass
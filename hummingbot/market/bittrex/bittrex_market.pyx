@@ -34,6 +34,7 @@ from hummingbot.market.bittrex.bittrex_user_stream_tracker import BittrexUserStr
 from hummingbot.market.deposit_info import DepositInfo
 from hummingbot.market.market_base import NaN
 from hummingbot.market.trading_rule cimport TradingRule
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -67,6 +68,7 @@ cdef class BittrexMarket(MarketBase):
 
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    USER_STREAM_STALE_INTERVAL = 60.0
     ORDER_NOT_EXIST_CONFIRMATION_COUNT = 3
 
     BITTREX_API_ENDPOINT = "https://api.bittrex.com/v3"
@@ -125,6 +127,17 @@ cdef class BittrexMarket(MarketBase):
     def bittrex_auth(self) -> BittrexAuth:
         return self._bittrex_auth
 
+    @property
+    def user_stream_tracker(self) -> BittrexUserStreamTracker:
+        return self._user_stream_tracker
+
+    @property
+    def poll_notifier(self) -> asyncio.Event:
+        """
+        Set by c_tick to wake up the REST status polling loop.
+        """
+        return self._poll_notifier
+
     @property
     def status_dict(self) -> Dict[str, bool]:
         return {
@@ -166,12 +179,17 @@ cdef class BittrexMarket(MarketBase):
 
     cdef c_tick(self, double timestamp):
         cdef:
+            double now = time.time()
             int64_t last_tick = <int64_t> (self._last_timestamp / self._poll_interval)
             int64_t current_tick = <int64_t> (timestamp / self._poll_interval)
 
         MarketBase.c_tick(self, timestamp)
         self._tx_tracker.c_tick(timestamp)
-        if current_tick > last_tick:
+        # Balance and order deltas from the user stream are authoritative. The REST status polling only runs to fetch
+        # the initial balances, and to reconcile state while the user stream is stale.
+        if current_tick > last_tick and (len(self._account_balances) == 0 or
+                                         now - self._user_stream_tracker.last_recv_time >
+                                         self.USER_STREAM_STALE_INTERVAL):
             if not self._poll_notifier.is_set():
                 self._poll_notifier.set()
         self._last_timestamp = timestamp
@@ -992,7 +1010,7 @@ cdef class BittrexMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = aiohttp.ClientSession(trace_configs=rest_request_trace_configs("bittrex"))
         return self._shared_client
 
     async def _api_request(self,
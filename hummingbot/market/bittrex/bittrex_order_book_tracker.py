@@ -249,3 +249,5 @@ class BittrexOrderBookTracker(OrderBookTracker):
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
+        if len(self._order_book_features) > 0:
+            self._start_order_book_features_task()
@@ -1,7 +1,9 @@
+import asyncio
 import subprocess
 from subprocess import CalledProcessError
 from decimal import Decimal
-from typing import List, Optional, Dict
+import time
+from typing import List, Optional, Dict, Tuple
 from hummingbot.market.celo.celo_data_types import CeloExchangeRate, CeloBalance
 
 
@@ -9,23 +11,51 @@ UNIT_MULTIPLIER = Decimal(1e18)
 CELO_BASE = "CGLD"
 CELO_QUOTE = "CUSD"
 SYMBOLS_MAP = {CELO_BASE: "gold", CELO_QUOTE: "usd"}
+# Exchange rates only change once per block, Celo produces a block every 5 seconds.
+EXCHANGE_RATE_CACHE_TTL = 5.0
+# Seconds a celocli call run as an asyncio subprocess is given to finish before it is killed.
+ASYNC_COMMAND_TIMEOUT = 30.0
 
 
 def command(commands: List[str]) -> Optional[str]:
     try:
         output = subprocess.check_output(commands, stderr=subprocess.STDOUT, shell=False)
-        output = output.decode("utf-8").strip()
-
-        # ignore lines with "libusb".
-        output = "\n".join([line for line in output.split("\n") if "libusb" not in line])
-
-        if output == "":
-            output = None
-        return output
+        return clean_output(output)
     except CalledProcessError as e:
         raise Exception(error_msg_from_output(e.output))
 
 
+async def async_command(commands: List[str], timeout: float = ASYNC_COMMAND_TIMEOUT) -> Optional[str]:
+    """
+    Same as command, but runs celocli as an asyncio subprocess so the event loop isn't blocked while it runs. A
+    celocli call that hangs is killed after timeout seconds, and raises asyncio.TimeoutError.
+    """
+    process = await asyncio.create_subprocess_exec(*commands,
+                                                   stdout=asyncio.subprocess.PIPE,
+                                                   stderr=asyncio.subprocess.STDOUT)
+    try:
+        output, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except (asyncio.TimeoutError, asyncio.CancelledError):
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+    if process.returncode != 0:
+        raise Exception(error_msg_from_output(output))
+    return clean_output(output)
+
+
+def clean_output(output: bytes) -> Optional[str]:
+    output = output.decode("utf-8").strip()
+
+    # ignore lines with "libusb".
+    output = "\n".join([line for line in output.split("\n") if "libusb" not in line])
+
+    if output == "":
+        output = None
+    return output
+
+
 def error_msg_from_output(output):
     lines = output.decode("utf-8").split("\n")
     err_lines = [line for line in lines if "Error" in line]
@@ -39,6 +69,8 @@ def error_msg_from_output(output):
 class CeloCLI:
     unlocked = False
     address = None
+    # amount in wei -> (fetch timestamp, exchange rates)
+    _exchange_rate_cache: Dict[str, Tuple[float, List[CeloExchangeRate]]] = {}
 
     @classmethod
     def unlock_account(cls, address: str, password: str) -> Optional[str]:
@@ -53,8 +85,17 @@ class CeloCLI:
 
     @classmethod
     def balances(cls) -> Dict[str, CeloBalance]:
-        balances = {}
         output = command(["celocli", "account:balance", cls.address])
+        return cls._balances_from_output(output)
+
+    @classmethod
+    async def balances_async(cls) -> Dict[str, CeloBalance]:
+        output = await async_command(["celocli", "account:balance", cls.address])
+        return cls._balances_from_output(output)
+
+    @classmethod
+    def _balances_from_output(cls, output: str) -> Dict[str, CeloBalance]:
+        balances = {}
         lines = output.split("\n")
         raw_balances = {}
         for line in lines:
@@ -68,8 +109,51 @@ class CeloCLI:
 
     @classmethod
     def exchange_rate(cls, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
+        args = cls._exchange_rate_args(amount)
+        rates = cls._cached_exchange_rates(args)
+        if rates is None:
+            rates = cls._cache_exchange_rates(args, command(args))
+        return rates
+
+    @classmethod
+    async def exchange_rate_async(cls, amount: Decimal = Decimal("1")) -> List[CeloExchangeRate]:
+        args = cls._exchange_rate_args(amount)
+        rates = cls._cached_exchange_rates(args)
+        if rates is None:
+            rates = cls._cache_exchange_rates(args, await async_command(args))
+        return rates
+
+    @classmethod
+    def _exchange_rate_args(cls, amount: Decimal) -> List[str]:
         amount *= UNIT_MULTIPLIER
-        output = command(["celocli", "exchange:show", "--amount", str(int(amount))])
+        return ["celocli", "exchange:show", "--amount", str(int(amount))]
+
+    @classmethod
+    def _cached_exchange_rates(cls, args: List[str]) -> Optional[List[CeloExchangeRate]]:
+        cached = cls._exchange_rate_cache.get(args[-1])
+        if cached is not None and time.time() - cached[0] < EXCHANGE_RATE_CACHE_TTL:
+            return cached[1]
+        return None
+
+    @classmethod
+    def _cache_exchange_rates(cls, args: List[str], output: str) -> List[CeloExchangeRate]:
+        rates = cls._exchange_rates_from_output(output)
+        now = time.time()
+        for key in [k for k, (timestamp, _) in cls._exchange_rate_cache.items()
+                    if now - timestamp >= EXCHANGE_RATE_CACHE_TTL]:
+            del cls._exchange_rate_cache[key]
+        cls._exchange_rate_cache[args[-1]] = (now, rates)
+        return rates
+
+    @classmethod
+    def clear_exchange_rate_cache(cls):
+        """
+        Cached rates are stale as soon as a trade has moved the exchange's buckets, this is called after every trade.
+        """
+        cls._exchange_rate_cache.clear()
+
+    @classmethod
+    def _exchange_rates_from_output(cls, output: str) -> List[CeloExchangeRate]:
         lines = output.split("\n")
         rates = []
         for line in lines:
@@ -91,7 +175,10 @@ class CeloCLI:
         if min_cgld_returned is not None:
             min_cgld_returned *= UNIT_MULTIPLIER
             args += ["--forAtLeast", str(int(min_cgld_returned))]
-        output = command(args)
+        try:
+            output = command(args)
+        finally:
+            cls.clear_exchange_rate_cache()
         return cls._tx_hash_from_exchange_output(output)
 
     @classmethod
@@ -101,7 +188,10 @@ class CeloCLI:
         if min_cusd_returned is not None:
             min_cusd_returned *= UNIT_MULTIPLIER
             args += ["--forAtLeast", str(int(min_cusd_returned))]
-        output = command(args)
+        try:
+            output = command(args)
+        finally:
+            cls.clear_exchange_rate_cache()
         return cls._tx_hash_from_exchange_output(output)
 
     @classmethod
@@ -112,7 +202,14 @@ class CeloCLI:
 
     @classmethod
     def validate_node_synced(cls) -> Optional[str]:
-        output = command(["celocli", "node:synced"])
+        return cls._node_synced_error_from_output(command(["celocli", "node:synced"]))
+
+    @classmethod
+    async def validate_node_synced_async(cls) -> Optional[str]:
+        return cls._node_synced_error_from_output(await async_command(["celocli", "node:synced"]))
+
+    @classmethod
+    def _node_synced_error_from_output(cls, output: str) -> Optional[str]:
         lines = output.split("\n")
         if "true" not in [line.strip().lower() for line in lines]:
             return lines[0]
@@ -53,6 +53,7 @@ from hummingbot.market.market_base import (
 from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.market.coinbase_pro.coinbase_pro_in_flight_order import CoinbaseProInFlightOrder
 from hummingbot.market.coinbase_pro.coinbase_pro_in_flight_order cimport CoinbaseProInFlightOrder
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -326,7 +327,7 @@ cdef class CoinbaseProMarket(MarketBase):
         :returns: Shared client session instance
         """
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = aiohttp.ClientSession(trace_configs=rest_request_trace_configs("coinbase_pro"))
         return self._shared_client
 
     async def _api_request(self,
@@ -33,6 +33,8 @@ from hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker_entry import
 
 
 class CoinbaseProOrderBookTracker(OrderBookTracker):
+    MAX_DIFF_BATCH_SIZE = 500
+
     _cbpobt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -191,12 +193,22 @@ class CoinbaseProOrderBookTracker(OrderBookTracker):
                     message = await message_queue.get()
 
                 if message.type is OrderBookMessageType.DIFF:
-                    bids, asks = active_order_tracker.convert_diff_message_to_order_book_row(message)
-                    order_book.apply_diffs(bids, asks, message.update_id)
-                    past_diffs_window.append(message)
+                    # Apply every diff that is already waiting in one go, so a busy level is only written to the
+                    # order book once per batch.
+                    diff_messages: List[CoinbaseProOrderBookMessage] = [message]
+                    while len(saved_messages) == 0 and not message_queue.empty() and \
+                            len(diff_messages) < self.MAX_DIFF_BATCH_SIZE:
+                        next_message: CoinbaseProOrderBookMessage = message_queue.get_nowait()
+                        if next_message.type is not OrderBookMessageType.DIFF:
+                            saved_messages.append(next_message)
+                            break
+                        diff_messages.append(next_message)
+                    bids, asks = active_order_tracker.convert_diff_messages_to_order_book_row(diff_messages)
+                    order_book.apply_diffs(bids, asks, diff_messages[-1].update_id)
+                    past_diffs_window.extend(diff_messages)
                     while len(past_diffs_window) > self.PAST_DIFF_WINDOW_SIZE:
                         past_diffs_window.popleft()
-                    diff_messages_accepted += 1
+                    diff_messages_accepted += len(diff_messages)
 
                     # Output some statistics periodically.
                     now: float = time.time()
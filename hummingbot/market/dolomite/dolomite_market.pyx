@@ -53,6 +53,7 @@ from hummingbot.market.dolomite.dolomite_util import (
     DolomiteExchangeRates,
     DolomiteExchangeInfo
 )
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
 s_logger = None
@@ -752,7 +753,7 @@ cdef class DolomiteMarket(MarketBase):
                           headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
 
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = aiohttp.ClientSession(trace_configs=rest_request_trace_configs("dolomite"))
 
         if data is not None and http_method == "POST":
             data = json.dumps(data).encode('utf8')
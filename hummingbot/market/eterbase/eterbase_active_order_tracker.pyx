@@ -7,10 +7,8 @@ from decimal import Decimal
 from typing import Dict
 
 from hummingbot.logger import HummingbotLogger
-from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 _eaot_logger = None
-s_empty_diff = np.ndarray(shape=(0, 4), dtype="float64")
 
 EterbaseOrderBookTrackingDictionary = Dict[Decimal, Dict[str, Dict[str, any]]]
 
@@ -23,13 +21,11 @@ SIDE_SELL = 2
 SIDE_NaN = 0
 ORDER_TYPE_MARKET = 1
 
-cdef class EterbaseActiveOrderTracker:
+cdef class EterbaseActiveOrderTracker(L3ActiveOrderTracker):
     def __init__(self,
                  active_asks: EterbaseOrderBookTrackingDictionary = None,
                  active_bids: EterbaseOrderBookTrackingDictionary = None):
-        super().__init__()
-        self._active_asks = active_asks or {}
-        self._active_bids = active_bids or {}
+        super().__init__(active_asks, active_bids, size_key="remaining_size")
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -38,40 +34,9 @@ cdef class EterbaseActiveOrderTracker:
             _eaot_logger = logging.getLogger(__name__)
         return _eaot_logger
 
-    @property
-    def active_asks(self) -> EterbaseOrderBookTrackingDictionary:
+    cdef c_apply_diff_message(self, object message):
         """
-        Get all asks on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
-        """
-        return self._active_asks
-
-    @property
-    def active_bids(self) -> EterbaseOrderBookTrackingDictionary:
-        """
-        Get all bids on the order book in dictionary format
-        :returns: Dict[price, Dict[order_id, order_book_message]]
-        """
-        return self._active_bids
-
-    def volume_for_ask_price(self, price) -> float:
-        """
-        For a certain price, get the volume sum of all ask order book rows with that price
-        :returns: volume sum
-        """
-        return sum([float(msg["remaining_size"]) for msg in self._active_asks[price].values()])
-
-    def volume_for_bid_price(self, price) -> float:
-        """
-        For a certain price, get the volume sum of all bid order book rows with that price
-        :returns: volume sum
-        """
-        return sum([float(msg["remaining_size"]) for msg in self._active_bids[price].values()])
-
-    cdef tuple c_convert_diff_message_to_np_arrays(self, object message):
-        """
-        Interpret an incoming diff message and apply changes to the order book accordingly
-        :returns: neworder book rows: Tuple(np.array (bids), np.array (asks))
+        Interpret an incoming diff message and apply changes to the tracked orders accordingly
         """
         cdef:
             dict content = message.content
@@ -80,13 +45,10 @@ cdef class EterbaseActiveOrderTracker:
             int order_side = SIDE_NaN
             str price_raw
             object price
-            dict order_dict
-            str remaining_size
-            double timestamp = message.timestamp
-            double quantity = 0
+            tuple entry
         order_id = content.get("orderId")
         if (order_id) is None:
-            order_id = str(timestamp)
+            order_id = str(message.timestamp)
 
         price_raw = content.get("cost")
         if (price_raw is None):
@@ -98,201 +60,74 @@ cdef class EterbaseActiveOrderTracker:
 
         # 'change' messages have 'null' as price for market orders
         elif price_raw == "null":
-            return s_empty_diff, s_empty_diff
+            return
         price = None
         if (price_raw is not None):
             price = Decimal(price_raw)
-        if msg_type!="ob_update":
+        if msg_type != "ob_update":
             if (content.get("side") is not None):
                 order_side = content.get("side")
             if order_side == SIDE_NaN:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    order_side = self._active_bids[price][order_id]["side"]
+                entry = self._order_index.get(order_id)
+                if entry is not None:
+                    order_side = SIDE_BUY if entry[0] else SIDE_SELL
             if ((order_side != SIDE_BUY) and (order_side != SIDE_SELL)):
                 raise ValueError(f"Invalid msg side it is not sell nor buy - found side: {order_side} for message {message}'. Aborting.")
 
         if msg_type == "ob_update":
-            changes = content["changes"]
-            for change in changes:
-                price = change[0]
-                quantity = change[1]
-
+            # Aggregated level updates, each change replaces the whole price level.
+            for change in content["changes"]:
+                price = Decimal(str(change[0]))
                 side = change[3]
-                order_dict = {
-                    "order_id": order_id,
-                    "remaining_size": quantity,
-                    "side": side
-                }
-
-                if side == SIDE_BUY:
-                    if price in self._active_bids:
-                        self._active_bids[price][order_id] = order_dict
-                    else:
-                        self._active_bids[price] = {order_id: order_dict}
-                    return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-                elif side == SIDE_SELL:
-                    if price in self._active_asks:
-                        self._active_asks[price][order_id] = order_dict
-                    else:
-                        self._active_asks[price] = {order_id: order_dict}
-                    return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                else:
+                if side != SIDE_BUY and side != SIDE_SELL:
                     raise ValueError(f"Invalid msg side it is not sell nor buy, found side: {side} for message {message}'. Aborting.")
+                self.c_set_level(side == SIDE_BUY, price, f"{price}_{side}", change[1], {
+                    "order_id": f"{price}_{side}",
+                    "remaining_size": change[1],
+                    "side": side
+                })
         elif msg_type == TYPE_OPEN:
-
-            order_dict = {
+            self.c_add_order(order_side == SIDE_BUY, price, order_id, content["qty"], {
                 "order_id": order_id,
                 "remaining_size": content["qty"],
                 "side": order_side,
                 "order_type": content["oType"]
-            }
-            if order_side == SIDE_BUY:
-                if price in self._active_bids:
-                    self._active_bids[price][order_id] = order_dict
-                else:
-                    self._active_bids[price] = {order_id: order_dict}
-                quantity = self.volume_for_bid_price(price)
-                return np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"), s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks:
-                    self._active_asks[price][order_id] = order_dict
-                else:
-                    self._active_asks[price] = {order_id: order_dict}
-                quantity = self.volume_for_ask_price(price)
-                return s_empty_diff, np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-            else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
+            })
 
         elif msg_type == TYPE_MATCH:
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    remaining_size = self._active_bids[price][order_id]["remaining_size"]
-
-                    if (self._active_bids[price][order_id]["order_type"] == ORDER_TYPE_MARKET):
-                        self._active_bids[price][order_id]["remaining_size"] = str(float(content["remainingCost"]))
-                    else:
-                        self._active_bids[price][order_id]["remaining_size"] = str(float(content["remainingQty"]))
-                    quantity = self.volume_for_bid_price(price)
-                    return (
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                        s_empty_diff
-                    )
-                else:
-                    return s_empty_diff, s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    remaining_size = self._active_asks[price][order_id]["remaining_size"]
-                    self._active_asks[price][order_id]["remaining_size"] = str(float(content["remainingQty"]))
-                    quantity = self.volume_for_ask_price(price)
-                    return (
-                        s_empty_diff,
-                        np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                    )
+            entry = self._order_index.get(order_id)
+            if entry is not None:
+                order_dict = (self._active_bids if entry[0] else self._active_asks)[entry[1]][order_id]
+                if order_side == SIDE_BUY and order_dict.get("order_type") == ORDER_TYPE_MARKET:
+                    self.c_update_order_size(order_id, str(float(content["remainingCost"])))
                 else:
-                    return s_empty_diff, s_empty_diff
-            else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
+                    self.c_update_order_size(order_id, str(float(content["remainingQty"])))
 
         elif msg_type == TYPE_DONE:
-
-            if order_side == SIDE_BUY:
-                if price in self._active_bids and order_id in self._active_bids[price]:
-                    del self._active_bids[price][order_id]
-                    if len(self._active_bids[price]) < 1:
-                        del self._active_bids[price]
-                        return (
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                    else:
-                        quantity = self.volume_for_bid_price(price)
-                        return (
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64"),
-                            s_empty_diff
-                        )
-                return s_empty_diff, s_empty_diff
-            elif order_side == SIDE_SELL:
-                if price in self._active_asks and order_id in self._active_asks[price]:
-                    del self._active_asks[price][order_id]
-                    if len(self._active_asks[price]) < 1:
-                        del self._active_asks[price]
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), 0.0, message.update_id]], dtype="float64")
-                        )
-                    else:
-                        quantity = self.volume_for_ask_price(price)
-                        return (
-                            s_empty_diff,
-                            np.array([[timestamp, float(price), quantity, message.update_id]], dtype="float64")
-                        )
-                return s_empty_diff, s_empty_diff
-            else:
-                raise ValueError(f"Cannot determine order side - {order_side} for message - {message}. Aborting.")
+            self.c_remove_order(order_id)
 
         else:
             raise ValueError(f"Unknown message type '{msg_type}' - {message}. Aborting.")
 
-    cdef tuple c_convert_snapshot_message_to_np_arrays(self, object message):
+    cdef c_apply_snapshot_message(self, object message):
         """
-        Interpret an incoming snapshot message and apply changes to the order book accordingly
-        :returns: new order book rows: Tuple(np.array (bids), np.array (asks))
+        Interpret an incoming snapshot message and start tracking its orders
         """
         cdef:
             object price
             str order_id
             str amount
-            dict order_dict
-
-        # Refresh all order tracking.
-        self._active_bids.clear()
-        self._active_asks.clear()
 
-        for snapshot_orders, active_orders in [(message.content["bids"], self._active_bids),
-                                               (message.content["asks"], self._active_asks)]:
+        for snapshot_orders, is_bid in [(message.content["bids"], True),
+                                        (message.content["asks"], False)]:
             for order in snapshot_orders:
                 price = Decimal(order[0])
-
                 amount = str(order[1])
-
                 order_id = str(price) + "_" + amount + "_" + str(order[2])
-                order_dict = {
+                self.c_add_order(is_bid, price, order_id, amount, {
                     "order_id": order_id,
                     "remaining_size": amount
-                }
-
-                if price in active_orders:
-                    active_orders[price][order_id] = order_dict
-                else:
-                    active_orders[price] = {
-                        order_id: order_dict
-                    }
-
-        # Return the sorted snapshot tables.
-        cdef:
-            np.ndarray[np.float64_t, ndim=2] bids = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_bids[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_bids.keys(), reverse=True)], dtype="float64", ndmin=2)
-            np.ndarray[np.float64_t, ndim=2] asks = np.array(
-                [[message.timestamp,
-                  float(price),
-                  sum([float(order_dict["remaining_size"])
-                       for order_dict in self._active_asks[price].values()]),
-                  message.update_id]
-                 for price in sorted(self._active_asks.keys(), reverse=True)], dtype="float64", ndmin=2)
-
-        # If there're no rows, the shape would become (1, 0) and not (0, 4).
-        # Reshape to fix that.
-        if bids.shape[1] != 4:
-            bids = bids.reshape((0, 4))
-        if asks.shape[1] != 4:
-            asks = asks.reshape((0, 4))
-
-        return bids, asks
+                })
 
     cdef np.ndarray[np.float64_t, ndim=1] c_convert_trade_message_to_np_array(self, object message):
         """
@@ -306,23 +141,3 @@ cdef class EterbaseActiveOrderTracker:
             [message.timestamp, trade_type_value, float(message.content["cost"]), float(message.content["qty"])],
             dtype="float64"
         )
-
-    def convert_diff_message_to_order_book_row(self, message):
-        """
-        Convert an incoming diff message to Tuple of np.arrays, and then convert to OrderBookRow
-        :returns: Tuple(List[bids_row], List[asks_row])
-        """
-        np_bids, np_asks = self.c_convert_diff_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
-
-    def convert_snapshot_message_to_order_book_row(self, message):
-        """
-        Convert an incoming snapshot message to Tuple of np.arrays, and then convert to OrderBookRow
-        :returns: Tuple(List[bids_row], List[asks_row])
-        """
-        np_bids, np_asks = self.c_convert_snapshot_message_to_np_arrays(message)
-        bids_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_bids]
-        asks_row = [OrderBookRow(price, qty, update_id) for ts, price, qty, update_id in np_asks]
-        return bids_row, asks_row
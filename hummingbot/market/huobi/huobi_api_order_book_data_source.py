@@ -23,6 +23,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
+from hummingbot.core.utils.message_decoder_pool import MessageDecoderPool
 from hummingbot.logger import HummingbotLogger
 from hummingbot.market.huobi.huobi_order_book import HuobiOrderBook
 
@@ -32,6 +33,39 @@ HUOBI_DEPTH_URL = "https://api.huobi.pro/market/depth"
 HUOBI_WS_URI = "wss://api.huobi.pro/ws"
 
 
+def decode_diff_messages(raw_messages: List[bytes]) -> List[Any]:
+    """
+    Decodes a batch of Huobi depth frames. Order book updates are normalized into OrderBookMessage objects, control
+    messages (pings, subscription replies) are returned as decoded dicts.
+    """
+    decoded: List[Any] = []
+    for raw_msg in raw_messages:
+        # Huobi compresses their ws data, and its data value for id is a large int too big for ujson to parse
+        msg: Dict[str, Any] = json.loads(gzip.decompress(raw_msg).decode("utf-8"))
+        if "ch" in msg:
+            decoded.append(HuobiOrderBook.diff_message_from_exchange(msg))
+        else:
+            decoded.append(msg)
+    return decoded
+
+
+def decode_trade_messages(raw_messages: List[bytes]) -> List[Any]:
+    """
+    Decodes a batch of Huobi trade frames. Trades are normalized into OrderBookMessage objects, control messages
+    (pings, subscription replies) are returned as decoded dicts.
+    """
+    decoded: List[Any] = []
+    for raw_msg in raw_messages:
+        msg: Dict[str, Any] = json.loads(gzip.decompress(raw_msg).decode("utf-8"))
+        if "ch" in msg:
+            trading_pair: str = msg["ch"].split(".")[1]
+            decoded.extend(HuobiOrderBook.trade_message_from_exchange(data, metadata={"trading_pair": trading_pair})
+                           for data in msg["tick"]["data"])
+        else:
+            decoded.append(msg)
+    return decoded
+
+
 class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
     MESSAGE_TIMEOUT = 30.0
@@ -170,6 +204,18 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         finally:
             await ws.close()
 
+    async def _process_decoded_batch(self, ws: websockets.WebSocketClientProtocol, batch: List[Any],
+                                     output: asyncio.Queue):
+        for item in batch:
+            if isinstance(item, OrderBookMessage):
+                output.put_nowait(item)
+            elif "ping" in item:
+                await ws.send(f'{{"op":"pong","ts": {str(item["ping"])}}}')
+            elif "subbed" in item:
+                pass
+            else:
+                self.logger().debug(f"Unrecognized message received from Huobi websocket: {item}")
+
     async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
         while True:
             try:
@@ -183,6 +229,13 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(json.dumps(subscribe_request))
 
+                    decoder_pool: Optional[MessageDecoderPool] = MessageDecoderPool.shared_instance()
+                    if decoder_pool is not None:
+                        async for batch in decoder_pool.decode_stream(self._inner_messages(ws),
+                                                                      decode_trade_messages):
+                            await self._process_decoded_batch(ws, batch, output)
+                        continue
+
                     async for raw_msg in self._inner_messages(ws):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
@@ -221,6 +274,13 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
                         }
                         await ws.send(json.dumps(subscribe_request))
 
+                    decoder_pool: Optional[MessageDecoderPool] = MessageDecoderPool.shared_instance()
+                    if decoder_pool is not None:
+                        async for batch in decoder_pool.decode_stream(self._inner_messages(ws),
+                                                                      decode_diff_messages):
+                            await self._process_decoded_batch(ws, batch, output)
+                        continue
+
                     async for raw_msg in self._inner_messages(ws):
                         # Huobi compresses their ws data
                         encoded_msg: bytes = gzip.decompress(raw_msg)
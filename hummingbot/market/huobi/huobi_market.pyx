@@ -59,6 +59,7 @@ from hummingbot.market.market_base import (
     MarketBase,
     NaN,
     s_decimal_NaN)
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.core.utils.estimate_fee import estimate_fee
@@ -101,6 +102,7 @@ cdef class HuobiMarket(MarketBase):
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     API_CALL_TIMEOUT = 10.0
     UPDATE_ORDERS_INTERVAL = 10.0
+    BATCH_ORDER_LIMIT = 10
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -263,7 +265,7 @@ cdef class HuobiMarket(MarketBase):
 
     async def _http_client(self) -> aiohttp.ClientSession:
         if self._shared_client is None:
-            self._shared_client = aiohttp.ClientSession()
+            self._shared_client = aiohttp.ClientSession(trace_configs=rest_request_trace_configs("huobi"))
         return self._shared_client
 
     async def _api_request(self,
@@ -806,6 +808,171 @@ cdef class HuobiMarket(MarketBase):
         safe_ensure_future(self.execute_cancel(trading_pair, order_id))
         return order_id
 
+    async def execute_batch_orders(self, trading_pair: str, orders: List[Tuple[str, bool, Decimal, Decimal]]):
+        """
+        Places limit orders through the order/batch-orders endpoint, BATCH_ORDER_LIMIT orders per request.
+
+        :param orders: (client order id, is buy, amount, price) of each order
+        """
+        cdef:
+            TradingRule trading_rule = self._trading_rules[trading_pair]
+            list batch = []
+
+        for order_id, is_buy, amount, price in orders:
+            decimal_amount = self.c_quantize_order_amount(trading_pair, amount)
+            decimal_price = self.c_quantize_order_price(trading_pair, price)
+            if decimal_amount < trading_rule.min_order_size:
+                self.logger().warning(f"{'Buy' if is_buy else 'Sell'} order amount {decimal_amount} is lower than the "
+                                      f"minimum order size {trading_rule.min_order_size}.")
+                self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                     MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.LIMIT))
+                continue
+            batch.append((order_id, is_buy, decimal_amount, decimal_price))
+
+        for i in range(0, len(batch), self.BATCH_ORDER_LIMIT):
+            await self._place_order_batch(trading_pair, batch[i:i + self.BATCH_ORDER_LIMIT])
+
+    async def _place_order_batch(self, trading_pair: str, batch: List[Tuple[str, bool, Decimal, Decimal]]):
+        """
+        Example response data:
+        [
+            {"order-id": 61713400772, "client-order-id": "buy-ethusdt-1590000000000000"},
+            {"err-code": "account-frozen-balance-insufficient-error",
+             "err-msg": "trade account balance is not enough, left: `0.0001`",
+             "client-order-id": "sell-ethusdt-1590000000000001"}
+        ]
+        """
+        data = [{
+            "account-id": self._account_id,
+            "amount": f"{amount:f}",
+            "client-order-id": order_id,
+            "price": f"{price:f}",
+            "symbol": trading_pair,
+            "type": f"{'buy' if is_buy else 'sell'}-limit",
+        } for order_id, is_buy, amount, price in batch]
+        try:
+            batch_results = await self._api_request(
+                "post",
+                path_url="order/batch-orders",
+                data=data,
+                is_auth_required=True
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network(
+                f"Error submitting batch orders to Huobi for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Failed to submit batch orders to Huobi. Check API key and network connection."
+            )
+            batch_results = []
+
+        order_results = {result.get("client-order-id"): result for result in batch_results}
+        for order_id, is_buy, amount, price in batch:
+            order_result = order_results.get(order_id, {})
+            if order_result.get("order-id") is None:
+                if len(order_results) > 0:
+                    self.logger().network(
+                        f"Error submitting {'buy' if is_buy else 'sell'} LIMIT order to Huobi for {amount} "
+                        f"{trading_pair} {price}: {order_result.get('err-msg')}",
+                        app_warning_msg=f"Failed to submit {'buy' if is_buy else 'sell'} order to Huobi. "
+                                        f"Check API key and network connection."
+                    )
+                self.c_trigger_event(self.MARKET_ORDER_FAILURE_EVENT_TAG,
+                                     MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.LIMIT))
+                continue
+            self.c_start_tracking_order(
+                client_order_id=order_id,
+                exchange_order_id=str(order_result["order-id"]),
+                trading_pair=trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY if is_buy else TradeType.SELL,
+                price=price,
+                amount=amount
+            )
+            self.logger().info(f"Created {OrderType.LIMIT} {'buy' if is_buy else 'sell'} order {order_id} for "
+                               f"{amount} {trading_pair}.")
+            if is_buy:
+                self.c_trigger_event(self.MARKET_BUY_ORDER_CREATED_EVENT_TAG,
+                                     BuyOrderCreatedEvent(self._current_timestamp, OrderType.LIMIT, trading_pair,
+                                                          amount, price, order_id))
+            else:
+                self.c_trigger_event(self.MARKET_SELL_ORDER_CREATED_EVENT_TAG,
+                                     SellOrderCreatedEvent(self._current_timestamp, OrderType.LIMIT, trading_pair,
+                                                           amount, price, order_id))
+
+    cdef list c_batch_submit_orders(self, str trading_pair, list order_requests):
+        cdef:
+            int64_t tracking_nonce
+            list order_ids = []
+            list orders = []
+
+        if any(order_request.order_type is not OrderType.LIMIT for order_request in order_requests):
+            # The batch endpoint is only used for limit orders.
+            return MarketBase.c_batch_submit_orders(self, trading_pair, order_requests)
+
+        for order_request in order_requests:
+            tracking_nonce = <int64_t> get_tracking_nonce()
+            order_id = f"{'buy' if order_request.is_buy else 'sell'}-{trading_pair}-{tracking_nonce}"
+            order_ids.append(order_id)
+            orders.append((order_id, order_request.is_buy, order_request.amount, order_request.price))
+        safe_ensure_future(self.execute_batch_orders(trading_pair, orders))
+        return order_ids
+
+    async def execute_batch_cancel(self, trading_pair: str, order_ids: List[str]):
+        tracked_orders = {}
+        for order_id in order_ids:
+            tracked_order = self._in_flight_orders.get(order_id)
+            if tracked_order is None:
+                self.logger().warning(f"Failed to cancel order - {order_id}. Order not found.")
+            elif tracked_order.exchange_order_id is None:
+                # The order hasn't been acknowledged yet, so it can't go into the batch request.
+                safe_ensure_future(self.execute_cancel(trading_pair, order_id))
+            else:
+                tracked_orders[tracked_order.exchange_order_id] = tracked_order
+        if len(tracked_orders) == 0:
+            return
+        exchange_order_ids = list(tracked_orders.keys())
+        path_url = "order/orders/batchcancel"
+        params = {"order-ids": ujson.dumps(exchange_order_ids)}
+        data = {"order-ids": exchange_order_ids}
+        try:
+            batch_cancel_results = await self._api_request(
+                "post",
+                path_url=path_url,
+                params=params,
+                data=data,
+                is_auth_required=True
+            )
+            for cancel_error in batch_cancel_results.get("failed", []):
+                tracked_order = tracked_orders.get(str(cancel_error.get("order-id")))
+                if tracked_order is None:
+                    continue
+                order_state = cancel_error.get("order-state")
+                if order_state == 7:
+                    # order-state is canceled
+                    self.c_stop_tracking_order(tracked_order.client_order_id)
+                    self.logger().info(f"The order {tracked_order.client_order_id} has been cancelled according"
+                                       f" to order status API. order_state - {order_state}")
+                    self.c_trigger_event(self.MARKET_ORDER_CANCELLED_EVENT_TAG,
+                                         OrderCancelledEvent(self._current_timestamp,
+                                                             tracked_order.client_order_id))
+                else:
+                    self.logger().network(
+                        f"Failed to cancel order {tracked_order.client_order_id}: {cancel_error.get('err-msg')}",
+                        app_warning_msg=f"Failed to cancel the order {tracked_order.client_order_id} on Huobi. "
+                                        f"Check API key and network connection."
+                    )
+        except Exception:
+            self.logger().network(
+                f"Failed to cancel orders: {order_ids}",
+                exc_info=True,
+                app_warning_msg=f"Failed to cancel orders on Huobi. Check API key and network connection."
+            )
+
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids):
+        safe_ensure_future(self.execute_batch_cancel(trading_pair, client_order_ids))
+
     async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
         open_orders = [o for o in self._in_flight_orders.values() if o.is_open]
         if len(open_orders) == 0:
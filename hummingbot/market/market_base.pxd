@@ -19,6 +19,8 @@ cdef class MarketBase(NetworkIterator):
     cdef str c_buy(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef str c_sell(self, str trading_pair, object amount, object order_type=*, object price=*, dict kwargs=*)
     cdef c_cancel(self, str trading_pair, str client_order_id)
+    cdef list c_batch_submit_orders(self, str trading_pair, list order_requests)
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids)
     cdef c_stop_tracking_order(self, str order_id)
     cdef object c_get_balance(self, str currency)
     cdef object c_get_available_balance(self, str currency)
@@ -29,6 +31,8 @@ cdef class MarketBase(NetworkIterator):
     cdef object c_get_order_size_quantum(self, str trading_pair, object order_size)
     cdef object c_quantize_order_price(self, str trading_pair, object price)
     cdef object c_quantize_order_amount(self, str trading_pair, object amount, object price=*)
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices)
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts, list prices=*)
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_base_amount(self, str trading_pair, bint is_buy, object base_amount)
     cdef ClientOrderBookQueryResult c_get_volume_for_price(self, str trading_pair, bint is_buy, object price)
     cdef ClientOrderBookQueryResult c_get_quote_volume_for_price(self, str trading_pair, bint is_buy, object price)
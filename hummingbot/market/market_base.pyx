@@ -24,6 +24,8 @@ from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkIterator
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_features import OrderBookFeatures
+from hummingbot.core.data_type.order_request import OrderRequest
 
 from .deposit_info import DepositInfo
 
@@ -140,6 +142,39 @@ cdef class MarketBase(NetworkIterator):
     cdef c_cancel(self, str trading_pair, str client_order_id):
         raise NotImplementedError
 
+    cdef list c_batch_submit_orders(self, str trading_pair, list order_requests):
+        """
+        Submits several orders for one trading pair. Markets with a batch order endpoint should override this to send
+        them in as few requests as possible; by default each order is submitted on its own. An order that can't be
+        submitted doesn't stop the rest of the batch.
+        :param order_requests: list of OrderRequest
+        :return: client order IDs, in the same order as the requests - None for the orders that couldn't be submitted
+        """
+        cdef:
+            list order_ids = []
+        for order_request in order_requests:
+            try:
+                if order_request.is_buy:
+                    order_ids.append(self.c_buy(trading_pair, order_request.amount, order_request.order_type,
+                                                order_request.price, order_request.kwargs))
+                else:
+                    order_ids.append(self.c_sell(trading_pair, order_request.amount, order_request.order_type,
+                                                 order_request.price, order_request.kwargs))
+            except Exception:
+                self.logger().error(f"Error submitting {'buy' if order_request.is_buy else 'sell'} order for "
+                                    f"{order_request.amount} {trading_pair} at {order_request.price}.",
+                                    exc_info=True)
+                order_ids.append(None)
+        return order_ids
+
+    cdef c_batch_cancel(self, str trading_pair, list client_order_ids):
+        """
+        Cancels several orders for one trading pair. Markets with a batch cancel endpoint should override this to
+        send them in as few requests as possible; by default each order is cancelled on its own.
+        """
+        for client_order_id in client_order_ids:
+            self.c_cancel(trading_pair, client_order_id)
+
     cdef c_stop_tracking_order(self, str order_id):
         raise NotImplementedError
 
@@ -194,6 +229,24 @@ cdef class MarketBase(NetworkIterator):
         order_size_quantum = self.c_get_order_size_quantum(trading_pair, amount)
         return (amount // order_size_quantum) * order_size_quantum
 
+    cdef list c_quantize_order_prices(self, str trading_pair, list prices):
+        """
+        Quantizes a list of order prices, e.g. all the levels of an order ladder, in one call. Markets whose
+        quantization doesn't depend on the price can override this to look up their trading rule once.
+        """
+        return [self.c_quantize_order_price(trading_pair, price) for price in prices]
+
+    cdef list c_quantize_order_amounts(self, str trading_pair, list amounts, list prices=None):
+        """
+        Quantizes a list of order amounts in one call. Amounts that don't meet the market's minimum order size come
+        back as 0, like they do from c_quantize_order_amount().
+
+        :param prices: Order prices of the amounts, if the market checks the minimum order value
+        """
+        if prices is None:
+            return [self.c_quantize_order_amount(trading_pair, amount) for amount in amounts]
+        return [self.c_quantize_order_amount(trading_pair, amount, price) for amount, price in zip(amounts, prices)]
+
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
@@ -326,6 +379,12 @@ cdef class MarketBase(NetworkIterator):
     def cancel(self, trading_pair: str, client_order_id: str):
         return self.c_cancel(trading_pair, client_order_id)
 
+    def batch_submit_orders(self, trading_pair: str, order_requests: List[OrderRequest]) -> List[str]:
+        return self.c_batch_submit_orders(trading_pair, order_requests)
+
+    def batch_cancel(self, trading_pair: str, client_order_ids: List[str]):
+        return self.c_batch_cancel(trading_pair, client_order_ids)
+
     def get_available_balance(self, currency: str) -> Decimal:
         return self.c_get_available_balance(currency)
 
@@ -335,6 +394,15 @@ cdef class MarketBase(NetworkIterator):
     def get_order_book(self, trading_pair: str) -> OrderBook:
         return self.c_get_order_book(trading_pair)
 
+    def get_order_book_features(self, trading_pair: str) -> Optional[OrderBookFeatures]:
+        """
+        :return: the rolling order book and trade flow features of the trading pair, or None if the market doesn't
+                 track order books or the trading pair's order book isn't ready yet
+        """
+        if self._order_book_tracker is None:
+            return None
+        return self._order_book_tracker.get_order_book_features(trading_pair)
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -353,8 +421,17 @@ cdef class MarketBase(NetworkIterator):
     def quantize_order_price(self, trading_pair: str, price: Decimal) -> Decimal:
         return self.c_quantize_order_price(trading_pair, price)
 
-    def quantize_order_amount(self, trading_pair: str, amount: Decimal) -> Decimal:
-        return self.c_quantize_order_amount(trading_pair, amount)
+    def quantize_order_amount(self, trading_pair: str, amount: Decimal, price: Optional[Decimal] = None) -> Decimal:
+        if price is None:
+            return self.c_quantize_order_amount(trading_pair, amount)
+        return self.c_quantize_order_amount(trading_pair, amount, price)
+
+    def quantize_order_prices(self, trading_pair: str, prices: List[Decimal]) -> List[Decimal]:
+        return self.c_quantize_order_prices(trading_pair, prices)
+
+    def quantize_order_amounts(self, trading_pair: str, amounts: List[Decimal],
+                               prices: Optional[List[Decimal]] = None) -> List[Decimal]:
+        return self.c_quantize_order_amounts(trading_pair, amounts, prices)
 
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+
+from functools import lru_cache
+import importlib
+from typing import (
+    Any,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+if TYPE_CHECKING:
+    from hummingbot.market.market_base import MarketBase
+
+
+# Each connector pulls in its own compiled extensions and client libraries (web3, python-binance, ...) when its
+# module is imported. The registry maps connector names to where their classes live, so only the connectors a bot
+# actually uses get imported.
+MARKET_CLASS_PATHS: Dict[str, Tuple[str, str]] = {
+    "bamboo_relay": ("hummingbot.market.bamboo_relay.bamboo_relay_market", "BambooRelayMarket"),
+    "binance": ("hummingbot.market.binance.binance_market", "BinanceMarket"),
+    "bitcoin_com": ("hummingbot.market.bitcoin_com.bitcoin_com_market", "BitcoinComMarket"),
+    "bittrex": ("hummingbot.market.bittrex.bittrex_market", "BittrexMarket"),
+    "coinbase_pro": ("hummingbot.market.coinbase_pro.coinbase_pro_market", "CoinbaseProMarket"),
+    "dolomite": ("hummingbot.market.dolomite.dolomite_market", "DolomiteMarket"),
+    "eterbase": ("hummingbot.market.eterbase.eterbase_market", "EterbaseMarket"),
+    "huobi": ("hummingbot.market.huobi.huobi_market", "HuobiMarket"),
+    "kraken": ("hummingbot.market.kraken.kraken_market", "KrakenMarket"),
+    "kucoin": ("hummingbot.market.kucoin.kucoin_market", "KucoinMarket"),
+    "liquid": ("hummingbot.market.liquid.liquid_market", "LiquidMarket"),
+    "radar_relay": ("hummingbot.market.radar_relay.radar_relay_market", "RadarRelayMarket"),
+}
+
+ORDER_BOOK_TRACKER_CLASS_PATHS: Dict[str, Tuple[str, str]] = {
+    "bamboo_relay": ("hummingbot.market.bamboo_relay.bamboo_relay_order_book_tracker",
+                     "BambooRelayOrderBookTracker"),
+    "binance": ("hummingbot.market.binance.binance_order_book_tracker", "BinanceOrderBookTracker"),
+    "bitcoin_com": ("hummingbot.market.bitcoin_com.bitcoin_com_order_book_tracker", "BitcoinComOrderBookTracker"),
+    "bittrex": ("hummingbot.market.bittrex.bittrex_order_book_tracker", "BittrexOrderBookTracker"),
+    "coinbase_pro": ("hummingbot.market.coinbase_pro.coinbase_pro_order_book_tracker",
+                     "CoinbaseProOrderBookTracker"),
+    "dolomite": ("hummingbot.market.dolomite.dolomite_order_book_tracker", "DolomiteOrderBookTracker"),
+    "eterbase": ("hummingbot.market.eterbase.eterbase_order_book_tracker", "EterbaseOrderBookTracker"),
+    "huobi": ("hummingbot.market.huobi.huobi_order_book_tracker", "HuobiOrderBookTracker"),
+    "kraken": ("hummingbot.market.kraken.kraken_order_book_tracker", "KrakenOrderBookTracker"),
+    "kucoin": ("hummingbot.market.kucoin.kucoin_order_book_tracker", "KucoinOrderBookTracker"),
+    "liquid": ("hummingbot.market.liquid.liquid_order_book_tracker", "LiquidOrderBookTracker"),
+    "radar_relay": ("hummingbot.market.radar_relay.radar_relay_order_book_tracker", "RadarRelayOrderBookTracker"),
+}
+
+
+@lru_cache(maxsize=None)
+def _import_class(module_name: str, class_name: str) -> Any:
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def get_market_class(market_name: str) -> Optional[Type["MarketBase"]]:
+    """
+    Imports the connector on first use.
+
+    :return: the market class of the connector, or None for an unknown connector name
+    """
+    if market_name not in MARKET_CLASS_PATHS:
+        return None
+    return _import_class(*MARKET_CLASS_PATHS[market_name])
+
+
+def get_order_book_tracker_class(market_name: str) -> Optional[Type]:
+    if market_name not in ORDER_BOOK_TRACKER_CLASS_PATHS:
+        return None
+    return _import_class(*ORDER_BOOK_TRACKER_CLASS_PATHS[market_name])
@@ -72,6 +72,7 @@ cdef class PaperTradeMarket(MarketBase):
                                                          LimitOrdersIterator *map_it_ptr)
     cdef c_process_crossed_limit_orders(self)
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event)
+    cdef c_match_trade_batch_to_limit_orders(self, object order_book_trade_batch_event)
     cdef object c_cancel_order_from_orders_map(self,
                                                LimitOrders *orders_map,
                                                str trading_pair_str,
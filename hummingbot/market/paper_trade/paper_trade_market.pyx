@@ -55,6 +55,7 @@ from hummingbot.core.event.events import (
     OrderBookEvent,
     BuyOrderCreatedEvent,
     SellOrderCreatedEvent,
+    OrderBookTradeBatchEvent,
     OrderBookTradeEvent,
     OrderCancelledEvent
 )
@@ -148,7 +149,7 @@ cdef class OrderBookTradeListener(EventListener):
 
     cdef c_call(self, object event_object):
         try:
-            self._market.match_trade_to_limit_orders(event_object)
+            self._market.match_trade_batch_to_limit_orders(event_object)
         except Exception as e:
             self.logger().error("Error call trade listener.", exc_info=True)
 
@@ -176,6 +177,7 @@ cdef class PaperTradeMarket(MarketBase):
     MARKET_ORDER_CANCELLED_EVENT_TAG = MarketEvent.OrderCancelled.value
     MARKET_ORDER_FAILURE_EVENT_TAG = MarketEvent.OrderFailure.value
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TRADE_BATCH_EVENT_TAG = OrderBookEvent.TradeBatchEvent.value
     MARKET_SELL_ORDER_CREATED_EVENT_TAG = MarketEvent.SellOrderCreated.value
     MARKET_BUY_ORDER_CREATED_EVENT_TAG = MarketEvent.BuyOrderCreated.value
 
@@ -206,7 +208,7 @@ cdef class PaperTradeMarket(MarketBase):
             base_asset, quote_asset = self.split_trading_pair(trading_pair_str)
             self._trading_pairs[trading_pair_str] = TradingPair(trading_pair_str, base_asset, quote_asset)
             (<CompositeOrderBook>order_book).c_add_listener(
-                self.ORDER_BOOK_TRADE_EVENT_TAG,
+                self.ORDER_BOOK_TRADE_BATCH_EVENT_TAG,
                 self._order_book_trade_listener
             )
 
@@ -821,6 +823,33 @@ cdef class PaperTradeMarket(MarketBase):
         for orders_it in process_order_its:
             self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
 
+    cdef c_match_trade_batch_to_limit_orders(self, object order_book_trade_batch_event):
+        """
+        Trigger limit orders crossed by any of the trades in a batch. Only the lowest sell and the highest buy price of
+        the batch can cross limit orders that the other trades don't, so at most one match per side is needed.
+
+        :param order_book_trade_batch_event: trade batch event from order book
+        """
+        cdef:
+            str trading_pair = order_book_trade_batch_event.trading_pair
+            object trades = order_book_trade_batch_event.trades
+            object is_buy = trades["is_buy"]
+            object sell_trades = trades[~is_buy]
+            object buy_trades = trades[is_buy]
+
+        if len(sell_trades) > 0:
+            self.c_match_trade_to_limit_orders(OrderBookTradeEvent(trading_pair,
+                                                                   float(sell_trades["timestamp"][-1]),
+                                                                   TradeType.SELL,
+                                                                   float(sell_trades["price"].min()),
+                                                                   float(sell_trades["amount"].sum())))
+        if len(buy_trades) > 0:
+            self.c_match_trade_to_limit_orders(OrderBookTradeEvent(trading_pair,
+                                                                   float(buy_trades["timestamp"][-1]),
+                                                                   TradeType.BUY,
+                                                                   float(buy_trades["price"].max()),
+                                                                   float(buy_trades["amount"].sum())))
+
     # </editor-fold>
 
     cdef object c_get_available_balance(self, str currency):
@@ -970,6 +999,9 @@ cdef class PaperTradeMarket(MarketBase):
     def match_trade_to_limit_orders(self, event_object: OrderBookTradeEvent):
         self.c_match_trade_to_limit_orders(event_object)
 
+    def match_trade_batch_to_limit_orders(self, event_object: OrderBookTradeBatchEvent):
+        self.c_match_trade_batch_to_limit_orders(event_object)
+
     def set_balance(self, currency: str, balance: Decimal):
         self.c_set_balance(currency, balance)
     # </editor-fold>
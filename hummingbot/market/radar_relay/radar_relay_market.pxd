@@ -1,5 +1,6 @@
 from libc.stdint cimport int64_t
 from hummingbot.market.market_base cimport MarketBase
+from hummingbot.core.data_type.deadline_queue cimport DeadlineQueue
 from hummingbot.core.data_type.transaction_tracker cimport TransactionTracker
 
 
@@ -19,10 +20,11 @@ cdef class RadarRelayMarket(MarketBase):
         double _poll_interval
         dict _in_flight_limit_orders
         dict _in_flight_market_orders
-        object _order_expiry_queue
+        DeadlineQueue _order_expiry_queue
         TransactionTracker _tx_tracker
         object _w3
         object _exchange
+        object _order_hasher
         dict _withdraw_rules
         dict _trading_rules
         object _pending_approval_tx_hashes
@@ -48,5 +50,13 @@ cdef class RadarRelayMarket(MarketBase):
                                        object price,
                                        object amount,
                                        str tx_hash)
+    cdef str c_place_order(self,
+                           object trade_type,
+                           str trading_pair,
+                           object amount,
+                           object order_type,
+                           object price,
+                           dict kwargs,
+                           object signing_batch)
     cdef c_expire_order(self, str order_id)
     cdef c_check_and_remove_expired_orders(self)
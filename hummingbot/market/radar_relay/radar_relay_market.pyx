@@ -1,7 +1,6 @@
 import aiohttp
 import asyncio
 from async_timeout import timeout
-from collections import deque
 import copy
 import logging
 import math
@@ -17,13 +16,12 @@ from decimal import Decimal
 from libc.stdint cimport int64_t
 from web3 import Web3
 from web3.exceptions import TransactionNotFound
-from zero_ex.order_utils import (
-    generate_order_hash_hex,
-    Order as ZeroExOrder
-)
+from zero_ex.order_utils import Order as ZeroExOrder
 from zero_ex.contract_wrappers.order_conversions import jsdict_to_order
 
+import hummingbot
 from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.deadline_queue import DeadlineQueue
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book cimport OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTrackerDataSourceType
@@ -57,8 +55,14 @@ from hummingbot.market.radar_relay.radar_relay_in_flight_order cimport RadarRela
 from hummingbot.market.radar_relay.radar_relay_order_book_tracker import RadarRelayOrderBookTracker
 from hummingbot.market.trading_rule cimport TradingRule
 from hummingbot.wallet.ethereum.web3_wallet import Web3Wallet
-from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import fix_signature
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
+    sign_order_hash,
+    sign_order_hashes,
+    ZeroExOrderHasher
+)
+from hummingbot.wallet.ethereum.zero_ex.order_signing_batch import OrderSigningBatch
 from hummingbot.wallet.ethereum.zero_ex.zero_ex_exchange_v3 import ZeroExExchange
+from hummingbot.core.utils.metrics import rest_request_trace_configs
 from hummingbot.core.utils.tracking_nonce import get_tracking_nonce
 from hummingbot.core.utils.estimate_fee import estimate_fee
 
@@ -131,7 +135,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._poll_interval = poll_interval
         self._in_flight_limit_orders = {}  # limit orders are off chain
         self._in_flight_market_orders = {}  # market orders are on chain
-        self._order_expiry_queue = deque()
+        self._order_expiry_queue = DeadlineQueue()
         self._tx_tracker = RadarRelayTransactionTracker(self)
         self._w3 = Web3(Web3.HTTPProvider(ethereum_rpc_url))
         self._provider = Web3.HTTPProvider(ethereum_rpc_url)
@@ -143,6 +147,7 @@ cdef class RadarRelayMarket(MarketBase):
         self._wallet = wallet
         self._wallet_spender_address = wallet_spender_address
         self._exchange = ZeroExExchange(self._w3, ZERO_EX_MAINNET_EXCHANGE_ADDRESS, wallet)
+        self._order_hasher = ZeroExOrderHasher(ZERO_EX_MAINNET_EXCHANGE_ADDRESS.lower(), 1)
         self._latest_salt = -1
 
     @property
@@ -194,13 +199,12 @@ cdef class RadarRelayMarket(MarketBase):
             RadarRelayInFlightOrder typed_in_flight_order
             str base_currency
             str quote_currency
-            set expiring_order_ids = set([order_id for _, order_id in self._order_expiry_queue])
 
         for in_flight_order in self._in_flight_limit_orders.values():
             typed_in_flight_order = in_flight_order
             if typed_in_flight_order.order_type is not OrderType.LIMIT:
                 continue
-            if typed_in_flight_order.client_order_id in expiring_order_ids:
+            if self._order_expiry_queue.c_contains(typed_in_flight_order.client_order_id):
                 continue
             retval.append(typed_in_flight_order.to_limit_order())
         return retval
@@ -576,7 +580,7 @@ cdef class RadarRelayMarket(MarketBase):
                 if len(self._pending_approval_tx_hashes) > 0:
                     for tx_hash in list(self._pending_approval_tx_hashes):
                         try:
-                            receipt = self._w3.eth.getTransactionReceipt(tx_hash)
+                            receipt = self._w3.eth.getTransactionReceipt(self._wallet.get_current_tx_hash(tx_hash))
                             self._pending_approval_tx_hashes.remove(tx_hash)
                         except TransactionNotFound:
                             pass
@@ -596,7 +600,7 @@ cdef class RadarRelayMarket(MarketBase):
                            data: Optional[Dict[str, Any]] = None,
                            headers: Optional[Dict[str, str]] = None,
                            json: int = 0) -> Dict[str, Any]:
-        async with aiohttp.ClientSession() as client:
+        async with aiohttp.ClientSession(trace_configs=rest_request_trace_configs("radar_relay")) as client:
             async with (
                     client.request(http_method,
                                    url=url,
@@ -658,16 +662,23 @@ cdef class RadarRelayMarket(MarketBase):
         return await self._api_request(http_method="post", url=url, data=data)
 
     def get_order_hash_hex(self, unsigned_order: Dict[str, Any]) -> str:
-        order_struct = jsdict_to_order(unsigned_order)
-        order_hash_hex = generate_order_hash_hex(order=order_struct,
-                                                 exchange_address=ZERO_EX_MAINNET_EXCHANGE_ADDRESS.lower(),
-                                                 chain_id=1)
-        return order_hash_hex
+        return self._order_hasher.hash_order_hex(jsdict_to_order(unsigned_order))
 
     def get_zero_ex_signature(self, order_hash_hex: str) -> str:
-        signature = self._wallet.current_backend.sign_hash(hexstr=order_hash_hex)
-        fixed_signature = fix_signature(self._provider, self._wallet.address, order_hash_hex, signature)
-        return fixed_signature
+        return sign_order_hash(self._wallet.current_backend.account, order_hash_hex)
+
+    def hash_and_sign_orders(self, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """
+        Hashes and signs several unsigned orders at once, e.g. every level of an order ladder.
+        :return: (order hash, signature) for each order, in the same order
+        """
+        order_hashes = [self.get_order_hash_hex(unsigned_order) for unsigned_order in unsigned_orders]
+        return list(zip(order_hashes, sign_order_hashes(self._wallet.current_backend.account, order_hashes)))
+
+    async def hash_and_sign_orders_async(self, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        return await self._ev_loop.run_in_executor(hummingbot.get_executor(),
+                                                   self.hash_and_sign_orders,
+                                                   unsigned_orders)
 
     async def submit_market_order(self,
                                   trading_pair: str,
@@ -706,7 +717,12 @@ cdef class RadarRelayMarket(MarketBase):
                                  trade_type: TradeType,
                                  amount: Decimal,
                                  price: Decimal,
-                                 expires: int) -> Tuple[str, ZeroExOrder]:
+                                 expires: int,
+                                 order_id: Optional[str] = None,
+                                 signing_batch: Optional[OrderSigningBatch] = None) -> Tuple[str, ZeroExOrder]:
+        """
+        :param signing_batch: if given, the order is hashed and signed together with the other orders of the batch
+        """
         url = f"{RADAR_RELAY_REST_ENDPOINT}/orders"
         unsigned_limit_order = await self.request_unsigned_limit_order(trading_pair=trading_pair,
                                                                        trade_type=trade_type,
@@ -714,9 +730,11 @@ cdef class RadarRelayMarket(MarketBase):
                                                                        price=f"{price:f}",
                                                                        expires=expires)
         unsigned_limit_order["makerAddress"] = self._wallet.address
-        order_hash_hex = self.get_order_hash_hex(unsigned_limit_order)
+        if signing_batch is not None:
+            order_hash_hex, signature = await signing_batch.hash_and_sign_order(order_id, unsigned_limit_order)
+        else:
+            order_hash_hex, signature = (await self.hash_and_sign_orders_async([unsigned_limit_order]))[0]
         signed_limit_order = copy.deepcopy(unsigned_limit_order)
-        signature = self.get_zero_ex_signature(order_hash_hex)
         signed_limit_order["signature"] = signature
         await self._api_request(http_method="post", url=url, data=signed_limit_order, headers={"Content-Type": "application/json"}, json=1)
         self._latest_salt = int(unsigned_limit_order["salt"])
@@ -761,7 +779,8 @@ cdef class RadarRelayMarket(MarketBase):
                             trading_pair: str,
                             amount: Decimal,
                             price: Decimal,
-                            expires: int) -> str:
+                            expires: int,
+                            signing_batch: Optional[OrderSigningBatch] = None) -> str:
         cdef:
             object q_price
             object q_amt = self.c_quantize_order_amount(trading_pair, amount)
@@ -788,7 +807,9 @@ cdef class RadarRelayMarket(MarketBase):
                                                                                      trade_type=trade_type,
                                                                                      amount=q_amt,
                                                                                      price=q_price,
-                                                                                     expires=expires)
+                                                                                     expires=expires,
+                                                                                     order_id=order_id,
+                                                                                     signing_batch=signing_batch)
                     self.c_start_tracking_limit_order(order_id=order_id,
                                                       exchange_order_id=exchange_order_id,
                                                       trading_pair=trading_pair,
@@ -843,48 +864,78 @@ cdef class RadarRelayMarket(MarketBase):
                 self.MARKET_ORDER_FAILURE_EVENT_TAG,
                 MarketOrderFailureEvent(self._current_timestamp, order_id, order_type)
             )
-
-    cdef str c_buy(self,
-                   str trading_pair,
-                   object amount,
-                   object order_type=OrderType.MARKET,
-                   object price=s_decimal_NaN,
-                   dict kwargs={}):
+        finally:
+            if signing_batch is not None:
+                signing_batch.remove(order_id)
+
+    cdef str c_place_order(self,
+                           object trade_type,
+                           str trading_pair,
+                           object amount,
+                           object order_type,
+                           object price,
+                           dict kwargs,
+                           object signing_batch):
         cdef:
             int64_t tracking_nonce = <int64_t> get_tracking_nonce()
-            str order_id = str(f"buy-{trading_pair}-{tracking_nonce}")
+            str order_id = str(f"{'buy' if trade_type is TradeType.BUY else 'sell'}-{trading_pair}-{tracking_nonce}")
         expires = kwargs.get("expiration_ts", None)
         if expires is not None:
             expires = int(expires)
+        if order_type is OrderType.LIMIT and signing_batch is not None:
+            signing_batch.add(order_id)
+        else:
+            # Only limit orders are signed.
+            signing_batch = None
         safe_ensure_future(self.execute_trade(order_id=order_id,
                                               order_type=order_type,
-                                              trade_type=TradeType.BUY,
+                                              trade_type=trade_type,
                                               trading_pair=trading_pair,
                                               amount=amount,
                                               price=price,
-                                              expires=expires))
+                                              expires=expires,
+                                              signing_batch=signing_batch))
         return order_id
 
+    cdef str c_buy(self,
+                   str trading_pair,
+                   object amount,
+                   object order_type=OrderType.MARKET,
+                   object price=s_decimal_NaN,
+                   dict kwargs={}):
+        return self.c_place_order(TradeType.BUY, trading_pair, amount, order_type, price, kwargs, None)
+
     cdef str c_sell(self,
                     str trading_pair,
                     object amount,
                     object order_type=OrderType.MARKET,
                     object price=s_decimal_NaN,
                     dict kwargs={}):
+        return self.c_place_order(TradeType.SELL, trading_pair, amount, order_type, price, kwargs, None)
+
+    cdef list c_batch_submit_orders(self, str trading_pair, list order_requests):
+        """
+        Submits the orders the same way c_buy and c_sell do, except that the limit orders of the batch are hashed
+        and signed together, in a single call, once the relayer has returned all of them.
+        """
         cdef:
-            int64_t tracking_nonce = <int64_t> get_tracking_nonce()
-            str order_id = str(f"sell-{trading_pair}-{tracking_nonce}")
-        expires = kwargs.get("expiration_ts", None)
-        if expires is not None:
-            expires = int(expires)
-        safe_ensure_future(self.execute_trade(order_id=order_id,
-                                              order_type=order_type,
-                                              trade_type=TradeType.SELL,
-                                              trading_pair=trading_pair,
-                                              amount=amount,
-                                              price=price,
-                                              expires=expires))
-        return order_id
+            list order_ids = []
+            object signing_batch = OrderSigningBatch(self.hash_and_sign_orders_async)
+        for order_request in order_requests:
+            try:
+                order_ids.append(self.c_place_order(TradeType.BUY if order_request.is_buy else TradeType.SELL,
+                                                    trading_pair,
+                                                    order_request.amount,
+                                                    order_request.order_type,
+                                                    order_request.price,
+                                                    order_request.kwargs,
+                                                    signing_batch))
+            except Exception:
+                self.logger().error(f"Error submitting {'buy' if order_request.is_buy else 'sell'} order for "
+                                    f"{order_request.amount} {trading_pair} at {order_request.price}.",
+                                    exc_info=True)
+                order_ids.append(None)
+        return order_ids
 
     async def cancel_order(self, client_order_id: str) -> Dict[str, Any]:
         order = self._in_flight_limit_orders.get(client_order_id)
@@ -901,7 +952,7 @@ cdef class RadarRelayMarket(MarketBase):
 
     def get_tx_hash_receipt(self, tx_hash: str) -> Dict[str, Any]:
         try:
-            tx_hash_receipt = self._w3.eth.getTransactionReceipt(tx_hash)
+            tx_hash_receipt = self._w3.eth.getTransactionReceipt(self._wallet.get_current_tx_hash(tx_hash))
             return tx_hash_receipt
         except TransactionNotFound:
             return None
@@ -1015,15 +1066,21 @@ cdef class RadarRelayMarket(MarketBase):
         )
 
     cdef c_expire_order(self, str order_id):
-        self._order_expiry_queue.append((self._current_timestamp + self.ORDER_EXPIRY_TIME, order_id))
+        cdef:
+            double expiry_timestamp = self._current_timestamp + self.ORDER_EXPIRY_TIME
+
+        # An order that's expired more than once stops being tracked at the earliest of its expiry times.
+        if (self._order_expiry_queue.c_contains(order_id) and
+                self._order_expiry_queue.c_get_deadline(order_id) <= expiry_timestamp):
+            return
+        self._order_expiry_queue.c_push(order_id, expiry_timestamp)
 
     cdef c_check_and_remove_expired_orders(self):
         cdef:
             double current_timestamp = self._current_timestamp
             str order_id
 
-        while len(self._order_expiry_queue) > 0 and self._order_expiry_queue[0][0] < current_timestamp:
-            _, order_id = self._order_expiry_queue.popleft()
+        for order_id in self._order_expiry_queue.c_pop_expired(current_timestamp):
             self.c_stop_tracking_order(order_id)
 
     cdef c_stop_tracking_order(self, str order_id):
@@ -4,6 +4,7 @@ from libc.stdint cimport int64_t
 import logging
 from typing import (
     List,
+    Optional,
     Tuple,
     Dict
 )
@@ -16,6 +17,7 @@ from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler, safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.market.market_base import MarketBase
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
@@ -26,6 +28,7 @@ from hummingbot.market.celo.celo_cli import (
     CELO_QUOTE,
 )
 from hummingbot.market.celo.celo_data_types import (
+    CeloExchangeRate,
     CeloOrder,
     CeloArbTradeProfit
 )
@@ -43,9 +46,10 @@ ds_logger = None
 NODE_SYNCED_CHECK_INTERVAL = 60.0 * 5.0
 
 
-def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
-    order_amount = Decimal(str(order_amount))
-    results = []
+def get_ctp_prices(market, trading_pair: str, order_amount: Decimal) -> Tuple[Decimal, Decimal, Decimal, Decimal]:
+    """
+    :return: counter party (buy price, buy vwap, sell price, sell vwap) for the order_amount
+    """
     # Find Celo counter party price for the order_amount
     # volume weighted average price is used for profit calculation.
     query_result = market.get_vwap_for_volume(trading_pair, True, float(order_amount))
@@ -58,13 +62,17 @@ def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[
     ctp_vwap_sell = Decimal(str(query_result.result_price))
     query_result = market.get_price_for_volume(trading_pair, False, float(order_amount))
     ctp_sell = Decimal(str(query_result.result_price))
-    # Celo exchange rate show buy result in USD amount
-    celo_buy_amount = ctp_vwap_sell * order_amount
-    celo_ex_rates = CeloCLI.exchange_rate(celo_buy_amount)
-    celo_buy_ex_rate = [r for r in celo_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
+    return ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell
+
+
+def trade_profits_from_rates(ctp_prices: Tuple[Decimal, Decimal, Decimal, Decimal],
+                             celo_buy_ex_rates: List[CeloExchangeRate],
+                             celo_sell_ex_rates: List[CeloExchangeRate]) -> List[CeloArbTradeProfit]:
+    ctp_buy, ctp_vwap_buy, ctp_sell, ctp_vwap_sell = ctp_prices
+    results = []
+    celo_buy_ex_rate = [r for r in celo_buy_ex_rates if r.to_token == CELO_BASE and r.from_token == CELO_QUOTE][0]
     celo_buy = celo_buy_ex_rate.from_amount / celo_buy_ex_rate.to_amount
-    celo_ex_rates = CeloCLI.exchange_rate(order_amount)
-    celo_sell_ex_rate = [r for r in celo_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
+    celo_sell_ex_rate = [r for r in celo_sell_ex_rates if r.from_token == CELO_BASE and r.to_token == CELO_QUOTE][0]
     celo_sell = celo_sell_ex_rate.to_amount / celo_sell_ex_rate.from_amount
     celo_buy_profit = (ctp_vwap_sell - celo_buy) / celo_buy
     results.append(CeloArbTradeProfit(True, ctp_sell, ctp_vwap_sell, celo_buy, celo_buy_profit))
@@ -73,6 +81,29 @@ def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[
     return results
 
 
+def get_trade_profits(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
+    order_amount = Decimal(str(order_amount))
+    ctp_prices = get_ctp_prices(market, trading_pair, order_amount)
+    # Celo exchange rate show buy result in USD amount
+    celo_buy_amount = ctp_prices[3] * order_amount
+    return trade_profits_from_rates(ctp_prices,
+                                    CeloCLI.exchange_rate(celo_buy_amount),
+                                    CeloCLI.exchange_rate(order_amount))
+
+
+async def get_trade_profits_async(market, trading_pair: str, order_amount: Decimal) -> List[CeloArbTradeProfit]:
+    """
+    Same as get_trade_profits, but fetches the Celo exchange rates for both directions concurrently, without
+    blocking the event loop.
+    """
+    order_amount = Decimal(str(order_amount))
+    ctp_prices = get_ctp_prices(market, trading_pair, order_amount)
+    celo_buy_amount = ctp_prices[3] * order_amount
+    celo_buy_ex_rates, celo_sell_ex_rates = await safe_gather(CeloCLI.exchange_rate_async(celo_buy_amount),
+                                                              CeloCLI.exchange_rate_async(order_amount))
+    return trade_profits_from_rates(ctp_prices, celo_buy_ex_rates, celo_sell_ex_rates)
+
+
 cdef class CeloArbStrategy(StrategyBase):
     OPTION_LOG_NULL_ORDER_SIZE = 1 << 0
     OPTION_LOG_REMOVING_ORDER = 1 << 1
@@ -259,25 +290,49 @@ cdef class CeloArbStrategy(StrategyBase):
             self.main_process()
         else:
             if self._main_task is None or self._main_task.done():
-                coro = self._async_scheduler.call_async(self.main_process, timeout_seconds=30)
-                self._main_task = safe_ensure_future(coro)
+                self._main_task = safe_ensure_future(self.main_process_async())
 
     def main_process(self):
         if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
-            err_msg = CeloCLI.validate_node_synced()
-            self._node_synced = err_msg is None
-            self._last_synced_checked = self._current_timestamp
-            check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
-            self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+            self.update_node_synced(CeloCLI.validate_node_synced())
         if not self._node_synced:
             return
         self._trade_profits = get_trade_profits(self._market_info.market, self._market_info.trading_pair, self._order_amount)
+        arb_trades = self.find_arb_trades()
+        if len(arb_trades) > 0:
+            self.execute_arb_trades(arb_trades)
+
+    async def main_process_async(self):
+        """
+        The node sync check and the exchange rate quotes run as asyncio subprocesses. Only the Celo trades
+        themselves, which are rare, are run in the executor.
+        """
+        if self._last_synced_checked < self._current_timestamp - NODE_SYNCED_CHECK_INTERVAL:
+            self.update_node_synced(await CeloCLI.validate_node_synced_async())
+        if not self._node_synced:
+            return
+        self._trade_profits = await get_trade_profits_async(self._market_info.market,
+                                                            self._market_info.trading_pair,
+                                                            self._order_amount)
+        arb_trades = self.find_arb_trades()
+        if len(arb_trades) > 0:
+            await self._async_scheduler.call_async(partial(self.execute_arb_trades, arb_trades), timeout_seconds=30)
+
+    def update_node_synced(self, err_msg: Optional[str]):
+        self._node_synced = err_msg is None
+        self._last_synced_checked = self._current_timestamp
+        check_msg = "synced" if err_msg is None else f"Error: {err_msg}"
+        self.log_with_clock(logging.INFO, f"Node sync check - {check_msg}")
+
+    def find_arb_trades(self) -> List[CeloArbTradeProfit]:
         arb_trades = [t for t in self._trade_profits if t.profit >= self._min_profitability]
         if len(arb_trades) == 0:
             if self._last_no_arb_reported < self._current_timestamp - 20:
                 self.logger().info(f"No arbitrage opportunity: {self._trade_profits[0]} {self._trade_profits[1]}")
                 self._last_no_arb_reported = self._current_timestamp
-            return
+        return arb_trades
+
+    def execute_arb_trades(self, arb_trades: List[CeloArbTradeProfit]):
         for arb_trade in arb_trades:
             self.logger().info(f"Found arbitrage opportunity!: {arb_trade}")
             if arb_trade.is_celo_buy:
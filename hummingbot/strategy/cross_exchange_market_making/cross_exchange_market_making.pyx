@@ -1,7 +1,4 @@
-from collections import (
-    defaultdict,
-    deque
-)
+from collections import defaultdict
 from decimal import Decimal
 import logging
 from math import (
@@ -25,6 +22,8 @@ from hummingbot.market.market_base import (
     OrderType
 )
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.rolling_statistics cimport WindowedExtrema
+from hummingbot.core.data_type.rolling_statistics import WindowedExtrema
 from hummingbot.strategy.strategy_base cimport StrategyBase
 from hummingbot.strategy.strategy_base import StrategyBase
 from .cross_exchange_market_pair import CrossExchangeMarketPair
@@ -239,6 +238,12 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
                                     LimitOrder active_order) -> bool:
         return self.c_check_if_sufficient_balance(market_pair, active_order)
 
+    def get_top_bid_ask(self, market_pair: CrossExchangeMarketPair) -> Tuple[Decimal, Decimal]:
+        return self.c_get_top_bid_ask(market_pair)
+
+    def get_top_bid_ask_from_price_samples(self, market_pair: CrossExchangeMarketPair) -> Tuple[Decimal, Decimal]:
+        return self.c_get_top_bid_ask_from_price_samples(market_pair)
+
     # ---------------------------------------------------------------
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -899,14 +904,18 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
     cdef tuple c_get_suggested_price_samples(self, object market_pair):
         """
-        Get the queues of order book price samples for a market pair.
+        Get the windows of order book price samples for a market pair.
 
         :param market_pair: The market pair under which samples were collected for.
-        :return: (bid order price samples, ask order price samples)
+        :return: (bid order price samples, ask order price samples), as WindowedExtrema
         """
-        if market_pair in self._suggested_price_samples:
-            return self._suggested_price_samples[market_pair]
-        return deque(), deque()
+        cdef:
+            tuple price_samples = self._suggested_price_samples.get(market_pair)
+        if price_samples is None:
+            price_samples = (WindowedExtrema(max_length=self.ORDER_ADJUST_SAMPLE_WINDOW),
+                             WindowedExtrema(max_length=self.ORDER_ADJUST_SAMPLE_WINDOW))
+            self._suggested_price_samples[market_pair] = price_samples
+        return price_samples
 
     cdef tuple c_get_top_bid_ask(self, object market_pair):
         """
@@ -946,20 +955,17 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
 
         :param market_pair: cross exchange market pair
         """
+        cdef:
+            WindowedExtrema bid_price_samples
+            WindowedExtrema ask_price_samples
+
         if ((self._last_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL) <
                 (self._current_timestamp // self.ORDER_ADJUST_SAMPLE_INTERVAL)):
-            if market_pair not in self._suggested_price_samples:
-                self._suggested_price_samples[market_pair] = (deque(), deque())
-
             top_bid_price, top_ask_price = self.c_get_top_bid_ask_from_price_samples(market_pair)
 
-            bid_price_samples_deque, ask_price_samples_deque = self._suggested_price_samples[market_pair]
-            bid_price_samples_deque.append(top_bid_price)
-            ask_price_samples_deque.append(top_ask_price)
-            while len(bid_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                bid_price_samples_deque.popleft()
-            while len(ask_price_samples_deque) > self.ORDER_ADJUST_SAMPLE_WINDOW:
-                ask_price_samples_deque.popleft()
+            bid_price_samples, ask_price_samples = self.c_get_suggested_price_samples(market_pair)
+            bid_price_samples.c_add(self._current_timestamp, top_bid_price)
+            ask_price_samples.c_add(self._current_timestamp, top_ask_price)
 
     cdef tuple c_get_top_bid_ask_from_price_samples(self,
                                                     object market_pair):
@@ -969,18 +975,28 @@ cdef class CrossExchangeMarketMakingStrategy(StrategyBase):
         :param market_pair: cross exchange market pair
         :return: (top bid, top ask)
         """
+        cdef:
+            WindowedExtrema bid_price_samples
+            WindowedExtrema ask_price_samples
+            object top_bid_sample
+            object top_ask_sample
+
         # Incorporate the past bid & ask price samples.
         current_top_bid_price, current_top_ask_price = self.c_get_top_bid_ask(market_pair)
 
         bid_price_samples, ask_price_samples = self.c_get_suggested_price_samples(market_pair)
 
-        if not any(Decimal.is_nan(p) for p in bid_price_samples) and not Decimal.is_nan(current_top_bid_price):
-            top_bid_price = max(list(bid_price_samples) + [current_top_bid_price])
+        if not bid_price_samples.c_has_nan() and not Decimal.is_nan(current_top_bid_price):
+            top_bid_sample = bid_price_samples.c_get_max()
+            top_bid_price = (current_top_bid_price if top_bid_sample is None
+                             else max(top_bid_sample, current_top_bid_price))
         else:
             top_bid_price = current_top_ask_price
 
-        if not any(Decimal.is_nan(p) for p in ask_price_samples) and not Decimal.is_nan(current_top_ask_price):
-            top_ask_price = min(list(ask_price_samples) + [current_top_ask_price])
+        if not ask_price_samples.c_has_nan() and not Decimal.is_nan(current_top_ask_price):
+            top_ask_sample = ask_price_samples.c_get_min()
+            top_ask_price = (current_top_ask_price if top_ask_sample is None
+                             else min(top_ask_sample, current_top_ask_price))
         else:
             top_ask_price = current_top_ask_price
 
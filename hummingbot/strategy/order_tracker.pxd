@@ -1,5 +1,6 @@
 # distutils: language=c++
 
+from hummingbot.core.data_type.deadline_queue cimport DeadlineQueue
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.time_iterator cimport TimeIterator
 
@@ -11,8 +12,9 @@ cdef class OrderTracker(TimeIterator):
         dict _order_id_to_market_pair
         dict _shadow_tracked_limit_orders
         dict _shadow_order_id_to_market_pair
-        object _shadow_gc_requests
+        DeadlineQueue _shadow_gc_requests
         object _in_flight_cancels
+        DeadlineQueue _in_flight_cancel_expiries
         object _in_flight_pending_created
 
     cdef dict c_get_limit_orders(self)
@@ -1,7 +1,4 @@
-from collections import (
-    deque,
-    OrderedDict
-)
+from collections import OrderedDict
 import pandas as pd
 from typing import (
     Dict,
@@ -9,6 +6,7 @@ from typing import (
     Tuple
 )
 
+from hummingbot.core.data_type.deadline_queue import DeadlineQueue
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.market_order import MarketOrder
@@ -31,9 +29,10 @@ cdef class OrderTracker(TimeIterator):
         self._order_id_to_market_pair = {}
         self._shadow_tracked_limit_orders = {}
         self._shadow_order_id_to_market_pair = {}
-        self._shadow_gc_requests = deque()
+        self._shadow_gc_requests = DeadlineQueue()
         self._in_flight_pending_created = set()
         self._in_flight_cancels = OrderedDict()
+        self._in_flight_cancel_expiries = DeadlineQueue()
 
     @property
     def active_limit_orders(self) -> List[Tuple[MarketBase, LimitOrder]]:
@@ -136,24 +135,19 @@ cdef class OrderTracker(TimeIterator):
         :param order_id: the order id to be cancelled
         :return: True if there's no existing in flight cancel for the order id, False otherwise.
         """
-        cdef:
-            list keys_to_delete = []
-
         if order_id in self._in_flight_pending_created:  # Checks if a Buy/SellOrderCreatedEvent has been received
             return False
 
         # Maintain the cancel expiry time invariant.
-        for k, cancel_timestamp in self._in_flight_cancels.items():
-            if cancel_timestamp < self._current_timestamp - self.CANCEL_EXPIRY_DURATION:
-                keys_to_delete.append(k)
-        for k in keys_to_delete:
-            del self._in_flight_cancels[k]
+        for k in self._in_flight_cancel_expiries.c_pop_expired(self._current_timestamp):
+            self._in_flight_cancels.pop(k, None)
 
         if order_id in self.in_flight_cancels:
             return False
 
         # Track the cancel.
         self._in_flight_cancels[order_id] = self._current_timestamp
+        self._in_flight_cancel_expiries.c_push(order_id, self._current_timestamp + self.CANCEL_EXPIRY_DURATION)
         return True
 
     cdef object c_get_market_pair_from_order_id(self, str order_id):
@@ -199,16 +193,14 @@ cdef class OrderTracker(TimeIterator):
             del self._tracked_limit_orders[market_pair][order_id]
             if len(self._tracked_limit_orders[market_pair]) < 1:
                 del self._tracked_limit_orders[market_pair]
-            self._shadow_gc_requests.append((
-                self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION,
-                market_pair,
-                order_id
-            ))
+            self._shadow_gc_requests.c_push(order_id,
+                                            self._current_timestamp + self.SHADOW_MAKER_ORDER_KEEP_ALIVE_DURATION)
 
         if order_id in self._order_id_to_market_pair:
             del self._order_id_to_market_pair[order_id]
         if order_id in self._in_flight_cancels:
             del self._in_flight_cancels[order_id]
+            self._in_flight_cancel_expiries.c_remove(order_id)
 
     cdef c_start_tracking_market_order(self, object market_pair, str order_id, bint is_buy, object quantity):
         if market_pair not in self._tracked_market_orders:
@@ -234,10 +226,10 @@ cdef class OrderTracker(TimeIterator):
 
     cdef c_check_and_cleanup_shadow_records(self):
         cdef:
-            double current_timestamp = self._current_timestamp
+            object market_pair
 
-        while len(self._shadow_gc_requests) > 0 and self._shadow_gc_requests[0][0] < current_timestamp:
-            _, market_pair, order_id = self._shadow_gc_requests.popleft()
+        for order_id in self._shadow_gc_requests.c_pop_expired(self._current_timestamp):
+            market_pair = self._shadow_order_id_to_market_pair.get(order_id)
             if (market_pair in self._shadow_tracked_limit_orders and
                     order_id in self._shadow_tracked_limit_orders[market_pair]):
                 del self._shadow_tracked_limit_orders[market_pair][order_id]
@@ -0,0 +1,20 @@
+# distutils: language=c++
+
+from hummingbot.market.market_base cimport MarketBase
+from hummingbot.strategy.strategy_base cimport StrategyBase
+from .pure_market_making cimport PureMarketMakingStrategy
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    cdef:
+        MarketBase _market
+        list _pair_strategies
+        int _pairs_per_tick
+        int _next_pair_index
+
+    cdef object c_get_shared_available_balance(self, str asset)
+
+
+cdef class SharedBudgetPureMarketMakingStrategy(PureMarketMakingStrategy):
+    cdef:
+        MultiPairPureMarketMakingStrategy _parent
@@ -0,0 +1,198 @@
+from decimal import Decimal
+import logging
+from typing import (
+    Dict,
+    List,
+)
+
+from hummingbot.core.clock cimport Clock
+from hummingbot.core.data_type.limit_order cimport LimitOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.market.market_base cimport MarketBase
+from hummingbot.market.market_base import MarketBase
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.strategy_base import StrategyBase
+
+from .pure_market_making cimport PureMarketMakingStrategy
+from .pure_market_making import PureMarketMakingStrategy
+
+s_decimal_zero = Decimal(0)
+s_logger = None
+
+
+cdef class MultiPairPureMarketMakingStrategy(StrategyBase):
+    """
+    Runs the pure market making pipeline on several trading pairs of one market, so the market's connections, order
+    book tracker, user stream and balance polling are shared by all of them.
+
+    Every trading pair gets its own PureMarketMakingStrategy, with its own orders, timers and hanging orders. Their
+    budget constraints are checked against the balances that are left after the orders of all the pairs, so pairs
+    that share an asset can't commit the same balance twice. With pairs_per_tick set, only that many pairs run their
+    pipeline on each tick, in turns, so the work of a tick stays bounded however many pairs there are.
+    """
+
+    @classmethod
+    def logger(cls):
+        global s_logger
+        if s_logger is None:
+            s_logger = logging.getLogger(__name__)
+        return s_logger
+
+    def __init__(self,
+                 market_infos: List[MarketTradingPairTuple],
+                 pairs_per_tick: int = 0,
+                 **kwargs):
+        """
+        :param market_infos: The trading pairs to make markets on, all on the same market
+        :param pairs_per_tick: Number of trading pairs that run their pipeline on each tick, 0 for all of them
+        :param kwargs: Parameters of the PureMarketMakingStrategy of every trading pair
+        """
+        if len(market_infos) < 1:
+            raise ValueError("At least one trading pair is required.")
+        if len(set(market_info.market for market_info in market_infos)) > 1:
+            raise ValueError("All the trading pairs must be on the same market.")
+        if len(set(market_info.trading_pair for market_info in market_infos)) < len(market_infos):
+            raise ValueError("Each trading pair can only be added once.")
+        if pairs_per_tick < 0:
+            raise ValueError("Parameter pairs_per_tick cannot be negative.")
+
+        cdef:
+            SharedBudgetPureMarketMakingStrategy pair_strategy
+
+        super().__init__()
+        self._market = market_infos[0].market
+        self._pair_strategies = []
+        self._pairs_per_tick = pairs_per_tick
+        self._next_pair_index = 0
+        for market_info in market_infos:
+            pair_strategy = SharedBudgetPureMarketMakingStrategy(market_info=market_info, **kwargs)
+            pair_strategy._parent = self
+            self._pair_strategies.append(pair_strategy)
+
+    @property
+    def pair_strategies(self) -> List[PureMarketMakingStrategy]:
+        return list(self._pair_strategies)
+
+    @property
+    def pairs_per_tick(self) -> int:
+        return self._pairs_per_tick
+
+    @pairs_per_tick.setter
+    def pairs_per_tick(self, value: int):
+        self._pairs_per_tick = value
+
+    @property
+    def active_markets(self) -> List[MarketBase]:
+        return [self._market]
+
+    @property
+    def market_info_to_active_orders(self) -> Dict[MarketTradingPairTuple, List[LimitOrder]]:
+        cdef:
+            dict market_info_to_active_orders = {}
+        for pair_strategy in self._pair_strategies:
+            market_info_to_active_orders.update(pair_strategy.market_info_to_active_orders)
+        return market_info_to_active_orders
+
+    @property
+    def active_orders(self) -> List[LimitOrder]:
+        return [order for pair_strategy in self._pair_strategies for order in pair_strategy.active_orders]
+
+    def all_markets_ready(self):
+        return self._market.ready
+
+    def get_shared_available_balance(self, asset: str) -> Decimal:
+        return self.c_get_shared_available_balance(asset)
+
+    def format_status(self) -> str:
+        cdef:
+            list lines = []
+        for pair_strategy in self._pair_strategies:
+            lines.extend(["", f"  {pair_strategy.trading_pair}:"] +
+                         ["  " + line for line in pair_strategy.format_status().split("\n")])
+        return "\n".join(lines)
+
+    cdef c_start(self, Clock clock, double timestamp):
+        cdef:
+            PureMarketMakingStrategy pair_strategy
+        StrategyBase.c_start(self, clock, timestamp)
+        for pair_strategy in self._pair_strategies:
+            pair_strategy.c_start(clock, timestamp)
+
+    cdef c_tick(self, double timestamp):
+        StrategyBase.c_tick(self, timestamp)
+        cdef:
+            int pair_count = len(self._pair_strategies)
+            int pairs_to_tick = (self._pairs_per_tick if 0 < self._pairs_per_tick < pair_count
+                                 else pair_count)
+            int i
+            PureMarketMakingStrategy pair_strategy
+
+        # Pairs that sit out this tick still get the current time, for their order event handlers and timers.
+        for pair_strategy in self._pair_strategies:
+            pair_strategy._current_timestamp = timestamp
+        for i in range(pairs_to_tick):
+            pair_strategy = self._pair_strategies[self._next_pair_index]
+            self._next_pair_index = (self._next_pair_index + 1) % pair_count
+            try:
+                pair_strategy.c_tick(timestamp)
+            except Exception:
+                self.logger().error(f"Unexpected error running the {pair_strategy.trading_pair} strategy.",
+                                    exc_info=True)
+
+    cdef c_stop(self, Clock clock):
+        cdef:
+            PureMarketMakingStrategy pair_strategy
+        for pair_strategy in self._pair_strategies:
+            pair_strategy.c_stop(clock)
+        StrategyBase.c_stop(self, clock)
+
+    cdef object c_get_shared_available_balance(self, str asset):
+        """
+        Balance of an asset that isn't committed to the active orders of any trading pair.
+
+        The orders are counted as soon as they're submitted - before the exchange reports them in the available
+        balance. The available balance still caps the result, for balance that's used outside of this strategy.
+        """
+        cdef:
+            object locked_balance = s_decimal_zero
+            PureMarketMakingStrategy pair_strategy
+            LimitOrder order
+            bint is_base
+            bint is_quote
+
+        for pair_strategy in self._pair_strategies:
+            is_base = pair_strategy._market_info.base_asset == asset
+            is_quote = pair_strategy._market_info.quote_asset == asset
+            if not (is_base or is_quote):
+                continue
+            for order in pair_strategy.active_orders:
+                if order.is_buy and is_quote:
+                    locked_balance += order.quantity * order.price
+                elif not order.is_buy and is_base:
+                    locked_balance += order.quantity
+
+        return max(s_decimal_zero, min(self._market.c_get_available_balance(asset),
+                                       self._market.c_get_balance(asset) - locked_balance))
+
+
+cdef class SharedBudgetPureMarketMakingStrategy(PureMarketMakingStrategy):
+    """
+    Pure market making on one trading pair of a MultiPairPureMarketMakingStrategy, with balances shared with the
+    other trading pairs.
+    """
+
+    cdef tuple c_get_adjusted_available_balance(self, list orders):
+        if self._parent is None:
+            return PureMarketMakingStrategy.c_get_adjusted_available_balance(self, orders)
+
+        cdef:
+            object base_balance = self._parent.c_get_shared_available_balance(self.base_asset)
+            object quote_balance = self._parent.c_get_shared_available_balance(self.quote_asset)
+
+        for order in orders:
+            if order.is_buy:
+                quote_balance += order.quantity * order.price
+            else:
+                base_balance += order.quantity
+
+        return base_balance, quote_balance
@@ -0,0 +1,3 @@
+cdef list c_calculate_ladder_prices(object mid_price, object first_spread, object level_spread, int levels,
+                                    bint is_buy)
+cdef list c_calculate_ladder_sizes(object order_amount, object level_amount, int levels)
@@ -0,0 +1,30 @@
+from decimal import Decimal
+from typing import List
+
+decimal_1 = Decimal(1)
+
+
+def calculate_ladder_prices(mid_price: Decimal, first_spread: Decimal, level_spread: Decimal, levels: int,
+                            is_buy: bool) -> List[Decimal]:
+    return c_calculate_ladder_prices(mid_price, first_spread, level_spread, levels, is_buy)
+
+
+def calculate_ladder_sizes(order_amount: Decimal, level_amount: Decimal, levels: int) -> List[Decimal]:
+    return c_calculate_ladder_sizes(order_amount, level_amount, levels)
+
+
+cdef list c_calculate_ladder_prices(object mid_price, object first_spread, object level_spread, int levels,
+                                    bint is_buy):
+    """
+    Unquantized prices of all the levels on one side of an order ladder, from a single mid price.
+
+    The ladder stays in Decimal - prices and sizes are quantized to the market's increments next, and float values
+    just below an increment would be rounded down by a whole step.
+    """
+    if is_buy:
+        return [mid_price * (decimal_1 - first_spread - level * level_spread) for level in range(levels)]
+    return [mid_price * (decimal_1 + first_spread + level * level_spread) for level in range(levels)]
+
+
+cdef list c_calculate_ladder_sizes(object order_amount, object level_amount, int levels):
+    return [order_amount + level_amount * level for level in range(levels)]
@@ -17,6 +17,7 @@ from hummingbot.core.event.events import TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.data_type.order_request import OrderRequest
 from hummingbot.market.market_base cimport MarketBase
 from hummingbot.market.market_base import (
     MarketBase,
@@ -37,6 +38,10 @@ from .asset_price_delegate cimport AssetPriceDelegate
 from .asset_price_delegate import AssetPriceDelegate
 from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_asset_ratio
 from .inventory_skew_calculator import calculate_total_order_size
+from .order_ladder cimport (
+    c_calculate_ladder_prices,
+    c_calculate_ladder_sizes,
+)
 
 
 NaN = float("nan")
@@ -545,6 +550,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def cancel_order(self, order_id: str):
         return self.c_cancel_order(self._market_info, order_id)
 
+    def create_base_proposal(self) -> Proposal:
+        return self.c_create_base_proposal()
+
     # ---------------------------------------------------------------
 
     cdef c_start(self, Clock clock, double timestamp):
@@ -603,24 +611,25 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef object c_create_base_proposal(self):
         cdef:
             MarketBase market = self._market_info.market
-            list buys = []
-            list sells = []
-        for level in range(0, self._buy_levels):
-            price = self.c_get_mid_price() * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount + (self._order_level_amount * level)
-            size = market.c_quantize_order_amount(self.trading_pair, size)
-            if size > 0:
-                buys.append(PriceSize(price, size))
-        for level in range(0, self._sell_levels):
-            price = self.c_get_mid_price() * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount + (self._order_level_amount * level)
-            size = market.c_quantize_order_amount(self.trading_pair, size)
-            if size > 0:
-                sells.append(PriceSize(price, size))
-
-        return Proposal(buys, sells)
+            str trading_pair = self._market_info.trading_pair
+            object mid_price = self.c_get_mid_price()
+            list buy_prices
+            list buy_sizes
+            list sell_prices
+            list sell_sizes
+
+        # The whole ladder is priced from one mid price, and quantized with one call per side.
+        buy_prices = market.c_quantize_order_prices(trading_pair, c_calculate_ladder_prices(
+            mid_price, self._bid_spread, self._order_level_spread, self._buy_levels, True))
+        buy_sizes = market.c_quantize_order_amounts(trading_pair, c_calculate_ladder_sizes(
+            self._order_amount, self._order_level_amount, self._buy_levels))
+        sell_prices = market.c_quantize_order_prices(trading_pair, c_calculate_ladder_prices(
+            mid_price, self._ask_spread, self._order_level_spread, self._sell_levels, False))
+        sell_sizes = market.c_quantize_order_amounts(trading_pair, c_calculate_ladder_sizes(
+            self._order_amount, self._order_level_amount, self._sell_levels))
+
+        return Proposal([PriceSize(price, size) for price, size in zip(buy_prices, buy_sizes) if size > 0],
+                        [PriceSize(price, size) for price, size in zip(sell_prices, sell_sizes) if size > 0])
 
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
@@ -646,9 +655,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             self.c_apply_ping_pong(proposal)
 
     cdef c_apply_price_band(self, proposal):
-        if self._price_ceiling > 0 and self.c_get_mid_price() >= self._price_ceiling:
+        cdef:
+            object mid_price = self.c_get_mid_price()
+        if self._price_ceiling > 0 and mid_price >= self._price_ceiling:
             proposal.buys = []
-        if self._price_floor > 0 and self.c_get_mid_price() <= self._price_floor:
+        if self._price_floor > 0 and mid_price <= self._price_floor:
             proposal.sells = []
 
     cdef c_apply_ping_pong(self, object proposal):
@@ -697,19 +708,19 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bid_adj_ratio = Decimal(bid_ask_ratios.bid_ratio)
         ask_adj_ratio = Decimal(bid_ask_ratios.ask_ratio)
 
-        for buy in proposal.buys:
-            size = buy.size * bid_adj_ratio
-            size = market.c_quantize_order_amount(self.trading_pair, size)
+        for buy, size in zip(proposal.buys, market.c_quantize_order_amounts(
+                self.trading_pair, [buy.size * bid_adj_ratio for buy in proposal.buys])):
             buy.size = size
 
-        for sell in proposal.sells:
-            size = sell.size * ask_adj_ratio
-            size = market.c_quantize_order_amount(self.trading_pair, size, sell.price)
+        for sell, size in zip(proposal.sells, market.c_quantize_order_amounts(
+                self.trading_pair, [sell.size * ask_adj_ratio for sell in proposal.sells],
+                [sell.price for sell in proposal.sells])):
             sell.size = size
 
     cdef c_apply_budget_constraint(self, object proposal):
         cdef:
             MarketBase market = self._market_info.market
+            object buy_fee_factor
             object quote_size
             object base_size
             object quote_size_total = Decimal("0")
@@ -717,10 +728,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_non_hanging_orders)
 
+        if len(proposal.buys) > 0:
+            # The fee rate is the same for every level of the ladder, so it's looked up once.
+            buy_fee_factor = Decimal(1) + market.c_get_fee(self.base_asset, self.quote_asset, OrderType.MARKET,
+                                                           TradeType.BUY, proposal.buys[0].size,
+                                                           proposal.buys[0].price).percent
         for buy in proposal.buys:
-            buy_fees = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.MARKET, TradeType.BUY,
-                                        buy.size, buy.price)
-            quote_size = buy.size * buy.price * (Decimal(1) + buy_fees.percent)
+            quote_size = buy.size * buy.price * buy_fee_factor
             if quote_balance < quote_size_total + quote_size:
                 self.logger().info(f"Insufficient balance: Buy order (price: {buy.price}, size: {buy.size}) is omitted, {self.quote_asset} available balance: {quote_balance - quote_size_total}.")
                 quote_size = s_decimal_zero
@@ -798,16 +812,21 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef object c_apply_add_transaction_costs(self, object proposal):
         cdef:
             MarketBase market = self._market_info.market
-        for buy in proposal.buys:
-            fee = market.c_get_fee(self.base_asset, self.quote_asset,
-                                   OrderType.LIMIT, TradeType.BUY, buy.size, buy.price)
-            price = buy.price * (Decimal(1) - fee.percent)
-            buy.price = market.c_quantize_order_price(self.trading_pair, price)
-        for sell in proposal.sells:
-            fee = market.c_get_fee(self.base_asset, self.quote_asset,
-                                   OrderType.LIMIT, TradeType.SELL, sell.size, sell.price)
-            price = sell.price * (Decimal(1) + fee.percent)
-            sell.price = market.c_quantize_order_price(self.trading_pair, price)
+            object fee_factor
+        if len(proposal.buys) > 0:
+            fee_factor = Decimal(1) - market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT,
+                                                       TradeType.BUY, proposal.buys[0].size,
+                                                       proposal.buys[0].price).percent
+            for buy, price in zip(proposal.buys, market.c_quantize_order_prices(
+                    self.trading_pair, [buy.price * fee_factor for buy in proposal.buys])):
+                buy.price = price
+        if len(proposal.sells) > 0:
+            fee_factor = Decimal(1) + market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT,
+                                                       TradeType.SELL, proposal.sells[0].size,
+                                                       proposal.sells[0].price).percent
+            for sell, price in zip(proposal.sells, market.c_quantize_order_prices(
+                    self.trading_pair, [sell.price * fee_factor for sell in proposal.sells])):
+                sell.price = price
 
     cdef c_did_fill_order(self, object order_filled_event):
         cdef:
@@ -960,8 +979,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 to_defer_canceling = True
 
         if not to_defer_canceling:
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_batch_cancel_orders(self._market_info, [order.client_order_id for order in active_orders])
         else:
             self.logger().info(f"Not cancelling active orders since difference between new order prices "
                                f"and current order prices is within "
@@ -1013,8 +1031,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                                              (self._market_info.market.name == "bamboo_relay" and
                                               not self._market_info.market.use_coordinator))
                                          else NaN)
-            str bid_order_id, ask_order_id
-            bint orders_created = False
+            list order_requests = []
 
         if len(proposal.buys) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
@@ -1025,15 +1042,8 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for buy in proposal.buys:
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
+            order_requests.extend(OrderRequest(True, buy.size, self._limit_order_type, buy.price)
+                                  for buy in proposal.buys)
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1043,16 +1053,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for sell in proposal.sells:
-                ask_order_id = self.c_sell_with_specific_market(
-                    self._market_info,
-                    sell.size,
-                    order_type=self._limit_order_type,
-                    price=sell.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-        if orders_created:
+            order_requests.extend(OrderRequest(False, sell.size, self._limit_order_type, sell.price)
+                                  for sell in proposal.sells)
+        if len(order_requests) > 0:
+            # Submitted as one batch, so markets with a batch order endpoint can place the whole ladder at once.
+            self.c_batch_submit_orders_with_specific_market(self._market_info, order_requests,
+                                                            expiration_seconds=expiration_seconds)
             self.set_timers()
 
     cdef set_timers(self):
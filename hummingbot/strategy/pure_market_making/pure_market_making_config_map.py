@@ -36,6 +36,18 @@ def validate_exchange_trading_pair(value: str) -> Optional[str]:
     return validate_market_trading_pair(exchange, value)
 
 
+def validate_additional_markets(value) -> Optional[str]:
+    trading_pairs = parse_cvar_value(pure_market_making_config_map["additional_markets"], value) or []
+    if pure_market_making_config_map["market"].value in trading_pairs:
+        return "Additional markets cannot include the main market."
+    if len(set(trading_pairs)) < len(trading_pairs):
+        return "Additional markets cannot contain duplicates."
+    for trading_pair in trading_pairs:
+        err_msg = validate_exchange_trading_pair(trading_pair)
+        if err_msg is not None:
+            return err_msg
+
+
 def order_amount_prompt() -> str:
     exchange = pure_market_making_config_map["exchange"].value
     trading_pair = pure_market_making_config_map["market"].value
@@ -110,6 +122,22 @@ pure_market_making_config_map = {
                   prompt=maker_trading_pair_prompt,
                   validator=validate_exchange_trading_pair,
                   prompt_on_new=True),
+    "additional_markets":
+        ConfigVar(key="additional_markets",
+                  prompt="Enter the other token trading pairs to make markets on with the same settings, "
+                         "separated by commas (leave empty to trade the main market only) >>> ",
+                  required_if=lambda: False,
+                  type_str="list",
+                  default=[],
+                  validator=validate_additional_markets),
+    "pairs_per_tick":
+        ConfigVar(key="pairs_per_tick",
+                  prompt="How many trading pairs should update their orders on each clock tick? "
+                         "(Enter 0 for all of them) >>> ",
+                  required_if=lambda: False,
+                  type_str="int",
+                  default=0,
+                  validator=lambda v: validate_int(v, min_value=-1, inclusive=False)),
     "bid_spread":
         ConfigVar(key="bid_spread",
                   prompt="How far away from the mid price do you want to place the "
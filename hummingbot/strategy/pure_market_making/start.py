@@ -6,6 +6,7 @@ from typing import (
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making import (
     PureMarketMakingStrategy,
+    MultiPairPureMarketMakingStrategy,
     OrderBookAssetPriceDelegate,
     APIAssetPriceDelegate
 )
@@ -30,6 +31,8 @@ def start(self):
         order_level_spread = c_map.get("order_level_spread").value / Decimal('100')
         exchange = c_map.get("exchange").value.lower()
         raw_trading_pair = c_map.get("market").value
+        raw_additional_trading_pairs = c_map.get("additional_markets").value or []
+        pairs_per_tick = c_map.get("pairs_per_tick").value or 0
         inventory_skew_enabled = c_map.get("inventory_skew_enabled").value
         inventory_target_base_pct = 0 if c_map.get("inventory_target_base_pct").value is None else \
             c_map.get("inventory_target_base_pct").value / Decimal('100')
@@ -48,14 +51,19 @@ def start(self):
         price_source_custom = c_map.get("price_source_custom").value
         order_refresh_tolerance_pct = c_map.get("order_refresh_tolerance_pct").value / Decimal('100')
 
-        trading_pair: str = self._convert_to_exchange_trading_pair(exchange, [raw_trading_pair])[0]
-        maker_assets: Tuple[str, str] = self._initialize_market_assets(exchange, [trading_pair])[0]
-        market_names: List[Tuple[str, List[str]]] = [(exchange, [trading_pair])]
-        self._initialize_wallet(token_trading_pairs=list(set(maker_assets)))
+        trading_pairs: List[str] = self._convert_to_exchange_trading_pair(
+            exchange, [raw_trading_pair] + raw_additional_trading_pairs)
+        maker_assets: List[Tuple[str, str]] = self._initialize_market_assets(exchange, trading_pairs)
+        market_names: List[Tuple[str, List[str]]] = [(exchange, trading_pairs)]
+        self._initialize_wallet(token_trading_pairs=list(set(asset for assets in maker_assets for asset in assets)))
         self._initialize_markets(market_names)
-        self.assets = set(maker_assets)
-        maker_data = [self.markets[exchange], trading_pair] + list(maker_assets)
-        self.market_trading_pair_tuples = [MarketTradingPairTuple(*maker_data)]
+        self.assets = set(asset for assets in maker_assets for asset in assets)
+        self.market_trading_pair_tuples = [MarketTradingPairTuple(self.markets[exchange], trading_pair, *assets)
+                                           for trading_pair, assets in zip(trading_pairs, maker_assets)]
+        if len(trading_pairs) > 1 and price_source_enabled:
+            self._notify("External price source is not supported when making markets on more than one "
+                         "trading pair. Please disable it or remove the additional markets.")
+            return
         asset_price_delegate = None
         if price_source_enabled:
             if price_source_type == "exchange":
@@ -70,8 +78,7 @@ def start(self):
 
         strategy_logging_options = PureMarketMakingStrategy.OPTION_LOG_ALL
 
-        self.strategy = PureMarketMakingStrategy(
-            market_info=MarketTradingPairTuple(*maker_data),
+        strategy_params = dict(
             bid_spread=bid_spread,
             ask_spread=ask_spread,
             order_levels=order_levels,
@@ -99,6 +106,15 @@ def start(self):
             minimum_spread=minimum_spread,
             hb_app_notification=True,
         )
+        if len(self.market_trading_pair_tuples) > 1:
+            self.strategy = MultiPairPureMarketMakingStrategy(
+                market_infos=self.market_trading_pair_tuples,
+                pairs_per_tick=pairs_per_tick,
+                **strategy_params
+            )
+        else:
+            self.strategy = PureMarketMakingStrategy(market_info=self.market_trading_pair_tuples[0],
+                                                     **strategy_params)
     except Exception as e:
         self._notify(str(e))
         self.logger().error("Unknown error during initialization.", exc_info=True)
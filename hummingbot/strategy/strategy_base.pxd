@@ -41,6 +41,9 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount,
                                          object order_type = *, object price = *, double expiration_seconds = *)
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef list c_batch_submit_orders_with_specific_market(self, object market_trading_pair_tuple, list order_requests,
+                                                         double expiration_seconds = *)
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
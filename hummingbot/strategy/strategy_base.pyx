@@ -456,6 +456,60 @@ cdef class StrategyBase(TimeIterator):
                 f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit order {order_id}."
             )
             market.c_cancel(market_trading_pair_tuple.trading_pair, order_id)
+
+    def batch_submit_orders_with_specific_market(self, market_trading_pair_tuple, order_requests,
+                                                 expiration_seconds=NaN):
+        return self.c_batch_submit_orders_with_specific_market(market_trading_pair_tuple, order_requests,
+                                                               expiration_seconds)
+
+    cdef list c_batch_submit_orders_with_specific_market(self, object market_trading_pair_tuple, list order_requests,
+                                                         double expiration_seconds=NaN):
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        for order_request in order_requests:
+            if not (isinstance(order_request.amount, Decimal) and isinstance(order_request.price, Decimal)):
+                raise TypeError("price and amount must be Decimal objects.")
+
+        cdef:
+            MarketBase market = market_trading_pair_tuple.market
+            list order_ids
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order is not in the whitelisted markets set.")
+
+        order_requests = [order_request._replace(kwargs={
+            **order_request.kwargs,
+            "expiration_ts": self._current_timestamp + expiration_seconds
+        }) for order_request in order_requests]
+        order_ids = market.c_batch_submit_orders(market_trading_pair_tuple.trading_pair, order_requests)
+
+        # Start order tracking
+        for order_id, order_request in zip(order_ids, order_requests):
+            if order_id is None:
+                continue
+            if order_request.order_type.is_limit_type():
+                self.c_start_tracking_limit_order(market_trading_pair_tuple, order_id, order_request.is_buy,
+                                                  order_request.price, order_request.amount)
+            elif order_request.order_type == OrderType.MARKET:
+                self.c_start_tracking_market_order(market_trading_pair_tuple, order_id, order_request.is_buy,
+                                                   order_request.amount)
+
+        return order_ids
+
+    cdef c_batch_cancel_orders(self, object market_trading_pair_tuple, list order_ids):
+        cdef:
+            MarketBase market = market_trading_pair_tuple.market
+            list orders_to_cancel = [order_id for order_id in order_ids
+                                     if self._sb_order_tracker.c_check_and_track_cancel(order_id)]
+
+        if len(orders_to_cancel) == 0:
+            return
+        self.log_with_clock(
+            logging.INFO,
+            f"({market_trading_pair_tuple.trading_pair}) Cancelling the limit orders {orders_to_cancel}."
+        )
+        market.c_batch_cancel(market_trading_pair_tuple.trading_pair, orders_to_cancel)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
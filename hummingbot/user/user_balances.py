@@ -1,11 +1,4 @@
-from hummingbot.market.binance.binance_market import BinanceMarket
-from hummingbot.market.bittrex.bittrex_market import BittrexMarket
-from hummingbot.market.coinbase_pro.coinbase_pro_market import CoinbaseProMarket
-from hummingbot.market.huobi.huobi_market import HuobiMarket
-from hummingbot.market.kucoin.kucoin_market import KucoinMarket
-from hummingbot.market.liquid.liquid_market import LiquidMarket
-from hummingbot.market.kraken.kraken_market import KrakenMarket
-from hummingbot.market.eterbase.eterbase_market import EterbaseMarket
+from hummingbot.market.market_registry import get_market_class
 from hummingbot.core.utils.market_mid_price import get_mid_price
 from hummingbot.client.settings import EXCHANGES, DEXES
 from hummingbot.client.config.security import Security
@@ -23,22 +16,23 @@ class UserBalances:
     @staticmethod
     def connect_market(exchange, *api_details):
         market = None
+        market_class = get_market_class(exchange)
         if exchange == "binance":
-            market = BinanceMarket(api_details[0], api_details[1])
+            market = market_class(api_details[0], api_details[1])
         elif exchange == "bittrex":
-            market = BittrexMarket(api_details[0], api_details[1])
+            market = market_class(api_details[0], api_details[1])
         elif exchange == "coinbase_pro":
-            market = CoinbaseProMarket(api_details[0], api_details[1], api_details[2])
+            market = market_class(api_details[0], api_details[1], api_details[2])
         elif exchange == "huobi":
-            market = HuobiMarket(api_details[0], api_details[1])
+            market = market_class(api_details[0], api_details[1])
         elif exchange == "kucoin":
-            market = KucoinMarket(api_details[0], api_details[2], api_details[1])
+            market = market_class(api_details[0], api_details[2], api_details[1])
         elif exchange == "liquid":
-            market = LiquidMarket(api_details[0], api_details[1])
+            market = market_class(api_details[0], api_details[1])
         elif exchange == "kraken":
-            market = KrakenMarket(api_details[0], api_details[1])
+            market = market_class(api_details[0], api_details[1])
         elif exchange == "eterbase":
-            market = EterbaseMarket(api_details[0], api_details[1], api_details[2])
+            market = market_class(api_details[0], api_details[1], api_details[2])
 
         return market
 
@@ -47,9 +41,7 @@ class UserBalances:
     async def _update_balances(market) -> Optional[str]:
         try:
             # Todo: Check first if _account_id is not already set, but the market objects need to expose this property.
-            if isinstance(market, HuobiMarket):
-                await market._update_account_id()
-            elif isinstance(market, KucoinMarket):
+            if market.name in ("huobi", "kucoin"):
                 await market._update_account_id()
             await market._update_balances()
         except Exception as e:
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+
+import aiohttp
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from web3.datastructures import AttributeDict
+
+from hummingbot.logger import HummingbotLogger
+
+RPC_INT_FIELDS = {
+    "number", "timestamp", "gasLimit", "gasUsed", "cumulativeGasUsed", "difficulty", "totalDifficulty", "size",
+    "status", "blockNumber", "transactionIndex", "logIndex", "value", "gas", "gasPrice", "effectiveGasPrice",
+}
+RPC_HEXBYTES_FIELDS = {
+    "hash", "blockHash", "parentHash", "transactionHash", "sha3Uncles", "logsBloom", "transactionsRoot", "stateRoot",
+    "receiptsRoot", "mixHash", "extraData", "root", "data", "input", "r", "s", "topics", "transactions", "uncles",
+}
+
+# A JSON-RPC call given as (method, params).
+RpcCall = Tuple[str, List[Any]]
+
+
+class JsonRpcError(IOError):
+    """
+    Error returned by a single call of a JSON-RPC batch.
+    """
+    pass
+
+
+def _format_hexbytes(value: Any) -> Any:
+    if isinstance(value, list):
+        return [_format_hexbytes(item) for item in value]
+    if isinstance(value, str):
+        return HexBytes(value)
+    return format_rpc_result(value)
+
+
+def format_rpc_result(result: Any) -> Any:
+    """
+    Converts a raw JSON-RPC block, transaction or receipt into the form web3 returns it in: quantities become ints,
+    hashes and other data become HexBytes. Any other field, e.g. an address, is left as a string.
+    """
+    if isinstance(result, list):
+        return [format_rpc_result(item) for item in result]
+    if not isinstance(result, dict):
+        return result
+    formatted_result: Dict[str, Any] = {}
+    for key, value in result.items():
+        if key in RPC_INT_FIELDS and isinstance(value, str):
+            formatted_result[key] = int(value, 16)
+        elif key in RPC_HEXBYTES_FIELDS:
+            formatted_result[key] = _format_hexbytes(value)
+        else:
+            formatted_result[key] = format_rpc_result(value)
+    return AttributeDict(formatted_result)
+
+
+class JsonRpcBatchClient:
+    """
+    Sends several Ethereum JSON-RPC calls in a single HTTP payload, over a pooled aiohttp connection. The wallet uses
+    it for the calls it makes once per block or per polling tick, where one round trip per call adds up quickly.
+    """
+    _jrbc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._jrbc_logger is None:
+            cls._jrbc_logger = logging.getLogger(__name__)
+        return cls._jrbc_logger
+
+    def __init__(self, jsonrpc_url: str, max_batch_size: int = 100):
+        self._jsonrpc_url: str = jsonrpc_url
+        self._max_batch_size: int = max_batch_size
+        self._shared_client: Optional[aiohttp.ClientSession] = None
+        self._request_id: int = 0
+
+    async def _http_client(self) -> aiohttp.ClientSession:
+        if self._shared_client is None:
+            self._shared_client = aiohttp.ClientSession()
+        return self._shared_client
+
+    async def close(self):
+        if self._shared_client is not None:
+            await self._shared_client.close()
+            self._shared_client = None
+
+    async def batch_call(self, calls: List[RpcCall]) -> List[Any]:
+        """
+        :param calls: list of (method, params) tuples
+        :return: the raw result of each call, in the same order. Calls that returned an error give None.
+        """
+        results: List[Any] = []
+        for (method, params), rpc_response in zip(calls, await self.batch_call_responses(calls)):
+            if "error" in rpc_response or "result" not in rpc_response:
+                self.logger().debug(f"JSON-RPC call {method}({params}) failed: {rpc_response.get('error')}")
+                results.append(None)
+            else:
+                results.append(rpc_response["result"])
+        return results
+
+    async def batch_call_responses(self, calls: List[RpcCall]) -> List[Dict[str, Any]]:
+        """
+        Same as batch_call, but returns the whole JSON-RPC response object of each call, for callers that need to
+        look at the error of a failed call.
+        """
+        responses: List[Dict[str, Any]] = []
+        for start in range(0, len(calls), self._max_batch_size):
+            responses.extend(await self._send_batch(calls[start:start + self._max_batch_size]))
+        return responses
+
+    async def _send_batch(self, calls: List[RpcCall]) -> List[Dict[str, Any]]:
+        if len(calls) == 0:
+            return []
+        request_ids: List[int] = []
+        payload: List[Dict[str, Any]] = []
+        for method, params in calls:
+            self._request_id += 1
+            request_ids.append(self._request_id)
+            payload.append({"jsonrpc": "2.0", "id": self._request_id, "method": method, "params": params})
+
+        client: aiohttp.ClientSession = await self._http_client()
+        async with client.post(self._jsonrpc_url, json=payload) as response:
+            if response.status != 200:
+                raise IOError(f"Error sending JSON-RPC batch to {self._jsonrpc_url}. HTTP status is {response.status}.")
+            responses: Any = await response.json(content_type=None)
+        if not isinstance(responses, list):
+            # Nodes answer a batch they can't process with a single error object.
+            raise IOError(f"Error sending JSON-RPC batch to {self._jsonrpc_url}. Response: {responses}")
+
+        # Batch responses may come back in any order.
+        responses_by_id: Dict[int, Dict[str, Any]] = {r.get("id"): r for r in responses}
+        return [responses_by_id.get(request_id, {}) for request_id in request_ids]
+
+    async def get_transaction_receipts(self,
+                                       tx_hashes: List[str]) -> List[Union[AttributeDict, None, JsonRpcError]]:
+        """
+        :return: the receipt of each transaction, in the same order. None if the node has no receipt for the
+                 transaction, or a JsonRpcError if the call failed.
+        """
+        responses: List[Dict[str, Any]] = await self.batch_call_responses([("eth_getTransactionReceipt", [tx_hash])
+                                                                           for tx_hash in tx_hashes])
+        receipts: List[Union[AttributeDict, None, JsonRpcError]] = []
+        for tx_hash, rpc_response in zip(tx_hashes, responses):
+            if "error" in rpc_response or "result" not in rpc_response:
+                receipts.append(JsonRpcError(f"Error fetching the receipt of transaction {tx_hash}: "
+                                             f"{rpc_response.get('error')}"))
+            elif rpc_response["result"] is None:
+                receipts.append(None)
+            else:
+                receipts.append(format_rpc_result(rpc_response["result"]))
+        return receipts
+
+    async def get_blocks(self, block_hashes: List[str]) -> List[Optional[AttributeDict]]:
+        results: List[Any] = await self.batch_call([("eth_getBlockByHash", [block_hash, False])
+                                                    for block_hash in block_hashes])
+        return [format_rpc_result(result) if result is not None else None for result in results]
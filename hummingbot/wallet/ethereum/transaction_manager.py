@@ -0,0 +1,360 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import OrderedDict
+from eth_account.signers.local import LocalAccount
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+from hummingbot.wallet.ethereum.json_rpc_batch_client import (
+    JsonRpcBatchClient,
+    RpcCall,
+)
+
+# Error messages nodes return when the exact same transaction is already in their pool.
+KNOWN_TRANSACTION_ERRORS = ("already known", "known transaction", "already imported")
+
+
+class PendingTransaction:
+    def __init__(self, transaction: Dict[str, Any], signed_transaction: AttributeDict, is_filler: bool = False):
+        self.transaction: Dict[str, Any] = transaction
+        self.original_tx_hash: str = signed_transaction.hash.hex()
+        self.tx_hashes: List[str] = [self.original_tx_hash]
+        self.gas_prices: Dict[str, int] = {self.original_tx_hash: transaction["gasPrice"]}
+        self.raw_transaction: bytes = signed_transaction.rawTransaction
+        self.is_filler: bool = is_filler
+        self.created_timestamp: float = time.time()
+        self.last_sent_timestamp: float = 0.0
+        self.send_failed: bool = False
+
+    @property
+    def nonce(self) -> int:
+        return self.transaction["nonce"]
+
+    @property
+    def gas_price(self) -> int:
+        return self.transaction["gasPrice"]
+
+    @property
+    def current_tx_hash(self) -> str:
+        return self.tx_hashes[-1]
+
+    @property
+    def replacements(self) -> int:
+        return len(self.tx_hashes) - 1
+
+
+class EthereumTransactionManager:
+    """
+    Sends the wallet's transactions with contiguous nonces, without waiting for one to be mined before sending the
+    next one.
+
+    Nonces are handed out locally, so building a transaction never waits on the network. Queued transactions are
+    sent in nonce order, in a single JSON-RPC batch. A maintenance loop reconciles the local nonce with the node,
+    fills the nonce gaps the node reports, sends again the transactions that couldn't be sent, and replaces
+    transactions stuck for longer than STUCK_TRANSACTION_TIMEOUT with a copy at a higher gas price. Transactions
+    that are still stuck after MAX_REPLACEMENTS replacements are broadcast again as they are.
+
+    A replaced transaction keeps being identified by the hash it was first sent with. current_tx_hash() maps it to
+    the hash of the latest replacement, or to the hash that was mined once the transaction is complete.
+    """
+    STUCK_TRANSACTION_TIMEOUT = 180.0
+    GAS_PRICE_BUMP = 1.125  # Nodes only accept a replacement that pays at least 10% more.
+    MAX_REPLACEMENTS = 5
+    MAINTENANCE_INTERVAL = 15.0
+    COMPLETED_TX_HASHES_LIMIT = 1000
+
+    _etm_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._etm_logger is None:
+            cls._etm_logger = logging.getLogger(__name__)
+        return cls._etm_logger
+
+    def __init__(self,
+                 account: LocalAccount,
+                 rpc_client: JsonRpcBatchClient,
+                 gas_price_getter: Callable[[], int],
+                 send_failure_callback: Callable[[str], None]):
+        self._account: LocalAccount = account
+        self._rpc_client: JsonRpcBatchClient = rpc_client
+        self._gas_price_getter: Callable[[], int] = gas_price_getter
+        self._send_failure_callback: Callable[[str], None] = send_failure_callback
+        self._next_nonce: int = -1
+        self._mined_nonce: int = -1
+        self._pending_transactions: Dict[str, PendingTransaction] = OrderedDict()
+        self._replaced_tx_hashes: Dict[str, str] = {}
+        # Mined hashes of the most recently completed transactions that had been replaced, by every hash they were
+        # sent with.
+        self._completed_tx_hashes: Dict[str, str] = OrderedDict()
+        self._send_queue: asyncio.Queue = asyncio.Queue()
+        self._send_transactions_task: Optional[asyncio.Task] = None
+        self._maintenance_task: Optional[asyncio.Task] = None
+
+    @property
+    def next_nonce(self) -> int:
+        return self._next_nonce
+
+    @property
+    def pending_transactions(self) -> List[PendingTransaction]:
+        return list(self._pending_transactions.values())
+
+    def initialize_nonce(self, remote_nonce: int):
+        self._next_nonce = max(self._next_nonce, remote_nonce)
+
+    def current_tx_hash(self, tx_hash: str) -> str:
+        """
+        :return: the hash of the latest replacement of a pending transaction, the hash a completed transaction was
+                 mined with, or the hash itself if it was never replaced
+        """
+        original_tx_hash: str = self._replaced_tx_hashes.get(tx_hash, tx_hash)
+        pending_transaction: Optional[PendingTransaction] = self._pending_transactions.get(original_tx_hash)
+        if pending_transaction is not None:
+            return pending_transaction.current_tx_hash
+        return self._completed_tx_hashes.get(tx_hash, tx_hash)
+
+    def submit(self, transaction: Dict[str, Any]) -> str:
+        """
+        Assigns the next nonce to a transaction, signs it and queues it for sending.
+
+        :param transaction: unsigned transaction, without a nonce
+        :return: transaction hash
+        """
+        transaction = dict(transaction, nonce=self._next_nonce)
+        signed_transaction: AttributeDict = self._account.signTransaction(transaction)
+        self._next_nonce += 1
+        pending_transaction: PendingTransaction = PendingTransaction(transaction, signed_transaction)
+        self._pending_transactions[pending_transaction.original_tx_hash] = pending_transaction
+        self._send_queue.put_nowait(pending_transaction)
+        return pending_transaction.original_tx_hash
+
+    def complete(self, tx_hash: str, mined_tx_hash: Optional[str] = None):
+        """
+        Stops tracking a transaction, once it has been mined or given up on.
+
+        :param tx_hash: the hash the transaction was first sent with
+        :param mined_tx_hash: the hash of the replacement that was mined, if any, which current_tx_hash() keeps
+                              returning for the transaction's other hashes
+        """
+        pending_transaction: Optional[PendingTransaction] = self._pending_transactions.pop(tx_hash, None)
+        if pending_transaction is None:
+            return
+        for replaced_tx_hash in pending_transaction.tx_hashes[1:]:
+            self._replaced_tx_hashes.pop(replaced_tx_hash, None)
+        if mined_tx_hash is not None and mined_tx_hash != tx_hash:
+            for sent_tx_hash in pending_transaction.tx_hashes:
+                self._completed_tx_hashes[sent_tx_hash] = mined_tx_hash
+            while len(self._completed_tx_hashes) > self.COMPLETED_TX_HASHES_LIMIT:
+                self._completed_tx_hashes.popitem(last=False)
+
+    def is_nonce_mined(self, pending_transaction: PendingTransaction) -> bool:
+        return pending_transaction.nonce < self._mined_nonce
+
+    def start(self):
+        self.stop()
+        self._send_transactions_task = safe_ensure_future(self.send_transactions_loop())
+        self._maintenance_task = safe_ensure_future(self.maintenance_loop())
+
+    def stop(self):
+        if self._send_transactions_task is not None:
+            self._send_transactions_task.cancel()
+            self._send_transactions_task = None
+        if self._maintenance_task is not None:
+            self._maintenance_task.cancel()
+            self._maintenance_task = None
+
+    async def send_transactions_loop(self):
+        while True:
+            try:
+                pending_transactions: List[PendingTransaction] = [await self._send_queue.get()]
+                while not self._send_queue.empty():
+                    pending_transactions.append(self._send_queue.get_nowait())
+                await self._send_transactions(sorted(pending_transactions, key=lambda t: t.nonce))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Unexpected error while sending transactions.", exc_info=True,
+                                      app_warning_msg="Unexpected error while sending transactions. "
+                                                      "Check wallet network connection")
+
+    async def _send_transactions(self, pending_transactions: List[PendingTransaction]):
+        calls: List[RpcCall] = [("eth_sendRawTransaction", ["0x" + bytes(pending_transaction.raw_transaction).hex()])
+                                for pending_transaction in pending_transactions]
+        try:
+            responses: List[Dict[str, Any]] = await self._rpc_client.batch_call_responses(calls)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error sending transactions.", exc_info=True,
+                                  app_warning_msg="Error sending transactions. Check wallet network connection")
+            # The node hasn't rejected any of them, releasing their nonces would leave gaps behind. Send them again on
+            # the next maintenance instead.
+            for pending_transaction in pending_transactions:
+                pending_transaction.send_failed = True
+            return
+
+        now: float = time.time()
+        for pending_transaction, response in zip(pending_transactions, responses):
+            error_message: str = str(response.get("error", {}).get("message", "")) if "error" in response else ""
+            if "error" not in response or any(e in error_message.lower() for e in KNOWN_TRANSACTION_ERRORS):
+                pending_transaction.last_sent_timestamp = now
+            elif pending_transaction.replacements > 0:
+                # A rejected replacement leaves the transaction it was replacing in the node's pool.
+                self.logger().network(f"Error replacing transaction {pending_transaction.original_tx_hash}: "
+                                      f"{error_message}")
+                rejected_tx_hash: str = pending_transaction.tx_hashes.pop()
+                self._replaced_tx_hashes.pop(rejected_tx_hash, None)
+                pending_transaction.gas_prices.pop(rejected_tx_hash, None)
+                pending_transaction.transaction = dict(
+                    pending_transaction.transaction,
+                    gasPrice=pending_transaction.gas_prices[pending_transaction.current_tx_hash]
+                )
+                pending_transaction.raw_transaction = self._account.signTransaction(
+                    pending_transaction.transaction
+                ).rawTransaction
+                pending_transaction.last_sent_timestamp = now
+            elif pending_transaction.is_filler and "nonce too low" not in error_message.lower():
+                # Later transactions can't be mined until the nonce is used, so the filler is sent again on the next
+                # maintenance.
+                self.logger().network(f"Error sending filler transaction for nonce {pending_transaction.nonce}: "
+                                      f"{error_message}")
+                pending_transaction.send_failed = True
+            else:
+                self.logger().network(f"Error sending transaction {pending_transaction.original_tx_hash}: "
+                                      f"{error_message}",
+                                      app_warning_msg=f"Error sending transaction "
+                                                      f"{pending_transaction.original_tx_hash}. "
+                                                      f"Check wallet network connection")
+                self._release_nonce(pending_transaction, error_message)
+                if not pending_transaction.is_filler:
+                    self._send_failure_callback(pending_transaction.original_tx_hash)
+
+    def _release_nonce(self, failed_transaction: PendingTransaction, error_message: str):
+        self.complete(failed_transaction.original_tx_hash)
+        if "nonce too low" in error_message.lower() or failed_transaction.is_filler:
+            # The nonce is already used, the next reconciliation with the node will pick it up.
+            return
+        if failed_transaction.nonce == self._next_nonce - 1:
+            self._next_nonce -= 1
+        elif any(t.nonce > failed_transaction.nonce for t in self._pending_transactions.values()):
+            # Later transactions can't be mined until this nonce is used, so fill it with an empty transfer.
+            self.logger().info(f"Filling nonce {failed_transaction.nonce} left by a failed transaction.")
+            self._fill_nonce(failed_transaction.nonce,
+                             failed_transaction.gas_price,
+                             failed_transaction.transaction.get("chainId"))
+
+    def _fill_nonce(self, nonce: int, gas_price: int, chain_id: Optional[int]):
+        """
+        Queues an empty transfer to the wallet itself, to use up a nonce that no other transaction is going to use.
+        """
+        filler_transaction: Dict[str, Any] = {
+            "to": self._account.address,
+            "value": 0,
+            "gas": 21000,
+            "gasPrice": gas_price,
+            "nonce": nonce,
+            "chainId": chain_id,
+        }
+        signed_transaction: AttributeDict = self._account.signTransaction(filler_transaction)
+        pending_transaction: PendingTransaction = PendingTransaction(filler_transaction,
+                                                                     signed_transaction,
+                                                                     is_filler=True)
+        self._pending_transactions[pending_transaction.original_tx_hash] = pending_transaction
+        self._send_queue.put_nowait(pending_transaction)
+
+    async def maintenance_loop(self):
+        while True:
+            try:
+                await self.reconcile_nonce()
+                self.resend_failed_transactions()
+                self.replace_stuck_transactions()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error reconciling the wallet nonce.", exc_info=True,
+                                      app_warning_msg="Error reconciling the wallet nonce. "
+                                                      "Check wallet network connection")
+            await asyncio.sleep(self.MAINTENANCE_INTERVAL)
+
+    async def reconcile_nonce(self):
+        mined_nonce, pending_nonce = await self._rpc_client.batch_call([
+            ("eth_getTransactionCount", [self._account.address, "latest"]),
+            ("eth_getTransactionCount", [self._account.address, "pending"]),
+        ])
+        if mined_nonce is None or pending_nonce is None:
+            return
+        self._mined_nonce = int(mined_nonce, 16)
+        pending_nonce: int = int(pending_nonce, 16)
+        unmined_transactions: List[PendingTransaction] = [t for t in self._pending_transactions.values()
+                                                          if not self.is_nonce_mined(t)]
+        if pending_nonce > self._next_nonce:
+            # Transactions were sent from this account by someone else.
+            self.logger().info(f"Wallet nonce moved ahead to {pending_nonce} outside of this wallet.")
+            self._next_nonce = pending_nonce
+        elif len(unmined_transactions) == 0 and pending_nonce < self._next_nonce:
+            # Nothing of ours is waiting to be mined, so the node dropped the transactions behind the gap.
+            self._next_nonce = max(pending_nonce, self._mined_nonce)
+        elif len(unmined_transactions) > 0:
+            lowest_unmined_transaction: PendingTransaction = min(unmined_transactions, key=lambda t: t.nonce)
+            if pending_nonce < lowest_unmined_transaction.nonce:
+                # None of our transactions uses the nonces in between, so everything after them is stuck until
+                # they're filled.
+                self.logger().info(f"Filling nonces {pending_nonce} to {lowest_unmined_transaction.nonce - 1} "
+                                   f"missing on the node.")
+                gas_price: int = int(self._gas_price_getter())
+                for nonce in range(pending_nonce, lowest_unmined_transaction.nonce):
+                    self._fill_nonce(nonce, gas_price, lowest_unmined_transaction.transaction.get("chainId"))
+
+    def resend_failed_transactions(self):
+        """
+        Queues the transactions that couldn't be sent for sending again, unless their nonce has been used since.
+        """
+        for pending_transaction in list(self._pending_transactions.values()):
+            if not pending_transaction.send_failed:
+                continue
+            pending_transaction.send_failed = False
+            if self.is_nonce_mined(pending_transaction):
+                if pending_transaction.is_filler:
+                    self.complete(pending_transaction.original_tx_hash)
+                continue
+            self._send_queue.put_nowait(pending_transaction)
+
+    def replace_stuck_transactions(self):
+        now: float = time.time()
+        for pending_transaction in list(self._pending_transactions.values()):
+            if (self.is_nonce_mined(pending_transaction) or
+                    pending_transaction.last_sent_timestamp == 0 or
+                    now - pending_transaction.last_sent_timestamp < self.STUCK_TRANSACTION_TIMEOUT):
+                continue
+            if pending_transaction.replacements >= self.MAX_REPLACEMENTS:
+                # Don't raise the gas price any further, but make sure the node hasn't dropped the transaction.
+                self.logger().info(f"Transaction {pending_transaction.current_tx_hash} with nonce "
+                                   f"{pending_transaction.nonce} is still stuck. Broadcasting it again.")
+                pending_transaction.last_sent_timestamp = now
+                self._send_queue.put_nowait(pending_transaction)
+                continue
+            gas_price: int = max(int(pending_transaction.gas_price * self.GAS_PRICE_BUMP) + 1,
+                                 int(self._gas_price_getter()))
+            self.logger().info(f"Transaction {pending_transaction.current_tx_hash} with nonce "
+                               f"{pending_transaction.nonce} is stuck. Replacing it with gas price {gas_price}.")
+            pending_transaction.transaction = dict(pending_transaction.transaction, gasPrice=gas_price)
+            signed_transaction: AttributeDict = self._account.signTransaction(pending_transaction.transaction)
+            replacement_tx_hash: str = signed_transaction.hash.hex()
+            pending_transaction.tx_hashes.append(replacement_tx_hash)
+            pending_transaction.gas_prices[replacement_tx_hash] = gas_price
+            pending_transaction.raw_transaction = signed_transaction.rawTransaction
+            # Don't replace it again before the replacement itself had time to be mined.
+            pending_transaction.last_sent_timestamp = now
+            self._replaced_tx_hashes[replacement_tx_hash] = pending_transaction.original_tx_hash
+            self._send_queue.put_nowait(pending_transaction)
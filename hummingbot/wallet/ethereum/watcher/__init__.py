@@ -1,6 +1,7 @@
 from .account_balance_watcher import AccountBalanceWatcher
 from .erc20_events_watcher import ERC20EventsWatcher
 from .incoming_eth_watcher import IncomingEthWatcher
+from .log_fetch_coordinator import LogFetchCoordinator
 from .new_blocks_watcher import NewBlocksWatcher
 from .zeroex_fill_watcher import ZeroExFillWatcher
 from .weth_watcher import WethWatcher
@@ -11,6 +12,7 @@ __all__ = [
     AccountBalanceWatcher,
     ERC20EventsWatcher,
     IncomingEthWatcher,
+    LogFetchCoordinator,
     NewBlocksWatcher,
     WethWatcher,
     ZeroExFillWatcher,
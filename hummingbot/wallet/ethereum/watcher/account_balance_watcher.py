@@ -6,7 +6,6 @@ from typing import (
     List,
     Dict,
     Optional,
-    Coroutine
 )
 from decimal import Decimal
 
@@ -16,14 +15,15 @@ from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.json_rpc_batch_client import (
+    JsonRpcBatchClient,
+    RpcCall,
+)
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_utils import (
-    safe_ensure_future,
-    safe_gather,
-)
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
-from .websocket_watcher import WSNewBlocksWatcher
+from .new_blocks_watcher import NewBlocksWatcher
 
 s_decimal_0 = Decimal(0)
 
@@ -39,12 +39,14 @@ class AccountBalanceWatcher(BaseWatcher):
 
     def __init__(self,
                  w3: Web3,
-                 blocks_watcher: WSNewBlocksWatcher,
+                 blocks_watcher: NewBlocksWatcher,
+                 rpc_client: JsonRpcBatchClient,
                  account_address: str,
                  erc20_addresses: List[str],
                  erc20_abis: List[any]):
         super().__init__(w3)
-        self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
+        self._blocks_watcher: NewBlocksWatcher = blocks_watcher
+        self._rpc_client: JsonRpcBatchClient = rpc_client
         self._account_address: str = account_address
         self._addresses_to_contracts: Dict[str, Contract] = {
             address: w3.eth.contract(address=address, abi=abi)
@@ -131,20 +133,28 @@ class AccountBalanceWatcher(BaseWatcher):
         safe_ensure_future(self.update_balances())
 
     async def update_balances(self):
+        """
+        Fetches the ETH balance and all the token balances in a single JSON-RPC batch.
+        """
         asset_symbols: List[str] = []
-        asset_update_tasks: List[Coroutine] = []
+        balance_calls: List[RpcCall] = []
 
         for asset_name, contract in self._erc20_contracts.items():
             asset_symbols.append(asset_name)
-            asset_update_tasks.append(self.call_async(contract.functions.balanceOf(self._account_address).call))
+            balance_calls.append(("eth_call", [{
+                "to": contract.address,
+                "data": contract.encodeABI(fn_name="balanceOf", args=[self._account_address])
+            }, "latest"]))
 
         asset_symbols.append("ETH")
-        asset_update_tasks.append(self.call_async(self._w3.eth.getBalance, self._account_address))
+        balance_calls.append(("eth_getBalance", [self._account_address, "latest"]))
 
         try:
-            asset_raw_balances: List[int] = await safe_gather(*asset_update_tasks)
-            for asset_name, raw_balance in zip(asset_symbols, asset_raw_balances):
-                self._raw_account_balances[asset_name] = raw_balance
+            raw_results: List[Optional[str]] = await self._rpc_client.batch_call(balance_calls)
+            for asset_name, raw_result in zip(asset_symbols, raw_results):
+                # Keep the last known balance if a single call in the batch failed.
+                if raw_result not in (None, "0x"):
+                    self._raw_account_balances[asset_name] = int(raw_result, 16)
         except asyncio.CancelledError:
             raise
         except Exception:
@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 
 import asyncio
-import cytoolz
 import logging
 import math
 from typing import (
@@ -12,25 +11,24 @@ from typing import (
     Optional
 )
 from web3 import Web3
+from web3._utils.contracts import find_matching_event_abi
 from web3.contract import Contract
 from web3.datastructures import AttributeDict
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
-    NewBlocksWatcherEvent,
     WalletReceivedAssetEvent,
     TokenApprovedEvent,
     ERC20WatcherEvent
 )
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
-from hummingbot.core.event.event_forwarder import EventForwarder
-from hummingbot.core.utils.async_utils import (
-    safe_ensure_future,
-    safe_gather,
-)
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
-from .websocket_watcher import WSNewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .log_fetch_coordinator import (
+    LogFetchCoordinator,
+    LogSubscription,
+)
+from .new_blocks_watcher import NewBlocksWatcher
 
 weth_sai_symbols: Set[str] = {"WETH", "SAI"}
 TRANSFER_EVENT_NAME = "Transfer"
@@ -53,7 +51,8 @@ class ERC20EventsWatcher(BaseWatcher):
 
     def __init__(self,
                  w3: Web3,
-                 blocks_watcher: WSNewBlocksWatcher,
+                 blocks_watcher: NewBlocksWatcher,
+                 log_fetch_coordinator: LogFetchCoordinator,
                  contract_addresses: List[str],
                  contract_abi: List[any],
                  watch_addresses: Iterable[str]):
@@ -61,7 +60,8 @@ class ERC20EventsWatcher(BaseWatcher):
             raise ValueError("Each entry in contract_addresses must have a corresponding entry in contract_abi.")
 
         super().__init__(w3)
-        self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
+        self._blocks_watcher: NewBlocksWatcher = blocks_watcher
+        self._log_fetch_coordinator: LogFetchCoordinator = log_fetch_coordinator
         self._addresses_to_contracts: Dict[str, Contract] = {
             address: w3.eth.contract(address=address, abi=abi)
             for address, abi in zip(contract_addresses, contract_abi)
@@ -69,9 +69,8 @@ class ERC20EventsWatcher(BaseWatcher):
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._address_to_asset_name_map: Dict[str, str] = {}
         self._asset_decimals: Dict[str, int] = {}
-        self._contract_event_loggers: Dict[str, ContractEventLogger] = {}
-        self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
-        self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
+        self._log_subscriptions: List[LogSubscription] = []
+        self._new_entries_queue: asyncio.Queue = asyncio.Queue()
         self._poll_erc20_logs_task: Optional[asyncio.Task] = None
 
     async def start_network(self):
@@ -90,12 +89,17 @@ class ERC20EventsWatcher(BaseWatcher):
                                           exc_info=True)
                 self._address_to_asset_name_map[address] = asset_name
                 self._asset_decimals[asset_name] = decimals
-                self._contract_event_loggers[address] = ContractEventLogger(self._w3, address, contract.abi)
 
         if self._poll_erc20_logs_task is not None:
             await self.stop_network()
 
-        self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        for address, contract in self._addresses_to_contracts.items():
+            for event_name in [TRANSFER_EVENT_NAME, APPROVAL_EVENT_NAME]:
+                self._log_subscriptions.append(self._log_fetch_coordinator.add_subscription(LogSubscription(
+                    find_matching_event_abi(contract.abi, event_name=event_name),
+                    self.did_receive_new_entries,
+                    address=address
+                )))
         self._poll_erc20_logs_task = safe_ensure_future(self.poll_erc20_logs_loop())
 
     async def stop_network(self):
@@ -103,37 +107,19 @@ class ERC20EventsWatcher(BaseWatcher):
         if self._poll_erc20_logs_task is not None:
             self._poll_erc20_logs_task.cancel()
             self._poll_erc20_logs_task = None
-        self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        for log_subscription in self._log_subscriptions:
+            self._log_fetch_coordinator.remove_subscription(log_subscription)
+        self._log_subscriptions.clear()
 
-    def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
-        self._new_blocks_queue.put_nowait(new_blocks)
+    def did_receive_new_entries(self, new_entries: List[AttributeDict]):
+        self._new_entries_queue.put_nowait(new_entries)
 
     async def poll_erc20_logs_loop(self):
         while True:
             try:
-                new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
-
-                transfer_tasks = []
-                approval_tasks = []
-                for address in self._addresses_to_contracts.keys():
-                    contract_event_logger: ContractEventLogger = self._contract_event_loggers[address]
-                    transfer_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(TRANSFER_EVENT_NAME,
-                                                                        new_blocks)
-                    )
-                    approval_tasks.append(
-                        contract_event_logger.get_new_entries_from_logs(APPROVAL_EVENT_NAME,
-                                                                        new_blocks)
-                    )
-
-                raw_transfer_entries = await safe_gather(*transfer_tasks)
-                raw_approval_entries = await safe_gather(*approval_tasks)
-                transfer_entries = list(cytoolz.concat(raw_transfer_entries))
-                approval_entries = list(cytoolz.concat(raw_approval_entries))
-                for transfer_entry in transfer_entries:
-                    await self._handle_event_data(transfer_entry)
-                for approval_entry in approval_entries:
-                    await self._handle_event_data(approval_entry)
+                new_entries: List[AttributeDict] = await self._new_entries_queue.get()
+                for new_entry in new_entries:
+                    await self._handle_event_data(new_entry)
 
             except asyncio.CancelledError:
                 raise
@@ -2,6 +2,7 @@
 
 import asyncio
 import cytoolz
+import functools
 import logging
 from typing import (
     List,
@@ -9,7 +10,8 @@ from typing import (
     Iterable,
     Dict,
     Coroutine,
-    Optional
+    Optional,
+    Tuple,
 )
 from web3 import Web3
 from web3.datastructures import AttributeDict
@@ -27,11 +29,17 @@ from hummingbot.core.utils.async_utils import (
 )
 from hummingbot.logger import HummingbotLogger
 from .base_watcher import BaseWatcher
-# from .new_blocks_watcher import NewBlocksWatcher
-from .websocket_watcher import WSNewBlocksWatcher
+from .new_blocks_watcher import NewBlocksWatcher
 
 
 class IncomingEthWatcher(BaseWatcher):
+    """
+    Emits ReceivedEther events for successful ETH transfers to the watched addresses.
+
+    Block headers don't carry transactions, so the watcher checks the balance and nonce of every watched address at
+    the newest block of each batch instead. Only when one of them has changed since the last batch are the blocks
+    fetched again with their transaction bodies, to find the incoming transfers.
+    """
     _iew_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -42,14 +50,26 @@ class IncomingEthWatcher(BaseWatcher):
 
     def __init__(self,
                  w3: Web3,
-                 blocks_watcher: WSNewBlocksWatcher,
+                 blocks_watcher: NewBlocksWatcher,
                  watch_addresses: Iterable[str]):
         super().__init__(w3)
         self._watch_addresses: Set[str] = set(watch_addresses)
-        self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
+        self._blocks_watcher: NewBlocksWatcher = blocks_watcher
         self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
+        # (balance, nonce) of each watched address, as of the newest block checked.
+        self._account_states: Dict[str, Tuple[int, int]] = {}
+        self._check_lock: asyncio.Lock = asyncio.Lock()
 
     async def start_network(self):
+        try:
+            self._account_states = await self._fetch_account_states("latest")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error fetching Ethereum account states.",
+                                  app_warning_msg="Error fetching Ethereum account states. "
+                                                  "Please check Ethereum node connection.",
+                                  exc_info=True)
         self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
 
     async def stop_network(self):
@@ -58,10 +78,60 @@ class IncomingEthWatcher(BaseWatcher):
     def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
         safe_ensure_future(self.check_incoming_eth(new_blocks))
 
+    async def _fetch_account_states(self, block_identifier: any) -> Dict[str, Tuple[int, int]]:
+        watch_addresses: List[str] = sorted(self._watch_addresses)
+        results: List[int] = await safe_gather(*(
+            [self.call_async(self._w3.eth.getBalance, address, block_identifier) for address in watch_addresses] +
+            [self.call_async(self._w3.eth.getTransactionCount, address, block_identifier)
+             for address in watch_addresses]
+        ))
+        return dict(zip(watch_addresses, zip(results[:len(watch_addresses)], results[len(watch_addresses):])))
+
+    @staticmethod
+    def _has_transaction_bodies(block: AttributeDict) -> bool:
+        transactions: Optional[List] = block.get("transactions")
+        return transactions is not None and all(isinstance(t, AttributeDict) for t in transactions)
+
+    async def _fetch_full_blocks(self, blocks: List[AttributeDict]) -> List[AttributeDict]:
+        return await safe_gather(*[
+            self.call_async(functools.partial(self._w3.eth.getBlock, block.hash, full_transactions=True))
+            for block in blocks
+            if not self._has_transaction_bodies(block)
+        ])
+
     async def check_incoming_eth(self, new_blocks: List[AttributeDict]):
+        # Batches are checked one at a time, so every batch is compared with the account states of the one before.
+        async with self._check_lock:
+            await self._check_incoming_eth(new_blocks)
+
+    async def _check_incoming_eth(self, new_blocks: List[AttributeDict]):
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
         watch_addresses: Set[str] = self._watch_addresses
         filtered_blocks: List[AttributeDict] = [block for block in new_blocks if block is not None]
+        if len(filtered_blocks) == 0:
+            return
+
+        try:
+            account_states: Dict[str, Tuple[int, int]] = await self._fetch_account_states(
+                max(block.number for block in filtered_blocks)
+            )
+            # An ETH transfer to an address always raises its balance, unless the address sent a transaction of its
+            # own in the same blocks, which shows in its nonce.
+            if account_states == self._account_states:
+                return
+            full_blocks: List[AttributeDict] = await self._fetch_full_blocks(filtered_blocks)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().network("Error fetching Ethereum blocks.",
+                                  app_warning_msg="Error fetching Ethereum blocks. "
+                                                  "Please check Ethereum node connection.",
+                                  exc_info=True)
+            return
+        self._account_states = account_states
+        filtered_blocks = [block for block in filtered_blocks if self._has_transaction_bodies(block)] + \
+            [block for block in full_blocks if block is not None]
+
         block_to_timestamp: Dict[str, float] = dict((block.hash, float(block.timestamp))
                                                     for block in filtered_blocks)
         transactions: List[AttributeDict] = list(cytoolz.concat(b.transactions for b in filtered_blocks))
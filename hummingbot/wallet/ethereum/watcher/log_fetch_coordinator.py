@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+
+import asyncio
+from collections import OrderedDict
+from eth_abi.codec import ABICodec
+from eth_abi.registry import registry
+from eth_bloom import BloomFilter
+from eth_utils import (
+    event_abi_to_log_topic,
+    to_bytes,
+)
+import functools
+from hexbytes import HexBytes
+import logging
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from web3 import Web3
+from web3.datastructures import AttributeDict
+from web3._utils.events import get_event_data
+
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import NewBlocksWatcherEvent
+from hummingbot.core.utils.async_utils import (
+    safe_ensure_future,
+    safe_gather,
+)
+from hummingbot.logger import HummingbotLogger
+from .base_watcher import BaseWatcher
+
+DEFAULT_WINDOW_SIZE = 100
+# Most RPC providers reject getLogs calls spanning more blocks than this.
+DEFAULT_MAX_BLOCK_RANGE = 1000
+
+# Extra topic filters after the event signature, e.g. [None, None, [order_hash_1, order_hash_2]]. May be given as a
+# function, so it is evaluated again for every batch of blocks.
+TopicFilters = Union[List[Any], Callable[[], List[Any]]]
+
+
+class LogSubscription:
+    def __init__(self,
+                 event_abi: Dict[str, Any],
+                 callback: Callable[[List[AttributeDict]], None],
+                 address: Optional[str] = None,
+                 topics: Optional[TopicFilters] = None):
+        self.event_abi: Dict[str, Any] = event_abi
+        self.callback: Callable[[List[AttributeDict]], None] = callback
+        self.address: Optional[str] = address
+        self.topics: Optional[TopicFilters] = topics
+        self.event_topic: HexBytes = HexBytes(event_abi_to_log_topic(event_abi))
+
+    def current_topics(self) -> List[Any]:
+        return (self.topics() if callable(self.topics) else self.topics) or []
+
+
+class LogFetchCoordinator(BaseWatcher):
+    """
+    Fetches contract event logs for every watcher subscribed to it, once per batch of new blocks.
+
+    The batch is checked against the block bloom filters first, then the logs of all address-bound subscriptions are
+    fetched with a single getLogs call over the block range, with the addresses and event signatures combined. Batches
+    spanning more than `max_block_range` blocks are split into several ranges. Each log is decoded once per event ABI
+    and handed to every subscription interested in it.
+    """
+    _lfc_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._lfc_logger is None:
+            cls._lfc_logger = logging.getLogger(__name__)
+        return cls._lfc_logger
+
+    def __init__(self,
+                 w3: Web3,
+                 blocks_watcher: BaseWatcher,
+                 block_events_window_size: int = DEFAULT_WINDOW_SIZE,
+                 max_block_range: int = DEFAULT_MAX_BLOCK_RANGE):
+        super().__init__(w3)
+        self._blocks_watcher: BaseWatcher = blocks_watcher
+        self._block_events_window_size: int = block_events_window_size
+        self._max_block_range: int = max_block_range
+        self._subscriptions: List[LogSubscription] = []
+        self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
+        self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
+        self._fetch_logs_task: Optional[asyncio.Task] = None
+        self._abi_codec: ABICodec = ABICodec(registry)
+        self._event_cache: Set[Tuple[HexBytes, int]] = set()
+        self._block_events: OrderedDict = OrderedDict()
+
+    @property
+    def subscriptions(self) -> List[LogSubscription]:
+        return self._subscriptions
+
+    def add_subscription(self, subscription: LogSubscription) -> LogSubscription:
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def remove_subscription(self, subscription: LogSubscription):
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+
+    async def start_network(self):
+        if self._fetch_logs_task is not None:
+            await self.stop_network()
+        self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        self._fetch_logs_task = safe_ensure_future(self.fetch_logs_loop())
+
+    async def stop_network(self):
+        if self._fetch_logs_task is not None:
+            self._fetch_logs_task.cancel()
+            self._fetch_logs_task = None
+        self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+
+    def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
+        self._new_blocks_queue.put_nowait(new_blocks)
+
+    async def fetch_logs_loop(self):
+        while True:
+            try:
+                new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
+                # Blocks arriving while the previous batch was being fetched are folded into this one.
+                while not self._new_blocks_queue.empty():
+                    new_blocks = new_blocks + self._new_blocks_queue.get_nowait()
+                await self.process_new_blocks(new_blocks)
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                continue
+            except Exception:
+                self.logger().network("Unknown error trying to fetch new contract event logs.", exc_info=True,
+                                      app_warning_msg="Unknown error trying to fetch new contract event logs. "
+                                                      "Check wallet network connection")
+
+    @staticmethod
+    def _topic_bytes(topic: Any) -> bytes:
+        return bytes(topic) if isinstance(topic, (bytes, bytearray)) else to_bytes(hexstr=topic)
+
+    def _matches_bloom(self, bloom: BloomFilter, subscription: LogSubscription, topics: List[Any]) -> bool:
+        if bytes(subscription.event_topic) not in bloom:
+            return False
+        if subscription.address is not None and to_bytes(hexstr=subscription.address) not in bloom:
+            return False
+        for topic in topics:
+            if topic is None:
+                continue
+            options: List[Any] = topic if isinstance(topic, list) else [topic]
+            if not any(self._topic_bytes(option) in bloom for option in options):
+                return False
+        return True
+
+    def _build_filters(self, subscriptions: List[LogSubscription], from_block: int, to_block: int,
+                       subscription_topics: Dict[int, List[Any]]) -> List[Dict[str, Any]]:
+        filters: List[Dict[str, Any]] = []
+        addresses: Set[str] = set()
+        address_topics: Set[str] = set()
+        for subscription in subscriptions:
+            topics: List[Any] = subscription_topics[id(subscription)]
+            if subscription.address is not None and len(topics) == 0:
+                addresses.add(subscription.address)
+                address_topics.add(subscription.event_topic.hex())
+            else:
+                # Subscriptions without an address or with extra topic filters can't be merged into the combined
+                # filter without widening it to every contract on chain, so they get a filter of their own.
+                event_filter: Dict[str, Any] = {
+                    "fromBlock": from_block,
+                    "toBlock": to_block,
+                    "topics": [subscription.event_topic.hex()] + topics
+                }
+                if subscription.address is not None:
+                    event_filter["address"] = subscription.address
+                filters.append(event_filter)
+        if len(addresses) > 0:
+            filters.append({
+                "fromBlock": from_block,
+                "toBlock": to_block,
+                "address": sorted(addresses),
+                "topics": [sorted(address_topics)]
+            })
+        return filters
+
+    def _split_block_ranges(self, block_numbers: List[int]) -> List[Tuple[int, int]]:
+        """
+        Groups the matched block numbers into (from_block, to_block) ranges of at most `max_block_range` blocks, each
+        starting and ending at a matched block.
+        """
+        block_ranges: List[Tuple[int, int]] = []
+        for block_number in sorted(set(block_numbers)):
+            if len(block_ranges) > 0 and block_number - block_ranges[-1][0] < self._max_block_range:
+                block_ranges[-1] = (block_ranges[-1][0], block_number)
+            else:
+                block_ranges.append((block_number, block_number))
+        return block_ranges
+
+    async def process_new_blocks(self, new_blocks: List[AttributeDict]):
+        subscriptions: List[LogSubscription] = list(self._subscriptions)
+        if len(subscriptions) == 0 or len(new_blocks) == 0:
+            return
+        subscription_topics: Dict[int, List[Any]] = {id(s): s.current_topics() for s in subscriptions}
+
+        interested_subscriptions: Set[int] = set()
+        block_numbers: List[int] = []
+        for block in new_blocks:
+            bloom: BloomFilter = BloomFilter(int.from_bytes(block["logsBloom"], byteorder="big"))
+            matched: bool = False
+            for subscription in subscriptions:
+                if self._matches_bloom(bloom, subscription, subscription_topics[id(subscription)]):
+                    interested_subscriptions.add(id(subscription))
+                    matched = True
+            if matched:
+                block_numbers.append(block["number"])
+        if len(block_numbers) == 0:
+            return
+
+        subscriptions = [s for s in subscriptions if id(s) in interested_subscriptions]
+        filters: List[Dict[str, Any]] = [
+            event_filter
+            for from_block, to_block in self._split_block_ranges(block_numbers)
+            for event_filter in self._build_filters(subscriptions, from_block, to_block, subscription_topics)
+        ]
+        raw_logs: List[List[AttributeDict]] = await safe_gather(*[self._get_logs(f) for f in filters])
+
+        new_entries: Dict[int, List[AttributeDict]] = {id(s): [] for s in subscriptions}
+        for log in sorted((log for logs in raw_logs for log in logs),
+                          key=lambda log: (log["blockNumber"], log["logIndex"])):
+            log_key: Tuple[HexBytes, int] = (log["transactionHash"], log["logIndex"])
+            if log_key in self._event_cache:
+                self.logger().debug(f"Duplicate event log found - '{log['transactionHash'].hex()}'.")
+                continue
+            self._event_cache.add(log_key)
+            self._block_events.setdefault(log["blockNumber"], []).append(log_key)
+
+            decoded_events: Dict[int, AttributeDict] = {}
+            log_topic: HexBytes = HexBytes(log["topics"][0])
+            for subscription in subscriptions:
+                if subscription.event_topic != log_topic:
+                    continue
+                if subscription.address is not None and subscription.address.lower() != log["address"].lower():
+                    continue
+                abi_id: int = id(subscription.event_abi)
+                if abi_id not in decoded_events:
+                    decoded_events[abi_id] = get_event_data(self._abi_codec, subscription.event_abi, log)
+                new_entries[id(subscription)].append(decoded_events[abi_id])
+
+        while len(self._block_events) > self._block_events_window_size:
+            for log_key in self._block_events.popitem(last=False)[1]:
+                self._event_cache.discard(log_key)
+
+        for subscription in subscriptions:
+            entries: List[AttributeDict] = new_entries[id(subscription)]
+            if len(entries) > 0:
+                subscription.callback(entries)
+
+    async def _get_logs(self,
+                        event_filter_params: Dict[str, Any],
+                        max_tries: Optional[int] = 30) -> List[AttributeDict]:
+        count: int = 0
+        logs = []
+        while True:
+            try:
+                count += 1
+                if count > max_tries:
+                    self.logger().debug(
+                        f"Error fetching logs from blocks with filters: '{event_filter_params}'."
+                    )
+                    break
+                logs = await self.call_async(functools.partial(self._w3.eth.getLogs, event_filter_params))
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().debug(f"Blocks not found with filters: '{event_filter_params}'. Retrying...")
+                await asyncio.sleep(0.5)
+        return logs
@@ -8,23 +8,43 @@ from hexbytes import HexBytes
 import logging
 import time
 from typing import (
+    Any,
+    AsyncIterable,
     Dict,
     List,
     Optional
 )
+import ujson
 from web3 import Web3
 from web3.datastructures import AttributeDict
 from web3.exceptions import BlockNotFound
+import websockets
+from websockets.exceptions import ConnectionClosed
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import NewBlocksWatcherEvent
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.wallet.ethereum.json_rpc_batch_client import format_rpc_result
 from .base_watcher import BaseWatcher
 
 DEFAULT_BLOCK_WINDOW_SIZE = 30
 
 
 class NewBlocksWatcher(BaseWatcher):
+    """
+    Source of new blocks for the wallet watchers.
+
+    When a websocket URL is given, the watcher subscribes to newHeads on the node and emits each block as soon as the
+    header arrives. If the node can't be reached over websocket or refuses the subscription, it polls the JSON-RPC
+    endpoint instead, and tries the websocket again every WS_RETRY_INTERVAL seconds.
+
+    Headers don't carry transactions, so full blocks are only fetched while at least one watcher has asked for them
+    with request_full_transactions().
+    """
+    MESSAGE_TIMEOUT = 30.0
+    PING_TIMEOUT = 10.0
+    WS_RETRY_INTERVAL = 60.0
+
     _nbw_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -33,14 +53,21 @@ class NewBlocksWatcher(BaseWatcher):
             cls._nbw_logger = logging.getLogger(__name__)
         return cls._nbw_logger
 
-    def __init__(self, w3: Web3, block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
+    def __init__(self,
+                 w3: Web3,
+                 websocket_url: Optional[str] = None,
+                 block_window_size: Optional[int] = DEFAULT_BLOCK_WINDOW_SIZE):
         super().__init__(w3)
+        self._websocket_url: Optional[str] = websocket_url
         self._block_window_size = block_window_size
         self._current_block_number: int = -1
         self._block_number_to_fetch: int = -1
         self._blocks_window: Dict = {}
         self._block_number_to_hash_map: OrderedDict = OrderedDict()
         self._fetch_new_blocks_task: Optional[asyncio.Task] = None
+        self._full_transactions_requests: int = 0
+        self._client: Optional[websockets.WebSocketClientProtocol] = None
+        self._nonce: int = 0
 
     @property
     def web3(self) -> Web3:
@@ -50,6 +77,19 @@ class NewBlocksWatcher(BaseWatcher):
     def block_number(self) -> int:
         return self._current_block_number
 
+    @property
+    def full_transactions(self) -> bool:
+        return self._full_transactions_requests > 0
+
+    def request_full_transactions(self):
+        """
+        Makes the watcher emit blocks with full transaction bodies, until the matching release_full_transactions().
+        """
+        self._full_transactions_requests += 1
+
+    def release_full_transactions(self):
+        self._full_transactions_requests = max(0, self._full_transactions_requests - 1)
+
     async def start_network(self):
         if self._fetch_new_blocks_task is not None:
             await self.stop_network()
@@ -70,6 +110,7 @@ class NewBlocksWatcher(BaseWatcher):
         if self._fetch_new_blocks_task is not None:
             self._fetch_new_blocks_task.cancel()
             self._fetch_new_blocks_task = None
+        await self._disconnect()
 
     async def get_timestamp_for_block(self, block_hash: HexBytes, max_tries: Optional[int] = 10) -> int:
         counter = 0
@@ -101,66 +142,119 @@ class NewBlocksWatcher(BaseWatcher):
             return block.timestamp
 
     async def fetch_new_blocks_loop(self):
-        last_timestamp_received_blocks: float = 0.0
-        block_hash = ""
-        try:
-            while True:
+        while True:
+            if self._websocket_url is not None:
                 try:
-                    async with timeout(30.0):
-                        incoming_block: AttributeDict = await self.call_async(
-                            functools.partial(
-                                self._w3.eth.getBlock,
-                                self._block_number_to_fetch,
-                                full_transactions=True)
-                        )
-                        if incoming_block is not None:
-                            current_block_hash: HexBytes = self._block_number_to_hash_map.get(
-                                self._current_block_number,
-                                None)
-                            incoming_block_hash: HexBytes = incoming_block.hash
-                            incoming_block_parent_hash: HexBytes = incoming_block.parentHash
-                            new_blocks: List[AttributeDict] = []
-                            if current_block_hash is not None and current_block_hash != incoming_block_parent_hash:
-                                block_reorganization: List[AttributeDict] = await self.get_block_reorganization(incoming_block)
-                                new_blocks += block_reorganization
-
-                            self._block_number_to_hash_map[self._block_number_to_fetch] = incoming_block_hash
-                            self._blocks_window[incoming_block_hash] = incoming_block
-                            new_blocks.append(incoming_block)
-                            self._current_block_number = self._block_number_to_fetch
-                            self._block_number_to_fetch += 1
-                            self.trigger_event(NewBlocksWatcherEvent.NewBlocks, new_blocks)
-                            last_timestamp_received_blocks = time.time()
-
-                            while len(self._blocks_window) > self._block_window_size:
-                                block_hash = self._block_number_to_hash_map.popitem(last=False)[1]
-                                del self._blocks_window[block_hash]
-
+                    await self.listen_for_new_heads()
                 except asyncio.CancelledError:
                     raise
-                except asyncio.TimeoutError:
-                    self.logger().network(f"Timed out fetching new block.", exc_info=True,
-                                          app_warning_msg=f"Timed out fetching new block. "
-                                                          f"Check wallet network connection")
-                except BlockNotFound:
-                    pass
                 except Exception:
-                    self.logger().network(f"Error fetching new block.", exc_info=True,
-                                          app_warning_msg=f"Error fetching new block. "
-                                                          f"Check wallet network connection")
-                sleep_time: int = 1
-                seconds_since_last_received_blocks: float = time.time() - last_timestamp_received_blocks
-                if seconds_since_last_received_blocks < 5:
-                    sleep_time = 5
-                elif seconds_since_last_received_blocks < 15:
-                    sleep_time = 4
-                elif seconds_since_last_received_blocks < 30:
-                    sleep_time = 3
-                elif seconds_since_last_received_blocks < 45:
-                    sleep_time = 2
-                await asyncio.sleep(sleep_time)
-        except asyncio.CancelledError:
-            raise
+                    self.logger().network("Error listening for new block headers.", exc_info=True,
+                                          app_warning_msg="Error listening for new block headers. "
+                                                          "Falling back to polling for new blocks.")
+                finally:
+                    await self._disconnect()
+                # Polling resumes right after the last block seen over the websocket, or from the newest block at start
+                # if the websocket never delivered one.
+                await self.poll_new_blocks(time.time() + self.WS_RETRY_INTERVAL)
+            else:
+                await self.poll_new_blocks(float("inf"))
+
+    async def listen_for_new_heads(self):
+        """
+        Emits a block for every header pushed by the node, until the websocket connection closes.
+        """
+        self._client = await websockets.connect(uri=self._websocket_url)
+        if not await self._subscribe(["newHeads"]):
+            self.logger().info("The Ethereum node rejected the newHeads subscription. Polling for new blocks.")
+            return
+        async for raw_message in self._messages():
+            message: Dict[str, Any] = ujson.loads(raw_message)
+            if message.get("method") != "eth_subscription":
+                continue
+            header: Optional[Dict[str, Any]] = message.get("params", {}).get("result")
+            if header is None:
+                continue
+            try:
+                if self.full_transactions:
+                    incoming_block: Optional[AttributeDict] = await self._fetch_block(HexBytes(header["hash"]))
+                else:
+                    incoming_block: Optional[AttributeDict] = format_rpc_result(header)
+                if incoming_block is not None:
+                    await self._process_incoming_block(incoming_block)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error processing new block header.", exc_info=True,
+                                      app_warning_msg="Error processing new block header. "
+                                                      "Check wallet network connection")
+
+    async def poll_new_blocks(self, deadline: float):
+        last_timestamp_received_blocks: float = 0.0
+        while time.time() < deadline:
+            try:
+                async with timeout(30.0):
+                    incoming_block: Optional[AttributeDict] = await self._fetch_block(self._block_number_to_fetch)
+                    if incoming_block is not None:
+                        await self._process_incoming_block(incoming_block)
+                        last_timestamp_received_blocks = time.time()
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                self.logger().network(f"Timed out fetching new block.", exc_info=True,
+                                      app_warning_msg=f"Timed out fetching new block. "
+                                                      f"Check wallet network connection")
+            except BlockNotFound:
+                pass
+            except Exception:
+                self.logger().network(f"Error fetching new block.", exc_info=True,
+                                      app_warning_msg=f"Error fetching new block. "
+                                                      f"Check wallet network connection")
+            sleep_time: int = 1
+            seconds_since_last_received_blocks: float = time.time() - last_timestamp_received_blocks
+            if seconds_since_last_received_blocks < 5:
+                sleep_time = 5
+            elif seconds_since_last_received_blocks < 15:
+                sleep_time = 4
+            elif seconds_since_last_received_blocks < 30:
+                sleep_time = 3
+            elif seconds_since_last_received_blocks < 45:
+                sleep_time = 2
+            await asyncio.sleep(sleep_time)
+
+    async def _fetch_block(self, block_identifier: Any) -> Optional[AttributeDict]:
+        return await self.call_async(
+            functools.partial(
+                self._w3.eth.getBlock,
+                block_identifier,
+                full_transactions=self.full_transactions)
+        )
+
+    def _add_to_blocks_window(self, block: AttributeDict):
+        replaced_block_hash: Optional[HexBytes] = self._block_number_to_hash_map.get(block.number)
+        if replaced_block_hash is not None and replaced_block_hash != block.hash:
+            self._blocks_window.pop(replaced_block_hash, None)
+        self._block_number_to_hash_map[block.number] = block.hash
+        self._blocks_window[block.hash] = block
+
+    async def _process_incoming_block(self, incoming_block: AttributeDict):
+        if incoming_block.hash in self._blocks_window:
+            return
+        new_blocks: List[AttributeDict] = []
+        # A parent we haven't seen means either a chain reorganization or blocks missed while disconnected. Both are
+        # resolved by walking back the parent hashes until the chain joins the blocks window.
+        if len(self._blocks_window) > 0 and incoming_block.parentHash not in self._blocks_window:
+            new_blocks += await self.get_block_reorganization(incoming_block)
+
+        self._add_to_blocks_window(incoming_block)
+        new_blocks.append(incoming_block)
+        self._current_block_number = incoming_block.number
+        self._block_number_to_fetch = incoming_block.number + 1
+        self.trigger_event(NewBlocksWatcherEvent.NewBlocks, new_blocks)
+
+        while len(self._block_number_to_hash_map) > self._block_window_size:
+            block_hash: HexBytes = self._block_number_to_hash_map.popitem(last=False)[1]
+            self._blocks_window.pop(block_hash, None)
 
     async def get_block_reorganization(self, incoming_block: AttributeDict) -> List[AttributeDict]:
         block_reorganization: List[AttributeDict] = []
@@ -170,27 +264,63 @@ class NewBlocksWatcher(BaseWatcher):
                 replacement_block = None
                 while replacement_block is None:
                     try:
-                        block = await self.call_async(
-                            functools.partial(
-                                self._w3.eth.getBlock,
-                                expected_parent_hash,
-                                full_transactions=True)
-                        )
-                        replacement_block = block
+                        replacement_block = await self._fetch_block(expected_parent_hash)
                     except BlockNotFound:
                         pass
                     if replacement_block is None:
                         await asyncio.sleep(0.5)
 
-                replacement_block_number: int = replacement_block.number
-                replacement_block_hash: HexBytes = replacement_block.hash
-                replacement_block_parent_hash: HexBytes = replacement_block.parentHash
-                self._block_number_to_hash_map[replacement_block_number] = replacement_block_hash
-                self._blocks_window[replacement_block_hash] = replacement_block
                 block_reorganization.append(replacement_block)
-                expected_parent_hash = replacement_block_parent_hash
+                expected_parent_hash = replacement_block.parentHash
+
+            if expected_parent_hash not in self._blocks_window:
+                # Events from the replaced blocks beyond the window can't be reverted by the watchers.
+                self.logger().warning(f"Chain reorganization at block #{incoming_block.number} goes deeper than "
+                                      f"the {len(self._blocks_window)} block window. Stopped walking back after "
+                                      f"{len(block_reorganization)} blocks.")
 
             block_reorganization.reverse()
+            for replacement_block in block_reorganization:
+                self._add_to_blocks_window(replacement_block)
             return block_reorganization
         except asyncio.CancelledError:
             raise
+
+    async def _send(self, emit_data: Dict[str, Any]) -> int:
+        self._nonce += 1
+        emit_data["id"] = self._nonce
+        await self._client.send(ujson.dumps(emit_data))
+        return self._nonce
+
+    async def _subscribe(self, params: List[Any]) -> bool:
+        nonce: int = await self._send({
+            "jsonrpc": "2.0",
+            "method": "eth_subscribe",
+            "params": params
+        })
+        raw_message: str = await asyncio.wait_for(self._client.recv(), self.MESSAGE_TIMEOUT)
+        response: Dict[str, Any] = ujson.loads(raw_message)
+        return response.get("id") == nonce and response.get("result") is not None
+
+    async def _messages(self) -> AsyncIterable[str]:
+        try:
+            while True:
+                try:
+                    raw_msg_str: str = await asyncio.wait_for(self._client.recv(), self.MESSAGE_TIMEOUT)
+                    yield raw_msg_str
+                except asyncio.TimeoutError:
+                    pong_waiter = await self._client.ping()
+                    await asyncio.wait_for(pong_waiter, timeout=self.PING_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger().warning("WebSocket ping timed out. Going to reconnect...")
+            return
+        except ConnectionClosed:
+            return
+
+    async def _disconnect(self):
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception:
+                self.logger().debug("Error closing the new block headers websocket.", exc_info=True)
+            self._client = None
@@ -11,21 +11,23 @@ from typing import (
     Optional
 )
 from web3 import Web3
+from web3._utils.contracts import find_matching_event_abi
 from web3.datastructures import AttributeDict
 
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
-    NewBlocksWatcherEvent,
     WalletWrappedEthEvent,
     WalletUnwrappedEthEvent,
     WalletEvent
 )
-from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from .base_watcher import BaseWatcher
-from .websocket_watcher import WSNewBlocksWatcher
-from .contract_event_logs import ContractEventLogger
+from .log_fetch_coordinator import (
+    LogFetchCoordinator,
+    LogSubscription,
+)
+from .new_blocks_watcher import NewBlocksWatcher
 
 DEPOSIT_EVENT_NAME = "Deposit"
 WITHDRAWAL_EVENT_NAME = "Withdrawal"
@@ -43,52 +45,48 @@ class WethWatcher(BaseWatcher):
     def __init__(self,
                  w3: Web3,
                  weth_token: ERC20Token,
-                 blocks_watcher: WSNewBlocksWatcher,
+                 blocks_watcher: NewBlocksWatcher,
+                 log_fetch_coordinator: LogFetchCoordinator,
                  watch_addresses: Iterable[str]):
         super().__init__(w3)
-        self._blocks_watcher: WSNewBlocksWatcher = blocks_watcher
+        self._blocks_watcher: NewBlocksWatcher = blocks_watcher
+        self._log_fetch_coordinator: LogFetchCoordinator = log_fetch_coordinator
         self._watch_addresses: Set[str] = set(watch_addresses)
         self._asset_decimals: Dict[str, int] = {}
         self._weth_token = weth_token
         self._weth_contract = weth_token.contract
-        self._contract_event_logger = ContractEventLogger(w3, weth_token.address, weth_token.abi)
+        self._log_subscriptions: List[LogSubscription] = []
         self._poll_weth_logs_task: asyncio.Task = None
-        self._event_forwarder: EventForwarder = EventForwarder(self.did_receive_new_blocks)
-        self._new_blocks_queue: asyncio.Queue = asyncio.Queue()
+        self._new_entries_queue: asyncio.Queue = asyncio.Queue()
 
     async def start_network(self):
         if self._poll_weth_logs_task is not None:
             await self.stop_network()
-        self._blocks_watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        for event_name in [DEPOSIT_EVENT_NAME, WITHDRAWAL_EVENT_NAME]:
+            self._log_subscriptions.append(self._log_fetch_coordinator.add_subscription(LogSubscription(
+                find_matching_event_abi(self._weth_token.abi, event_name=event_name),
+                self.did_receive_new_entries,
+                address=self._weth_token.address
+            )))
         self._poll_weth_logs_task = safe_ensure_future(self.poll_weth_logs_loop())
 
     async def stop_network(self):
         if self._poll_weth_logs_task is not None:
             self._poll_weth_logs_task.cancel()
             self._poll_weth_logs_task = None
-        self._blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
+        for log_subscription in self._log_subscriptions:
+            self._log_fetch_coordinator.remove_subscription(log_subscription)
+        self._log_subscriptions.clear()
 
-    def did_receive_new_blocks(self, new_blocks: List[AttributeDict]):
-        self._new_blocks_queue.put_nowait(new_blocks)
+    def did_receive_new_entries(self, new_entries: List[AttributeDict]):
+        self._new_entries_queue.put_nowait(new_entries)
 
     async def poll_weth_logs_loop(self):
         while True:
             try:
-                new_blocks: List[AttributeDict] = await self._new_blocks_queue.get()
-
-                deposit_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    DEPOSIT_EVENT_NAME,
-                    new_blocks
-                )
-
-                withdrawal_entries = await self._contract_event_logger.get_new_entries_from_logs(
-                    WITHDRAWAL_EVENT_NAME,
-                    new_blocks
-                )
-                for deposit_entry in deposit_entries:
-                    await self._handle_event_data(deposit_entry)
-                for withdrawal_entry in withdrawal_entries:
-                    await self._handle_event_data(withdrawal_entry)
+                new_entries: List[AttributeDict] = await self._new_entries_queue.get()
+                for new_entry in new_entries:
+                    await self._handle_event_data(new_entry)
 
             except asyncio.CancelledError:
                 raise
@@ -172,6 +172,9 @@ cdef class Web3Wallet(WalletBase):
     def execute_transaction(self, contract_function: ContractFunction, **kwargs) -> str:
         return self._best_backend.execute_transaction(contract_function, **kwargs)
 
+    def get_current_tx_hash(self, tx_hash: str) -> str:
+        return self._best_backend.get_current_tx_hash(tx_hash)
+
     def to_nominal(self, asset_name: str, raw_amount: int) -> Decimal:
         return self._best_backend.to_nominal(asset_name, raw_amount)
 
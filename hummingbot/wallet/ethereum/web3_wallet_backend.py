@@ -13,8 +13,9 @@ from typing import (
     List,
     Dict,
     Optional,
+    Coroutine,
     Set,
-    Coroutine
+    Tuple,
 )
 from web3 import Web3
 from web3.contract import (
@@ -22,10 +23,7 @@ from web3.contract import (
     ContractFunction
 )
 from web3.datastructures import AttributeDict
-from web3.exceptions import (
-    BlockNotFound,
-    TransactionNotFound
-)
+from web3.exceptions import BlockNotFound
 
 from hummingbot.core.utils.async_call_scheduler import AsyncCallScheduler
 from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
@@ -53,11 +51,20 @@ from hummingbot.wallet.ethereum.watcher import (
     AccountBalanceWatcher,
     ERC20EventsWatcher,
     IncomingEthWatcher,
+    LogFetchCoordinator,
+    NewBlocksWatcher,
     WethWatcher,
     ZeroExFillWatcher,
 )
-from hummingbot.wallet.ethereum.watcher.websocket_watcher import WSNewBlocksWatcher
 from hummingbot.wallet.ethereum.erc20_token import ERC20Token
+from hummingbot.wallet.ethereum.json_rpc_batch_client import (
+    JsonRpcBatchClient,
+    JsonRpcError,
+)
+from hummingbot.wallet.ethereum.transaction_manager import (
+    EthereumTransactionManager,
+    PendingTransaction,
+)
 from hummingbot.logger import HummingbotLogger
 from hummingbot.client.config.global_config_map import global_config_map
 
@@ -85,6 +92,7 @@ class Web3WalletBackend(PubSub):
 
         # Initialize Web3, accounts and contracts.
         self._w3: Web3 = Web3(Web3.HTTPProvider(jsonrpc_url))
+        self._rpc_client: JsonRpcBatchClient = JsonRpcBatchClient(jsonrpc_url)
         self._chain: EthereumChain = chain
         self._account: LocalAccount = Account.privateKeyToAccount(private_key)
         self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
@@ -115,10 +123,16 @@ class Web3WalletBackend(PubSub):
         )
 
         # Blockchain data
-        self._local_nonce: int = -1
+        self._transaction_manager: EthereumTransactionManager = EthereumTransactionManager(
+            self._account,
+            self._rpc_client,
+            lambda: self._gas_price,
+            self._transaction_send_failure_listener
+        )
 
         # Watchers
-        self._new_blocks_watcher: Optional[WSNewBlocksWatcher] = None
+        self._new_blocks_watcher: Optional[NewBlocksWatcher] = None
+        self._log_fetch_coordinator: Optional[LogFetchCoordinator] = None
         self._account_balance_watcher: Optional[AccountBalanceWatcher] = None
         self._erc20_events_watcher: Optional[ERC20EventsWatcher] = None
         self._incoming_eth_watcher: Optional[IncomingEthWatcher] = None
@@ -128,10 +142,7 @@ class Web3WalletBackend(PubSub):
         # Tasks and transactions
         self._check_network_task: Optional[asyncio.Task] = None
         self._network_status: NetworkStatus = NetworkStatus.STOPPED
-        self._outgoing_transactions_queue: asyncio.Queue = asyncio.Queue()
-        self._outgoing_transactions_task: Optional[asyncio.Task] = None
         self._check_transaction_receipts_task: Optional[asyncio.Task] = None
-        self._pending_tx_dict: Dict[str, any] = {}
         self._gas_price: int = self.DEFAULT_GAS_PRICE
         self._last_timestamp_received_blocks: float = 0.0
         self._event_forwarder: EventForwarder = EventForwarder(self._did_receive_new_blocks)
@@ -157,14 +168,9 @@ class Web3WalletBackend(PubSub):
     @property
     def nonce(self) -> int:
         """
-        Warning: This property causes network access, even though it's synchronous.
-
-        :return: Gas price in wei
+        :return: the nonce the next transaction from this wallet will be sent with
         """
-        remote_nonce: int = self.get_remote_nonce()
-        retval: int = max(remote_nonce, self._local_nonce)
-        self._local_nonce = retval
-        return retval
+        return self._transaction_manager.next_nonce
 
     @property
     def chain(self) -> EthereumChain:
@@ -205,7 +211,7 @@ class Web3WalletBackend(PubSub):
         self._network_status = NetworkStatus.STOPPED
 
     async def start_network(self):
-        if self._outgoing_transactions_task is not None:
+        if self._check_transaction_receipts_task is not None:
             await self.stop_network()
 
         async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
@@ -228,16 +234,18 @@ class Web3WalletBackend(PubSub):
             self._weth_token = self._erc20_tokens.get("WETH")
 
         # Fetch blockchain data.
-        self._local_nonce = await async_scheduler.call_async(
+        self._transaction_manager.initialize_nonce(await async_scheduler.call_async(
             lambda: self.get_remote_nonce()
-        )
+        ))
 
         # Create event watchers.
         websocket_url: str = global_config_map["ethereum_rpc_ws_url"].value
-        self._new_blocks_watcher = WSNewBlocksWatcher(self._w3, websocket_url)
+        self._new_blocks_watcher = NewBlocksWatcher(self._w3, websocket_url)
+        self._log_fetch_coordinator = LogFetchCoordinator(self._w3, self._new_blocks_watcher)
         self._account_balance_watcher = AccountBalanceWatcher(
             self._w3,
             self._new_blocks_watcher,
+            self._rpc_client,
             self._account.address,
             [erc20_token.address for erc20_token in self._erc20_tokens.values()],
             [token.abi for token in self._erc20_tokens.values()]
@@ -245,6 +253,7 @@ class Web3WalletBackend(PubSub):
         self._erc20_events_watcher = ERC20EventsWatcher(
             self._w3,
             self._new_blocks_watcher,
+            self._log_fetch_coordinator,
             [token.address for token in self._erc20_tokens.values()],
             [token.abi for token in self._erc20_tokens.values()],
             [self._account.address]
@@ -259,11 +268,13 @@ class Web3WalletBackend(PubSub):
                 self._w3,
                 self._weth_token,
                 self._new_blocks_watcher,
+                self._log_fetch_coordinator,
                 [self._account.address]
             )
         self._zeroex_fill_watcher = ZeroExFillWatcher(
             self._w3,
-            self._new_blocks_watcher
+            self._new_blocks_watcher,
+            self._log_fetch_coordinator
         )
 
         # Connect the event forwarders.
@@ -285,11 +296,12 @@ class Web3WalletBackend(PubSub):
                                             self._unwrapped_eth_event_forwarder)
 
         # Start the transaction processing tasks.
-        self._outgoing_transactions_task = safe_ensure_future(self.outgoing_eth_transactions_loop())
+        self._transaction_manager.start()
         self._check_transaction_receipts_task = safe_ensure_future(self.check_transaction_receipts_loop())
 
         # Start the event watchers.
         await self._new_blocks_watcher.start_network()
+        await self._log_fetch_coordinator.start_network()
         await self._account_balance_watcher.start_network()
         await self._erc20_events_watcher.start_network()
         await self._incoming_eth_watcher.start_network()
@@ -316,6 +328,8 @@ class Web3WalletBackend(PubSub):
         if self._new_blocks_watcher is not None:
             self._new_blocks_watcher.remove_listener(NewBlocksWatcherEvent.NewBlocks, self._event_forwarder)
             await self._new_blocks_watcher.stop_network()
+        if self._log_fetch_coordinator is not None:
+            await self._log_fetch_coordinator.stop_network()
         if self._account_balance_watcher is not None:
             await self._account_balance_watcher.stop_network()
         if self._erc20_events_watcher is not None:
@@ -328,12 +342,11 @@ class Web3WalletBackend(PubSub):
             await self._zeroex_fill_watcher.stop_network()
 
         # Stop the transaction processing tasks.
-        if self._outgoing_transactions_task is not None:
-            self._outgoing_transactions_task.cancel()
-            self._outgoing_transactions_task = None
+        self._transaction_manager.stop()
         if self._check_transaction_receipts_task is not None:
             self._check_transaction_receipts_task.cancel()
             self._check_transaction_receipts_task = None
+        await self._rpc_client.close()
 
     async def check_network(self) -> NetworkStatus:
         # Assume connected if received new blocks in last 2 minutes
@@ -383,42 +396,51 @@ class Web3WalletBackend(PubSub):
                                     "Check wallet network connection")
                 await asyncio.sleep(5.0)
 
-    async def _check_transaction_receipt(self, tx_hash: str, timestamp: int):
-        """
-        Look for transaction receipt, only raise not found error if they are missing for longer than two minutes.
-        """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        try:
-            return await async_scheduler.call_async(self._w3.eth.getTransactionReceipt, tx_hash)
-        except TransactionNotFound as e:
-            now: float = time.time()
-            if now - timestamp > 120:
-                stop_tx_hash = e.args[0].split(" ")[3]
-                self._stop_tx_tracking(stop_tx_hash)
-                self.logger().info(f"Stopped tracking transaction with hash: {stop_tx_hash}.")
-            return None
-
     async def check_transaction_receipts(self):
         """
         Look for failed transactions, and emit transaction fail event if any are found.
+
+        The receipts of all pending transactions, including any gas price replacements, and then the blocks they were
+        mined in, are each fetched in a single JSON-RPC batch. Events always refer to a transaction by the hash it was
+        first sent with.
         """
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        tasks = [self._check_transaction_receipt(tx_hash, self._pending_tx_dict[tx_hash]['timestamp'])
-                 for tx_hash in self._pending_tx_dict.keys()]
-        transaction_receipts: List[AttributeDict] = [tr for tr in await safe_gather(*tasks)
-                                                     if (tr is not None and tr.get("blockHash") is not None)]
-        block_hash_set: Set[HexBytes] = set(tr.blockHash for tr in transaction_receipts)
-        fetch_block_tasks = [async_scheduler.call_async(self._w3.eth.getBlock, block_hash)
-                             for block_hash in block_hash_set]
+        pending_transactions: List[PendingTransaction] = self._transaction_manager.pending_transactions
+        tx_hashes: List[str] = [tx_hash for t in pending_transactions for tx_hash in t.tx_hashes]
+        if len(tx_hashes) == 0:
+            return
+        receipts: Dict[str, AttributeDict] = {}
+        failed_tx_hashes: Set[str] = set()
+        for tx_hash, receipt in zip(tx_hashes, await self._rpc_client.get_transaction_receipts(tx_hashes)):
+            if isinstance(receipt, JsonRpcError):
+                self.logger().debug(str(receipt))
+                failed_tx_hashes.add(tx_hash)
+            elif receipt is not None and receipt.get("blockHash") is not None:
+                receipts[tx_hash] = receipt
+        now: float = time.time()
+        mined_transactions: List[Tuple[PendingTransaction, str, AttributeDict]] = []
+        for pending_transaction in pending_transactions:
+            mined_tx_hash: Optional[str] = next((h for h in pending_transaction.tx_hashes if h in receipts), None)
+            if mined_tx_hash is not None:
+                mined_transactions.append((pending_transaction, mined_tx_hash, receipts[mined_tx_hash]))
+            elif (self._transaction_manager.is_nonce_mined(pending_transaction) and
+                  now - pending_transaction.last_sent_timestamp > 120 and
+                  not any(h in failed_tx_hashes for h in pending_transaction.tx_hashes)):
+                # Only stop tracking a transaction once its nonce has been used by another transaction, and its
+                # receipt has been missing for longer than two minutes. A receipt that could not be fetched is not
+                # known to be missing, so the transaction is checked again on the next tick.
+                self._transaction_manager.complete(pending_transaction.original_tx_hash)
+                self.logger().info(f"Stopped tracking transaction with hash: "
+                                   f"{pending_transaction.original_tx_hash}.")
+
+        block_hashes: List[str] = list(set(receipt.blockHash.hex() for _, _, receipt in mined_transactions))
         blocks: Dict[HexBytes, AttributeDict] = dict((block.hash, block)
-                                                     for block
-                                                     in await safe_gather(*fetch_block_tasks)
+                                                     for block in await self._rpc_client.get_blocks(block_hashes)
                                                      if block is not None)
 
-        for receipt in transaction_receipts:
+        for pending_transaction, mined_tx_hash, receipt in mined_transactions:
             # Emit gas used event.
-            tx_hash: str = receipt.transactionHash.hex()
-            gas_price_wei: int = self._pending_tx_dict[tx_hash]['gas_price']
+            tx_hash: str = pending_transaction.original_tx_hash
+            gas_price_wei: int = pending_transaction.gas_prices[mined_tx_hash]
             gas_used: int = receipt.gasUsed
             gas_eth_amount_raw: int = gas_price_wei * gas_used
 
@@ -440,42 +462,26 @@ class Web3WalletBackend(PubSub):
                 ))
 
                 # Stop tracking the transaction.
-                self._stop_tx_tracking(tx_hash)
+                self._transaction_manager.complete(tx_hash, mined_tx_hash)
 
-    async def outgoing_eth_transactions_loop(self):
-        async_scheduler: AsyncCallScheduler = AsyncCallScheduler.shared_instance()
-        while True:
-            signed_transaction: AttributeDict = await self._outgoing_transactions_queue.get()
-            tx_hash: str = signed_transaction.hash.hex()
-            try:
-                await async_scheduler.call_async(self._w3.eth.sendRawTransaction, signed_transaction.rawTransaction)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                self.logger().network(
-                    f"Error sending transaction {tx_hash}.", exc_info=True,
-                    app_warning_msg=f"Error sending transaction {tx_hash}. Check wallet network connection")
-                self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
-                self._local_nonce -= 1
-
-    def _start_tx_tracking(self, tx_hash: str, gas_price: int):
-        self._pending_tx_dict[tx_hash] = {
-            'gas_price': gas_price,
-            'timestamp': time.time()
-        }
+    def _transaction_send_failure_listener(self, tx_hash: str):
+        self.trigger_event(WalletEvent.TransactionFailure, tx_hash)
 
-    def _stop_tx_tracking(self, tx_hash: str):
-        if tx_hash in self._pending_tx_dict:
-            del self._pending_tx_dict[tx_hash]
+    def submit_transaction(self, transaction: Dict[str, Any]) -> str:
+        """
+        Signs an unsigned transaction with the next nonce, and queues it to be sent.
 
-    def schedule_eth_transaction(self, signed_transaction: AttributeDict, gas_price: int):
+        :return: transaction hash
+        """
         if self._network_status is not NetworkStatus.CONNECTED:
             raise EnvironmentError("Cannot send transactions when network status is not connected.")
+        return self._transaction_manager.submit(transaction)
 
-        self._outgoing_transactions_queue.put_nowait(signed_transaction)
-        tx_hash: str = signed_transaction.hash.hex()
-        self._start_tx_tracking(tx_hash, gas_price)
-        self._local_nonce += 1
+    def get_current_tx_hash(self, tx_hash: str) -> str:
+        """
+        :return: the hash of the latest gas price replacement of a transaction, or the hash itself
+        """
+        return self._transaction_manager.current_tx_hash(tx_hash)
 
     def get_balance(self, symbol: str) -> Decimal:
         if self._account_balance_watcher is not None:
@@ -516,12 +522,11 @@ class Web3WalletBackend(PubSub):
         if self._network_status is not NetworkStatus.CONNECTED:
             raise EnvironmentError("Cannot send transactions when network status is not connected.")
 
-        gas_price: int = self.gas_price
         transaction_args: Dict[str, Any] = {
             "from": self.address,
             "nonce": self.nonce,
             "chainId": self.chain.value,
-            "gasPrice": gas_price,
+            "gasPrice": self.gas_price,
         }
         transaction_args.update(kwargs)
         transaction: Dict[str, Any] = contract_function.buildTransaction(transaction_args)
@@ -532,10 +537,9 @@ class Web3WalletBackend(PubSub):
             except ValueError:
                 self.logger().error("Failed to estimate gas. Using default of 1000000.")
             transaction["gas"] = estimate_gas
-        signed_transaction: AttributeDict = self._account.signTransaction(transaction)
-        tx_hash: str = signed_transaction.hash.hex()
-        self.schedule_eth_transaction(signed_transaction, gas_price)
-        return tx_hash
+        # The transaction manager assigns the actual nonce when the transaction is submitted.
+        del transaction["nonce"]
+        return self.submit_transaction(transaction)
 
     def send(self, address: str, asset_name: str, amount: Decimal) -> str:
         """
@@ -550,18 +554,14 @@ class Web3WalletBackend(PubSub):
             raise EnvironmentError("Cannot send transactions when network status is not connected.")
 
         if asset_name == "ETH":
-            gas_price: int = self.gas_price
             transaction: Dict[str, Any] = {
                 "to": address,
                 "value": int(amount * 1e18),
                 "gas": 21000,
-                "gasPrice": gas_price,
-                "nonce": self.nonce,
+                "gasPrice": self.gas_price,
                 "chainId": self.chain.value
             }
-            signed_transaction: AttributeDict = self._account.signTransaction(transaction)
-            tx_hash: str = signed_transaction.hash.hex()
-            self.schedule_eth_transaction(signed_transaction, gas_price)
+            tx_hash: str = self.submit_transaction(transaction)
             self.logger().info(f"Sending {amount} ETH from {self.address} to {address}. tx_hash = {tx_hash}.")
             return tx_hash
         else:
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Tuple,
+)
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+HashAndSignOrders = Callable[[List[Dict[str, Any]]], Awaitable[List[Tuple[str, str]]]]
+
+
+class OrderSigningBatch:
+    """
+    Hashes and signs the orders of a batch submission in a single call. Each order is submitted from a task of its
+    own; the batch waits until every order it expects has either been handed in for signing or been removed, e.g.
+    because it failed validation, and then signs all of them at once.
+    """
+    def __init__(self, hash_and_sign_orders: HashAndSignOrders):
+        self._hash_and_sign_orders: HashAndSignOrders = hash_and_sign_orders
+        self._expected_order_ids: Set[str] = set()
+        self._pending_orders: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+
+    def add(self, order_id: str):
+        self._expected_order_ids.add(order_id)
+
+    def remove(self, order_id: str):
+        """
+        Stops waiting for an order. Does nothing if the order has already been handed in.
+        """
+        self._expected_order_ids.discard(order_id)
+        if len(self._expected_order_ids) == 0 and len(self._pending_orders) > 0:
+            pending_orders, self._pending_orders = self._pending_orders, []
+            safe_ensure_future(self._sign(pending_orders))
+
+    async def hash_and_sign_order(self, order_id: str, unsigned_order: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        :return: (order hash, signature), once the whole batch has been signed
+        """
+        future: asyncio.Future = asyncio.get_event_loop().create_future()
+        self._pending_orders.append((unsigned_order, future))
+        self.remove(order_id)
+        return await future
+
+    async def _sign(self, pending_orders: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        try:
+            results: List[Tuple[str, str]] = await self._hash_and_sign_orders([order for order, _ in pending_orders])
+            for (_, future), result in zip(pending_orders, results):
+                if not future.done():
+                    future.set_result(result)
+        except asyncio.CancelledError:
+            for _, future in pending_orders:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in pending_orders:
+                if not future.done():
+                    future.set_exception(e)
@@ -1,10 +1,14 @@
 from copy import copy
 from enum import auto, Enum
+from eth_account.messages import defunct_hash_message
+from eth_account.signers.local import LocalAccount
 from eth_typing import HexStr
 from eth_utils import keccak, remove_0x_prefix, to_bytes, to_checksum_address
+import functools
 from mypy_extensions import TypedDict
 from typing import (
     cast,
+    List,
     Tuple,
     Union
 )
@@ -127,48 +131,83 @@ def generate_order_hash_hex(
     'cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714'
     """  # noqa: E501 (line too long)
 
-    def pad_20_bytes_to_32(twenty_bytes: bytes):
-        return bytes(12) + twenty_bytes
+    return get_order_hasher(exchange_address, int(chain_id)).hash_order_hex(order)
 
-    def int_to_32_big_endian_bytes(i: int):
-        return i.to_bytes(32, byteorder="big")
 
-    eip712_domain_struct_hash = keccak(
-        _Constants.eip712_domain_struct_header
-        + int_to_32_big_endian_bytes(int(chain_id))
-        + pad_20_bytes_to_32(to_bytes(hexstr=exchange_address))
-    )
+class ZeroExOrderHasher:
+    """
+    Hashes 0x v3 orders for one exchange deployment. The EIP-712 domain hash is computed once, and the padded address
+    words and asset data hashes, which repeat across every order of a trading pair, are cached.
+    """
+
+    def __init__(self, exchange_address: str, chain_id: int):
+        self._domain_struct_hash: bytes = keccak(
+            _Constants.eip712_domain_struct_header
+            + int(chain_id).to_bytes(32, byteorder="big")
+            + self.address_word(exchange_address)
+        )
 
-    def ensure_bytes(str_or_bytes: Union[str, bytes]) -> bytes:
-        return (
-            to_bytes(hexstr=cast(bytes, str_or_bytes))
-            if isinstance(str_or_bytes, str)
-            else str_or_bytes
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def address_word(address: str) -> bytes:
+        return bytes(12) + to_bytes(hexstr=address)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def asset_data_hash(asset_data: Union[str, bytes]) -> bytes:
+        return keccak(to_bytes(hexstr=asset_data) if isinstance(asset_data, str) else asset_data)
+
+    def hash_order(self, order: Order) -> bytes:
+        eip712_order_struct_hash = keccak(
+            _Constants.eip712_order_schema_hash
+            + self.address_word(order["makerAddress"])
+            + self.address_word(order["takerAddress"])
+            + self.address_word(order["feeRecipientAddress"])
+            + self.address_word(order["senderAddress"])
+            + int(order["makerAssetAmount"]).to_bytes(32, byteorder="big")
+            + int(order["takerAssetAmount"]).to_bytes(32, byteorder="big")
+            + int(order["makerFee"]).to_bytes(32, byteorder="big")
+            + int(order["takerFee"]).to_bytes(32, byteorder="big")
+            + int(order["expirationTimeSeconds"]).to_bytes(32, byteorder="big")
+            + int(order["salt"]).to_bytes(32, byteorder="big")
+            + self.asset_data_hash(order["makerAssetData"])
+            + self.asset_data_hash(order["takerAssetData"])
+            + self.asset_data_hash(order["makerFeeAssetData"])
+            + self.asset_data_hash(order["takerFeeAssetData"])
         )
+        return keccak(_Constants.eip191_header + self._domain_struct_hash + eip712_order_struct_hash)
+
+    def hash_order_hex(self, order: Order) -> str:
+        return self.hash_order(order).hex()
+
+    def hash_orders_hex(self, orders: List[Order]) -> List[str]:
+        return [self.hash_order(order).hex() for order in orders]
 
-    eip712_order_struct_hash = keccak(
-        _Constants.eip712_order_schema_hash
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["makerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["takerAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["feeRecipientAddress"]))
-        + pad_20_bytes_to_32(to_bytes(hexstr=order["senderAddress"]))
-        + int_to_32_big_endian_bytes(int(order["makerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["takerAssetAmount"]))
-        + int_to_32_big_endian_bytes(int(order["makerFee"]))
-        + int_to_32_big_endian_bytes(int(order["takerFee"]))
-        + int_to_32_big_endian_bytes(int(order["expirationTimeSeconds"]))
-        + int_to_32_big_endian_bytes(int(order["salt"]))
-        + keccak(ensure_bytes(order["makerAssetData"]))
-        + keccak(ensure_bytes(order["takerAssetData"]))
-        + keccak(ensure_bytes(order["makerFeeAssetData"]))
-        + keccak(ensure_bytes(order["takerFeeAssetData"]))
+
+@functools.lru_cache(maxsize=16)
+def get_order_hasher(exchange_address: str, chain_id: int) -> ZeroExOrderHasher:
+    return ZeroExOrderHasher(exchange_address, chain_id)
+
+
+def sign_order_hash(account: LocalAccount, order_hash_hex: str) -> str:
+    """
+    Signs an order hash with a local private key, formatted as a 0x ETH_SIGN signature.
+
+    Unlike fix_signature, this never calls the provider: a local key gives v, r and s separately, so there is no
+    need to check on chain which order the signature parameters came back in.
+    """
+    signed_message = account.signHash(defunct_hash_message(hexstr=order_hash_hex))
+    return (
+        "0x"
+        + signed_message.v.to_bytes(1, byteorder="big").hex()
+        + signed_message.r.to_bytes(32, byteorder="big").hex()
+        + signed_message.s.to_bytes(32, byteorder="big").hex()
+        + _Constants.SignatureType.ETH_SIGN.value.to_bytes(1, byteorder="big").hex()
     )
 
-    return keccak(
-        _Constants.eip191_header
-        + eip712_domain_struct_hash
-        + eip712_order_struct_hash
-    ).hex()
+
+def sign_order_hashes(account: LocalAccount, order_hash_hexes: List[str]) -> List[str]:
+    return [sign_order_hash(account, order_hash_hex) for order_hash_hex in order_hash_hexes]
 
 
 def is_valid_signature(
@@ -25,6 +25,7 @@ def main():
         "hummingbot.client",
         "hummingbot.client.command",
         "hummingbot.client.config",
+        "hummingbot.client.headless",
         "hummingbot.client.ui",
         "hummingbot.core",
         "hummingbot.core.data_type",
@@ -141,7 +142,8 @@ def main():
           ],
           scripts=[
               "bin/hummingbot.py",
-              "bin/hummingbot_quickstart.py"
+              "bin/hummingbot_quickstart.py",
+              "bin/hummingbot_headless.py"
           ],
           )
 
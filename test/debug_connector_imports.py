@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import json
+import subprocess
+from typing import (
+    Any,
+    Dict,
+)
+
+from hummingbot.market.market_registry import MARKET_CLASS_PATHS
+
+PROJECT_DIR = realpath(join(__file__, "../../"))
+
+# Runs in a fresh interpreter, so every measurement starts from an empty module cache. ru_maxrss is in KB on Linux.
+MEASURE_SCRIPT = """
+import json, resource, sys, time
+sys.path.insert(0, {project_dir!r})
+start = time.perf_counter()
+{statement}
+import_time = time.perf_counter() - start
+connectors = sorted(name for name, (module, _) in
+                    __import__("hummingbot.market.market_registry", fromlist=["MARKET_CLASS_PATHS"])
+                    .MARKET_CLASS_PATHS.items() if module in sys.modules)
+print(json.dumps({{"import_time": import_time,
+                   "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+                   "connectors": connectors}}))
+"""
+
+
+def measure(statement: str) -> Dict[str, Any]:
+    script: str = MEASURE_SCRIPT.format(project_dir=PROJECT_DIR, statement=statement)
+    output: bytes = subprocess.check_output([sys.executable, "-c", script])
+    return json.loads(output.decode("utf8").strip().split("\n")[-1])
+
+
+def main():
+    app_stats: Dict[str, Any] = measure("import hummingbot.client.hummingbot_application")
+    print(f"import hummingbot_application: {app_stats['import_time']:.3f} s, "
+          f"max RSS {app_stats['max_rss_mb']:.1f} MB, "
+          f"connectors imported: {', '.join(app_stats['connectors']) or 'none'}")
+
+    print("connector imports on first use, after the application import:")
+    for market_name in sorted(MARKET_CLASS_PATHS.keys()):
+        stats: Dict[str, Any] = measure("import hummingbot.client.hummingbot_application\n"
+                                        "start = time.perf_counter()\n"
+                                        "from hummingbot.market.market_registry import get_market_class\n"
+                                        f"get_market_class({market_name!r})")
+        print(f"  {market_name:<14} {stats['import_time']:.3f} s, "
+              f"max RSS {stats['max_rss_mb']:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import time
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.pubsub import PubSub
+
+ITERATIONS = 200000
+
+
+class BenchmarkEvent(Enum):
+    Listened = 1
+    NotListened = 2
+
+
+class CountingListener(EventListener):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def __call__(self, arg):
+        self.count += 1
+
+
+def events_per_second(pubsub: PubSub, event_tag: BenchmarkEvent) -> float:
+    start: float = time.perf_counter()
+    for i in range(ITERATIONS):
+        pubsub.trigger_event(event_tag, i)
+    return ITERATIONS / (time.perf_counter() - start)
+
+
+def main():
+    for num_listeners in (0, 1, 5, 20):
+        pubsub: PubSub = PubSub()
+        listeners = [CountingListener() for _ in range(num_listeners)]
+        for listener in listeners:
+            pubsub.add_listener(BenchmarkEvent.Listened, listener)
+        print(f"{num_listeners:>2} listeners: "
+              f"{events_per_second(pubsub, BenchmarkEvent.Listened):>12,.0f} events/s, "
+              f"no listeners on tag: {events_per_second(pubsub, BenchmarkEvent.NotListened):>12,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+import time
+from typing import List
+
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
+    Order,
+    sign_order_hashes,
+    ZeroExOrderHasher,
+)
+
+EXCHANGE_ADDRESS = "0x61935cbdd02287b511119ddb11aeb42f1593b7ef"
+LADDER_LEVELS = 10
+ITERATIONS = 200
+
+
+def make_ladder(maker_address: str, salt: int) -> List[Order]:
+    base_asset_data: str = "0xf47261b0000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2"
+    quote_asset_data: str = "0xf47261b00000000000000000000000006b175474e89094c44da98b954eedeac495271d0f"
+    return [Order(makerAddress=maker_address.lower(),
+                  takerAddress="0x0000000000000000000000000000000000000000",
+                  feeRecipientAddress="0x0000000000000000000000000000000000000000",
+                  senderAddress="0x0000000000000000000000000000000000000000",
+                  makerAssetAmount=str(10 ** 18 + level),
+                  takerAssetAmount=str(200 * 10 ** 18 + level * 10 ** 16),
+                  makerFee="0",
+                  takerFee="0",
+                  expirationTimeSeconds=str(int(time.time()) + 120),
+                  salt=str(salt + level),
+                  makerAssetData=base_asset_data,
+                  takerAssetData=quote_asset_data,
+                  makerFeeAssetData=base_asset_data,
+                  takerFeeAssetData=base_asset_data)
+            for level in range(LADDER_LEVELS)]
+
+
+def main():
+    account: LocalAccount = Account.create()
+    hasher: ZeroExOrderHasher = ZeroExOrderHasher(EXCHANGE_ADDRESS, 1)
+    ladders: List[List[Order]] = [make_ladder(account.address, i * LADDER_LEVELS) for i in range(ITERATIONS)]
+
+    start: float = time.perf_counter()
+    for ladder in ladders:
+        # A fresh hasher per order is what generating each hash from scratch costs.
+        [ZeroExOrderHasher(EXCHANGE_ADDRESS, 1).hash_order_hex(order) for order in ladder]
+    uncached_hashing_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ladder in ladders:
+        hasher.hash_orders_hex(ladder)
+    hashing_time: float = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for ladder in ladders:
+        sign_order_hashes(account, ["0x" + h for h in hasher.hash_orders_hex(ladder)])
+    signing_time: float = time.perf_counter() - start
+
+    print(f"{LADDER_LEVELS}-level ladder, averaged over {ITERATIONS} ladders:")
+    print(f"  hashing, fresh domain per order: {uncached_hashing_time / ITERATIONS * 1e3:.3f} ms")
+    print(f"  hashing, shared hasher:          {hashing_time / ITERATIONS * 1e3:.3f} ms")
+    print(f"  hashing and local signing:       {signing_time / ITERATIONS * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
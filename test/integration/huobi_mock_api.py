@@ -130,6 +130,7 @@ class HuobiMockAPI:
     def __init__(self):
         self.order_id = None
         self.cancel_all_order_ids = []
+        self.rejected_batch_order_indices = []
         self.order_response_dict = {
             self.MOCK_HUOBI_LIMIT_BUY_ORDER_ID: self.MOCK_HUOBI_LIMIT_BUY_RESPONSE,
             self.MOCK_HUOBI_LIMIT_SELL_ORDER_ID: self.MOCK_HUOBI_LIMIT_SELL_RESPONSE,
@@ -270,6 +271,22 @@ class HuobiMockAPI:
         }
         return web.json_response(response, status=200)
 
+    async def post_batch_orders(self, req: web.Request):
+        orders = await req.json()
+        results = []
+        for index, order in enumerate(orders):
+            if index in self.rejected_batch_order_indices:
+                results.append({"err-code": "account-frozen-balance-insufficient-error",
+                                "err-msg": "trade account balance is not enough",
+                                "client-order-id": order["client-order-id"]})
+            else:
+                results.append({"order-id": self.order_id, "client-order-id": order["client-order-id"]})
+        response = {
+            "status": "ok",
+            "data": results
+        }
+        return web.json_response(response, status=200)
+
     async def post_submit_cancel(self, _):
         response = {
             "status": "ok",
@@ -34,10 +34,12 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     OrderCancelledEvent,
     BuyOrderCreatedEvent,
+    MarketOrderFailureEvent,
     SellOrderCreatedEvent,
     TradeFee,
     TradeType,
 )
+from hummingbot.core.data_type.order_request import OrderRequest
 from hummingbot.core.utils.async_utils import (
     safe_ensure_future,
     safe_gather,
@@ -73,7 +75,8 @@ class HuobiMarketUnitTest(AioHTTPTestCase):
         MarketEvent.TransactionFailure,
         MarketEvent.BuyOrderCreated,
         MarketEvent.SellOrderCreated,
-        MarketEvent.OrderCancelled
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderFailure
     ]
 
     market: HuobiMarket
@@ -104,6 +107,7 @@ class HuobiMarketUnitTest(AioHTTPTestCase):
         app.router.add_get("/order/orders/{order_id}", self.mock_api.get_order_update)
         app.router.add_post("/order/orders/{order_id}/submitcancel", self.mock_api.post_submit_cancel)
         app.router.add_post("/order/orders/batchcancel", self.mock_api.post_batch_cancel)
+        app.router.add_post("/order/batch-orders", self.mock_api.post_batch_orders)
         return app
 
     @staticmethod
@@ -339,6 +343,31 @@ class HuobiMarketUnitTest(AioHTTPTestCase):
         for cr in cancellation_results:
             self.assertEqual(cr.success, True)
 
+    def test_batch_submit_orders(self):
+        self.customSetUp()
+        self.mock_api.order_id = self.mock_api.MOCK_HUOBI_LIMIT_OPEN_ORDER_ID
+        self.mock_api.rejected_batch_order_indices = [1]
+        trading_pair = "ethusdt"
+
+        bid_price: Decimal = self.market.get_price(trading_pair, True) * Decimal("0.5")
+        ask_price: Decimal = self.market.get_price(trading_pair, False) * Decimal("2")
+        amount: Decimal = self.market.quantize_order_amount(trading_pair, Decimal("0.05"))
+        order_requests: List[OrderRequest] = [
+            OrderRequest(True, amount, OrderType.LIMIT, self.market.quantize_order_price(trading_pair, bid_price)),
+            OrderRequest(True, amount, OrderType.LIMIT, self.market.quantize_order_price(trading_pair, bid_price)),
+            OrderRequest(False, amount, OrderType.LIMIT, self.market.quantize_order_price(trading_pair, ask_price)),
+        ]
+        order_ids: List[str] = self.market.batch_submit_orders(trading_pair, order_requests)
+        self.assertEqual(3, len(set(order_ids)))
+
+        [order_failure_event] = self.run_parallel(self.market_logger.wait_for(MarketOrderFailureEvent))
+        self.assertEqual(order_ids[1], order_failure_event.order_id)
+        created_order_ids = [event.order_id for event in self.market_logger.event_log
+                             if isinstance(event, (BuyOrderCreatedEvent, SellOrderCreatedEvent))]
+        self.assertEqual([order_ids[0], order_ids[2]], created_order_ids)
+        self.assertEqual({order_ids[0], order_ids[2]}, set(o.client_order_id for o in self.market.limit_orders))
+        self.market_logger.clear()
+
     def test_orders_saving_and_restoration(self):
         self.customSetUp()
         config_path: str = "test_config"
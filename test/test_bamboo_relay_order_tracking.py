@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.CRITICAL)
+from typing import (
+    Callable,
+    List,
+)
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.event.events import TradeType
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.market.bamboo_relay.bamboo_relay_market import BambooRelayMarket
+from hummingbot.wallet.ethereum.ethereum_chain import EthereumChain
+
+
+class MockFillWatcher:
+    def __init__(self):
+        self.watched_hashes: List[str] = []
+        self.unwatched_hashes: List[str] = []
+
+    async def watch_order_hash(self, order_hash: str, callback: Callable):
+        self.watched_hashes.append(order_hash)
+
+    async def unwatch_order_hash(self, order_hash: str):
+        self.unwatched_hashes.append(order_hash)
+
+
+class MockWalletBackend:
+    def __init__(self):
+        self.zeroex_fill_watcher: MockFillWatcher = MockFillWatcher()
+
+
+class MockWallet:
+    def __init__(self):
+        self.chain: EthereumChain = EthereumChain.ZEROEX_TEST
+        self.address: str = "0x" + "11" * 20
+        self.gas_price: int = 1
+        self.network_status: NetworkStatus = NetworkStatus.NOT_CONNECTED
+        self.current_backend: MockWalletBackend = MockWalletBackend()
+
+
+class BambooRelayOrderTrackingUnitTest(unittest.TestCase):
+    start_timestamp: float = 1000.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.wallet: MockWallet = MockWallet()
+        self.market: BambooRelayMarket = BambooRelayMarket(self.wallet, "http://127.0.0.1:8545",
+                                                           trading_pairs=["ZRX-WETH"], trading_required=False)
+        self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 3600)
+        self.clock.add_iterator(self.market)
+        self.clock.backtest_til(self.start_timestamp)
+
+    def tearDown(self):
+        self.clock.remove_iterator(self.market)
+        self.run_for(0.01)
+
+    def run_for(self, seconds: float):
+        self.ev_loop.run_until_complete(asyncio.sleep(seconds))
+
+    def start_tracking(self, order_id: str, order_hash: str):
+        self.market.start_tracking_limit_order(order_id, order_hash, "ZRX-WETH", TradeType.BUY, Decimal("0.001"),
+                                               Decimal("100"), int(self.start_timestamp) + 120)
+
+    def test_limit_order_lookup_by_hash(self):
+        self.start_tracking("buy-1", "0x01")
+        self.start_tracking("buy-2", "0x02")
+        self.run_for(0.01)
+        self.assertIs(self.market.in_flight_limit_orders["buy-1"],
+                      self.market.get_in_flight_limit_order_by_hash("0x01"))
+        self.assertIs(self.market.in_flight_limit_orders["buy-2"],
+                      self.market.get_in_flight_limit_order_by_hash("0x02"))
+        self.assertIsNone(self.market.get_in_flight_limit_order_by_hash("0x03"))
+        self.assertEqual(["0x01", "0x02"], self.wallet.current_backend.zeroex_fill_watcher.watched_hashes)
+
+    def test_stopped_order_is_removed_from_hash_index(self):
+        self.start_tracking("buy-1", "0x01")
+        self.start_tracking("buy-2", "0x02")
+        self.market.stop_tracking_order("buy-1")
+        self.run_for(0.01)
+        self.assertIsNone(self.market.get_in_flight_limit_order_by_hash("0x01"))
+        self.assertNotIn("buy-1", self.market.in_flight_limit_orders)
+        self.assertIsNotNone(self.market.get_in_flight_limit_order_by_hash("0x02"))
+        self.assertEqual(["0x01"], self.wallet.current_backend.zeroex_fill_watcher.unwatched_hashes)
+
+        # Stopping an order that is no longer tracked does nothing.
+        self.market.stop_tracking_order("buy-1")
+        self.assertIsNotNone(self.market.get_in_flight_limit_order_by_hash("0x02"))
+
+    def test_expired_order_is_removed_from_hash_index(self):
+        self.start_tracking("buy-1", "0x01")
+        self.market.expire_order("buy-1", 10)
+        self.clock.backtest_til(self.start_timestamp + 5)
+        self.assertIsNotNone(self.market.get_in_flight_limit_order_by_hash("0x01"))
+        self.clock.backtest_til(self.start_timestamp + 11)
+        self.assertIsNone(self.market.get_in_flight_limit_order_by_hash("0x01"))
+        self.assertNotIn("buy-1", self.market.in_flight_limit_orders)
+
+    def test_filled_order_hashes_window(self):
+        window_size: int = BambooRelayMarket.FILLED_ORDER_HASHES_WINDOW_SIZE
+        for i in range(window_size):
+            self.market.add_filled_order_hash(f"0x{i:04x}")
+        self.assertEqual(window_size, len(self.market.filled_order_hashes))
+
+        # Filling an order hash again makes it the newest entry, so it outlives the ones filled after it.
+        self.market.add_filled_order_hash("0x0000")
+        self.market.add_filled_order_hash("new-1")
+        self.market.add_filled_order_hash("new-2")
+        filled_order_hashes: List[str] = self.market.filled_order_hashes
+        self.assertEqual(window_size, len(filled_order_hashes))
+        self.assertNotIn("0x0001", filled_order_hashes)
+        self.assertNotIn("0x0002", filled_order_hashes)
+        self.assertEqual("0x0003", filled_order_hashes[0])
+        self.assertEqual(["0x0000", "new-1", "new-2"], filled_order_hashes[-3:])
+
+
+if __name__ == "__main__":
+    unittest.main()
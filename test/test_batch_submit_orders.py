@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.CRITICAL)
+from typing import List
+import unittest
+
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_request import OrderRequest
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    BuyOrderCreatedEvent,
+    MarketEvent,
+    OrderType,
+    SellOrderCreatedEvent,
+)
+from hummingbot.market.binance.binance_market import BinanceMarket
+from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+from hummingbot.market.paper_trade.market_config import MarketConfig
+from hummingbot.market.paper_trade.paper_trade_market import PaperTradeMarket
+
+
+class BatchSubmitOrdersUnitTest(unittest.TestCase):
+    trading_pair = "ETHUSDT"
+
+    def setUp(self):
+        order_book_tracker: BinanceOrderBookTracker = BinanceOrderBookTracker(trading_pairs=[self.trading_pair])
+        order_book: CompositeOrderBook = CompositeOrderBook()
+        order_book.apply_snapshot([OrderBookRow(99, 10, 1)], [OrderBookRow(101, 10, 1)], 1)
+        order_book_tracker._order_books[self.trading_pair] = order_book
+        self.market: PaperTradeMarket = PaperTradeMarket(order_book_tracker,
+                                                         MarketConfig.default_config(),
+                                                         BinanceMarket)
+        self.market.init_paper_trade_market()
+        self.market.set_balance("ETH", Decimal("10"))
+        self.market.set_balance("USDT", Decimal("1000"))
+        self.market_logger: EventLogger = EventLogger()
+        self.market.add_listener(MarketEvent.BuyOrderCreated, self.market_logger)
+        self.market.add_listener(MarketEvent.SellOrderCreated, self.market_logger)
+
+    def test_fallback_submits_every_order(self):
+        order_requests: List[OrderRequest] = [
+            OrderRequest(True, Decimal("1"), OrderType.LIMIT, Decimal("98")),
+            OrderRequest(True, Decimal("2"), OrderType.LIMIT, Decimal("97")),
+            OrderRequest(False, Decimal("1"), OrderType.LIMIT, Decimal("102")),
+        ]
+        order_ids: List[str] = self.market.batch_submit_orders(self.trading_pair, order_requests)
+        self.assertEqual(3, len(set(order_ids)))
+        self.assertEqual(order_ids, [event.order_id for event in self.market_logger.event_log])
+        self.assertEqual([(True, Decimal("98"), Decimal("1")),
+                          (True, Decimal("97"), Decimal("2")),
+                          (False, Decimal("102"), Decimal("1"))],
+                         [(order.is_buy, order.price, order.quantity)
+                          for order in sorted(self.market.limit_orders,
+                                              key=lambda order: order_ids.index(order.client_order_id))])
+
+    def test_fallback_reports_partial_failure(self):
+        order_requests: List[OrderRequest] = [
+            OrderRequest(True, Decimal("1"), OrderType.LIMIT, Decimal("98")),
+            # A limit order without a price can't be submitted.
+            OrderRequest(True, Decimal("1"), OrderType.LIMIT, None),
+            OrderRequest(False, Decimal("1"), OrderType.LIMIT, Decimal("102")),
+        ]
+        order_ids: List[str] = self.market.batch_submit_orders(self.trading_pair, order_requests)
+        self.assertIsNone(order_ids[1])
+        self.assertIsNotNone(order_ids[0])
+        self.assertIsNotNone(order_ids[2])
+        self.assertEqual([BuyOrderCreatedEvent, SellOrderCreatedEvent],
+                         [type(event) for event in self.market_logger.event_log])
+        self.assertEqual({order_ids[0], order_ids[2]}, set(order.client_order_id for order in self.market.limit_orders))
+
+
+if __name__ == "__main__":
+    unittest.main()
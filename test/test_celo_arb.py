@@ -1,4 +1,5 @@
 #!/usr/bin/env python
+import asyncio
 from decimal import Decimal
 from os.path import join, realpath
 import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
@@ -22,7 +23,11 @@ from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
     MarketEvent
 )
-from hummingbot.strategy.celo_arb.celo_arb import CeloArbStrategy, get_trade_profits
+from hummingbot.strategy.celo_arb.celo_arb import (
+    CeloArbStrategy,
+    get_trade_profits,
+    get_trade_profits_async,
+)
 from test.integration.assets.mock_data.fixture_celo import outputs as celo_outputs, TEST_ADDRESS, TEST_PASSWORD
 from hummingbot.market.celo.celo_cli import CeloCLI
 
@@ -37,6 +42,10 @@ def mock_command(commands):
     return celo_outputs[commands]
 
 
+async def mock_async_command(commands, timeout=None):
+    return mock_command(commands)
+
+
 @attr('stable')
 class CeloArbUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
@@ -61,6 +70,8 @@ class CeloArbUnitTest(unittest.TestCase):
 
     def setUp(self):
         self.maxDiff = None
+        # The exchange rate cache is class level, rates cached by an earlier test would hide the celocli calls.
+        CeloCLI.clear_exchange_rate_cache()
         self.clock: Clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.end_timestamp)
         self.market: BacktestMarket = BacktestMarket()
 
@@ -212,3 +223,43 @@ class CeloArbUnitTest(unittest.TestCase):
         self.clock.backtest_til(self.start_timestamp + 1)
         self.assertEqual(len(self.strategy.market_info_to_active_orders), 0)
         self.assertEqual(len(self.strategy.celo_orders), 0)
+
+    def test_exchange_rates_are_cached(self):
+        get_trade_profits(self.market, self.trading_pair, 1)
+        call_count = self._mock.call_count
+        trade_profits = get_trade_profits(self.market, self.trading_pair, 1)
+        # Both quotes are served from the cache until the next block.
+        self.assertEqual(call_count, self._mock.call_count)
+        self.assertEqual(trade_profits[1].celo_price, Decimal("10.5"))
+
+    def test_exchange_rate_cache_is_cleared_after_trades(self):
+        self.strategy.order_amount = 1
+        self.clock.backtest_til(self.start_timestamp + 1)
+        self.assertEqual(len(self.strategy.celo_orders), 1)
+        self.assertEqual(len(CeloCLI._exchange_rate_cache), 0)
+
+        get_trade_profits(self.market, self.trading_pair, 1)
+        self.assertGreater(len(CeloCLI._exchange_rate_cache), 0)
+        CeloCLI.buy_cgld(Decimal("1"))
+        self.assertEqual(len(CeloCLI._exchange_rate_cache), 0)
+
+        # A failed trade may still have been mined, the cached rates are dropped all the same.
+        get_trade_profits(self.market, self.trading_pair, 1)
+        with self.assertRaises(KeyError):
+            CeloCLI.sell_cgld(Decimal("3"))
+        self.assertEqual(len(CeloCLI._exchange_rate_cache), 0)
+
+    def test_get_trade_profits_async(self):
+        with mock.patch("hummingbot.market.celo.celo_cli.async_command") as async_command_mock:
+            async_command_mock.side_effect = mock_async_command
+            trade_profits = asyncio.get_event_loop().run_until_complete(
+                get_trade_profits_async(self.market, self.trading_pair, 1)
+            )
+            self.assertEqual(2, async_command_mock.call_count)
+            # The rates fetched by the async path are cached the same way.
+            asyncio.get_event_loop().run_until_complete(get_trade_profits_async(self.market, self.trading_pair, 1))
+            self.assertEqual(2, async_command_mock.call_count)
+
+        CeloCLI.clear_exchange_rate_cache()
+        self.assertEqual(get_trade_profits(self.market, self.trading_pair, 1), trade_profits)
+        self.assertEqual(Decimal("10.5"), trade_profits[1].celo_price)
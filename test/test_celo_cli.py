@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+import unittest
+
+from hummingbot.market.celo.celo_cli import async_command
+
+
+class CeloCLIAsyncCommandUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def test_async_command_output(self):
+        output = self.ev_loop.run_until_complete(async_command(["sh", "-c", "echo libusb warning; echo synced"]))
+        self.assertEqual("synced", output)
+
+    def test_async_command_error(self):
+        with self.assertRaisesRegex(Exception, "Node is not synced"):
+            self.ev_loop.run_until_complete(async_command(["sh", "-c", "echo 'Error: Node is not synced'; exit 1"]))
+
+    def test_async_command_timeout(self):
+        start: float = time.time()
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(async_command(["sleep", "10"], timeout=0.2))
+        # The hung process is killed, instead of being waited on.
+        self.assertLess(time.time() - start, 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -60,6 +60,16 @@ class ConfigTemplatesUnitTest(unittest.TestCase):
                 for key in strategy_config_map:
                     self.assertTrue(key in template_data, f"{key} not in {strategy_template_path}")
 
+    def test_templates_load(self):
+        # Duplicate keys and other YAML errors make ruamel raise when a template is loaded.
+        folder = realpath(join(__file__, "../../hummingbot/templates"))
+        template_file_names = [f for f in listdir(folder) if f.endswith("_TEMPLATE.yml")]
+        self.assertGreater(len(template_file_names), 0)
+        for template_file_name in template_file_names:
+            with open(join(folder, template_file_name), "r") as template_fd:
+                template_data = yaml_parser.load(template_fd)
+                self.assertIsNotNone(template_data, f"{template_file_name} is empty")
+
     def test_global_config_prompt_exists(self):
         for key in global_config_map:
             cvar = global_config_map[key]
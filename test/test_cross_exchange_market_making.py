@@ -1,9 +1,15 @@
 #!/usr/bin/env python
 
+from collections import deque
 from os.path import join, realpath
+import random
 import sys
 import pandas as pd
-from typing import List
+from typing import (
+    Deque,
+    List,
+    Tuple,
+)
 import unittest
 from hummingsim.backtest.backtest_market import BacktestMarket
 from hummingsim.backtest.market import (
@@ -603,3 +609,59 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("1.006"), ask_order.price)
         self.assertAlmostEqual(Decimal("1"), round(bid_order.quantity, 4))
         self.assertAlmostEqual(Decimal("1"), round(ask_order.quantity, 4))
+
+    @staticmethod
+    def list_based_top_bid_ask(bid_price_samples: Deque[Decimal],
+                               ask_price_samples: Deque[Decimal],
+                               current_top_bid_price: Decimal,
+                               current_top_ask_price: Decimal) -> Tuple[Decimal, Decimal]:
+        # The calculation from when the price samples were kept in plain deques.
+        if not any(Decimal.is_nan(p) for p in bid_price_samples) and not Decimal.is_nan(current_top_bid_price):
+            top_bid_price = max(list(bid_price_samples) + [current_top_bid_price])
+        else:
+            top_bid_price = current_top_ask_price
+        if not any(Decimal.is_nan(p) for p in ask_price_samples) and not Decimal.is_nan(current_top_ask_price):
+            top_ask_price = min(list(ask_price_samples) + [current_top_ask_price])
+        else:
+            top_ask_price = current_top_ask_price
+        return top_bid_price, top_ask_price
+
+    def assertSamePrice(self, expected: Decimal, actual: Decimal):
+        if expected.is_nan():
+            self.assertTrue(actual.is_nan())
+        else:
+            self.assertEqual(expected, actual)
+
+    def test_price_samples_match_list_based_calculation(self):
+        random.seed(48)
+        sample_interval: int = CrossExchangeMarketMakingStrategy.ORDER_ADJUST_SAMPLE_INTERVAL
+        sample_window: int = CrossExchangeMarketMakingStrategy.ORDER_ADJUST_SAMPLE_WINDOW
+        order_book: OrderBook = self.maker_market.get_order_book(self.maker_trading_pairs[0])
+        bid_price_samples: Deque[Decimal] = deque(maxlen=sample_window)
+        ask_price_samples: Deque[Decimal] = deque(maxlen=sample_window)
+
+        # Three full sample windows, with an empty maker order book in the first one.
+        for step in range(3 * sample_window):
+            update_id: int = order_book.last_diff_uid + 1
+            if step in (4, 5):
+                order_book.apply_snapshot([], [], update_id)
+            else:
+                top_bid: float = round(random.uniform(0.9, 0.99), 2)
+                top_ask: float = round(random.uniform(1.01, 1.1), 2)
+                order_book.apply_snapshot([OrderBookRow(top_bid, 10, update_id)],
+                                          [OrderBookRow(top_ask, 10, update_id)],
+                                          update_id)
+            current_top_bid_price, current_top_ask_price = self.strategy.get_top_bid_ask(self.market_pair)
+            # The strategy takes a sample once per sample interval.
+            self.clock.backtest_til(self.start_timestamp + (step + 1) * sample_interval)
+            top_bid_sample, top_ask_sample = self.list_based_top_bid_ask(bid_price_samples, ask_price_samples,
+                                                                         current_top_bid_price, current_top_ask_price)
+            bid_price_samples.append(top_bid_sample)
+            ask_price_samples.append(top_ask_sample)
+
+            expected_top_bid, expected_top_ask = self.list_based_top_bid_ask(bid_price_samples, ask_price_samples,
+                                                                             current_top_bid_price,
+                                                                             current_top_ask_price)
+            top_bid_price, top_ask_price = self.strategy.get_top_bid_ask_from_price_samples(self.market_pair)
+            self.assertSamePrice(expected_top_bid, top_bid_price)
+            self.assertSamePrice(expected_top_ask, top_ask_price)
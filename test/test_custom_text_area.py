@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import unittest
+
+from hummingbot.client.ui.custom_widgets import CustomTextArea
+
+
+class CustomTextAreaUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.text_area: CustomTextArea = CustomTextArea(max_line_count=5, initial_text="header")
+
+    def test_log_lines_are_bounded(self):
+        for i in range(10):
+            self.text_area.log(f"line {i}")
+        self.assertEqual(5, len(self.text_area.log_lines))
+        self.assertEqual("\n".join(f"line {i}" for i in range(5, 10)), self.text_area.document.text)
+
+    def test_redraws_are_coalesced(self):
+        async def log_lines():
+            for i in range(3):
+                self.text_area.log(f"line {i}")
+            # Nothing is drawn until the next frame.
+            self.assertEqual("header", self.text_area.document.text)
+            await asyncio.sleep(2.0 / CustomTextArea.REDRAW_FRAME_RATE)
+
+        self.ev_loop.run_until_complete(log_lines())
+        self.assertEqual("header\nline 0\nline 1\nline 2", self.text_area.document.text)
+        self.assertEqual(len(self.text_area.document.text), self.text_area.document.cursor_position)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import math
+import unittest
+
+from hummingbot.core.data_type.deadline_queue import DeadlineQueue
+
+
+class DeadlineQueueUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.queue: DeadlineQueue = DeadlineQueue()
+
+    def test_pop_expired_in_deadline_order(self):
+        self.queue.push("c", 30.0)
+        self.queue.push("a", 10.0)
+        self.queue.push("b", 20.0)
+        self.assertEqual([], self.queue.pop_expired(10.0))
+        self.assertEqual(["a", "b"], self.queue.pop_expired(25.0))
+        self.assertEqual(1, len(self.queue))
+        self.assertIn("c", self.queue)
+        self.assertEqual(["c"], self.queue.pop_expired(100.0))
+        self.assertEqual(0, len(self.queue))
+
+    def test_remove_and_reschedule(self):
+        self.queue.push("a", 10.0)
+        self.queue.push("b", 20.0)
+        self.queue.push("c", 30.0)
+        self.queue.remove("a")
+        self.queue.remove("missing")
+        self.queue.push("c", 5.0)
+        self.queue.push("b", 50.0)
+        self.assertEqual(5.0, self.queue.get_deadline("c"))
+        self.assertTrue(math.isnan(self.queue.get_deadline("a")))
+        self.assertEqual(["c"], self.queue.pop_expired(40.0))
+        self.assertEqual(["b"], self.queue.pop_expired(60.0))
+
+    def test_rescheduling_does_not_grow_unbounded(self):
+        for i in range(10000):
+            self.queue.push("a", float(i))
+        self.assertEqual(1, len(self.queue))
+        self.assertEqual(9999.0, self.queue.get_deadline("a"))
+        self.assertEqual([], self.queue.pop_expired(9999.0))
+        self.assertEqual(["a"], self.queue.pop_expired(10000.0))
+        self.queue.push("b", 1.0)
+        self.queue.clear()
+        self.assertEqual([], self.queue.pop_expired(10000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_utils import keccak
+from hexbytes import HexBytes
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from web3.datastructures import AttributeDict
+
+from hummingbot.wallet.ethereum.transaction_manager import (
+    EthereumTransactionManager,
+    PendingTransaction,
+)
+
+
+class MockAccount:
+    address = "0x0000000000000000000000000000000000000001"
+
+    def signTransaction(self, transaction: Dict[str, Any]) -> AttributeDict:
+        raw_transaction: bytes = json.dumps(transaction, sort_keys=True).encode("utf8")
+        return AttributeDict({"hash": HexBytes(keccak(raw_transaction)), "rawTransaction": HexBytes(raw_transaction)})
+
+
+class MockRpcClient:
+    def __init__(self):
+        self.sent_transactions: List[Dict[str, Any]] = []
+        self.rejected_nonces: List[int] = []
+        self.transaction_count: Dict[str, int] = {"latest": 5, "pending": 5}
+        self.is_offline: bool = False
+
+    async def batch_call_responses(self, calls) -> List[Dict[str, Any]]:
+        if self.is_offline:
+            raise IOError("Connection refused.")
+        responses: List[Dict[str, Any]] = []
+        for method, params in calls:
+            transaction: Dict[str, Any] = json.loads(bytes.fromhex(params[0][2:]).decode("utf8"))
+            self.sent_transactions.append(transaction)
+            if transaction["nonce"] in self.rejected_nonces:
+                responses.append({"error": {"message": "insufficient funds for gas * price + value"}})
+            else:
+                responses.append({"result": "0x"})
+        return responses
+
+    async def batch_call(self, calls) -> List[Any]:
+        return [hex(self.transaction_count[params[1]]) for _, params in calls]
+
+
+class EthereumTransactionManagerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.rpc_client: MockRpcClient = MockRpcClient()
+        self.failed_tx_hashes: List[str] = []
+        self.manager: EthereumTransactionManager = EthereumTransactionManager(MockAccount(),
+                                                                              self.rpc_client,
+                                                                              lambda: 10,
+                                                                              self.failed_tx_hashes.append)
+        self.manager.initialize_nonce(5)
+
+    def tearDown(self):
+        self.manager.stop()
+
+    def run_send_loop(self):
+        self.manager.start()
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.manager.stop()
+
+    def test_nonces_are_sent_in_one_batch(self):
+        tx_hashes: List[str] = [self.manager.submit({"to": "0x2", "value": i, "gasPrice": 10}) for i in range(3)]
+        self.assertEqual(8, self.manager.next_nonce)
+        self.run_send_loop()
+        self.assertEqual([5, 6, 7], [t["nonce"] for t in self.rpc_client.sent_transactions])
+        self.assertEqual(tx_hashes, [t.original_tx_hash for t in self.manager.pending_transactions])
+        self.assertTrue(all(t.last_sent_timestamp > 0 for t in self.manager.pending_transactions))
+
+    def test_failed_transaction_nonce_is_filled(self):
+        self.rpc_client.rejected_nonces = [6]
+        tx_hashes: List[str] = [self.manager.submit({"to": "0x2", "value": i, "gasPrice": 10}) for i in range(3)]
+        self.run_send_loop()
+        self.assertEqual([tx_hashes[1]], self.failed_tx_hashes)
+        self.assertEqual(8, self.manager.next_nonce)
+        filler: Dict[str, Any] = self.rpc_client.sent_transactions[-1]
+        self.assertEqual((6, 0, MockAccount.address), (filler["nonce"], filler["value"], filler["to"]))
+
+        # A failure of the last transaction just hands its nonce out again.
+        self.rpc_client.rejected_nonces = [8]
+        self.failed_tx_hashes.clear()
+        tx_hash: str = self.manager.submit({"to": "0x2", "value": 3, "gasPrice": 10})
+        self.run_send_loop()
+        self.assertEqual([tx_hash], self.failed_tx_hashes)
+        self.assertEqual(8, self.manager.next_nonce)
+
+    def test_stuck_transaction_is_replaced(self):
+        tx_hash: str = self.manager.submit({"to": "0x2", "value": 1, "gasPrice": 10})
+        self.run_send_loop()
+        self.manager.pending_transactions[0].last_sent_timestamp -= EthereumTransactionManager.STUCK_TRANSACTION_TIMEOUT
+        self.manager.replace_stuck_transactions()
+        self.run_send_loop()
+
+        replacement_tx_hash: str = self.manager.current_tx_hash(tx_hash)
+        self.assertNotEqual(tx_hash, replacement_tx_hash)
+        self.assertEqual(replacement_tx_hash, self.manager.current_tx_hash(replacement_tx_hash))
+        self.assertEqual([5, 5], [t["nonce"] for t in self.rpc_client.sent_transactions])
+        self.assertEqual(12, self.rpc_client.sent_transactions[-1]["gasPrice"])
+
+        self.manager.complete(tx_hash)
+        self.assertEqual(0, len(self.manager.pending_transactions))
+        self.assertEqual(replacement_tx_hash, self.manager.current_tx_hash(replacement_tx_hash))
+
+    def test_mined_replacement_resolves_after_complete(self):
+        tx_hash: str = self.manager.submit({"to": "0x2", "value": 1, "gasPrice": 10})
+        self.run_send_loop()
+        self.manager.pending_transactions[0].last_sent_timestamp -= EthereumTransactionManager.STUCK_TRANSACTION_TIMEOUT
+        self.manager.replace_stuck_transactions()
+        self.run_send_loop()
+        replacement_tx_hash: str = self.manager.current_tx_hash(tx_hash)
+
+        # The replacement is mined - the original hash keeps resolving to it, so its receipt can be found.
+        self.manager.complete(tx_hash, replacement_tx_hash)
+        self.assertEqual(0, len(self.manager.pending_transactions))
+        self.assertEqual(replacement_tx_hash, self.manager.current_tx_hash(tx_hash))
+        self.assertEqual(replacement_tx_hash, self.manager.current_tx_hash(replacement_tx_hash))
+
+        # Only the most recently completed transactions are remembered.
+        self.manager.COMPLETED_TX_HASHES_LIMIT = 2
+        other_tx_hash: str = self.manager.submit({"to": "0x2", "value": 2, "gasPrice": 10})
+        self.manager.complete(other_tx_hash, "0xmined")
+        self.assertEqual("0xmined", self.manager.current_tx_hash(other_tx_hash))
+        self.assertEqual(tx_hash, self.manager.current_tx_hash(tx_hash))
+
+    def test_failed_filler_is_sent_again(self):
+        self.rpc_client.rejected_nonces = [6]
+        for i in range(3):
+            self.manager.submit({"to": "0x2", "value": i, "gasPrice": 10})
+        self.run_send_loop()
+        filler: PendingTransaction = next(t for t in self.manager.pending_transactions if t.is_filler)
+        self.assertTrue(filler.send_failed)
+
+        self.rpc_client.rejected_nonces = []
+        self.run_send_loop()
+        self.assertFalse(filler.send_failed)
+        self.assertGreater(filler.last_sent_timestamp, 0)
+        self.assertEqual((6, MockAccount.address), (self.rpc_client.sent_transactions[-1]["nonce"],
+                                                    self.rpc_client.sent_transactions[-1]["to"]))
+
+    def test_unsent_batch_is_sent_again(self):
+        self.rpc_client.is_offline = True
+        for i in range(2):
+            self.manager.submit({"to": "0x2", "value": i, "gasPrice": 10})
+        self.run_send_loop()
+        self.assertEqual([], self.failed_tx_hashes)
+        self.assertEqual(7, self.manager.next_nonce)
+        self.assertTrue(all(t.send_failed for t in self.manager.pending_transactions))
+
+        self.rpc_client.is_offline = False
+        self.run_send_loop()
+        self.assertEqual([5, 6], [t["nonce"] for t in self.rpc_client.sent_transactions])
+        self.assertTrue(all(t.last_sent_timestamp > 0 for t in self.manager.pending_transactions))
+
+    def test_reconcile_fills_nonce_gaps(self):
+        tx_hashes: List[str] = [self.manager.submit({"to": "0x2", "value": i, "gasPrice": 10}) for i in range(3)]
+        self.run_send_loop()
+
+        # The node lost the first two transactions, the third one can't be mined until their nonces are used.
+        self.manager.complete(tx_hashes[0])
+        self.manager.complete(tx_hashes[1])
+        self.ev_loop.run_until_complete(self.manager.reconcile_nonce())
+        self.run_send_loop()
+        fillers: List[Dict[str, Any]] = self.rpc_client.sent_transactions[3:]
+        self.assertEqual([5, 6], [t["nonce"] for t in fillers])
+        self.assertTrue(all(t["to"] == MockAccount.address and t["gasPrice"] == 10 for t in fillers))
+        self.assertEqual(8, self.manager.next_nonce)
+
+        # Nothing is filled twice.
+        self.ev_loop.run_until_complete(self.manager.reconcile_nonce())
+        self.assertEqual(3, len(self.manager.pending_transactions))
+
+    def test_stuck_transaction_is_broadcast_again_after_max_replacements(self):
+        tx_hash: str = self.manager.submit({"to": "0x2", "value": 1, "gasPrice": 10})
+        self.run_send_loop()
+        for _ in range(EthereumTransactionManager.MAX_REPLACEMENTS + 1):
+            self.manager.pending_transactions[0].last_sent_timestamp -= \
+                EthereumTransactionManager.STUCK_TRANSACTION_TIMEOUT
+            self.manager.replace_stuck_transactions()
+            self.run_send_loop()
+
+        pending_transaction: PendingTransaction = self.manager.pending_transactions[0]
+        self.assertEqual(EthereumTransactionManager.MAX_REPLACEMENTS, pending_transaction.replacements)
+        self.assertEqual(EthereumTransactionManager.MAX_REPLACEMENTS + 2, len(self.rpc_client.sent_transactions))
+        self.assertEqual(self.rpc_client.sent_transactions[-2], self.rpc_client.sent_transactions[-1])
+        self.assertEqual(pending_transaction.current_tx_hash, self.manager.current_tx_hash(tx_hash))
+
+    def test_reconcile_nonce(self):
+        self.rpc_client.transaction_count = {"latest": 7, "pending": 9}
+        self.ev_loop.run_until_complete(self.manager.reconcile_nonce())
+        self.assertEqual(9, self.manager.next_nonce)
+
+        self.rpc_client.transaction_count = {"latest": 8, "pending": 8}
+        self.ev_loop.run_until_complete(self.manager.reconcile_nonce())
+        self.assertEqual(8, self.manager.next_nonce)
+
+
+if __name__ == "__main__":
+    unittest.main()
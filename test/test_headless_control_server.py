@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+import os
+import tempfile
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.client.headless import (
+    ControlServer,
+    HeadlessApp,
+)
+
+
+class MockHummingbotApplication:
+    def __init__(self):
+        self.app: HeadlessApp = HeadlessApp()
+        self.stopped: bool = False
+        self.cancellation_success: bool = True
+
+    def _notify(self, msg: str):
+        self.app.log(msg)
+
+    async def status_check_all(self) -> bool:
+        self._notify("\n  Strategy status line 1\n  Strategy status line 2\n")
+        return True
+
+    def history(self):
+        self._notify("\n  No past trades.")
+
+    async def stop_loop(self) -> bool:
+        self._notify("\nWinding down...")
+        self.stopped = True
+        if not self.cancellation_success:
+            self._notify("\nFailed to cancel the following orders on binance:\nbuy-ETHUSDT-1")
+        return self.cancellation_success
+
+
+class ControlServerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.temp_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.hb: MockHummingbotApplication = MockHummingbotApplication()
+        self.server: ControlServer = ControlServer(self.hb, os.path.join(self.temp_dir.name, "bot.sock"))
+        self.ev_loop.run_until_complete(self.server.start())
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.server.stop())
+        self.temp_dir.cleanup()
+
+    async def send_commands(self, commands: List[str]) -> List[Dict[str, Any]]:
+        reader, writer = await asyncio.open_unix_connection(self.server.socket_path)
+        responses: List[Dict[str, Any]] = []
+        for command in commands:
+            writer.write(f"{command}\n".encode("utf8"))
+            responses.append(json.loads(await reader.readline()))
+        writer.close()
+        return responses
+
+    def test_commands(self):
+        status, history, unknown = self.ev_loop.run_until_complete(self.send_commands(["status", "HISTORY", "exit"]))
+        self.assertEqual({"command": "status",
+                          "success": True,
+                          "output": ["  Strategy status line 1", "  Strategy status line 2"]}, status)
+        self.assertEqual(["  No past trades."], history["output"])
+        self.assertFalse(unknown["success"])
+
+    def test_stop_exits_app(self):
+        run_task: asyncio.Task = self.ev_loop.create_task(self.hb.app.run())
+        stop, = self.ev_loop.run_until_complete(self.send_commands(["stop"]))
+        self.assertTrue(stop["success"])
+        self.assertTrue(self.hb.stopped)
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_task, timeout=1))
+
+    def test_stop_keeps_app_running_when_cancellation_fails(self):
+        run_task: asyncio.Task = self.ev_loop.create_task(self.hb.app.run())
+        self.hb.cancellation_success = False
+        stop, status = self.ev_loop.run_until_complete(self.send_commands(["stop", "status"]))
+        self.assertFalse(stop["success"])
+        self.assertIn("buy-ETHUSDT-1", stop["output"])
+        self.assertTrue(status["success"])
+        self.assertFalse(run_task.done())
+
+        # Sending stop again retries the cancellation.
+        self.hb.cancellation_success = True
+        stop, = self.ev_loop.run_until_complete(self.send_commands(["stop"]))
+        self.assertTrue(stop["success"])
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_task, timeout=1))
+
+    def test_prompt_cancels_command(self):
+        self.assertEqual("", self.ev_loop.run_until_complete(self.hb.app.prompt("Enter your password >>> ")))
+        self.assertTrue(self.hb.app.to_stop_config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from aiohttp import web
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.wallet.ethereum.json_rpc_batch_client import (
+    JsonRpcBatchClient,
+    JsonRpcError,
+    format_rpc_result,
+)
+
+
+class JsonRpcBatchClientUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.payloads: List[List[Dict[str, Any]]] = []
+        self.runner: web.AppRunner = self.ev_loop.run_until_complete(self.start_server())
+        self.client: JsonRpcBatchClient = JsonRpcBatchClient("http://127.0.0.1:18545", max_batch_size=3)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.client.close())
+        self.ev_loop.run_until_complete(self.runner.cleanup())
+
+    async def start_server(self) -> web.AppRunner:
+        app: web.Application = web.Application()
+        app.router.add_post("/", self.handle_batch)
+        runner: web.AppRunner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 18545).start()
+        return runner
+
+    async def handle_batch(self, request: web.Request) -> web.Response:
+        payload: List[Dict[str, Any]] = await request.json()
+        self.payloads.append(payload)
+        responses: List[Dict[str, Any]] = []
+        for call in reversed(payload):
+            if call["method"] == "eth_getBalance":
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": hex(int(call["params"][0], 16))})
+            elif call["method"] == "eth_getTransactionReceipt" and call["params"][0] != "0xbad":
+                receipt: Any = None
+                if call["params"][0] == "0xmined":
+                    receipt = {"transactionHash": "0xab", "blockHash": "0xcd", "status": "0x1"}
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "result": receipt})
+            else:
+                responses.append({"jsonrpc": "2.0", "id": call["id"], "error": {"code": -32601}})
+        return web.json_response(responses)
+
+    def test_batch_call_preserves_order(self):
+        calls = [("eth_getBalance", [hex(i), "latest"]) for i in range(5)] + [("eth_unknown", [])]
+        results: List[Any] = self.ev_loop.run_until_complete(self.client.batch_call(calls))
+        self.assertEqual([hex(i) for i in range(5)] + [None], results)
+        self.assertEqual([3, 3], [len(payload) for payload in self.payloads])
+
+    def test_format_rpc_result(self):
+        receipt = format_rpc_result({
+            "blockHash": "0xab",
+            "gasUsed": "0x5208",
+            "status": "0x1",
+            "from": "0x0000000000000000000000000000000000000001",
+            "logs": [{"logIndex": "0x2", "data": "0x"}]
+        })
+        self.assertEqual(21000, receipt.gasUsed)
+        self.assertEqual(1, receipt.status)
+        self.assertEqual(b"\xab", bytes(receipt.blockHash))
+        self.assertEqual("0x0000000000000000000000000000000000000001", receipt["from"])
+        self.assertEqual(2, receipt.logs[0].logIndex)
+        self.assertEqual(b"", bytes(receipt.logs[0].data))
+
+    def test_format_rpc_result_only_converts_data_fields(self):
+        log = format_rpc_result({
+            "topics": ["0x01", "0x02"],
+            "transactionHash": "0xab",
+            "customField": "0x1234",
+            "removed": False
+        })
+        self.assertEqual([b"\x01", b"\x02"], [bytes(topic) for topic in log.topics])
+        self.assertEqual(b"\xab", bytes(log.transactionHash))
+        self.assertEqual("0x1234", log.customField)
+        self.assertFalse(log.removed)
+
+    def test_get_transaction_receipts_marks_errors(self):
+        receipts: List[Any] = self.ev_loop.run_until_complete(
+            self.client.get_transaction_receipts(["0xmined", "0xpending", "0xbad"])
+        )
+        self.assertEqual(1, receipts[0].status)
+        self.assertEqual(b"\xcd", bytes(receipts[0].blockHash))
+        self.assertIsNone(receipts[1])
+        self.assertIsInstance(receipts[2], JsonRpcError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+from typing import (
+    Any,
+    Dict,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.market.coinbase_pro.coinbase_pro_active_order_tracker import CoinbaseProActiveOrderTracker
+
+
+def diff_message(content: Dict[str, Any], update_id: int) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {**content, "update_id": update_id}, 1.0)
+
+
+class L3ActiveOrderTrackerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.tracker: CoinbaseProActiveOrderTracker = CoinbaseProActiveOrderTracker()
+        snapshot: OrderBookMessage = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "bids": [["100", "1", "a"], ["100", "2", "b"], ["99", "1", "c"]],
+            "asks": [["101", "3", "d"]],
+            "update_id": 1
+        }, 1.0)
+        self.snapshot_rows = self.tracker.convert_snapshot_message_to_order_book_row(snapshot)
+
+    def test_snapshot_levels(self):
+        bids, asks = self.snapshot_rows
+        self.assertEqual([(100.0, 3.0), (99.0, 1.0)], [(row.price, row.amount) for row in bids])
+        self.assertEqual([(101.0, 3.0)], [(row.price, row.amount) for row in asks])
+        self.assertEqual((True, Decimal("100"), 2.0), self.tracker.order_index["b"])
+
+    def test_running_volume(self):
+        bids, asks = self.tracker.convert_diff_message_to_order_book_row(diff_message(
+            {"type": "match", "maker_order_id": "a", "side": "buy", "price": "100", "size": "0.5"}, 2))
+        self.assertEqual([(100.0, 2.5, 2)], [(row.price, row.amount, row.update_id) for row in bids])
+        self.assertEqual([], asks)
+        self.assertEqual("0.5", self.tracker.active_bids[Decimal("100")]["a"]["remaining_size"])
+        self.assertAlmostEqual(2.5, self.tracker.volume_for_bid_price(Decimal("100")))
+
+    def test_batch_returns_each_changed_level_once(self):
+        bids, asks = self.tracker.convert_diff_messages_to_order_book_row([
+            diff_message({"type": "done", "order_id": "c", "side": "buy", "price": "99"}, 2),
+            diff_message({"type": "open", "order_id": "e", "side": "sell", "price": "102", "remaining_size": "4"}, 3),
+            diff_message({"type": "done", "order_id": "a", "side": "buy", "price": "100"}, 4),
+            diff_message({"type": "change", "order_id": "b", "side": "buy", "price": "100", "new_size": "1.5"}, 5),
+        ])
+        self.assertEqual([(99.0, 0.0, 5), (100.0, 1.5, 5)],
+                         [(row.price, row.amount, row.update_id) for row in bids])
+        self.assertEqual([(102.0, 4.0, 5)], [(row.price, row.amount, row.update_id) for row in asks])
+        self.assertNotIn(Decimal("99"), self.tracker.active_bids)
+        self.assertNotIn("c", self.tracker.order_index)
+
+    def test_unknown_order_is_ignored(self):
+        bids, asks = self.tracker.convert_diff_message_to_order_book_row(diff_message(
+            {"type": "done", "order_id": "x", "side": "sell", "price": "101"}, 2))
+        self.assertEqual(([], []), (bids, asks))
+        self.assertAlmostEqual(3.0, self.tracker.volume_for_ask_price(Decimal("101")))
+
+    def test_level_volume_does_not_drift(self):
+        # Order "b" keeps the level alive while other orders come and go on it.
+        sizes = ["0.1", "0.2", "0.3", "0.7", "1.1", "0.00000001", "3.3"]
+        update_id: int = 2
+        for cycle in range(200):
+            messages = []
+            for i, size in enumerate(sizes):
+                messages.append(diff_message({"type": "open", "order_id": f"o{cycle}-{i}", "side": "buy",
+                                              "price": "100", "remaining_size": size}, update_id))
+                update_id += 1
+            for i, size in enumerate(sizes):
+                messages.append(diff_message({"type": "match", "maker_order_id": f"o{cycle}-{i}", "side": "buy",
+                                              "price": "100", "size": "0.00000001"}, update_id))
+                messages.append(diff_message({"type": "done", "order_id": f"o{cycle}-{i}", "side": "buy",
+                                              "price": "100"}, update_id + 1))
+                update_id += 2
+            self.tracker.convert_diff_messages_to_order_book_row(messages)
+        self.tracker.convert_diff_messages_to_order_book_row([
+            diff_message({"type": "done", "order_id": "a", "side": "buy", "price": "100"}, update_id),
+            diff_message({"type": "change", "order_id": "b", "side": "buy", "price": "100", "new_size": "0.3"},
+                         update_id + 1)
+        ])
+        self.assertEqual(0.3, self.tracker.volume_for_bid_price(Decimal("100")))
+
+        bids, _ = self.tracker.convert_diff_message_to_order_book_row(diff_message(
+            {"type": "match", "maker_order_id": "b", "side": "buy", "price": "100", "size": "0.3"}, update_id + 2))
+        self.assertEqual([(100.0, 0.0)], [(row.price, row.amount) for row in bids])
+        self.assertEqual(Decimal(0), self.tracker.order_index["b"][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_bloom import BloomFilter
+from eth_utils import (
+    event_abi_to_log_topic,
+    to_bytes,
+)
+from hexbytes import HexBytes
+import logging; logging.basicConfig(level=logging.CRITICAL)
+from typing import (
+    Any,
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+from web3.datastructures import AttributeDict
+
+from hummingbot.core.pubsub import PubSub
+from hummingbot.wallet.ethereum.watcher.log_fetch_coordinator import (
+    LogFetchCoordinator,
+    LogSubscription,
+)
+
+TRANSFER_ABI: Dict[str, Any] = {
+    "anonymous": False,
+    "inputs": [
+        {"indexed": True, "name": "from", "type": "address"},
+        {"indexed": True, "name": "to", "type": "address"},
+        {"indexed": False, "name": "value", "type": "uint256"},
+    ],
+    "name": "Transfer",
+    "type": "event",
+}
+TRANSFER_TOPIC: HexBytes = HexBytes(event_abi_to_log_topic(TRANSFER_ABI))
+TOKEN_A = "0x" + "aa" * 20
+TOKEN_B = "0x" + "bb" * 20
+SENDER = "0x" + "11" * 20
+RECIPIENT = "0x" + "22" * 20
+
+
+def address_topic(address: str) -> HexBytes:
+    return HexBytes(b"\x00" * 12 + to_bytes(hexstr=address))
+
+
+def make_block(number: int, token_addresses: List[str] = ()) -> AttributeDict:
+    bloom: BloomFilter = BloomFilter()
+    for token_address in token_addresses:
+        bloom.add(bytes(TRANSFER_TOPIC))
+        bloom.add(to_bytes(hexstr=token_address))
+        bloom.add(bytes(address_topic(SENDER)))
+        bloom.add(bytes(address_topic(RECIPIENT)))
+    return AttributeDict({"number": number, "logsBloom": HexBytes(int(bloom).to_bytes(256, byteorder="big"))})
+
+
+def make_log(block_number: int, log_index: int, token_address: str, value: int) -> AttributeDict:
+    return AttributeDict({
+        "address": token_address,
+        "topics": [TRANSFER_TOPIC, address_topic(SENDER), address_topic(RECIPIENT)],
+        "data": HexBytes(value.to_bytes(32, byteorder="big")),
+        "blockNumber": block_number,
+        "blockHash": HexBytes(block_number.to_bytes(32, byteorder="big")),
+        "logIndex": log_index,
+        "transactionIndex": log_index,
+        "transactionHash": HexBytes((block_number * 1000 + log_index).to_bytes(32, byteorder="big")),
+    })
+
+
+class MockEth:
+    def __init__(self):
+        self.logs: List[AttributeDict] = []
+        self.filters: List[Dict[str, Any]] = []
+        self.failures_left: int = 0
+
+    def getLogs(self, params: Dict[str, Any]) -> List[AttributeDict]:
+        self.filters.append(params)
+        if self.failures_left > 0:
+            self.failures_left -= 1
+            raise ValueError("RPC node unavailable.")
+        addresses: List[str] = params["address"] if isinstance(params.get("address"), list) else [params.get("address")]
+        return [log for log in self.logs
+                if params["fromBlock"] <= log["blockNumber"] <= params["toBlock"]
+                and (params.get("address") is None or log["address"] in addresses)]
+
+
+class MockWeb3:
+    def __init__(self):
+        self.eth: MockEth = MockEth()
+
+
+class LogFetchCoordinatorUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.w3: MockWeb3 = MockWeb3()
+        self.coordinator: LogFetchCoordinator = LogFetchCoordinator(self.w3, PubSub(), max_block_range=10)
+        self.received: Dict[str, List[AttributeDict]] = {}
+
+    def subscribe(self, name: str, address: str = None, topics: List[Any] = None) -> LogSubscription:
+        self.received[name] = []
+        return self.coordinator.add_subscription(
+            LogSubscription(TRANSFER_ABI, self.received[name].extend, address=address, topics=topics)
+        )
+
+    def process_new_blocks(self, new_blocks: List[AttributeDict]):
+        self.ev_loop.run_until_complete(self.coordinator.process_new_blocks(new_blocks))
+
+    def test_fetch_range_covers_matched_blocks_only(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.process_new_blocks([make_block(1), make_block(2), make_block(3)])
+        self.assertEqual([], self.w3.eth.filters)
+
+        self.w3.eth.logs = [make_log(3, 0, TOKEN_A, 5), make_log(5, 0, TOKEN_A, 7)]
+        self.process_new_blocks([make_block(2), make_block(3, [TOKEN_A]), make_block(4), make_block(5, [TOKEN_A]),
+                                 make_block(6)])
+        self.assertEqual([(3, 5)], [(f["fromBlock"], f["toBlock"]) for f in self.w3.eth.filters])
+        self.assertEqual([5, 7], [event["args"]["value"] for event in self.received["token_a"]])
+
+    def test_range_splitting(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.w3.eth.logs = [make_log(100, 0, TOKEN_A, 1), make_log(109, 0, TOKEN_A, 2),
+                            make_log(110, 0, TOKEN_A, 3), make_log(135, 0, TOKEN_A, 4)]
+        self.process_new_blocks([make_block(number, [TOKEN_A] if number in (100, 109, 110, 135) else [])
+                                 for number in range(100, 140)])
+        self.assertEqual([(100, 109), (110, 110), (135, 135)],
+                         [(f["fromBlock"], f["toBlock"]) for f in self.w3.eth.filters])
+        self.assertEqual([1, 2, 3, 4], [event["args"]["value"] for event in self.received["token_a"]])
+
+    def test_subscriptions_are_merged(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.subscribe("token_a_again", address=TOKEN_A)
+        self.subscribe("token_b", address=TOKEN_B)
+        self.subscribe("to_recipient", address=TOKEN_B, topics=[None, [address_topic(RECIPIENT).hex()]])
+        self.w3.eth.logs = [make_log(10, 0, TOKEN_A, 1), make_log(10, 1, TOKEN_B, 2)]
+        self.process_new_blocks([make_block(10, [TOKEN_A, TOKEN_B])])
+
+        # The topic filtered subscription gets a filter of its own, the address-only subscriptions share one.
+        self.assertEqual(2, len(self.w3.eth.filters))
+        self.assertEqual([TRANSFER_TOPIC.hex(), None, [address_topic(RECIPIENT).hex()]],
+                         self.w3.eth.filters[0]["topics"])
+        self.assertEqual(TOKEN_B, self.w3.eth.filters[0]["address"])
+        self.assertEqual([TOKEN_A, TOKEN_B], self.w3.eth.filters[1]["address"])
+        self.assertEqual([[TRANSFER_TOPIC.hex()]], self.w3.eth.filters[1]["topics"])
+
+        # Both subscriptions to the same contract receive the event, and the log found by both filters is only
+        # delivered once per subscription.
+        self.assertEqual([1], [event["args"]["value"] for event in self.received["token_a"]])
+        self.assertEqual([1], [event["args"]["value"] for event in self.received["token_a_again"]])
+        self.assertEqual([2], [event["args"]["value"] for event in self.received["token_b"]])
+        self.assertEqual([2], [event["args"]["value"] for event in self.received["to_recipient"]])
+        self.assertEqual(RECIPIENT.lower(), self.received["token_b"][0]["args"]["to"].lower())
+
+    def test_duplicate_logs_across_batches(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.w3.eth.logs = [make_log(10, 0, TOKEN_A, 1)]
+        self.process_new_blocks([make_block(10, [TOKEN_A])])
+        # The same block is seen again, e.g. after the blocks watcher falls back to polling.
+        self.w3.eth.logs.append(make_log(11, 0, TOKEN_A, 2))
+        self.process_new_blocks([make_block(10, [TOKEN_A]), make_block(11, [TOKEN_A])])
+        self.assertEqual([1, 2], [event["args"]["value"] for event in self.received["token_a"]])
+
+    def test_get_logs_retries_after_errors(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.w3.eth.logs = [make_log(10, 0, TOKEN_A, 1)]
+        self.w3.eth.failures_left = 2
+        with patch("asyncio.sleep", side_effect=self.fast_sleep):
+            self.process_new_blocks([make_block(10, [TOKEN_A])])
+        self.assertEqual(3, len(self.w3.eth.filters))
+        self.assertEqual([1], [event["args"]["value"] for event in self.received["token_a"]])
+
+    def test_get_logs_gives_up_after_max_tries(self):
+        self.w3.eth.failures_left = 100
+        with patch("asyncio.sleep", side_effect=self.fast_sleep):
+            logs: List[AttributeDict] = self.ev_loop.run_until_complete(
+                self.coordinator._get_logs({"fromBlock": 1, "toBlock": 1}, max_tries=3)
+            )
+        self.assertEqual([], logs)
+        self.assertEqual(3, len(self.w3.eth.filters))
+
+    def test_fetch_logs_loop_survives_errors(self):
+        self.subscribe("token_a", address=TOKEN_A)
+        self.w3.eth.logs = [make_log(10, 0, TOKEN_A, 1)]
+        fetch_logs_task: asyncio.Task = self.ev_loop.create_task(self.coordinator.fetch_logs_loop())
+        # A block without a bloom filter makes processing the first batch fail.
+        self.coordinator.did_receive_new_blocks([AttributeDict({"number": 9})])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        self.coordinator.did_receive_new_blocks([make_block(10, [TOKEN_A])])
+        self.ev_loop.run_until_complete(asyncio.sleep(0.1))
+        fetch_logs_task.cancel()
+        self.assertEqual([1], [event["args"]["value"] for event in self.received["token_a"]])
+
+    @staticmethod
+    async def fast_sleep(delay: float):
+        pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import json
+from typing import (
+    AsyncIterable,
+    List,
+)
+import unittest
+
+from hummingbot.core.utils.message_decoder_pool import MessageDecoderPool
+
+
+def decode_ids(raw_frames: List[str]) -> List[int]:
+    return [json.loads(raw_frame)["id"] for raw_frame in raw_frames]
+
+
+def decode_or_fail(raw_frames: List[str]) -> List[int]:
+    if any("bad" in raw_frame for raw_frame in raw_frames):
+        raise ValueError("Undecodable frame.")
+    return decode_ids(raw_frames)
+
+
+async def raw_frame_stream(frames: List[str]) -> AsyncIterable[str]:
+    for index, frame in enumerate(frames):
+        yield frame
+        if index % 50 == 0:
+            await asyncio.sleep(0.001)
+
+
+class MessageDecoderPoolUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.pool: MessageDecoderPool = MessageDecoderPool(max_workers=2, max_batch_size=100)
+
+    def tearDown(self):
+        self.pool.stop()
+
+    async def collect_batches(self, frames: List[str], decode_function) -> List[List[int]]:
+        batches: List[List[int]] = []
+        async for batch in self.pool.decode_stream(raw_frame_stream(frames), decode_function):
+            batches.append(batch)
+        return batches
+
+    def test_batches_preserve_stream_order(self):
+        frames: List[str] = [json.dumps({"id": i}) for i in range(1000)]
+        batches: List[List[int]] = self.ev_loop.run_until_complete(self.collect_batches(frames, decode_ids))
+        self.assertEqual(list(range(1000)), [message_id for batch in batches for message_id in batch])
+        self.assertTrue(all(len(batch) <= 100 for batch in batches))
+
+    def test_only_bad_frames_are_dropped(self):
+        frames: List[str] = [json.dumps({"id": i}) if i not in (3, 150) else "bad" for i in range(300)]
+        batches: List[List[int]] = self.ev_loop.run_until_complete(self.collect_batches(frames, decode_or_fail))
+        self.assertEqual([i for i in range(300) if i not in (3, 150)],
+                         [message_id for batch in batches for message_id in batch])
+
+    def test_read_error_is_raised(self):
+        async def failing_stream() -> AsyncIterable[str]:
+            async for frame in raw_frame_stream([json.dumps({"id": i}) for i in range(10)]):
+                yield frame
+            raise ConnectionError("Websocket read failed.")
+
+        async def collect() -> List[int]:
+            message_ids: List[int] = []
+            with self.assertRaises(ConnectionError):
+                async for batch in self.pool.decode_stream(failing_stream(), decode_ids):
+                    message_ids.extend(batch)
+            return message_ids
+
+        # The frames read before the error are still delivered.
+        self.assertEqual(list(range(10)), self.ev_loop.run_until_complete(collect()))
+
+
+if __name__ == "__main__":
+    unittest.main()
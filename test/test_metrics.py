@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import time
+from typing import List
+import unittest
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.py_time_iterator import PyTimeIterator
+from hummingbot.core.utils.metrics import (
+    GaugeSample,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+class SlowIterator(PyTimeIterator):
+    def tick(self, timestamp: float):
+        time.sleep(0.002)
+
+
+class QueueOwner:
+    def __init__(self, size: int):
+        self.size: int = size
+
+    def collect(self) -> List[GaugeSample]:
+        return [("order_book_tracker_queue_size", {"exchange": "test", "stream": "diff"}, self.size)]
+
+
+class MetricsUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.metrics: MetricsRegistry = MetricsRegistry()
+        MetricsRegistry._mr_shared_instance = self.metrics
+
+    def tearDown(self):
+        MetricsRegistry._mr_shared_instance = None
+
+    def test_histogram(self):
+        histogram: Histogram = Histogram(buckets=(0.001, 0.01, 0.1))
+        for value in [0.0005] * 90 + [0.05] * 9 + [2.0]:
+            histogram.observe(value)
+        self.assertEqual(100, histogram.count)
+        self.assertAlmostEqual(0.0005 * 90 + 0.05 * 9 + 2.0, histogram.sum)
+        self.assertEqual(0.001, histogram.quantile(0.5))
+        self.assertEqual(0.1, histogram.quantile(0.99))
+        self.assertEqual(2.0, histogram.quantile(1.0))
+        self.assertEqual([(0.001, 90), (0.01, 90), (0.1, 99), (float("inf"), 100)], histogram.cumulative_counts())
+
+    def test_prometheus_text(self):
+        self.metrics.histogram("rest_request_duration_seconds", connector="binance").observe(0.02)
+        self.metrics.increment("rest_request_errors_total", connector="binance")
+        queue_owner: QueueOwner = QueueOwner(3)
+        self.metrics.add_collector(queue_owner.collect)
+
+        lines: List[str] = self.metrics.prometheus_text().split("\n")
+        self.assertIn("# TYPE rest_request_duration_seconds histogram", lines)
+        self.assertIn('rest_request_duration_seconds_bucket{connector="binance",le="+Inf"} 1', lines)
+        self.assertIn('rest_request_duration_seconds_count{connector="binance"} 1', lines)
+        self.assertIn('rest_request_errors_total{connector="binance"} 1.0', lines)
+        self.assertIn('order_book_tracker_queue_size{exchange="test",stream="diff"} 3.0', lines)
+
+        # Collectors don't keep their owners alive.
+        del queue_owner
+        self.assertEqual([], self.metrics.collect_gauges())
+
+    def test_clock_tick_metrics(self):
+        iterator: SlowIterator = SlowIterator()
+        clock: Clock = Clock(ClockMode.REALTIME, tick_size=0.05)
+        clock.add_iterator(iterator)
+        with clock:
+            asyncio.get_event_loop().run_until_complete(clock.run_til(time.time() + 0.3))
+
+        tick_histogram: Histogram = self.metrics.histogram("clock_tick_duration_seconds", iterator="SlowIterator")
+        self.assertGreater(tick_histogram.count, 0)
+        self.assertGreaterEqual(tick_histogram.max, 0.002)
+        lag_histogram: Histogram = self.metrics.histogram("event_loop_lag_seconds", clock="realtime")
+        self.assertEqual(tick_histogram.count, lag_histogram.count)
+        self.assertIn("SlowIterator", self.metrics.format_status())
+        # The clock only reports its iterators' event counts while it's running.
+        self.assertEqual([], self.metrics.collect_gauges())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from eth_utils import to_hex
+from hexbytes import HexBytes
+import logging; logging.basicConfig(level=logging.CRITICAL)
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+import ujson
+import unittest
+from unittest.mock import patch
+from web3.datastructures import AttributeDict
+from web3.exceptions import BlockNotFound
+
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    IncomingEthWatcherEvent,
+    NewBlocksWatcherEvent,
+)
+from hummingbot.wallet.ethereum.watcher.incoming_eth_watcher import IncomingEthWatcher
+from hummingbot.wallet.ethereum.watcher.new_blocks_watcher import NewBlocksWatcher
+
+WALLET = "0x" + "11" * 20
+OTHER = "0x" + "22" * 20
+real_sleep = asyncio.sleep
+
+
+async def fast_sleep(delay: float):
+    await real_sleep(0.001)
+
+
+def block_hash(number: int, fork: int = 0) -> HexBytes:
+    return HexBytes(bytes([fork]) + max(number, 0).to_bytes(31, byteorder="big"))
+
+
+class MockEth:
+    def __init__(self):
+        self.blocks_by_hash: Dict[HexBytes, AttributeDict] = {}
+        self.chain: List[AttributeDict] = []
+        self.get_block_calls: List[Any] = []
+
+    @property
+    def blockNumber(self) -> int:
+        return self.chain[-1].number
+
+    def add_block(self, number: int, fork: int = 0, parent_fork: int = 0,
+                  transactions: List[Dict[str, Any]] = (), canonical: bool = True) -> AttributeDict:
+        full_block: AttributeDict = AttributeDict({
+            "number": number,
+            "hash": block_hash(number, fork),
+            "parentHash": block_hash(number - 1, parent_fork),
+            "timestamp": 1000 + number,
+            "transactions": [AttributeDict(dict(t, hash=HexBytes(f"0x{number:04x}{i:060x}"),
+                                                blockHash=block_hash(number, fork)))
+                             for i, t in enumerate(transactions)],
+        })
+        self.blocks_by_hash[full_block.hash] = full_block
+        if canonical:
+            del self.chain[number:]
+            self.chain.append(full_block)
+        return full_block
+
+    def getBlock(self, block_identifier: Any, full_transactions: bool = False) -> AttributeDict:
+        self.get_block_calls.append(block_identifier)
+        if isinstance(block_identifier, int):
+            if block_identifier >= len(self.chain):
+                raise BlockNotFound(f"Block #{block_identifier} not found.")
+            full_block: AttributeDict = self.chain[block_identifier]
+        elif block_identifier in self.blocks_by_hash:
+            full_block: AttributeDict = self.blocks_by_hash[block_identifier]
+        else:
+            raise BlockNotFound(f"Block {block_identifier.hex()} not found.")
+        if full_transactions:
+            return full_block
+        return AttributeDict(dict(full_block, transactions=[t.hash for t in full_block.transactions]))
+
+    def _transactions(self, block_identifier: Any) -> List[AttributeDict]:
+        last_block: int = self.blockNumber if block_identifier == "latest" else block_identifier
+        return [t for b in self.chain[:last_block + 1] for t in b.transactions]
+
+    def getBalance(self, address: str, block_identifier: Any) -> int:
+        return sum(t.value if t.to == address else -t.value
+                   for t in self._transactions(block_identifier) if address in (t.to, t["from"]))
+
+    def getTransactionCount(self, address: str, block_identifier: Any) -> int:
+        return len([t for t in self._transactions(block_identifier) if t["from"] == address])
+
+    def getTransactionReceipt(self, transaction_hash: HexBytes) -> AttributeDict:
+        return AttributeDict({"transactionHash": transaction_hash, "status": 1})
+
+
+class MockWeb3:
+    def __init__(self):
+        self.eth: MockEth = MockEth()
+
+
+class MockWebsocket:
+    def __init__(self, accept_subscription: bool = True):
+        self.accept_subscription: bool = accept_subscription
+        self.messages: asyncio.Queue = asyncio.Queue()
+        self.subscribed: bool = False
+        self.closed: bool = False
+
+    async def send(self, raw_message: str):
+        message: Dict[str, Any] = ujson.loads(raw_message)
+        if message["method"] == "eth_subscribe":
+            self.subscribed = self.accept_subscription
+            response: Dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+            if self.accept_subscription:
+                response["result"] = "0x1"
+            else:
+                response["error"] = {"code": -32601, "message": "Subscriptions are not supported."}
+            self.messages.put_nowait(ujson.dumps(response))
+
+    def push_header(self, block: AttributeDict):
+        self.messages.put_nowait(ujson.dumps({
+            "jsonrpc": "2.0",
+            "method": "eth_subscription",
+            "params": {"subscription": "0x1", "result": {
+                "number": hex(block.number),
+                "hash": to_hex(block.hash),
+                "parentHash": to_hex(block.parentHash),
+                "timestamp": hex(block.timestamp),
+            }}
+        }))
+
+    def drop_connection(self):
+        self.messages.put_nowait(None)
+
+    async def recv(self) -> str:
+        raw_message: Optional[str] = await self.messages.get()
+        if raw_message is None:
+            raise OSError("Connection reset by peer.")
+        return raw_message
+
+    async def close(self):
+        self.closed = True
+
+
+class NewBlocksWatcherUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.w3: MockWeb3 = MockWeb3()
+        for number in range(3):
+            self.w3.eth.add_block(number)
+        self.websockets: List[Any] = []
+        self.blocks_logger: EventLogger = EventLogger()
+
+    def create_watcher(self, websocket_url: Optional[str] = None, block_window_size: int = 30) -> NewBlocksWatcher:
+        watcher: NewBlocksWatcher = NewBlocksWatcher(self.w3, websocket_url, block_window_size)
+        watcher.WS_RETRY_INTERVAL = 0.3
+        watcher.add_listener(NewBlocksWatcherEvent.NewBlocks, self.blocks_logger)
+        return watcher
+
+    async def connect(self, uri: str) -> MockWebsocket:
+        websocket: Any = self.websockets.pop(0)
+        if isinstance(websocket, Exception):
+            raise websocket
+        return websocket
+
+    def run_for(self, seconds: float):
+        self.ev_loop.run_until_complete(real_sleep(seconds))
+
+    def emitted_blocks(self) -> List[List[int]]:
+        return [[block.number for block in new_blocks] for new_blocks in self.blocks_logger.event_log]
+
+    def test_websocket_and_polling_switch(self):
+        websocket: MockWebsocket = MockWebsocket()
+        self.websockets = [OSError("Connection refused."), websocket]
+        watcher: NewBlocksWatcher = self.create_watcher("ws://localhost:8546")
+        with patch("websockets.connect", side_effect=self.connect), patch("asyncio.sleep", side_effect=fast_sleep):
+            try:
+                self.ev_loop.run_until_complete(watcher.start_network())
+                # The websocket can't connect, so the watcher polls until it tries again.
+                self.run_for(0.1)
+                self.assertFalse(websocket.subscribed)
+                self.assertEqual([[2]], self.emitted_blocks())
+
+                self.run_for(0.4)
+                self.assertTrue(websocket.subscribed)
+                polled_blocks: int = len(self.w3.eth.get_block_calls)
+                websocket.push_header(self.w3.eth.add_block(3))
+                self.run_for(0.1)
+                self.assertEqual([[2], [3]], self.emitted_blocks())
+                # Headers are emitted without fetching the block.
+                self.assertEqual(polled_blocks, len(self.w3.eth.get_block_calls))
+
+                # Polling resumes after the last block seen over the websocket.
+                websocket.drop_connection()
+                self.run_for(0.1)
+                self.assertTrue(websocket.closed)
+                self.w3.eth.add_block(4)
+                self.run_for(0.1)
+                self.assertEqual([[2], [3], [4]], self.emitted_blocks())
+            finally:
+                self.ev_loop.run_until_complete(watcher.stop_network())
+
+    def test_rejected_subscription_falls_back_to_polling(self):
+        websocket: MockWebsocket = MockWebsocket(accept_subscription=False)
+        self.websockets = [websocket]
+        watcher: NewBlocksWatcher = self.create_watcher("ws://localhost:8546")
+        with patch("websockets.connect", side_effect=self.connect), patch("asyncio.sleep", side_effect=fast_sleep):
+            try:
+                self.ev_loop.run_until_complete(watcher.start_network())
+                self.w3.eth.add_block(3)
+                self.run_for(0.1)
+                self.assertTrue(websocket.closed)
+                self.assertEqual([[2], [3]], self.emitted_blocks())
+            finally:
+                self.ev_loop.run_until_complete(watcher.stop_network())
+
+    def process_blocks(self, watcher: NewBlocksWatcher, blocks: List[AttributeDict]):
+        for block in blocks:
+            self.ev_loop.run_until_complete(watcher._process_incoming_block(block))
+
+    def test_reorg_within_window(self):
+        watcher: NewBlocksWatcher = self.create_watcher(block_window_size=5)
+        self.process_blocks(watcher, [self.w3.eth.add_block(number) for number in range(3, 9)])
+        self.w3.eth.add_block(7, fork=1)
+        self.w3.eth.add_block(8, fork=1, parent_fork=1)
+        with patch.object(NewBlocksWatcher.logger(), "warning") as warning:
+            self.process_blocks(watcher, [self.w3.eth.add_block(9, fork=1, parent_fork=1)])
+        warning.assert_not_called()
+        self.assertEqual([7, 8, 9], self.emitted_blocks()[-1])
+        self.assertEqual([block_hash(7, 1), block_hash(8, 1), block_hash(9, 1)],
+                         [block.hash for block in self.blocks_logger.event_log[-1]])
+        self.assertEqual(9, watcher.block_number)
+
+    def test_reorg_deeper_than_window(self):
+        watcher: NewBlocksWatcher = self.create_watcher(block_window_size=5)
+        self.process_blocks(watcher, [self.w3.eth.add_block(number) for number in range(3, 9)])
+        self.w3.eth.add_block(2, fork=1)
+        for number in range(3, 9):
+            self.w3.eth.add_block(number, fork=1, parent_fork=1)
+        with patch.object(NewBlocksWatcher.logger(), "warning") as warning:
+            self.process_blocks(watcher, [self.w3.eth.add_block(9, fork=1, parent_fork=1)])
+        # The walk back stops at the window size, instead of going all the way back to the fork at block #2.
+        warning.assert_called_once()
+        self.assertEqual([4, 5, 6, 7, 8, 9], self.emitted_blocks()[-1])
+        self.assertTrue(all(block.hash == block_hash(block.number, 1) for block in self.blocks_logger.event_log[-1]))
+
+        # The watcher carries on from the new chain.
+        self.process_blocks(watcher, [self.w3.eth.add_block(10, parent_fork=1)])
+        self.assertEqual([10], self.emitted_blocks()[-1])
+
+
+class IncomingEthWatcherUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.w3: MockWeb3 = MockWeb3()
+        self.w3.eth.add_block(0, transactions=[{"from": OTHER, "to": WALLET, "value": 10}])
+        self.blocks_watcher: NewBlocksWatcher = NewBlocksWatcher(self.w3)
+        self.watcher: IncomingEthWatcher = IncomingEthWatcher(self.w3, self.blocks_watcher, [WALLET])
+        self.ev_loop.run_until_complete(self.watcher.start_network())
+        self.eth_logger: EventLogger = EventLogger()
+        self.watcher.add_listener(IncomingEthWatcherEvent.ReceivedEther, self.eth_logger)
+
+    def tearDown(self):
+        self.ev_loop.run_until_complete(self.watcher.stop_network())
+
+    def check_blocks(self, blocks: List[AttributeDict]):
+        self.w3.eth.get_block_calls.clear()
+        headers: List[AttributeDict] = [self.w3.eth.getBlock(block.hash) for block in blocks]
+        self.w3.eth.get_block_calls.clear()
+        self.ev_loop.run_until_complete(self.watcher.check_incoming_eth(headers))
+
+    def test_full_transactions_not_requested(self):
+        self.assertFalse(self.blocks_watcher.full_transactions)
+
+    def test_unchanged_account_skips_full_blocks(self):
+        self.check_blocks([self.w3.eth.add_block(1, transactions=[{"from": OTHER, "to": OTHER, "value": 5}]),
+                           self.w3.eth.add_block(2)])
+        self.assertEqual([], self.w3.eth.get_block_calls)
+        self.assertEqual([], self.eth_logger.event_log)
+
+    def test_incoming_eth(self):
+        blocks: List[AttributeDict] = [self.w3.eth.add_block(1),
+                                       self.w3.eth.add_block(2, transactions=[{"from": OTHER, "to": WALLET,
+                                                                               "value": 3}])]
+        self.check_blocks(blocks)
+        # Block #1 has no transactions, so there's nothing to fetch for it.
+        self.assertEqual([blocks[1].hash], self.w3.eth.get_block_calls)
+        self.assertEqual([(3, OTHER, WALLET, 1002)],
+                         [(event.raw_amount_received, event.from_address, event.to_address, event.timestamp)
+                          for event in self.eth_logger.event_log])
+
+        # The next batch is compared with the account after the transfer.
+        self.check_blocks([self.w3.eth.add_block(3)])
+        self.assertEqual([], self.w3.eth.get_block_calls)
+        self.assertEqual(1, len(self.eth_logger.event_log))
+
+    def test_incoming_eth_with_unchanged_balance(self):
+        # The wallet sends out what it receives in the same block, so only its nonce shows the change.
+        self.check_blocks([self.w3.eth.add_block(1, transactions=[{"from": OTHER, "to": WALLET, "value": 4},
+                                                                  {"from": WALLET, "to": OTHER, "value": 4}])])
+        self.assertEqual([4], [event.raw_amount_received for event in self.eth_logger.event_log])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import math
+import random
+import statistics
+import time
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_features import OrderBookFeatures
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.event.events import (
+    OrderBookTradeEvent,
+    TradeType,
+)
+from hummingbot.core.data_type.rolling_statistics import (
+    RollingStats,
+    WindowedExtrema,
+)
+
+
+class RollingStatisticsUnitTest(unittest.TestCase):
+    def test_windowed_extrema_by_count(self):
+        random.seed(42)
+        values = [random.uniform(0, 100) for _ in range(500)]
+        extrema: WindowedExtrema = WindowedExtrema(max_length=12)
+        for i, value in enumerate(values):
+            extrema.add(i, value)
+            window = values[max(0, i - 11):i + 1]
+            self.assertEqual(max(window), extrema.max)
+            self.assertEqual(min(window), extrema.min)
+        self.assertEqual(12, len(extrema))
+
+    def test_windowed_extrema_nan_and_age(self):
+        extrema: WindowedExtrema = WindowedExtrema(max_age=10)
+        extrema.add(0, Decimal("5"))
+        extrema.add(1, Decimal("nan"))
+        extrema.add(2, Decimal("3"))
+        self.assertEqual(1, extrema.nan_count)
+        self.assertEqual(Decimal("5"), extrema.max)
+        self.assertEqual(Decimal("3"), extrema.min)
+        extrema.evict(11)
+        self.assertEqual(0, extrema.nan_count)
+        self.assertEqual(Decimal("3"), extrema.max)
+        extrema.evict(20)
+        self.assertEqual(0, len(extrema))
+        self.assertIsNone(extrema.max)
+
+    def test_rolling_stats(self):
+        random.seed(7)
+        values = [random.gauss(10, 2) for _ in range(300)]
+        stats: RollingStats = RollingStats(max_length=50)
+        for i, value in enumerate(values):
+            stats.add(i, value)
+        window = values[-50:]
+        self.assertEqual(50, stats.count)
+        self.assertAlmostEqual(statistics.mean(window), stats.mean)
+        self.assertAlmostEqual(statistics.variance(window), stats.variance)
+        self.assertAlmostEqual(sum(window), stats.sum)
+
+
+class OrderBookFeaturesUnitTest(unittest.TestCase):
+    def test_features(self):
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(99.0, 3.0, 1), OrderBookRow(98.0, 5.0, 1)],
+                                  [OrderBookRow(101.0, 1.0, 1), OrderBookRow(102.0, 1.0, 1)],
+                                  1)
+        features: OrderBookFeatures = OrderBookFeatures(window=10.0, sample_interval=1.0, depth_levels=2)
+        features.update_from_order_book(order_book, 1000.0)
+        self.assertEqual(100.0, features.mid_price)
+        self.assertEqual(2.0, features.spread)
+        self.assertAlmostEqual((99.0 * 1.0 + 101.0 * 3.0) / 4.0, features.microprice)
+        self.assertAlmostEqual((8.0 - 2.0) / 10.0, features.depth_imbalance)
+
+        order_book.apply_diffs([OrderBookRow(100.0, 1.0, 2)], [], 2)
+        features.update_from_order_book(order_book, 1001.0)
+        self.assertEqual(100.5, features.mid_price)
+        self.assertEqual(100.5, features.mid_price_max)
+        self.assertEqual(100.0, features.mid_price_min)
+        self.assertAlmostEqual(abs(math.log(100.5 / 100.0)), features.realized_volatility)
+
+        features.add_trade(1001.0, 101.0, 2.0, True)
+        features.add_trade(1001.5, 100.0, 1.0, False)
+        self.assertEqual(2, features.trade_count)
+        self.assertAlmostEqual((2.0 - 1.0) / 3.0, features.trade_flow_imbalance)
+        self.assertAlmostEqual((101.0 * 2.0 + 100.0) / 3.0, features.trade_vwap)
+
+        # Everything but the latest sample has left the window.
+        features.update_from_order_book(order_book, 1011.6)
+        self.assertEqual(100.5, features.mid_price_min)
+        self.assertEqual(0, features.trade_count)
+
+
+def make_order_book() -> OrderBook:
+    order_book: OrderBook = OrderBook()
+    order_book.apply_snapshot([OrderBookRow(99.0, 1.0, 1)], [OrderBookRow(101.0, 1.0, 1)], 1)
+    return order_book
+
+
+class MockDataSource:
+    def __init__(self, trading_pairs: List[str]):
+        self._trading_pairs: List[str] = trading_pairs
+
+    async def get_trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {trading_pair: OrderBookTrackerEntry(trading_pair, time.time(), make_order_book())
+                for trading_pair in self._trading_pairs}
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    ORDER_BOOK_FEATURES_SAMPLE_INTERVAL = 0.05
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__()
+        self._data_source: MockDataSource = MockDataSource(trading_pairs)
+
+    @property
+    def data_source(self) -> MockDataSource:
+        return self._data_source
+
+
+class OrderBookTrackerFeaturesUnitTest(unittest.TestCase):
+    trading_pair = "ETH-USDT"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.tracker: MockOrderBookTracker = MockOrderBookTracker([self.trading_pair])
+        self.tracker.start()
+        self.run_for(0.1)
+
+    def tearDown(self):
+        self.tracker.stop()
+        self.run_for(0.01)
+
+    def run_for(self, seconds: float):
+        self.ev_loop.run_until_complete(asyncio.sleep(seconds))
+
+    def apply_trade(self, order_book: OrderBook):
+        order_book.apply_trade(OrderBookTradeEvent(self.trading_pair, time.time(), TradeType.BUY, 100.0, 1.0))
+
+    def test_sampler_only_runs_while_tracking(self):
+        features: OrderBookFeatures = self.tracker.get_order_book_features(self.trading_pair)
+        self.assertIsNotNone(features)
+        self.assertIsNotNone(self.tracker._order_book_features_task)
+        self.run_for(0.01)
+
+        self.tracker.stop()
+        self.assertIsNone(self.tracker._order_book_features_task)
+        # Asking for the features of a stopped tracker doesn't start the sampler again.
+        self.assertIs(features, self.tracker.get_order_book_features(self.trading_pair))
+        self.assertIsNone(self.tracker._order_book_features_task)
+
+        self.tracker.start()
+        self.assertIsNotNone(self.tracker._order_book_features_task)
+        self.run_for(0.01)
+
+    def test_trade_forwarder_follows_replaced_order_book(self):
+        features: OrderBookFeatures = self.tracker.get_order_book_features(self.trading_pair)
+        old_order_book: OrderBook = self.tracker.order_books[self.trading_pair]
+        self.apply_trade(old_order_book)
+        self.assertEqual(1, features.trade_count)
+
+        # The trading pair starts being tracked again, with a new order book.
+        self.tracker._tracking_tasks[self.trading_pair].cancel()
+        new_order_book: OrderBook = make_order_book()
+        self.tracker._start_tracking(self.trading_pair, new_order_book)
+        self.apply_trade(new_order_book)
+        self.apply_trade(old_order_book)
+        self.assertEqual(2, features.trade_count)
+
+        # Order books replaced outside of _start_tracking() are picked up by the sampler.
+        newest_order_book: OrderBook = make_order_book()
+        self.tracker._order_books[self.trading_pair] = newest_order_book
+        self.run_for(0.1)
+        self.apply_trade(newest_order_book)
+        self.apply_trade(new_order_book)
+        self.assertEqual(3, features.trade_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from collections import deque
+from typing import (
+    Deque,
+    List,
+)
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+
+TRADING_PAIR = "ETHBTC"
+
+
+def snapshot_message(update_id: int, bid_price: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+        "trading_pair": TRADING_PAIR,
+        "update_id": update_id,
+        "bids": [[bid_price, 1.0]],
+        "asks": [[bid_price + 1, 1.0]],
+    }, timestamp=1.0)
+
+
+def diff_message(first_update_id: int, update_id: int, bid_price: float) -> OrderBookMessage:
+    return OrderBookMessage(OrderBookMessageType.DIFF, {
+        "trading_pair": TRADING_PAIR,
+        "first_update_id": first_update_id,
+        "update_id": update_id,
+        "bids": [[bid_price, float(update_id)]],
+        "asks": [],
+    }, timestamp=1.0)
+
+
+class MockDataSource:
+    def __init__(self):
+        self.snapshot_messages: List[OrderBookMessage] = []
+        self.snapshot_requests: int = 0
+
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_requests += 1
+        return self.snapshot_messages.pop(0)
+
+
+class OrderBookResyncUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.data_source: MockDataSource = MockDataSource()
+        self.tracker: BinanceOrderBookTracker = BinanceOrderBookTracker(trading_pairs=[TRADING_PAIR])
+        self.tracker._data_source = self.data_source
+        self.order_book: OrderBook = OrderBook()
+        self.order_book.apply_snapshot(snapshot_message(100, 10.0).bids, snapshot_message(100, 10.0).asks, 100)
+        self.tracker._order_books[TRADING_PAIR] = self.order_book
+        self.tracker._tracking_message_queues[TRADING_PAIR] = asyncio.Queue()
+        self.past_diffs_window: Deque[OrderBookMessage] = deque()
+
+    def tearDown(self):
+        self.tracker.stop()
+
+    def apply_diff(self, message: OrderBookMessage) -> bool:
+        return self.tracker._apply_diff_message(TRADING_PAIR, self.order_book, message, self.past_diffs_window)
+
+    def run_resync(self):
+        # Fetches the resync snapshot, and applies it the way the pair's tracking task would.
+        self.ev_loop.run_until_complete(self.tracker._resync_tasks[TRADING_PAIR])
+        message: OrderBookMessage = self.tracker._tracking_message_queues[TRADING_PAIR].get_nowait()
+        self.tracker._apply_snapshot_message(TRADING_PAIR, self.order_book, message, self.past_diffs_window)
+
+    def test_diffs_in_sequence(self):
+        self.assertTrue(self.apply_diff(diff_message(95, 101, 9.0)))
+        self.assertTrue(self.apply_diff(diff_message(102, 104, 8.0)))
+        self.assertEqual(104, self.order_book.last_diff_uid)
+        self.assertEqual({}, self.tracker.resync_stats)
+
+    def test_stale_and_duplicate_diffs_are_dropped(self):
+        self.assertTrue(self.apply_diff(diff_message(101, 103, 9.0)))
+        self.assertFalse(self.apply_diff(diff_message(101, 103, 9.0)))
+        self.assertFalse(self.apply_diff(diff_message(98, 102, 7.0)))
+        self.assertEqual(103, self.order_book.last_diff_uid)
+        self.assertEqual([10.0, 9.0], [row.price for row in self.order_book.bid_entries()])
+        self.assertNotIn(TRADING_PAIR, self.tracker.resync_stats)
+
+    def test_gap_detection_and_resync(self):
+        self.assertFalse(self.apply_diff(diff_message(105, 106, 9.0)))
+        self.assertEqual(1, self.tracker.resync_stats[TRADING_PAIR]["sequence_gaps"])
+        self.assertTrue(self.tracker.resync_stats[TRADING_PAIR]["resync_pending"])
+        # Diffs that arrive while the resync is pending are buffered, not applied.
+        self.assertFalse(self.apply_diff(diff_message(107, 107, 8.0)))
+        self.assertEqual(100, max(self.order_book.snapshot_uid, self.order_book.last_diff_uid))
+
+        self.data_source.snapshot_messages.append(snapshot_message(105, 5.0))
+        self.run_resync()
+        self.assertEqual(1, self.data_source.snapshot_requests)
+        self.assertEqual(1, self.tracker.resync_stats[TRADING_PAIR]["resyncs"])
+        self.assertFalse(self.tracker.resync_stats[TRADING_PAIR]["resync_pending"])
+        self.assertEqual(107, self.order_book.last_diff_uid)
+        self.assertEqual([9.0, 8.0, 5.0], [row.price for row in self.order_book.bid_entries()])
+
+    def test_buffered_replay_drops_old_and_duplicate_diffs(self):
+        self.assertFalse(self.apply_diff(diff_message(105, 106, 9.0)))
+        for message in [diff_message(100, 104, 6.0),
+                        diff_message(107, 108, 8.0),
+                        diff_message(107, 108, 8.0),
+                        diff_message(105, 106, 9.0),
+                        diff_message(109, 110, 7.0)]:
+            self.apply_diff(message)
+
+        self.data_source.snapshot_messages.append(snapshot_message(106, 5.0))
+        self.run_resync()
+        self.assertEqual(110, self.order_book.last_diff_uid)
+        self.assertEqual([8.0, 7.0, 5.0], [row.price for row in self.order_book.bid_entries()])
+        self.assertEqual([108, 110], [message.update_id for message in self.past_diffs_window])
+
+    def test_resync_snapshot_older_than_gap(self):
+        self.assertFalse(self.apply_diff(diff_message(105, 106, 9.0)))
+        self.assertFalse(self.apply_diff(diff_message(107, 108, 8.0)))
+
+        # The snapshot is still before the first buffered diff, so a second resync is needed.
+        self.data_source.snapshot_messages.append(snapshot_message(102, 5.0))
+        self.run_resync()
+        self.assertEqual(2, self.tracker.resync_stats[TRADING_PAIR]["sequence_gaps"])
+        self.assertTrue(self.tracker.resync_stats[TRADING_PAIR]["resync_pending"])
+
+        self.data_source.snapshot_messages.append(snapshot_message(106, 4.0))
+        self.run_resync()
+        self.assertEqual(1, self.tracker.resync_stats[TRADING_PAIR]["resyncs"])
+        self.assertEqual(108, self.order_book.last_diff_uid)
+        self.assertEqual([8.0, 4.0], [row.price for row in self.order_book.bid_entries()])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    TradeType,
+)
+
+
+def make_trade(i: int) -> OrderBookTradeEvent:
+    return OrderBookTradeEvent("ETH-USDT", 1000.0 + i, TradeType.BUY if i % 2 else TradeType.SELL, 100.0 + i, 1.0)
+
+
+class OrderBookTradeBatchUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        self.order_book: OrderBook = OrderBook()
+        self.trade_logger: EventLogger = EventLogger()
+        self.batch_logger: EventLogger = EventLogger()
+        self.order_book.add_listener(OrderBookEvent.TradeEvent, self.trade_logger)
+        self.order_book.add_listener(OrderBookEvent.TradeBatchEvent, self.batch_logger)
+
+    async def apply_trades(self, count: int):
+        batch_count: int = len(self.batch_logger.event_log)
+        for i in range(count):
+            self.order_book.apply_trade(make_trade(i))
+        # Trades applied in the same event loop iteration are delivered together, on the next iteration.
+        self.assertEqual(batch_count, len(self.batch_logger.event_log))
+        await asyncio.sleep(0)
+
+    def test_trades_are_batched_per_loop_iteration(self):
+        self.ev_loop.run_until_complete(self.apply_trades(5))
+        self.assertEqual(5, len(self.trade_logger.event_log))
+        self.assertEqual(1, len(self.batch_logger.event_log))
+        batch = self.batch_logger.event_log[0]
+        self.assertEqual("ETH-USDT", batch.trading_pair)
+        self.assertEqual([100.0, 101.0, 102.0, 103.0, 104.0], list(batch.trades["price"]))
+        self.assertEqual([False, True, False, True, False], list(batch.trades["is_buy"]))
+
+        self.ev_loop.run_until_complete(self.apply_trades(2))
+        self.assertEqual(2, len(self.batch_logger.event_log))
+        self.assertEqual(2, len(self.batch_logger.event_log[1].trades))
+
+    def test_trades_without_running_loop(self):
+        self.order_book.apply_trade(make_trade(0))
+        self.assertEqual(1, len(self.batch_logger.event_log))
+        self.assertEqual(1, len(self.batch_logger.event_log[0].trades))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+from typing import (
+    List,
+    Tuple,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.market.binance.binance_market import BinanceMarket
+from hummingbot.market.trading_rule import TradingRule
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.data_types import Proposal
+from hummingbot.strategy.pure_market_making.order_ladder import (
+    calculate_ladder_prices,
+    calculate_ladder_sizes,
+)
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+
+class OrderLadderUnitTest(unittest.TestCase):
+    def test_ladder_prices(self):
+        mid_price: Decimal = Decimal("100")
+        self.assertEqual([Decimal("99"), Decimal("98"), Decimal("97")],
+                         calculate_ladder_prices(mid_price, Decimal("0.01"), Decimal("0.01"), 3, True))
+        self.assertEqual([Decimal("102"), Decimal("102.5")],
+                         calculate_ladder_prices(mid_price, Decimal("0.02"), Decimal("0.005"), 2, False))
+        self.assertEqual([], calculate_ladder_prices(mid_price, Decimal("0.01"), Decimal("0.01"), 0, True))
+
+    def test_ladder_prices_match_per_level_calculation(self):
+        mid_price: Decimal = Decimal("0.0036271")
+        bid_spread: Decimal = Decimal("0.0037")
+        level_spread: Decimal = Decimal("0.0011")
+        prices = calculate_ladder_prices(mid_price, bid_spread, level_spread, 25, True)
+        for level, price in enumerate(prices):
+            self.assertEqual(mid_price * (Decimal("1") - bid_spread - (level * level_spread)), price)
+
+    def test_ladder_sizes(self):
+        self.assertEqual([Decimal("1"), Decimal("1.5"), Decimal("2")],
+                         calculate_ladder_sizes(Decimal("1"), Decimal("0.5"), 3))
+        self.assertEqual([Decimal("3"), Decimal("2"), Decimal("1"), Decimal("0")],
+                         calculate_ladder_sizes(Decimal("3"), Decimal("-1"), 4))
+
+
+class OrderLadderQuantizationUnitTest(unittest.TestCase):
+    """
+    Quantizing a whole ladder in one call must give the same prices and sizes as quantizing each order on its own.
+    """
+    trading_pair = "ETHUSDT"
+
+    def setUp(self):
+        # The binance client pings the exchange when it is created.
+        with patch("binance.client.Client.ping"):
+            self.market: BinanceMarket = BinanceMarket("api_key", "api_secret", trading_pairs=[self.trading_pair])
+        self.market.trading_rules[self.trading_pair] = TradingRule(self.trading_pair,
+                                                                   min_order_size=Decimal("0.01"),
+                                                                   min_price_increment=Decimal("0.01"),
+                                                                   min_base_amount_increment=Decimal("0.001"),
+                                                                   min_notional_size=Decimal("10"))
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(199.5, 10, 1)], [OrderBookRow(200.5, 10, 1)], 1)
+        self.market.order_books[self.trading_pair] = order_book
+
+    def test_quantize_order_prices(self):
+        prices: List[Decimal] = [Decimal("199.004"), Decimal("199.005"), Decimal("0.0049"), Decimal("0"),
+                                 Decimal("1234.5678"), Decimal("nan")]
+        expected: List[Decimal] = [self.market.quantize_order_price(self.trading_pair, price) for price in prices]
+        # Compared as strings, since NaN isn't equal to itself.
+        self.assertEqual([str(price) for price in expected],
+                         [str(price) for price in self.market.quantize_order_prices(self.trading_pair, prices)])
+
+    def test_quantize_order_amounts(self):
+        # The current price is the top bid, 199.5. The minimum notional size is 10 * 1.01 = 10.1.
+        amounts: List[Decimal] = [Decimal("0.009"), Decimal("0.0109"), Decimal("0.0505"), Decimal("0.0519"),
+                                  Decimal("0.0519"), Decimal("0.1"), Decimal("1.23456")]
+        prices: List[Decimal] = [Decimal("2000"), Decimal("2000"), Decimal("0"), Decimal("0"),
+                                 Decimal("150"), Decimal("101"), Decimal("0")]
+
+        expected: List[Decimal] = [self.market.quantize_order_amount(self.trading_pair, amount) for amount in amounts]
+        self.assertEqual(expected, self.market.quantize_order_amounts(self.trading_pair, amounts))
+        self.assertEqual([Decimal("0"), Decimal("0"), Decimal("0"), Decimal("0.051"), Decimal("0.051"),
+                          Decimal("0.100"), Decimal("1.234")], expected)
+
+        expected = [self.market.quantize_order_amount(self.trading_pair, amount, price)
+                    for amount, price in zip(amounts, prices)]
+        self.assertEqual(expected, self.market.quantize_order_amounts(self.trading_pair, amounts, prices))
+        # Below the minimum order size, below and above the minimum notional size at the current price, and below
+        # and exactly at the minimum notional size at the order price.
+        self.assertEqual([Decimal("0"), Decimal("0.010"), Decimal("0"), Decimal("0.051"), Decimal("0"),
+                          Decimal("0.100"), Decimal("1.234")], expected)
+
+    def test_base_proposal_matches_per_level_calculation(self):
+        strategy: PureMarketMakingStrategy = PureMarketMakingStrategy(
+            MarketTradingPairTuple(self.market, self.trading_pair, "ETH", "USDT"),
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.0137"),
+            order_amount=Decimal("0.2"),
+            order_level_spread=Decimal("0.0043"),
+            order_level_amount=Decimal("-0.0377"),
+        )
+        strategy.buy_levels = 6
+        strategy.sell_levels = 3
+
+        # The ladder as the strategy used to build it, one level at a time.
+        mid_price: Decimal = strategy.get_mid_price()
+        buys: List[Tuple[Decimal, Decimal]] = []
+        sells: List[Tuple[Decimal, Decimal]] = []
+        for level in range(0, strategy.buy_levels):
+            price = mid_price * (Decimal("1") - strategy.bid_spread - (level * strategy.order_level_spread))
+            price = self.market.quantize_order_price(self.trading_pair, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = self.market.quantize_order_amount(self.trading_pair, size)
+            if size > 0:
+                buys.append((price, size))
+        for level in range(0, strategy.sell_levels):
+            price = mid_price * (Decimal("1") + strategy.ask_spread + (level * strategy.order_level_spread))
+            price = self.market.quantize_order_price(self.trading_pair, price)
+            size = strategy.order_amount + (strategy.order_level_amount * level)
+            size = self.market.quantize_order_amount(self.trading_pair, size)
+            if size > 0:
+                sells.append((price, size))
+
+        proposal: Proposal = strategy.create_base_proposal()
+        self.assertEqual(buys, [(buy.price, buy.size) for buy in proposal.buys])
+        self.assertEqual(sells, [(sell.price, sell.size) for sell in proposal.sells])
+        # The two deepest buy levels are under the minimum order size and notional size, and are left out.
+        self.assertEqual(4, len(proposal.buys))
+        self.assertEqual(3, len(proposal.sells))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from typing import (
+    Any,
+    Dict,
+    List,
+    Tuple,
+)
+import unittest
+
+from hummingbot.wallet.ethereum.zero_ex.order_signing_batch import OrderSigningBatch
+
+
+class OrderSigningBatchUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.calls: List[List[Dict[str, Any]]] = []
+        self.batch: OrderSigningBatch = OrderSigningBatch(self.hash_and_sign_orders)
+        self.fail: bool = False
+
+    async def hash_and_sign_orders(self, unsigned_orders: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        self.calls.append(unsigned_orders)
+        if self.fail:
+            raise ValueError("Wallet locked.")
+        return [(f"hash-{order['salt']}", f"signature-{order['salt']}") for order in unsigned_orders]
+
+    async def submit_order(self, order_id: str, salt: int, delay: float) -> Tuple[str, str]:
+        try:
+            # Stands in for the work done before the order is signed, e.g. requesting it from the relayer.
+            await asyncio.sleep(delay)
+            return await self.batch.hash_and_sign_order(order_id, {"salt": salt})
+        finally:
+            self.batch.remove(order_id)
+
+    async def submit_orders(self, *orders: Tuple[str, int, float]) -> List[Any]:
+        for order_id, _, _ in orders:
+            self.batch.add(order_id)
+        return await asyncio.gather(*[self.submit_order(*order) for order in orders], return_exceptions=True)
+
+    def test_orders_are_signed_in_one_call(self):
+        results: List[Any] = self.ev_loop.run_until_complete(self.submit_orders(("buy-1", 1, 0.03),
+                                                                                ("buy-2", 2, 0),
+                                                                                ("sell-3", 3, 0.01)))
+        self.assertEqual([("hash-1", "signature-1"), ("hash-2", "signature-2"), ("hash-3", "signature-3")], results)
+        self.assertEqual([[{"salt": 2}, {"salt": 3}, {"salt": 1}]], self.calls)
+
+    def test_removed_order_does_not_hold_up_batch(self):
+        async def failed_order():
+            # The order fails validation before it is signed.
+            self.batch.remove("sell-2")
+
+        self.batch.add("sell-2")
+        results: List[Any] = self.ev_loop.run_until_complete(asyncio.gather(
+            self.submit_orders(("buy-1", 1, 0.01)),
+            failed_order()
+        ))
+        self.assertEqual([[("hash-1", "signature-1")], None], results)
+        self.assertEqual([[{"salt": 1}]], self.calls)
+
+    def test_signing_error_fails_every_order(self):
+        self.fail = True
+        results: List[Any] = self.ev_loop.run_until_complete(self.submit_orders(("buy-1", 1, 0), ("buy-2", 2, 0)))
+        self.assertTrue(all(isinstance(result, ValueError) for result in results))
+        self.assertEqual(1, len(self.calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+from os.path import join, realpath
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from decimal import Decimal
+import logging; logging.basicConfig(level=logging.ERROR)
+import pandas as pd
+import unittest
+
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingsim.backtest.backtest_market import BacktestMarket
+from hummingsim.backtest.market import QuantizationParams
+from hummingsim.backtest.mock_order_book_loader import MockOrderBookLoader
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.strategy.pure_market_making.multi_pair_pure_market_making import MultiPairPureMarketMakingStrategy
+
+
+class MultiPairPMMUnitTest(unittest.TestCase):
+    start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
+    end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
+    start_timestamp: float = start.timestamp()
+    end_timestamp: float = end.timestamp()
+    trading_pairs = ["HBOT-ETH", "COINALPHA-ETH"]
+
+    def setUp(self):
+        self.clock_tick_size = 1
+        self.clock: Clock = Clock(ClockMode.BACKTEST, self.clock_tick_size, self.start_timestamp, self.end_timestamp)
+        self.market: BacktestMarket = BacktestMarket()
+        self.market_infos = []
+        for trading_pair in self.trading_pairs:
+            base_asset, quote_asset = trading_pair.split("-")
+            book_data: MockOrderBookLoader = MockOrderBookLoader(trading_pair, base_asset, quote_asset)
+            book_data.set_balanced_order_book(mid_price=100,
+                                              min_price=1,
+                                              max_price=200,
+                                              price_step_size=1,
+                                              volume_step_size=10)
+            self.market.add_data(book_data)
+            self.market.set_quantization_param(QuantizationParams(trading_pair, 6, 6, 6, 6))
+            self.market_infos.append(MarketTradingPairTuple(self.market, trading_pair, base_asset, quote_asset))
+        self.market.set_balance("HBOT", 500)
+        self.market.set_balance("COINALPHA", 500)
+        self.market.set_balance("ETH", 5000)
+        self.clock.add_iterator(self.market)
+
+    def create_strategy(self, pairs_per_tick: int = 0) -> MultiPairPureMarketMakingStrategy:
+        strategy = MultiPairPureMarketMakingStrategy(
+            self.market_infos,
+            pairs_per_tick=pairs_per_tick,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+        return strategy
+
+    def test_all_pairs(self):
+        strategy = self.create_strategy()
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        for pair_strategy in strategy.pair_strategies:
+            self.assertEqual(1, len(pair_strategy.active_buys))
+            self.assertEqual(1, len(pair_strategy.active_sells))
+            self.assertEqual(Decimal("99"), pair_strategy.active_buys[0].price)
+            self.assertEqual(Decimal("101"), pair_strategy.active_sells[0].price)
+        self.assertEqual(4, len(strategy.active_orders))
+
+    def test_pairs_per_tick(self):
+        strategy = self.create_strategy(pairs_per_tick=1)
+        hbot_strategy, coinalpha_strategy = strategy.pair_strategies
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(2, len(hbot_strategy.active_orders))
+        self.assertEqual(0, len(coinalpha_strategy.active_orders))
+
+        self.clock.backtest_til(self.start_timestamp + 2 * self.clock_tick_size)
+        self.assertEqual(2, len(hbot_strategy.active_orders))
+        self.assertEqual(2, len(coinalpha_strategy.active_orders))
+
+    def test_shared_budget(self):
+        # Enough ETH for one bid only - the second trading pair can't commit the same ETH again.
+        self.market.set_balance("ETH", Decimal("150"))
+        strategy = self.create_strategy()
+        hbot_strategy, coinalpha_strategy = strategy.pair_strategies
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(1, len(hbot_strategy.active_buys))
+        self.assertEqual(0, len(coinalpha_strategy.active_buys))
+        self.assertEqual(1, len(coinalpha_strategy.active_sells))
+        self.assertEqual(Decimal("51"), strategy.get_shared_available_balance("ETH"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from enum import Enum
+import gc
+import unittest
+
+from hummingbot.core.event.event_listener import EventListener
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.pubsub import PubSub
+
+
+class MockEvent(Enum):
+    EventA = 1
+    EventB = 2
+
+
+class RemovingListener(EventListener):
+    def __init__(self, pubsub: PubSub):
+        super().__init__()
+        self.pubsub = pubsub
+        self.calls = 0
+
+    def __call__(self, arg):
+        self.calls += 1
+        self.pubsub.remove_listener(MockEvent.EventA, self)
+
+
+class PubSubUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.pubsub: PubSub = PubSub()
+
+    def test_trigger_event(self):
+        logger_a: EventLogger = EventLogger()
+        logger_b: EventLogger = EventLogger()
+        self.pubsub.add_listener(MockEvent.EventA, logger_a)
+        self.pubsub.add_listener(MockEvent.EventA, logger_b)
+        self.pubsub.trigger_event(MockEvent.EventA, 1)
+        self.pubsub.trigger_event(MockEvent.EventB, 2)
+        self.assertEqual([1], logger_a.event_log)
+        self.assertEqual([1], logger_b.event_log)
+
+        self.pubsub.remove_listener(MockEvent.EventA, logger_a)
+        self.pubsub.trigger_event(MockEvent.EventA, 3)
+        self.assertEqual([1], logger_a.event_log)
+        self.assertEqual([1, 3], logger_b.event_log)
+        self.assertEqual([logger_b], self.pubsub.get_listeners(MockEvent.EventA))
+
+    def test_remove_listener_while_dispatching(self):
+        listeners = [RemovingListener(self.pubsub) for _ in range(3)]
+        for listener in listeners:
+            self.pubsub.add_listener(MockEvent.EventA, listener)
+        self.pubsub.trigger_event(MockEvent.EventA, 1)
+        self.pubsub.trigger_event(MockEvent.EventA, 2)
+        self.assertEqual([1, 1, 1], [listener.calls for listener in listeners])
+        self.assertEqual([], self.pubsub.get_listeners(MockEvent.EventA))
+
+    def test_dead_listeners_are_removed(self):
+        event_logger: EventLogger = EventLogger()
+        self.pubsub.add_listener(MockEvent.EventA, event_logger)
+        self.pubsub.add_listener(MockEvent.EventB, EventLogger())
+        gc.collect()
+        self.assertEqual([], self.pubsub.get_listeners(MockEvent.EventB))
+        self.assertEqual([event_logger], self.pubsub.get_listeners(MockEvent.EventA))
+
+        del event_logger
+        gc.collect()
+        self.pubsub.trigger_event(MockEvent.EventA, 1)
+        self.assertEqual([], self.pubsub.get_listeners(MockEvent.EventA))
+
+
+if __name__ == "__main__":
+    unittest.main()
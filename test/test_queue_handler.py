@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import logging
+import threading
+from typing import List
+import unittest
+
+from hummingbot.logger.queue_handler import (
+    BoundedQueueHandler,
+    LogWriterThread,
+    log_writer,
+    start_queue_logging,
+    stop_queue_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages: List[str] = []
+        self.threads: List[threading.Thread] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.messages.append(self.format(record))
+        self.threads.append(threading.current_thread())
+
+
+class QueueHandlerUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.logger: logging.Logger = logging.getLogger("test_queue_handler")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.debug_handler: RecordingHandler = RecordingHandler(logging.DEBUG)
+        self.info_handler: RecordingHandler = RecordingHandler(logging.INFO)
+        self.logger.addHandler(self.debug_handler)
+        self.logger.addHandler(self.info_handler)
+
+    def tearDown(self):
+        stop_queue_logging()
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+        root_logger: logging.Logger = logging.getLogger()
+        for handler in list(root_logger.handlers):
+            if isinstance(handler, BoundedQueueHandler):
+                root_logger.removeHandler(handler)
+                for wrapped_handler in handler.handlers:
+                    root_logger.addHandler(wrapped_handler)
+
+    def test_records_are_handled_on_writer_thread(self):
+        start_queue_logging([self.logger.name])
+        self.assertEqual(1, len(self.logger.handlers))
+        self.assertIsInstance(self.logger.handlers[0], BoundedQueueHandler)
+        self.assertIn(self.info_handler, self.logger.handlers[0].handlers)
+
+        self.logger.debug("debug %s", "message")
+        self.logger.info("info message")
+        writer: LogWriterThread = log_writer()
+        stop_queue_logging()
+
+        self.assertEqual(["debug message", "info message"], self.debug_handler.messages)
+        self.assertEqual(["info message"], self.info_handler.messages)
+        self.assertTrue(all(t is not threading.current_thread() for t in self.debug_handler.threads))
+        self.assertEqual(0, writer.dropped_records)
+
+    def test_records_are_dropped_when_queue_is_full(self):
+        writer: LogWriterThread = LogWriterThread(max_queue_size=2)
+        queue_handler: BoundedQueueHandler = BoundedQueueHandler(writer, [self.debug_handler])
+        self.assertEqual(logging.DEBUG, queue_handler.level)
+        for i in range(5):
+            queue_handler.handle(logging.makeLogRecord({"msg": f"message {i}", "levelno": logging.INFO}))
+        self.assertEqual(3, writer.dropped_records)
+
+        writer.start()
+        writer.stop()
+        queue_handler.handle(logging.makeLogRecord({"msg": "message 5", "levelno": logging.INFO}))
+        writer.start()
+        writer.stop()
+        self.assertEqual(["message 0",
+                          "message 1",
+                          "3 log records were dropped because the log queue was full.",
+                          "message 5"], self.debug_handler.messages)
+        self.assertEqual(0, writer.dropped_records)
+
+
+if __name__ == "__main__":
+    unittest.main()
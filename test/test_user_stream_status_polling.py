@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+import logging; logging.basicConfig(level=logging.CRITICAL)
+import time
+from typing import (
+    Any,
+    Dict,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.core.clock import (
+    Clock,
+    ClockMode,
+)
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+)
+from hummingbot.market.binance.binance_market import BinanceMarket
+from hummingbot.market.bittrex.bittrex_market import BittrexMarket
+
+
+class UserStreamStatusPollingTest:
+    """
+    c_tick only wakes up the REST status polling loop to fetch the initial balances, and while the user stream is
+    stale.
+    """
+    POLL_INTERVAL = 5.0
+    start_timestamp: float = 1000.0
+
+    @classmethod
+    def setUpClass(cls):
+        cls.ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+
+    def setUp(self):
+        self.market = self.create_market()
+        self.clock: Clock = Clock(ClockMode.BACKTEST, self.POLL_INTERVAL, self.start_timestamp,
+                                  self.start_timestamp + 3600)
+        self.clock.add_iterator(self.market)
+        self.timestamp: float = self.start_timestamp
+
+    def tearDown(self):
+        self.clock.remove_iterator(self.market)
+        self.run_for(0.01)
+
+    def create_market(self):
+        raise NotImplementedError
+
+    def balance_message(self) -> Any:
+        raise NotImplementedError
+
+    def run_for(self, seconds: float):
+        self.ev_loop.run_until_complete(asyncio.sleep(seconds))
+
+    def receive_balances(self):
+        self.market.user_stream_tracker.user_stream.put_nowait(self.balance_message())
+        listener_task: asyncio.Task = self.ev_loop.create_task(self.market._user_stream_event_listener())
+        self.run_for(0.01)
+        listener_task.cancel()
+        self.run_for(0.01)
+        self.assertEqual(1, self.market.get_balance("ETH"))
+
+    def poll_requested(self, user_stream_age: float) -> bool:
+        """
+        Advances the clock by one polling interval, with the last user stream message received `user_stream_age`
+        seconds ago, and tells whether the status polling loop was woken up.
+        """
+        self.market.poll_notifier.clear()
+        self.market.user_stream_tracker.data_source._last_recv_time = time.time() - user_stream_age
+        self.timestamp += self.POLL_INTERVAL
+        self.clock.backtest_til(self.timestamp)
+        return self.market.poll_notifier.is_set()
+
+    def test_polls_until_balances_are_known(self):
+        self.assertTrue(self.poll_requested(user_stream_age=0))
+        self.receive_balances()
+        self.assertFalse(self.poll_requested(user_stream_age=0))
+
+    def test_polls_only_while_user_stream_is_stale(self):
+        self.receive_balances()
+        stale_interval: float = self.market.USER_STREAM_STALE_INTERVAL
+        self.assertFalse(self.poll_requested(user_stream_age=1))
+        self.assertFalse(self.poll_requested(user_stream_age=stale_interval - 5))
+        self.assertTrue(self.poll_requested(user_stream_age=stale_interval + 5))
+        self.assertTrue(self.poll_requested(user_stream_age=stale_interval + 10))
+        # Polling stops again once the user stream is back.
+        self.assertFalse(self.poll_requested(user_stream_age=0))
+
+
+class BinanceStatusPollingUnitTest(UserStreamStatusPollingTest, unittest.TestCase):
+    def create_market(self) -> BinanceMarket:
+        # The binance client pings the exchange when it is created.
+        with patch("binance.client.Client.ping"):
+            return BinanceMarket("api_key", "api_secret", trading_pairs=["ETHUSDT"])
+
+    def balance_message(self) -> Dict[str, Any]:
+        return {"e": "outboundAccountInfo", "B": [{"a": "ETH", "f": "0.75", "l": "0.25"}]}
+
+
+class BittrexStatusPollingUnitTest(UserStreamStatusPollingTest, unittest.TestCase):
+    def create_market(self) -> BittrexMarket:
+        return BittrexMarket("api_key", "api_secret", poll_interval=self.POLL_INTERVAL, trading_pairs=["ETH-USDT"])
+
+    def balance_message(self) -> OrderBookMessage:
+        return OrderBookMessage(OrderBookMessageType.DIFF, {
+            "event_type": "uB",
+            "content": {"d": {"c": "ETH", "b": "1", "a": "0.75"}}
+        }, timestamp=self.start_timestamp)
+
+
+if __name__ == "__main__":
+    unittest.main()
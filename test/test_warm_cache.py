@@ -0,0 +1,203 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+import asyncio
+from decimal import Decimal
+import os
+import tempfile
+import time
+from typing import (
+    Dict,
+    List,
+)
+import unittest
+from unittest.mock import patch
+
+from hummingbot.client.config.global_config_map import global_config_map
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_entry import OrderBookTrackerEntry
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.utils.warm_cache import WarmCache
+from hummingbot.market.binance.binance_order_book_tracker import BinanceOrderBookTracker
+from hummingbot.market.trading_rule import TradingRule
+
+
+def make_order_book(price: float) -> OrderBook:
+    order_book: OrderBook = OrderBook()
+    order_book.apply_snapshot([OrderBookRow(price - 1, 1.0, 1)], [OrderBookRow(price + 1, 1.0, 1)], 1)
+    return order_book
+
+
+class MockDataSource:
+    def __init__(self, trading_pairs: List[str]):
+        self._trading_pairs: List[str] = trading_pairs
+        self.order_book_create_function = OrderBook
+
+    async def get_trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    async def get_tracking_pairs(self) -> Dict[str, OrderBookTrackerEntry]:
+        return {trading_pair: OrderBookTrackerEntry(trading_pair, time.time(), make_order_book(100.0))
+                for trading_pair in self._trading_pairs}
+
+    async def get_snapshot_message(self, trading_pair: str) -> OrderBookMessage:
+        # Keeps the order books seeded from the warm cache provisional.
+        await asyncio.sleep(3600)
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.BaseEventLoop, output: asyncio.Queue):
+        pass
+
+
+class MockOrderBookTracker(OrderBookTracker):
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__()
+        self._data_source: MockDataSource = MockDataSource(trading_pairs)
+
+    @property
+    def data_source(self) -> MockDataSource:
+        return self._data_source
+
+    @property
+    def exchange_name(self) -> str:
+        return "mock"
+
+
+class SeedingMockOrderBookTracker(MockOrderBookTracker):
+    SUPPORTS_WARM_CACHE = True
+
+
+class WarmCacheUnitTest(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.warm_cache: WarmCache = WarmCache(self.cache_dir.name, max_age=60.0)
+
+    def tearDown(self):
+        self.cache_dir.cleanup()
+
+    def test_expired_entries_are_ignored(self):
+        self.warm_cache.save("trading_pairs", {"binance": ["ETHBTC"]})
+        self.assertEqual({"binance": ["ETHBTC"]}, self.warm_cache.load_trading_pairs())
+
+        expired_cache: WarmCache = WarmCache(self.cache_dir.name, max_age=-1.0)
+        self.assertIsNone(expired_cache.load("trading_pairs"))
+        self.assertIsNone(self.warm_cache.load("missing_key"))
+
+    def test_failed_trading_pair_fetches_are_not_saved(self):
+        self.warm_cache.save_trading_pairs({"binance": ["ETHBTC"], "huobi": IOError("Network error.")})
+        self.assertEqual({"binance": ["ETHBTC"]}, self.warm_cache.load_trading_pairs())
+
+    def test_trading_rules_round_trip(self):
+        trading_rule: TradingRule = TradingRule("ETHBTC",
+                                                min_order_size=Decimal("0.001"),
+                                                min_price_increment=Decimal("0.000001"),
+                                                min_base_amount_increment=Decimal("0.001"),
+                                                min_notional_size=Decimal("0.0001"),
+                                                supports_market_orders=False)
+        asyncio.get_event_loop().run_until_complete(
+            self.warm_cache.save_trading_rules("binance", {"ETHBTC": trading_rule})
+        )
+        loaded_rule: TradingRule = self.warm_cache.load_trading_rules("binance")["ETHBTC"]
+        self.assertEqual(Decimal("0.001"), loaded_rule.min_order_size)
+        self.assertEqual(Decimal("0.000001"), loaded_rule.min_price_increment)
+        self.assertEqual(trading_rule.max_order_size, loaded_rule.max_order_size)
+        self.assertTrue(loaded_rule.supports_limit_orders)
+        self.assertFalse(loaded_rule.supports_market_orders)
+
+    def test_order_books_round_trip(self):
+        order_book: OrderBook = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.99, 10, 5), OrderBookRow(0.98, 20, 5)],
+                                  [OrderBookRow(1.01, 15, 5)],
+                                  5)
+        order_book.apply_diffs([OrderBookRow(0.97, 30, 6)], [], 6)
+        self.warm_cache.save("binance_order_books", self.warm_cache.order_books_to_json({"ETHBTC": order_book}))
+
+        loaded_books: Dict[str, OrderBook] = self.warm_cache.load_order_books("binance", OrderBook)
+        loaded_book: OrderBook = loaded_books["ETHBTC"]
+        self.assertEqual(6, loaded_book.snapshot_uid)
+        self.assertEqual([(0.99, 10), (0.98, 20), (0.97, 30)],
+                         [(row.price, row.amount) for row in loaded_book.bid_entries()])
+        self.assertEqual([(1.01, 15)], [(row.price, row.amount) for row in loaded_book.ask_entries()])
+
+    def test_save_overwrites_without_leaving_temp_files(self):
+        self.warm_cache.save("trading_pairs", {"binance": ["ETHBTC"]})
+        self.warm_cache.save("trading_pairs", {"binance": ["ETHBTC", "LTCBTC"]})
+        self.assertEqual(["ETHBTC", "LTCBTC"], self.warm_cache.load("trading_pairs")["binance"])
+        self.assertEqual(["trading_pairs.json"], os.listdir(self.cache_dir.name))
+
+    def start_tracker(self, tracker: MockOrderBookTracker) -> List[str]:
+        """
+        Runs the tracker on top of a warm cache holding an order book of its trading pair.
+
+        :return: the keys the tracker read from the warm cache
+        """
+        self.warm_cache.save("mock_order_books", self.warm_cache.order_books_to_json({"ETH-USDT": make_order_book(50.0)}))
+        loaded_keys: List[str] = []
+        load = self.warm_cache.load
+
+        def record_load(key: str):
+            loaded_keys.append(key)
+            return load(key)
+
+        ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
+        with patch.object(self.warm_cache, "load", side_effect=record_load), \
+                patch.object(WarmCache, "_wc_shared_instance", self.warm_cache):
+            tracker.start()
+            ev_loop.run_until_complete(asyncio.sleep(0.1))
+            tracker.stop()
+            ev_loop.run_until_complete(asyncio.sleep(0.01))
+        return loaded_keys
+
+    def test_warm_cache_is_not_read_without_seeding_support(self):
+        tracker: MockOrderBookTracker = MockOrderBookTracker(["ETH-USDT"])
+        self.assertEqual([], self.start_tracker(tracker))
+        # The order book came from the exchange.
+        self.assertEqual(101.0, tracker.order_books["ETH-USDT"].get_price(True))
+
+    def test_warm_cache_is_not_read_when_disabled(self):
+        tracker: SeedingMockOrderBookTracker = SeedingMockOrderBookTracker(["ETH-USDT"])
+        warm_cache_enabled = global_config_map.get("warm_cache_enabled")
+        previous_value = warm_cache_enabled.value
+        warm_cache_enabled.value = False
+        try:
+            # The shared instance is only created once the warm cache is enabled.
+            with patch.object(WarmCache, "_wc_shared_instance", None), \
+                    patch.object(WarmCache, "load", side_effect=AssertionError("The warm cache was read.")):
+                tracker.start()
+                asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.1))
+                tracker.stop()
+                asyncio.get_event_loop().run_until_complete(asyncio.sleep(0.01))
+        finally:
+            warm_cache_enabled.value = previous_value
+        self.assertEqual(101.0, tracker.order_books["ETH-USDT"].get_price(True))
+
+    def test_warm_cache_seeds_supporting_trackers(self):
+        tracker: SeedingMockOrderBookTracker = SeedingMockOrderBookTracker(["ETH-USDT"])
+        self.assertEqual(["mock_order_books"], self.start_tracker(tracker))
+        self.assertEqual(51.0, tracker.order_books["ETH-USDT"].get_price(True))
+
+    def test_provisional_order_books_are_not_ready(self):
+        tracker: BinanceOrderBookTracker = BinanceOrderBookTracker(trading_pairs=["ETHBTC", "LTCBTC"])
+        tracker._order_books["ETHBTC"] = OrderBook()
+        tracker._order_books["LTCBTC"] = OrderBook()
+        tracker._provisional_trading_pairs.add("LTCBTC")
+        self.assertFalse(tracker.ready)
+
+        tracker._provisional_trading_pairs.discard("LTCBTC")
+        self.assertTrue(tracker.ready)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+from os.path import (
+    join,
+    realpath,
+)
+import sys; sys.path.insert(0, realpath(join(__file__, "../../")))
+
+from eth_account import Account
+from eth_account.messages import defunct_hash_message
+from eth_account.signers.local import LocalAccount
+import unittest
+
+from hummingbot.wallet.ethereum.zero_ex.zero_ex_custom_utils_v3 import (
+    generate_order_hash_hex,
+    Order,
+    sign_order_hashes,
+    ZeroExOrderHasher,
+)
+
+NULL_ADDRESS = "0x0000000000000000000000000000000000000000"
+TEST_EXCHANGE_ADDRESS = "0x1dc4c1cefef38a777b15aa20260a54e584b16c48"
+
+
+def make_order(salt: int) -> Order:
+    return Order(
+        makerAddress=NULL_ADDRESS,
+        takerAddress=NULL_ADDRESS,
+        feeRecipientAddress=NULL_ADDRESS,
+        senderAddress=NULL_ADDRESS,
+        makerAssetAmount="0",
+        takerAssetAmount="0",
+        makerFee="0",
+        takerFee="0",
+        expirationTimeSeconds="0",
+        salt=str(salt),
+        makerAssetData=bytes(20),
+        takerAssetData=bytes(20),
+        makerFeeAssetData=bytes(20),
+        takerFeeAssetData=bytes(20),
+    )
+
+
+class ZeroExOrderHasherUnitTest(unittest.TestCase):
+    def test_order_hash_matches_reference(self):
+        # Reference hash from @0x/order-utils/test/order_hash_test.ts
+        expected_hash: str = "cb36e4fedb36508fb707e2c05e21bffc7a72766ccae93f8ff096693fff7f1714"
+        hasher: ZeroExOrderHasher = ZeroExOrderHasher(TEST_EXCHANGE_ADDRESS, 1337)
+        self.assertEqual(expected_hash, hasher.hash_order_hex(make_order(0)))
+        self.assertEqual(expected_hash, generate_order_hash_hex(make_order(0), TEST_EXCHANGE_ADDRESS, 1337))
+        self.assertEqual(hasher.hash_orders_hex([make_order(i) for i in range(3)]),
+                         [generate_order_hash_hex(make_order(i), TEST_EXCHANGE_ADDRESS, 1337) for i in range(3)])
+
+    def test_signatures_recover_to_signer(self):
+        account: LocalAccount = Account.create()
+        order_hashes = ["0x" + h for h in ZeroExOrderHasher(TEST_EXCHANGE_ADDRESS, 1337).hash_orders_hex(
+            [make_order(i) for i in range(3)]
+        )]
+        for order_hash, signature in zip(order_hashes, sign_order_hashes(account, order_hashes)):
+            # v + r + s + signature type, with 0x ETH_SIGN = 3
+            self.assertEqual(2 + 2 + 64 + 64 + 2, len(signature))
+            self.assertEqual("03", signature[-2:])
+            v, r, s = int(signature[2:4], 16), int(signature[4:68], 16), int(signature[68:132], 16)
+            recovered_address: str = Account.recoverHash(defunct_hash_message(hexstr=order_hash), vrs=(v, r, s))
+            self.assertEqual(account.address, recovered_address)
+
+
+if __name__ == "__main__":
+    unittest.main()